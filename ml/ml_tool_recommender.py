@@ -139,6 +139,12 @@ class DynamicToolRecommender:
         "divergence": 0.005
     }
     
+    # محورهای جدول امتیاز از پیش محاسبه شده
+    REGIMES = ("trending_bullish", "trending_bearish", "ranging", "volatile")
+    TIMEFRAMES = ("1m", "5m", "15m", "1h", "4h", "1d")
+    TRADING_STYLES = ("scalp", "day", "swing", "position")
+    VOLATILITY_BUCKET_LEVELS = (100.0, 0.0, 50.0)  # high, low, medium
+    
     def __init__(self, model_type: str = "lightgbm"):
         """
         Initialize Dynamic Tool Recommender
@@ -161,6 +167,93 @@ class DynamicToolRecommender:
         elif model_type == "xgboost" and not XGBOOST_AVAILABLE:
             print("⚠️ XGBoost not available, falling back to sklearn")
             self.model_type = "sklearn"
+        
+        self._build_score_tables()
+    
+    def _build_score_tables(self):
+        """
+        پیش‌محاسبه جدول‌های امتیاز سازگاری ابزارها
+        
+        امتیاز هر ابزار فقط به (رژیم، timeframe، سبک، سطح نوسان) بستگی دارد؛
+        پس برای همه ترکیب‌ها یک بار محاسبه و در آرایه‌ای با شکل
+        (regime, timeframe, style, volatility_bucket, tool) ذخیره می‌شود.
+        ردیف آخر هر محور برای مقادیر ناشناخته (پیش‌فرض) است و ردیف
+        آخر محور سبک برای حالت بدون سبک (بدون سهم در امتیاز).
+        """
+        self._tools = [tool for tools in self.TOOL_CATEGORIES.values() for tool in tools]
+        self._categories = list(self.TOOL_CATEGORIES)
+        self._tool_category = np.array([
+            i for i, tools in enumerate(self.TOOL_CATEGORIES.values()) for _ in tools
+        ])
+        
+        regimes = self.REGIMES + ("",)
+        timeframes = self.TIMEFRAMES + ("",)
+        styles = self.TRADING_STYLES + ("",)
+        
+        def table(check, keys):
+            return np.array([[check(tool, key) for tool in self._tools] for key in keys])
+        
+        regime = table(self._check_regime_compatibility, regimes)
+        timeframe = table(self._check_timeframe_compatibility, timeframes)
+        volatility = table(self._check_volatility_compatibility, self.VOLATILITY_BUCKET_LEVELS)
+        style = np.vstack([
+            table(self._check_trading_style_compatibility, styles),
+            np.zeros(len(self._tools))
+        ])
+        
+        # همان ترتیب جمع _calculate_tool_score تا نتایج بیت به بیت یکسان باشند
+        score = 0.5 + regime[:, None, None, None, :] * 0.3
+        score = score + timeframe[None, :, None, None, :] * 0.2
+        score = score + volatility[None, None, None, :, :] * 0.2
+        score = score + style[None, None, :, None, :] * 0.1
+        self._score_table = np.minimum(score, 1.0)
+        
+        self._accuracy_table = table(self._get_historical_accuracy, regimes)
+        
+        self._regime_index = {r: i for i, r in enumerate(self.REGIMES)}
+        self._timeframe_index = {t: i for i, t in enumerate(self.TIMEFRAMES)}
+        self._style_index = {s: i for i, s in enumerate(self.TRADING_STYLES)}
+    
+    def _volatility_bucket(self, volatility: float) -> int:
+        """شماره بازه نوسان: 0 = بالا، 1 = پایین، 2 = متوسط"""
+        if volatility > 70:
+            return 0
+        elif volatility < 30:
+            return 1
+        return 2
+    
+    def _context_scores(self, context: MarketContext) -> Tuple[np.ndarray, np.ndarray]:
+        """بردار امتیاز و دقت تاریخی همه ابزارها برای یک کانتکست"""
+        regime = self._regime_index.get(context.market_regime, len(self.REGIMES))
+        timeframe = self._timeframe_index.get(context.timeframe, len(self.TIMEFRAMES))
+        if context.trading_style:
+            style = self._style_index.get(context.trading_style, len(self.TRADING_STYLES))
+        else:
+            style = len(self.TRADING_STYLES) + 1
+        bucket = self._volatility_bucket(context.volatility_level)
+        
+        scores = self._score_table[regime, timeframe, style, bucket]
+        return scores, self._accuracy_table[regime]
+    
+    @staticmethod
+    def _top_indices(values: np.ndarray, top_n: int) -> np.ndarray:
+        """
+        اندیس top_n بزرگ‌ترین مقدار به ترتیب نزولی
+        
+        مقادیر برابر به ترتیب اصلی ابزارها می‌مانند (مانند مرتب‌سازی پایدار).
+        """
+        n = len(values)
+        if top_n <= 0:
+            return np.array([], dtype=int)
+        if top_n < n:
+            threshold = np.partition(values, n - top_n)[n - top_n]
+            above = np.flatnonzero(values > threshold)
+            ties = np.flatnonzero(values == threshold)[:top_n - len(above)]
+            candidates = np.concatenate([above, ties])
+        else:
+            candidates = np.arange(n)
+        order = np.lexsort((candidates, -values[candidates]))
+        return candidates[order]
     
     def recommend_tools(
         self,
@@ -179,62 +272,45 @@ class DynamicToolRecommender:
         Returns:
             لیست ابزارهای پیشنهادی به ترتیب اولویت
         """
-        recommendations = []
-        
         # 1. دریافت وزن‌ها برای این رژیم بازار
         if ml_weights is None:
             ml_weights = self._get_regime_based_weights(context.market_regime)
         
-        # 2. رتبه‌بندی ابزارها در هر دسته
-        for category, tools in self.TOOL_CATEGORIES.items():
-            category_weight = ml_weights.get(category, self.BASE_CATEGORY_WEIGHTS[category])
+        category_weights = np.array([
+            ml_weights.get(category, self.BASE_CATEGORY_WEIGHTS[category])
+            for category in self._categories
+        ])[self._tool_category]
+        
+        # 2. امتیاز همه ابزارها در یک گذر برداری
+        scores, accuracies = self._context_scores(context)
+        confidences = np.minimum(scores * accuracies, 1.0)
+        
+        # 3. انتخاب top_n بر اساس confidence
+        recommendations = []
+        for i in self._top_indices(confidences, top_n):
+            tool = self._tools[i]
+            category = self._categories[self._tool_category[i]]
+            score = float(scores[i])
+            historical_accuracy = float(accuracies[i])
             
-            for tool in tools:
-                # محاسبه امتیاز ابزار
-                tool_score = self._calculate_tool_score(
-                    tool=tool,
-                    category=category,
-                    category_weight=category_weight,
-                    context=context
-                )
-                
-                # دریافت عملکرد تاریخی
-                historical_accuracy = self._get_historical_accuracy(
-                    tool=tool,
-                    market_regime=context.market_regime
-                )
-                
-                # تعیین اولویت
-                priority = self._determine_priority(tool_score, historical_accuracy)
-                
-                # تولید دلیل
-                reason = self._generate_reason(
+            # دلیل و کاربردها فقط برای ابزارهای برگزیده ساخته می‌شوند
+            recommendations.append(ToolRecommendation(
+                tool_name=tool,
+                category=category,
+                ml_weight=float(category_weights[i] * scores[i]),
+                confidence=float(confidences[i]),
+                historical_accuracy=historical_accuracy,
+                reason=self._generate_reason(
                     tool=tool,
                     category=category,
                     context=context,
-                    score=tool_score
-                )
-                
-                # بهترین کاربردها
-                best_for = self._get_best_use_cases(tool, context)
-                
-                rec = ToolRecommendation(
-                    tool_name=tool,
-                    category=category,
-                    ml_weight=category_weight * tool_score,
-                    confidence=min(tool_score * historical_accuracy, 1.0),
-                    historical_accuracy=historical_accuracy,
-                    reason=reason,
-                    priority=priority,
-                    best_for=best_for
-                )
-                
-                recommendations.append(rec)
-        
-        # 3. مرتب‌سازی بر اساس confidence
-        recommendations.sort(key=lambda x: x.confidence, reverse=True)
-        
-        return recommendations[:top_n]
+                    score=score
+                ),
+                priority=self._determine_priority(score, historical_accuracy),
+                best_for=self._get_best_use_cases(tool, context)
+            ))
+        
+        return recommendations
     
     def _get_regime_based_weights(self, market_regime: str) -> Dict[str, float]:
         """
@@ -7,6 +7,7 @@ All business entities are immutable and framework-independent.
 
 Exported Entities:
 - Candle: OHLCV price data (Phase 2)
+- CandleArray / CandleView: columnar candle series and its row view
 - Signal: Trading signal entity (Phase 2)
 - Decision: Trading decision entity (Phase 2)
 - SignalStrength: Signal strength enumeration - 7 levels (Phase 2.1)
@@ -22,7 +23,7 @@ Last Updated: 2025-11-07 (Phase 2.1 - Task 1.3)
 """
 
 # Existing exports (Phase 2)
-from .candle import Candle, CandleType
+from .candle import Candle, CandleArray, CandleType, CandleView, candle_column, validate_ohlcv
 from .signal import Signal, SignalType, SignalStrength as OldSignalStrength
 from .decision import Decision, DecisionType, ConfidenceLevel
 
@@ -41,7 +42,11 @@ from .elliott_wave_result import ElliottWaveResult
 __all__ = [
     # Existing (Phase 2)
     "Candle",
+    "CandleArray",
     "CandleType",
+    "CandleView",
+    "candle_column",
+    "validate_ohlcv",
     "Signal",
     "SignalType",
     "Decision",
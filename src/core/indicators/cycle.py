@@ -42,16 +42,200 @@ Cycle Analysis helps identify:
 
 import numpy as np
 import pandas as pd
+from numba import njit
 from typing import List, Tuple
 from dataclasses import dataclass
 from src.core.domain.entities import (
     Candle,
     IndicatorResult,
+    candle_column,
     CoreSignalStrength as SignalStrength,
     IndicatorCategory
 )
 
 
+# ═══════════════════════════════════════════════════════════════
+# Array kernels for the Ehlers / Hilbert indicators
+# ═══════════════════════════════════════════════════════════════
+
+# Hilbert detrender FIR coefficients for lags 0, 2, 4, 6
+HILBERT_DETRENDER = (0.0962, 0.5769, -0.5769, -0.0962)
+
+
+@njit(cache=True)
+def ewm_mean(values: np.ndarray, span: float) -> np.ndarray:
+    """
+    Exponentially weighted mean, identical to pandas ewm(span).mean()
+    with adjust=True (the recurrence pandas uses internally)
+    """
+    n = len(values)
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    
+    alpha = 2.0 / (span + 1.0)
+    old_wt_factor = 1.0 - alpha
+    weighted = values[0]
+    old_wt = 1.0
+    out[0] = weighted
+    for i in range(1, n):
+        cur = values[i]
+        old_wt *= old_wt_factor
+        if weighted != cur:
+            weighted = (old_wt * weighted + cur) / (old_wt + 1.0)
+        old_wt += 1.0
+        out[i] = weighted
+    return out
+
+
+def rolling_mean_bfill(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling mean with leading NaNs back-filled"""
+    return pd.Series(values).rolling(window=window).mean().bfill().to_numpy()
+
+
+def hilbert_detrender(smooth: np.ndarray, start: int) -> np.ndarray:
+    """
+    Hilbert detrender as a 4-tap FIR filter, zero before `start`
+    
+    detrender[i] = 0.0962*s[i] + 0.5769*s[i-2] - 0.5769*s[i-4] - 0.0962*s[i-6]
+    """
+    n = len(smooth)
+    detrender = np.zeros(n)
+    start = max(start, 6)
+    if n > start:
+        detrender[start:] = (0.0962 * smooth[start:] +
+                             0.5769 * smooth[start - 2:n - 2] -
+                             0.5769 * smooth[start - 4:n - 4] -
+                             0.0962 * smooth[start - 6:n - 6])
+    return detrender
+
+
+def hilbert_components(detrender: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """In-phase and quadrature components of a detrended series"""
+    n = len(detrender)
+    in_phase = np.zeros(n)
+    quadrature = np.zeros(n)
+    if n > 6:
+        in_phase[6:] = 1.25 * (detrender[2:n - 4] - 0.5 * detrender[:n - 6])
+        quadrature[6:] = detrender[4:n - 2] - 0.5 * detrender[2:n - 4]
+    return in_phase, quadrature
+
+
+def hilbert_phase_series(closes: np.ndarray, period: int = 7) -> np.ndarray:
+    """Smoothed Hilbert phase in degrees [0, 360) for every bar"""
+    smooth = rolling_mean_bfill(closes, period)
+    in_phase, quadrature = hilbert_components(hilbert_detrender(smooth, period))
+    phase = np.degrees(np.arctan2(ewm_mean(quadrature, 3.0), ewm_mean(in_phase, 3.0)))
+    phase[phase < 0] += 360
+    return phase
+
+
+# ═══════════════════════════════════════════════════════════════
+# FFT autocorrelation kernels for the dominant cycle
+# ═══════════════════════════════════════════════════════════════
+
+DEFAULT_DOMINANT_PERIOD = 20
+
+
+def centered_detrend(closes: np.ndarray, window: int = 20) -> np.ndarray:
+    """
+    Subtract a centered rolling mean along the last axis
+    
+    Matches pandas rolling(window, center=True); edges without a full
+    window are set to 0. Accepts a 1-D series or a 2-D batch of windows.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    n = closes.shape[-1]
+    detrended = np.zeros_like(closes)
+    if n < window:
+        return detrended
+    
+    means = np.lib.stride_tricks.sliding_window_view(closes, window, axis=-1).mean(axis=-1)
+    half = window // 2
+    detrended[..., half:half + means.shape[-1]] = closes[..., half:half + means.shape[-1]] - means
+    return detrended
+
+
+def autocorrelation(values: np.ndarray, lags: np.ndarray) -> np.ndarray:
+    """
+    Pearson autocorrelation for many lags at once (Wiener-Khinchin)
+    
+    Equivalent to pandas Series.autocorr(lag) for every lag: the lagged
+    cross-products come from one FFT, the segment means and variances
+    from cumulative sums. Works along the last axis, so a 2-D batch of
+    windows is handled in a single call. Zero-variance segments give NaN.
+    
+    Args:
+        values: 1-D series or 2-D array (windows × bars)
+        lags: Positive lags, each shorter than the series
+    
+    Returns:
+        Correlations with shape values.shape[:-1] + (len(lags),)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    lags = np.asarray(lags, dtype=np.int64)
+    n = values.shape[-1]
+    
+    nfft = 1 << int(2 * n - 1).bit_length()
+    spectrum = np.fft.rfft(values, n=nfft, axis=-1)
+    cross = np.fft.irfft(spectrum * np.conj(spectrum), n=nfft, axis=-1)[..., lags]
+    
+    zero = np.zeros(values.shape[:-1] + (1,))
+    csum = np.concatenate([zero, np.cumsum(values, axis=-1)], axis=-1)
+    csq = np.concatenate([zero, np.cumsum(values * values, axis=-1)], axis=-1)
+    
+    count = (n - lags).astype(np.float64)
+    # Leading segment x[lag:] and trailing segment x[:n-lag]
+    sum_a = csum[..., [n]] - csum[..., lags]
+    sum_b = csum[..., n - lags]
+    sq_a = csq[..., [n]] - csq[..., lags]
+    sq_b = csq[..., n - lags]
+    
+    cov = cross - sum_a * sum_b / count
+    var_a = sq_a - sum_a * sum_a / count
+    var_b = sq_b - sum_b * sum_b / count
+    
+    # Variances lost to cancellation are treated as zero
+    tol = 1e-12 * np.maximum(sq_a, sq_b)
+    valid = (var_a > tol) & (var_b > tol)
+    denom = np.sqrt(np.where(valid, var_a * var_b, 1.0))
+    return np.where(valid, np.clip(cov / denom, -1.0, 1.0), np.nan)
+
+
+def dominant_cycle_batch(closes: np.ndarray, min_period: int = 8,
+                         max_period: int = 50) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Dominant cycle period for a batch of equal-length windows
+    
+    Args:
+        closes: 2-D array (windows × bars) or a single 1-D series
+        min_period: Shortest lag tested
+        max_period: Longest lag tested (exclusive, capped at bars // 2)
+    
+    Returns:
+        (periods, correlations) with one entry per window; windows without
+        a usable correlation fall back to DEFAULT_DOMINANT_PERIOD and 0
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    batch_shape = closes.shape[:-1]
+    lags = np.arange(min_period, min(max_period, closes.shape[-1] // 2))
+    if len(lags) == 0:
+        return (np.full(batch_shape, DEFAULT_DOMINANT_PERIOD, dtype=np.int64),
+                np.zeros(batch_shape))
+    
+    corr = np.nan_to_num(autocorrelation(centered_detrend(closes), lags), nan=0.0)
+    best = np.argmax(np.abs(corr), axis=-1)
+    best_corr = np.take_along_axis(corr, best[..., None], axis=-1)[..., 0]
+    periods = np.where(best_corr != 0, lags[best], DEFAULT_DOMINANT_PERIOD)
+    return periods.astype(np.int64), best_corr
+
+
+def dominant_cycle_phase(n_bars, periods) -> np.ndarray:
+    """Position of the last bar within its dominant cycle, in degrees"""
+    periods = np.asarray(periods)
+    return (np.asarray(n_bars) % periods) / periods * 360
+
+
 @dataclass
 class CycleResult:
     """Result of a cycle indicator calculation"""
@@ -81,7 +265,7 @@ class CycleIndicators:
         - DPO > 0: Price above cycle center (overbought in cycle)
         - DPO < 0: Price below cycle center (oversold in cycle)
         """
-        closes = np.array([c.close for c in candles])
+        closes = candle_column(candles, "close")
         sma = pd.Series(closes).rolling(window=period).mean()
         shift = period // 2 + 1
         dpo_values = closes - sma.shift(shift)
@@ -129,15 +313,15 @@ class CycleIndicators:
     @staticmethod
     def ehlers_cycle_period(candles: List[Candle], smooth_period: int = 5) -> CycleResult:
         """Ehler's Cycle Period Detector using Hilbert Transform"""
-        closes = np.array([c.close for c in candles])
-        smooth = pd.Series(closes).rolling(window=smooth_period).mean().fillna(method='bfill')
-        
-        in_phase = np.zeros(len(smooth))
-        quadrature = np.zeros(len(smooth))
+        closes = candle_column(candles, "close")
+        smooth = rolling_mean_bfill(closes, smooth_period)
+        n = len(smooth)
         
-        for i in range(6, len(smooth)):
-            in_phase[i] = smooth.iloc[i] - smooth.iloc[i-4]
-            quadrature[i] = (smooth.iloc[i-2] - smooth.iloc[i-6]) / 2
+        in_phase = np.zeros(n)
+        quadrature = np.zeros(n)
+        if n > 6:
+            in_phase[6:] = smooth[6:] - smooth[2:n - 4]
+            quadrature[6:] = (smooth[4:n - 2] - smooth[:n - 6]) / 2
         
         phase_values = np.arctan2(quadrature, in_phase) * 180 / np.pi
         phase_values[phase_values < 0] += 360
@@ -187,25 +371,13 @@ class CycleIndicators:
     
     @staticmethod
     def dominant_cycle(candles: List[Candle], min_period: int = 8, max_period: int = 50) -> CycleResult:
-        """Dominant Cycle using Autocorrelation"""
-        closes = np.array([c.close for c in candles])
-        prices = pd.Series(closes)
-        detrended = prices - prices.rolling(window=20, center=True).mean()
-        detrended = detrended.fillna(0)
-        
-        best_period = 20
-        best_correlation = 0
-        
-        for period in range(min_period, min(max_period, len(closes) // 2)):
-            if len(detrended) > period:
-                correlation = detrended.autocorr(lag=period)
-                if not np.isnan(correlation) and abs(correlation) > abs(best_correlation):
-                    best_correlation = correlation
-                    best_period = period
+        """Dominant Cycle using Autocorrelation (all lags from one FFT)"""
+        closes = candle_column(candles, "close")
+        periods, correlations = dominant_cycle_batch(closes, min_period, max_period)
+        best_period = int(periods)
         
-        position_in_cycle = len(closes) % best_period
-        phase = (position_in_cycle / best_period) * 360
-        normalized = best_correlation
+        phase = float(dominant_cycle_phase(len(closes), best_period))
+        normalized = float(correlations)
         
         if 315 <= phase or phase < 45:
             signal = SignalStrength.VERY_BULLISH
@@ -242,7 +414,7 @@ class CycleIndicators:
     @staticmethod
     def schaff_trend_cycle(candles: List[Candle], fast: int = 23, slow: int = 50, cycle: int = 10) -> IndicatorResult:
         """Schaff Trend Cycle (STC) - Returns IndicatorResult for backward compatibility"""
-        closes = np.array([c.close for c in candles])
+        closes = candle_column(candles, "close")
         ema_fast = pd.Series(closes).ewm(span=fast, adjust=False).mean()
         ema_slow = pd.Series(closes).ewm(span=slow, adjust=False).mean()
         macd = ema_fast - ema_slow
@@ -294,15 +466,16 @@ class CycleIndicators:
     @staticmethod
     def phase_accumulation(candles: List[Candle], period: int = 14) -> CycleResult:
         """Phase Accumulation Indicator"""
-        closes = np.array([c.close for c in candles])
+        closes = candle_column(candles, "close")
         returns = np.diff(closes) / closes[:-1]
         returns = np.append(0, returns)
-        smooth_returns = pd.Series(returns).rolling(window=period).mean().fillna(0)
+        smooth_returns = np.nan_to_num(
+            pd.Series(returns).rolling(window=period).mean().to_numpy(), nan=0.0
+        )
         phase_changes = smooth_returns * 180
         accumulated_phase = np.cumsum(phase_changes)
         
-        # pandas Series requires .iloc for position-based indexing
-        current_phase_raw = accumulated_phase.iloc[-1]
+        current_phase_raw = accumulated_phase[-1]
         current_phase = current_phase_raw % 360
         if current_phase < 0:
             current_phase += 360
@@ -345,32 +518,13 @@ class CycleIndicators:
     @staticmethod
     def hilbert_transform_phase(candles: List[Candle], period: int = 7) -> CycleResult:
         """Hilbert Transform for Phase Detection"""
-        closes = np.array([c.close for c in candles])
-        smooth = pd.Series(closes).rolling(window=period).mean().fillna(method='bfill')
-        
-        detrender = np.zeros(len(smooth))
-        for i in range(period, len(smooth)):
-            detrender[i] = (0.0962 * smooth.iloc[i] + 
-                           0.5769 * smooth.iloc[i-2] - 
-                           0.5769 * smooth.iloc[i-4] - 
-                           0.0962 * smooth.iloc[i-6])
-        
-        in_phase = np.zeros(len(detrender))
-        quadrature = np.zeros(len(detrender))
-        
-        for i in range(6, len(detrender)):
-            in_phase[i] = 1.25 * (detrender[i-4] - 0.5 * detrender[i-6])
-            quadrature[i] = detrender[i-2] - 0.5 * detrender[i-4]
-        
-        i_smooth = pd.Series(in_phase).ewm(span=3).mean()
-        q_smooth = pd.Series(quadrature).ewm(span=3).mean()
-        phase = np.arctan2(q_smooth, i_smooth) * 180 / np.pi
-        phase[phase < 0] += 360
-        
-        current_phase = phase.iloc[-1]
-        phase_delta = phase.diff().fillna(0)
+        closes = candle_column(candles, "close")
+        phase = hilbert_phase_series(closes, period)
+        
+        current_phase = phase[-1]
+        phase_delta = np.diff(phase, prepend=phase[0])
         phase_delta[phase_delta < 0] += 360
-        avg_phase_change = phase_delta.tail(10).mean()
+        avg_phase_change = phase_delta[-10:].mean()
         inst_period = 360 / avg_phase_change if avg_phase_change > 0 else 15
         inst_period = np.clip(inst_period, 6, 50)
         
@@ -414,8 +568,8 @@ class CycleIndicators:
             lookback = len(candles)
         
         recent_candles = candles[-lookback:]
-        closes = np.array([c.close for c in recent_candles])
-        volumes = np.array([c.volume for c in recent_candles])
+        closes = candle_column(recent_candles, "close")
+        volumes = candle_column(recent_candles, "volume")
         
         sma_short = pd.Series(closes).rolling(window=10).mean()
         sma_long = pd.Series(closes).rolling(window=30).mean()
@@ -504,7 +658,7 @@ class CycleIndicators:
         - Value < -0.3: Moderate downtrend (BEARISH)
         - Value < 0: Weak downtrend (BEARISH_BROKEN)
         """
-        closes = np.array([c.close for c in candles])
+        closes = candle_column(candles, "close")
         
         # Simple sine wave approximation using EWM smoothing
         prices = pd.Series(closes)
@@ -46,6 +46,7 @@ from src.core.domain.entities import (
     CoreSignalStrength as SignalStrength,
     IndicatorCategory
 )
+from src.core.patterns.pivots import find_pivots
 
 
 class SupportResistanceIndicators:
@@ -255,28 +256,17 @@ class SupportResistanceIndicators:
         recent = candles[-lookback:]
         current_price = candles[-1].close
         
-        # Find local highs and lows
-        highs = []
-        lows = []
-        
-        for i in range(2, len(recent) - 2):
-            # Local high
-            if (recent[i].high > recent[i-1].high and 
-                recent[i].high > recent[i-2].high and
-                recent[i].high > recent[i+1].high and 
-                recent[i].high > recent[i+2].high):
-                highs.append(recent[i].high)
-            
-            # Local low
-            if (recent[i].low < recent[i-1].low and 
-                recent[i].low < recent[i-2].low and
-                recent[i].low < recent[i+1].low and 
-                recent[i].low < recent[i+2].low):
-                lows.append(recent[i].low)
+        # Find local highs and lows (strictly beyond 2 bars on each side)
+        recent_highs = np.fromiter((c.high for c in recent), dtype=np.float64, count=len(recent))
+        recent_lows = np.fromiter((c.low for c in recent), dtype=np.float64, count=len(recent))
+        highs = recent_highs[find_pivots(recent_highs, 2, maxima=True, strict=True)]
+        lows = recent_lows[find_pivots(recent_lows, 2, maxima=False, strict=True)]
         
         # Find nearest support and resistance
-        resistance = min([h for h in highs if h > current_price], default=current_price * 1.05)
-        support = max([l for l in lows if l < current_price], default=current_price * 0.95)
+        above = highs[highs > current_price]
+        below = lows[lows < current_price]
+        resistance = above.min() if len(above) else current_price * 1.05
+        support = below.max() if len(below) else current_price * 0.95
         
         # Signal based on position
         range_sr = resistance - support
@@ -44,6 +44,7 @@ from dataclasses import dataclass
 from src.core.domain.entities import (
     Candle,
     IndicatorResult,
+    candle_column,
     CoreSignalStrength as SignalStrength,
     IndicatorCategory
 )
@@ -76,9 +77,9 @@ class VolatilityIndicators:
         Returns:
             Array of true range values
         """
-        highs = np.array([c.high for c in candles])
-        lows = np.array([c.low for c in candles])
-        closes = np.array([c.close for c in candles])
+        highs = candle_column(candles, "high")
+        lows = candle_column(candles, "low")
+        closes = candle_column(candles, "close")
         
         # Calculate three ranges
         high_low = highs - lows
@@ -198,7 +199,7 @@ class VolatilityIndicators:
         Returns:
             IndicatorResult with upper/lower bands in additional_values
         """
-        closes = np.array([c.close for c in candles])
+        closes = candle_column(candles, "close")
         
         # Calculate bands
         sma = pd.Series(closes).rolling(window=period).mean()
@@ -292,7 +293,7 @@ class VolatilityIndicators:
         Returns:
             VolatilityResult
         """
-        closes = np.array([c.close for c in candles])
+        closes = candle_column(candles, "close")
         
         # Calculate middle line (EMA)
         ema = pd.Series(closes).ewm(span=period, adjust=False).mean()
@@ -381,9 +382,9 @@ class VolatilityIndicators:
         Returns:
             VolatilityResult
         """
-        highs = np.array([c.high for c in candles])
-        lows = np.array([c.low for c in candles])
-        closes = np.array([c.close for c in candles])
+        highs = candle_column(candles, "high")
+        lows = candle_column(candles, "low")
+        closes = candle_column(candles, "close")
         
         # Calculate channels
         upper_channel = pd.Series(highs).rolling(window=period).max()
@@ -471,7 +472,7 @@ class VolatilityIndicators:
         Returns:
             VolatilityResult
         """
-        closes = np.array([c.close for c in candles])
+        closes = candle_column(candles, "close")
         
         # Calculate rolling standard deviation
         std = pd.Series(closes).rolling(window=period).std()
@@ -549,7 +550,7 @@ class VolatilityIndicators:
         Returns:
             VolatilityResult
         """
-        closes = np.array([c.close for c in candles])
+        closes = candle_column(candles, "close")
         
         # Calculate log returns
         log_returns = np.log(closes[1:] / closes[:-1])
@@ -653,7 +654,7 @@ class VolatilityIndicators:
             VolatilityResult
         """
         tr = VolatilityIndicators.true_range(candles)
-        closes = np.array([c.close for c in candles])
+        closes = candle_column(candles, "close")
         
         # Calculate ATR
         atr = pd.Series(tr).ewm(span=period, adjust=False).mean()
@@ -728,8 +729,8 @@ class VolatilityIndicators:
         Returns:
             VolatilityResult
         """
-        highs = np.array([c.high for c in candles])
-        lows = np.array([c.low for c in candles])
+        highs = candle_column(candles, "high")
+        lows = candle_column(candles, "low")
         
         # Calculate High-Low range
         hl_range = highs - lows
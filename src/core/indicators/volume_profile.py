@@ -0,0 +1,380 @@
+"""
+Volume-Profile Support/Resistance Levels
+
+A price-binned histogram of traded volume and touches (bar highs and
+lows) that is updated bar by bar, and the support/resistance levels read
+from it.
+
+- Bins are logarithmic (bin_pct wide), so a bin covers the same relative
+  move at any price. A bar's volume is spread evenly over the bins
+  between its low and high; its high and low bins get one touch each.
+- With a window, the oldest bar is subtracted when a new one arrives, so
+  the histogram always describes the last window bars.
+- Levels are volume nodes (histogram peaks) and bins with many touches,
+  merged into clusters no wider than cluster_tolerance_pct.
+  They are rebuilt from the histogram (O(bins)) only when it changed, and
+  kept sorted by price so nearest-support/resistance lookups are a binary
+  search.
+
+LevelEngine keeps one profile per (symbol, timeframe, window) and syncs
+it with the candles of each call: only bars newer than the last one seen
+are added, and the profile is rebuilt when the history does not line up.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.patterns.pivots import find_pivots
+
+
+@dataclass(frozen=True)
+class PriceLevel:
+    """A support/resistance level (a cluster of histogram bins)"""
+    price: float  # Volume-weighted centre of the cluster
+    lower: float  # Lower edge of the lowest bin
+    upper: float  # Upper edge of the highest bin
+    volume: float
+    touches: int
+    strength: float  # Share of the profile's volume [0, 1]
+
+
+class VolumeProfile:
+    """
+    Incremental price-binned volume/touch histogram
+
+    Args:
+        bin_pct: Bin width in percent of price
+        cluster_tolerance_pct: Width of a level cluster, and of the
+            neighbourhood a volume node is the peak of (percent)
+        window: Keep only the last window bars (None = all bars)
+        volume_factor: A volume node holds more than volume_factor times
+            the mean volume of the traded bins
+        touch_factor: A bin is a touch level above touch_factor times the
+            mean touches of the touched bins (and at least min_touches)
+        min_touches: Minimum touches of a touch level
+    """
+
+    GROWTH_PAD = 64  # Extra bins allocated on each side when the range grows
+
+    def __init__(
+        self,
+        bin_pct: float = 0.2,
+        cluster_tolerance_pct: float = 0.5,
+        window: Optional[int] = None,
+        volume_factor: float = 1.5,
+        touch_factor: float = 1.5,
+        min_touches: int = 2
+    ):
+        if bin_pct <= 0:
+            raise ValueError(f"bin_pct must be > 0, got {bin_pct}")
+        if cluster_tolerance_pct < 0:
+            raise ValueError(f"cluster_tolerance_pct must be >= 0, got {cluster_tolerance_pct}")
+        if window is not None and window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+
+        self.bin_pct = bin_pct
+        self.cluster_tolerance_pct = cluster_tolerance_pct
+        self.window = window
+        self.volume_factor = volume_factor
+        self.touch_factor = touch_factor
+        self.min_touches = min_touches
+
+        self._log_step = math.log1p(bin_pct / 100)
+        self._tolerance_bins = max(1, round(cluster_tolerance_pct / bin_pct))
+        self._offset = 0  # Bin index of _volume[0]
+        self._volume = np.zeros(0, dtype=np.float64)
+        self._touches = np.zeros(0, dtype=np.int64)
+        # (candle, low bin, high bin, volume per bin) of every bar held
+        self._bars: Deque[Tuple[Any, int, int, float]] = deque()
+
+        self._dirty = True
+        self._levels: List[PriceLevel] = []
+        self._prices: List[float] = []
+
+    # ─── Histogram ───────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self._bars)
+
+    @property
+    def bars(self) -> Deque[Tuple[Any, int, int, float]]:
+        """Bars in the profile, oldest first (read-only view)"""
+        return self._bars
+
+    def bin_index(self, price: float) -> int:
+        """Histogram bin that contains price"""
+        return math.floor(math.log(price) / self._log_step)
+
+    def bin_bounds(self, index: int) -> Tuple[float, float]:
+        """(lower, upper) price edges of a bin"""
+        return math.exp(index * self._log_step), math.exp((index + 1) * self._log_step)
+
+    def histogram(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(bin lower edges, volume, touches) of the traded range"""
+        active = np.flatnonzero((self._volume > self._volume_floor()) | (self._touches > 0))
+        if len(active) == 0:
+            return np.empty(0), np.empty(0), np.empty(0, dtype=np.int64)
+        span = slice(active[0], active[-1] + 1)
+        indices = np.arange(span.start, span.stop) + self._offset
+        return np.exp(indices * self._log_step), self._volume[span].copy(), self._touches[span].copy()
+
+    def _volume_floor(self) -> float:
+        # Add/subtract round-off left in bins whose bars were all evicted
+        return 1e-9 * max(float(self._volume.max(initial=0.0)), 1.0)
+
+    def _ensure(self, low_bin: int, high_bin: int):
+        """Grow the arrays to cover [low_bin, high_bin]"""
+        start, stop = self._offset, self._offset + len(self._volume)
+        if len(self._volume) and low_bin >= start and high_bin < stop:
+            return
+        if len(self._volume) == 0:
+            start, stop = low_bin, low_bin
+        new_start = min(start, low_bin - self.GROWTH_PAD)
+        new_stop = max(stop, high_bin + 1 + self.GROWTH_PAD)
+        volume = np.zeros(new_stop - new_start, dtype=np.float64)
+        touches = np.zeros(new_stop - new_start, dtype=np.int64)
+        shift = start - new_start
+        volume[shift:shift + len(self._volume)] = self._volume
+        touches[shift:shift + len(self._touches)] = self._touches
+        self._volume, self._touches, self._offset = volume, touches, new_start
+
+    def _bar_bins(self, candle) -> Optional[Tuple[int, int, float]]:
+        low, high = float(candle.low), float(candle.high)
+        if not (low > 0 and high >= low) or not math.isfinite(high):
+            return None
+        low_bin, high_bin = self.bin_index(low), self.bin_index(high)
+        return low_bin, high_bin, float(candle.volume) / (high_bin - low_bin + 1)
+
+    def _apply(self, low_bin: int, high_bin: int, share: float, sign: int):
+        lo, hi = low_bin - self._offset, high_bin - self._offset
+        self._volume[lo:hi + 1] += sign * share
+        self._touches[lo] += sign
+        if hi != lo:
+            self._touches[hi] += sign
+
+    def update(self, candle) -> None:
+        """Add one bar (evicting the oldest one beyond the window)"""
+        bins = self._bar_bins(candle)
+        if bins is None:
+            return
+        low_bin, high_bin, share = bins
+        self._ensure(low_bin, high_bin)
+        self._apply(low_bin, high_bin, share, 1)
+        self._bars.append((candle, low_bin, high_bin, share))
+        if self.window is not None and len(self._bars) > self.window:
+            self.pop_oldest()
+        self._dirty = True
+
+    def pop_oldest(self) -> None:
+        """Remove the oldest bar"""
+        _, low_bin, high_bin, share = self._bars.popleft()
+        self._apply(low_bin, high_bin, share, -1)
+        self._dirty = True
+
+    def pop_latest(self) -> None:
+        """Remove the newest bar (e.g. to replace a still-forming candle)"""
+        _, low_bin, high_bin, share = self._bars.pop()
+        self._apply(low_bin, high_bin, share, -1)
+        self._dirty = True
+
+    def rebuild(self, candles: Sequence) -> None:
+        """Replace the contents with candles (the last window of them)"""
+        if self.window is not None:
+            candles = candles[-self.window:]
+        bars = [(c, bins) for c in candles if (bins := self._bar_bins(c)) is not None]
+
+        self._bars = deque((c, lo, hi, share) for c, (lo, hi, share) in bars)
+        self._dirty = True
+        if not bars:
+            self._offset = 0
+            self._volume = np.zeros(0, dtype=np.float64)
+            self._touches = np.zeros(0, dtype=np.int64)
+            return
+
+        low_bins = np.fromiter((b[1][0] for b in bars), dtype=np.int64, count=len(bars))
+        high_bins = np.fromiter((b[1][1] for b in bars), dtype=np.int64, count=len(bars))
+        shares = np.fromiter((b[1][2] for b in bars), dtype=np.float64, count=len(bars))
+
+        self._offset = int(low_bins.min()) - self.GROWTH_PAD
+        size = int(high_bins.max()) - self._offset + 1 + self.GROWTH_PAD
+        lo, hi = low_bins - self._offset, high_bins - self._offset
+
+        # Each bar adds share to bins lo..hi: difference array + cumsum
+        delta = np.bincount(lo, weights=shares, minlength=size + 1)
+        delta -= np.bincount(hi + 1, weights=shares, minlength=size + 1)
+        self._volume = np.cumsum(delta[:size])
+        self._touches = (
+            np.bincount(lo, minlength=size)
+            + np.bincount(hi[hi != lo], minlength=size)
+        ).astype(np.int64)
+
+    # ─── Levels ──────────────────────────────────────────────
+
+    def levels(self) -> List[PriceLevel]:
+        """Support/resistance levels sorted by price"""
+        if self._dirty:
+            self._build_levels()
+        return self._levels
+
+    def _build_levels(self):
+        self._dirty = False
+        self._levels, self._prices = [], []
+
+        volume = np.where(self._volume > self._volume_floor(), self._volume, 0.0)
+        touches = np.maximum(self._touches, 0)
+        traded = volume > 0
+        touched = touches > 0
+        if not traded.any() and not touched.any():
+            return
+
+        # Volume nodes: peaks of the histogram within the cluster tolerance
+        candidate = np.zeros(len(volume), dtype=bool)
+        if traded.any():
+            peaks = find_pivots(volume, self._tolerance_bins)
+            candidate[peaks] = volume[peaks] > self.volume_factor * volume[traded].mean()
+        if touched.any():
+            touch_threshold = max(self.min_touches, self.touch_factor * touches[touched].mean())
+            candidate |= touches >= touch_threshold
+        bins = np.flatnonzero(candidate)
+        if len(bins) == 0:
+            return
+
+        # A cluster spans at most the tolerance from its lowest bin
+        starts = [0]
+        for k in range(1, len(bins)):
+            if bins[k] - bins[starts[-1]] > self._tolerance_bins:
+                starts.append(k)
+        starts = np.array(starts)
+        ends = np.append(starts[1:], len(bins)) - 1
+
+        centres = np.exp((bins + self._offset + 0.5) * self._log_step)
+        bin_volume = volume[bins]
+        weights = np.where(bin_volume > 0, bin_volume, 1e-12)
+        cluster_volume = np.add.reduceat(bin_volume, starts)
+        cluster_price = np.add.reduceat(centres * weights, starts) / np.add.reduceat(weights, starts)
+        cluster_touches = np.add.reduceat(touches[bins], starts)
+        total = volume.sum()
+
+        for k in range(len(starts)):
+            lower, _ = self.bin_bounds(int(bins[starts[k]]) + self._offset)
+            _, upper = self.bin_bounds(int(bins[ends[k]]) + self._offset)
+            self._levels.append(PriceLevel(
+                price=float(cluster_price[k]),
+                lower=lower,
+                upper=upper,
+                volume=float(cluster_volume[k]),
+                touches=int(cluster_touches[k]),
+                strength=float(cluster_volume[k] / total) if total > 0 else 0.0,
+            ))
+        self._prices = [level.price for level in self._levels]
+
+    def nearest_support(self, price: float) -> Optional[PriceLevel]:
+        """Highest level below price"""
+        levels = self.levels()
+        i = bisect_left(self._prices, price)
+        return levels[i - 1] if i > 0 else None
+
+    def nearest_resistance(self, price: float) -> Optional[PriceLevel]:
+        """Lowest level above price"""
+        levels = self.levels()
+        i = bisect_right(self._prices, price)
+        return levels[i] if i < len(levels) else None
+
+    def levels_between(self, low: float, high: float) -> List[PriceLevel]:
+        """Levels with low <= price <= high"""
+        levels = self.levels()
+        return levels[bisect_left(self._prices, low):bisect_right(self._prices, high)]
+
+
+class LevelEngine:
+    """
+    Volume profiles per (symbol, timeframe, window), synced incrementally
+
+    Args:
+        max_profiles: Profiles kept (least recently used are dropped)
+        **profile_options: VolumeProfile arguments (bin_pct, ...)
+    """
+
+    def __init__(self, max_profiles: int = 256, **profile_options):
+        self.max_profiles = max_profiles
+        self.profile_options = profile_options
+        self._profiles: "OrderedDict[Hashable, VolumeProfile]" = OrderedDict()
+        self.rebuilds = 0
+        self.incremental_updates = 0
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def profile(self, symbol: str, timeframe: str, window: Optional[int]) -> VolumeProfile:
+        """The profile of a series (created empty when missing)"""
+        key = (symbol, timeframe, window)
+        profile = self._profiles.get(key)
+        if profile is None:
+            profile = VolumeProfile(window=window, **self.profile_options)
+            self._profiles[key] = profile
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+        else:
+            self._profiles.move_to_end(key)
+        return profile
+
+    def sync(self, candles: Sequence, window: Optional[int] = None) -> VolumeProfile:
+        """
+        Profile of the last window candles (window=None: len(candles))
+
+        Bars newer than the profile's last bar are added and a revised
+        last bar (a still-forming candle) is replaced. The profile is
+        rebuilt when its last bar is not in candles, or when the oldest
+        bar it would keep differs from the window's first candle.
+        """
+        window = window or len(candles)
+        if not candles:
+            return VolumeProfile(window=window, **self.profile_options)
+        last = candles[-1]
+        profile = self.profile(
+            getattr(last, "symbol", "UNKNOWN"), getattr(last, "timeframe", "1h"), window
+        )
+        if not self._advance(profile, candles):
+            profile.rebuild(candles)
+            self.rebuilds += 1
+        return profile
+
+    def _advance(self, profile: VolumeProfile, candles: Sequence) -> bool:
+        """Bring profile up to date incrementally; False when it cannot"""
+        bars = profile.bars
+        if not bars:
+            return False
+        last_seen = bars[-1][0]
+
+        # New bars are at the end of candles
+        k = 0
+        while k < len(candles) and candles[-1 - k].timestamp > last_seen.timestamp:
+            k += 1
+        if k == len(candles) or candles[-1 - k].timestamp != last_seen.timestamp:
+            return False
+        window = profile.window or len(candles)
+        kept = min(window, len(candles)) - k  # Profile bars still in the window
+        if kept < 1 or kept > len(bars):
+            return False
+        if bars[len(bars) - kept][0] != candles[len(candles) - k - kept]:
+            return False
+
+        if candles[-1 - k] != last_seen:
+            profile.pop_latest()
+            profile.update(candles[-1 - k])
+        for candle in candles[len(candles) - k:]:
+            profile.update(candle)
+        while len(profile) > min(window, len(candles)):
+            profile.pop_oldest()
+        self.incremental_updates += 1
+        return True
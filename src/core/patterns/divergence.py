@@ -37,6 +37,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from src.core.domain.entities import Candle
+from src.core.patterns.pivots import pivot_points
 
 
 class DivergenceType(Enum):
@@ -213,26 +214,12 @@ class DivergenceDetector:
             is_high: True برای High (قله)، False برای Low (دره)
             window: تعداد نقاط قبل و بعد برای مقایسه
         """
-        swings = []
-        
-        for i in range(window, len(values) - window):
-            current = values[i]
-            
-            if is_high:
-                # بررسی قله: باید از همه نقاط قبل و بعد بیشتر باشد
-                is_swing = all(current >= values[j] for j in range(i - window, i + window + 1) if j != i)
-            else:
-                # بررسی دره: باید از همه نقاط قبل و بعد کمتر باشد
-                is_swing = all(current <= values[j] for j in range(i - window, i + window + 1) if j != i)
-            
-            if is_swing:
-                swings.append(SwingPoint(
-                    index=i,
-                    value=current,
-                    is_high=is_high
-                ))
-        
-        return swings
+        # قله: بزرگ‌تر یا مساوی همه نقاط قبل و بعد؛ دره: کوچک‌تر یا مساوی
+        values = np.asarray(values, dtype=np.float64)
+        return [
+            SwingPoint(index=i, value=value, is_high=is_high)
+            for i, value in pivot_points(values, window, maxima=is_high)
+        ]
     
     def _check_regular_bullish_divergence(
         self,
@@ -0,0 +1,124 @@
+"""
+Sliding-Window Extrema and Pivot Detection
+
+One O(N) rolling max/min kernel (monotonic deque) and the pivot API the
+swing, pivot and support/resistance detectors share.
+
+A pivot high at bar i compares values[i] with the window bars on each
+side: left = max(values[i - window:i]), right = max(values[i + 1:i + window + 1]).
+Both come from the same trailing rolling max, so a scan costs O(N)
+whatever the window, instead of O(N * window) neighbour comparisons.
+
+- strict=False: values[i] >= every neighbour (ties are all pivots)
+- strict=True:  values[i] >  every neighbour (flat tops are not pivots)
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+from numba import njit
+
+ArrayLike = Union[np.ndarray, Sequence[float]]
+
+
+@njit(cache=True)
+def rolling_extreme(values: np.ndarray, window: int, maxima: bool) -> np.ndarray:
+    """
+    Trailing rolling max (or min) over values[i - window + 1:i + 1]
+
+    The first window - 1 bars use the shorter prefix. The deque holds
+    indices whose values decrease (max) or increase (min), so each index
+    is pushed and popped at most once.
+    """
+    n = len(values)
+    result = np.empty(n, dtype=np.float64)
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        value = values[i]
+        if maxima:
+            while tail > head and values[deque[tail - 1]] <= value:
+                tail -= 1
+        else:
+            while tail > head and values[deque[tail - 1]] >= value:
+                tail -= 1
+        deque[tail] = i
+        tail += 1
+        if deque[head] <= i - window:
+            head += 1
+        result[i] = values[deque[head]]
+    return result
+
+
+def rolling_max(values: ArrayLike, window: int) -> np.ndarray:
+    """Trailing rolling maximum (partial windows at the start)"""
+    return rolling_extreme(np.asarray(values, dtype=np.float64), window, True)
+
+
+def rolling_min(values: ArrayLike, window: int) -> np.ndarray:
+    """Trailing rolling minimum (partial windows at the start)"""
+    return rolling_extreme(np.asarray(values, dtype=np.float64), window, False)
+
+
+def find_pivots(
+    values: ArrayLike,
+    window: int,
+    maxima: bool = True,
+    strict: bool = False
+) -> np.ndarray:
+    """
+    Indices of pivot highs (maxima) or pivot lows
+
+    Only bars with window bars on both sides are candidates
+    (window <= i < n - window), as in the neighbour loops this replaces.
+
+    Args:
+        values: Price or indicator series
+        window: Bars compared on each side
+        maxima: True for pivot highs, False for pivot lows
+        strict: Require a strict extreme (see module docstring)
+
+    Returns:
+        Ascending int64 bar indices
+    """
+    if window < 1:
+        raise ValueError(f"window must be >= 1, got {window}")
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if n < 2 * window + 1:
+        return np.empty(0, dtype=np.int64)
+
+    trailing = rolling_extreme(values, window, maxima)
+    center = values[window:n - window]
+    left = trailing[window - 1:n - window - 1]
+    right = trailing[2 * window:]
+
+    if maxima:
+        mask = (center > left) & (center > right) if strict else (center >= left) & (center >= right)
+    else:
+        mask = (center < left) & (center < right) if strict else (center <= left) & (center <= right)
+
+    # A NaN anywhere in the window fails the comparison, as in a neighbour loop
+    missing = np.isnan(values)
+    if missing.any():
+        counts = np.concatenate(([0], np.cumsum(missing)))
+        mask &= counts[2 * window + 1:] == counts[:n - 2 * window]
+    return np.flatnonzero(mask) + window
+
+
+def pivot_points(
+    values: ArrayLike,
+    window: int,
+    maxima: bool = True,
+    strict: bool = False
+) -> List[Tuple[int, float]]:
+    """find_pivots as a list of (index, value) tuples"""
+    values = np.asarray(values, dtype=np.float64)
+    indices = find_pivots(values, window, maxima, strict)
+    return list(zip(indices.tolist(), values[indices].tolist()))
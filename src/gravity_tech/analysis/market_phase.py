@@ -23,11 +23,13 @@ License: MIT
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 from enum import Enum
 
 from gravity_tech.models.schemas import Candle, SignalStrength
+from gravity_tech.patterns.pivots import find_pivots, pivot_points
 from gravity_tech.indicators.trend import TrendIndicators
 from gravity_tech.indicators.momentum import MomentumIndicators
 from gravity_tech.indicators.volume import VolumeIndicators
@@ -76,22 +78,13 @@ class MarketPhaseAnalysis:
             return {"structure": "insufficient_data"}
         
         # Find recent swing highs and lows
-        highs = [c.high for c in candles]
-        lows = [c.low for c in candles]
-        
-        # Find local peaks and troughs
-        swing_highs = []
-        swing_lows = []
+        highs = np.fromiter((c.high for c in candles), dtype=np.float64, count=len(candles))
+        lows = np.fromiter((c.low for c in candles), dtype=np.float64, count=len(candles))
         
+        # Find local peaks and troughs (>= / <= every bar within 5 bars)
         window = 5
-        for i in range(window, len(candles) - window):
-            # Check for swing high
-            if all(highs[i] >= highs[j] for j in range(i-window, i+window+1) if j != i):
-                swing_highs.append((i, highs[i]))
-            
-            # Check for swing low
-            if all(lows[i] <= lows[j] for j in range(i-window, i+window+1) if j != i):
-                swing_lows.append((i, lows[i]))
+        swing_highs = pivot_points(highs, window, maxima=True)
+        swing_lows = pivot_points(lows, window, maxima=False)
         
         # Analyze trend structure
         if len(swing_highs) >= 2 and len(swing_lows) >= 2:
@@ -406,6 +399,210 @@ class MarketPhaseAnalysis:
         
         return phase, strength, detailed_analysis
     
+    @staticmethod
+    def trend_structure_series(highs: np.ndarray, lows: np.ndarray, window: int = 5) -> np.ndarray:
+        """
+        identify_trend_structure()["structure"] at every bar
+        
+        A swing at bar j needs window bars after it and never changes once
+        confirmed, so bar t sees exactly the swings at j <= t - window.
+        
+        Args:
+            highs: High prices
+            lows: Low prices
+            window: Bars compared on each side of a swing
+            
+        Returns:
+            Array of structure labels (object dtype)
+        """
+        bars = np.arange(len(highs))
+        swing = {}
+        for name, values, maxima in (("high", highs, True), ("low", lows, False)):
+            indices = find_pivots(values, window, maxima=maxima)
+            prices = values[indices]
+            count = np.searchsorted(indices, bars - window, side="right")
+            
+            # Rising / falling over the last min(3, k) swings, indexed by swing count k
+            rising = np.zeros(len(indices) + 1, dtype=bool)
+            falling = np.zeros(len(indices) + 1, dtype=bool)
+            if len(indices) >= 2:
+                up = prices[1:] > prices[:-1]
+                down = prices[1:] < prices[:-1]
+                rising[2], falling[2] = up[0], down[0]
+                rising[3:] = up[1:] & up[:-1]
+                falling[3:] = down[1:] & down[:-1]
+            swing[name] = (count, rising[count], falling[count])
+        
+        high_count, higher_highs, lower_highs = swing["high"]
+        low_count, higher_lows, lower_lows = swing["low"]
+        enough = (high_count >= 2) & (low_count >= 2)
+        return np.select(
+            [~enough, higher_highs & higher_lows, lower_highs & lower_lows,
+             higher_highs & lower_lows, lower_highs & higher_lows],
+            ["insufficient_swings", "uptrend", "downtrend", "expansion", "contraction"],
+            default="mixed"
+        ).astype(object)
+    
+    @staticmethod
+    def volume_behavior_series(closes: np.ndarray, volumes: np.ndarray, period: int = 20) -> Dict[str, np.ndarray]:
+        """
+        analyze_volume_behavior() at every bar with at least period bars
+        
+        Returns:
+            Dictionary of arrays: avg_up_volume, avg_down_volume,
+            volume_trend (object) - NaN / None before bar period - 1
+        """
+        n = len(closes)
+        avg_up = np.full(n, np.nan)
+        avg_down = np.full(n, np.nan)
+        volume_trend = np.full(n, None, dtype=object)
+        if n < period:
+            return {"avg_up_volume": avg_up, "avg_down_volume": avg_down, "volume_trend": volume_trend}
+        
+        up = np.zeros(n, dtype=bool)
+        down = np.zeros(n, dtype=bool)
+        up[1:] = closes[1:] > closes[:-1]
+        down[1:] = closes[1:] < closes[:-1]
+        
+        # Row r is the window of bars r .. r + period - 1; its up/down days
+        # compare each bar with the previous bar of the same window
+        windows = sliding_window_view(volumes, period)
+        pair_volumes = windows[:, 1:]
+        for flags, target in ((up, avg_up), (down, avg_down)):
+            mask = sliding_window_view(flags, period)[:, 1:]
+            count = mask.sum(axis=1)
+            total = np.where(mask, pair_volumes, 0.0).sum(axis=1)
+            target[period - 1:] = np.divide(total, count, out=np.zeros(len(count)), where=count > 0)
+        
+        first_half = windows[:, :period // 2].mean(axis=1)
+        second_half = windows[:, period // 2:].mean(axis=1)
+        volume_trend[period - 1:] = np.select(
+            [second_half > first_half * 1.1, second_half < first_half * 0.9],
+            ["increasing", "decreasing"],
+            default="stable"
+        )
+        return {"avg_up_volume": avg_up, "avg_down_volume": avg_down, "volume_trend": volume_trend}
+    
+    def identify_phase_series(self, candles: List[Candle]) -> pd.DataFrame:
+        """
+        identify_phase() for every prefix of the candles in one pass
+        
+        Row t equals identify_phase(candles[:t + 1]): swing structure,
+        volume behaviour, momentum, moving averages and RSI are all
+        computed once as causal rolling series instead of once per bar.
+        
+        Args:
+            candles: List of candles
+            
+        Returns:
+            DataFrame with one row per candle: timestamp, phase, strength,
+            trend_structure, volume_trend, the four Dow-theory scores and
+            overall_score (scores are NaN before bar 50)
+        """
+        n = len(candles)
+        closes = np.fromiter((c.close for c in candles), dtype=np.float64, count=n)
+        highs = np.fromiter((c.high for c in candles), dtype=np.float64, count=n)
+        lows = np.fromiter((c.low for c in candles), dtype=np.float64, count=n)
+        volumes = np.fromiter((c.volume for c in candles), dtype=np.float64, count=n)
+        bars = np.arange(n)
+        
+        structure = self.trend_structure_series(highs, lows)
+        volume = self.volume_behavior_series(closes, volumes, period=20)
+        volume_trend = volume["volume_trend"]
+        
+        # Same rolling computations as TrendIndicators.sma / MomentumIndicators.rsi
+        close_series = pd.Series(closes)
+        sma_20 = close_series.rolling(window=20).mean().to_numpy()
+        sma_50 = close_series.rolling(window=50).mean().to_numpy()
+        delta = close_series.diff()
+        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+        rsi = (100 - (100 / (1 + gain / loss))).to_numpy()
+        
+        def change_pct(period: int) -> np.ndarray:
+            past = np.full(n, np.nan)
+            if n >= period:
+                past[period - 1:] = closes[:n - period + 1]
+            return ((closes - past) / past) * 100
+        
+        change_20 = change_pct(20)
+        long_term_change = change_pct(100)
+        
+        # Scores
+        trend_score = np.select([structure == "uptrend", structure == "downtrend"], [80, 20], default=50)
+        up_dominance = volume["avg_up_volume"] > volume["avg_down_volume"] * 1.2
+        down_dominance = volume["avg_down_volume"] > volume["avg_up_volume"] * 1.2
+        volume_score = np.select([up_dominance, down_dominance], [70, 30], default=50)
+        momentum_score = np.select(
+            [change_20 > 5, change_20 > 2, change_20 < -5, change_20 < -2],
+            [80, 65, 20, 35],
+            default=50
+        )
+        price_position_score = (
+            50 + np.where(closes > sma_50, 20, -20) + np.where(closes > sma_20, 10, -10)
+        )
+        overall = (trend_score + volume_score + momentum_score + price_position_score) / 4
+        
+        # Phase branches in the order identify_phase tries them
+        markup = (structure == "uptrend") & (overall > 60) & (momentum_score > 60)
+        markdown = ~markup & (structure == "downtrend") & (overall < 40) & (momentum_score < 40)
+        accumulation_branch = (
+            ~markup & ~markdown
+            & np.isin(structure, ["contraction", "mixed"])
+            & (overall >= 40) & (overall <= 60)
+            & (volume_trend != "increasing")
+        )
+        distribution_branch = (
+            ~markup & ~markdown & ~accumulation_branch
+            & np.isin(structure, ["contraction", "mixed", "expansion"])
+            & (overall > 50) & (momentum_score < 60)
+        )
+        has_history = bars >= 99
+        accumulation = accumulation_branch & has_history & (long_term_change < 0)
+        distribution = distribution_branch & has_history & (long_term_change > 0)
+        
+        phase = np.select(
+            [markup, markdown, accumulation, distribution],
+            [MarketPhase.MARKUP.value, MarketPhase.MARKDOWN.value,
+             MarketPhase.ACCUMULATION.value, MarketPhase.DISTRIBUTION.value],
+            default=MarketPhase.TRANSITION.value
+        ).astype(object)
+        strength = np.select(
+            [markup & (overall > 75), markup & (overall > 65),
+             markdown & (overall < 25), markdown & (overall < 35),
+             accumulation & (volume_score > 50) & (rsi < 50) & (volume_trend == "stable"),
+             distribution & (volume_trend == "increasing") & (rsi > 50) & (momentum_score < 55)],
+            [PhaseStrength.VERY_STRONG.value, PhaseStrength.STRONG.value,
+             PhaseStrength.VERY_STRONG.value, PhaseStrength.STRONG.value,
+             PhaseStrength.STRONG.value, PhaseStrength.STRONG.value],
+            default=PhaseStrength.MODERATE.value
+        ).astype(object)
+        
+        # identify_phase needs 50 candles
+        warmup = bars < 49
+        phase[warmup] = MarketPhase.TRANSITION.value
+        strength[warmup] = PhaseStrength.WEAK.value
+        scores = {
+            "trend_score": trend_score,
+            "volume_score": volume_score,
+            "momentum_score": momentum_score,
+            "price_position_score": price_position_score,
+            "overall_score": overall,
+        }
+        scores = {name: np.where(warmup, np.nan, values).astype(float) for name, values in scores.items()}
+        structure[warmup] = None
+        volume_trend = volume_trend.copy()
+        volume_trend[warmup] = None
+        
+        return pd.DataFrame({
+            "timestamp": [c.timestamp for c in candles],
+            "phase": phase,
+            "strength": strength,
+            "trend_structure": structure,
+            "volume_trend": volume_trend,
+            **scores,
+        })
+    
     def generate_analysis_report(self, candles: List[Candle]) -> Dict:
         """
         Generate comprehensive market phase analysis report
@@ -504,3 +701,18 @@ def analyze_market_phase(candles: List[Candle]) -> Dict:
     """
     analyzer = MarketPhaseAnalysis()
     return analyzer.generate_analysis_report(candles)
+
+
+def analyze_market_phase_series(candles: List[Candle]) -> pd.DataFrame:
+    """
+    Market phase, phase strength and Dow-theory scores at every bar
+    
+    One-pass equivalent of calling analyze_market_phase on every prefix.
+    
+    Args:
+        candles: List of candles
+        
+    Returns:
+        DataFrame with one row per candle (see identify_phase_series)
+    """
+    return MarketPhaseAnalysis().identify_phase_series(candles)
@@ -10,21 +10,34 @@ Version: 1.0.0
 License: MIT
 """
 
-from typing import List, Dict, Any, Tuple, Optional
-from datetime import datetime
+from typing import AsyncIterator, List, Dict, Any, Sequence, Tuple, Optional, Union
+from datetime import datetime, timedelta
+from concurrent.futures import Executor
+from functools import partial
+from operator import attrgetter
+import asyncio
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import structlog
 
 from gravity_tech.models.schemas import Candle, IndicatorResult, SignalStrength
 from gravity_tech.indicators.trend import TrendIndicators
 from gravity_tech.indicators.momentum import MomentumIndicators
 from gravity_tech.indicators.volume import VolumeIndicators
-from gravity_tech.patterns.classical import detect_classical_patterns
+from gravity_tech.patterns.classical import ClassicalPatterns
 from gravity_tech.clients.data_service_client import DataServiceClient, CandleData
+from gravity_tech.analysis.scenario_simulation import (
+    MonteCarloSimulator,
+    ScenarioOutcome,
+    SimulationConfig,
+    SimulationSummary,
+)
 
 logger = structlog.get_logger()
 
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+PATTERN_WINDOW = 100  # کندل‌های آخر برای الگوهای کلاسیک
+
 
 @dataclass
 class ScenarioResult:
@@ -58,6 +71,8 @@ class ThreeScenarioAnalysis:
     
     recommended_scenario: str
     overall_confidence: str
+    
+    simulation: Optional[SimulationSummary] = None  # فقط در حالت شبیه‌سازی
 
 
 class ScenarioAnalyzer:
@@ -73,6 +88,11 @@ class ScenarioAnalyzer:
     - دریافت داده از Data Service Microservice
     - پردازش داده‌های تعدیل‌شده (adjusted prices/volumes)
     - محاسبه سناریوها بر اساس داده‌های clean
+    
+    Simulation Mode:
+    - با SimulationConfig، احتمال، هدف و حد ضرر هر سناریو و بازده/ریسک
+      مورد انتظار از توزیع مسیرهای مونت‌کارلو خوانده می‌شوند
+    - امتیاز، سیگنال‌ها و توصیه‌ها همچنان از تحلیل تکنیکال می‌آیند
     """
     
     def __init__(self, data_service_client: Optional[DataServiceClient] = None):
@@ -91,7 +111,8 @@ class ScenarioAnalyzer:
         self,
         symbol: str,
         timeframe: str = "1d",
-        lookback_days: int = 365
+        lookback_days: int = 365,
+        simulation: Optional[SimulationConfig] = None
     ) -> ThreeScenarioAnalysis:
         """
         تحلیل سه‌سناریویی با دریافت داده از Data Service
@@ -100,6 +121,7 @@ class ScenarioAnalyzer:
             symbol: نماد (مثل "AAPL", "فولاد")
             timeframe: بازه زمانی (1d, 1h, etc.)
             lookback_days: تعداد روزهای گذشته
+            simulation: تنظیمات شبیه‌سازی مونت‌کارلو (اختیاری)
         
         Returns:
             ThreeScenarioAnalysis
@@ -117,8 +139,85 @@ class ScenarioAnalyzer:
             lookback_days=lookback_days
         )
         
-        # دریافت داده از Data Service
-        from datetime import timedelta
+        # دریافت داده از Data Service و تبدیل مستقیم به آرایه
+        arrays = await self._fetch_arrays(symbol, timeframe, lookback_days)
+        
+        logger.info(
+            "data_received_for_scenario_analysis",
+            symbol=symbol,
+            candles_count=len(arrays["close"]),
+            current_price=float(arrays["close"][-1])
+        )
+        
+        # تحلیل سناریوها
+        return self.analyze_arrays(symbol, arrays, simulation=simulation)
+    
+    async def analyze_many_from_service(
+        self,
+        symbols: Sequence[str],
+        timeframe: str = "1d",
+        lookback_days: int = 365,
+        simulation: Optional[SimulationConfig] = None,
+        max_concurrency: int = 8,
+        executor: Optional[Executor] = None
+    ) -> AsyncIterator[Tuple[str, Union[ThreeScenarioAnalysis, Exception]]]:
+        """
+        تحلیل سه‌سناریویی چند نماد، به ترتیب اتمام
+        
+        حداکثر max_concurrency درخواست هم‌زمان به Data Service ارسال می‌شود
+        و تحلیل هر نماد روی executor (یا executor پیش‌فرض loop) اجرا می‌شود،
+        پس نتیجه نمادهای سریع قبل از کندترین‌ها برمی‌گردد.
+        
+        Args:
+            symbols: نمادها
+            timeframe: بازه زمانی
+            lookback_days: تعداد روزهای گذشته
+            simulation: تنظیمات شبیه‌سازی مونت‌کارلو (اختیاری)
+            max_concurrency: سقف دریافت هم‌زمان داده
+            executor: worker pool تحلیل‌ها
+        
+        Yields:
+            (symbol, ThreeScenarioAnalysis) یا (symbol, Exception) برای نماد ناموفق
+        """
+        if not self.data_client:
+            raise ValueError("Data service client not configured. Use analyze() with candles instead.")
+        
+        loop = asyncio.get_running_loop()
+        fetch_slots = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def run(symbol: str):
+            try:
+                async with fetch_slots:
+                    arrays = await self._fetch_arrays(symbol, timeframe, lookback_days)
+                analysis = await loop.run_in_executor(
+                    executor, partial(self.analyze_arrays, symbol, arrays, simulation=simulation)
+                )
+                return symbol, analysis
+            except Exception as e:
+                logger.warning(
+                    "batch_scenario_symbol_failed",
+                    symbol=symbol,
+                    error=str(e),
+                    error_type=type(e).__name__
+                )
+                return symbol, e
+        
+        tasks = [asyncio.ensure_future(run(symbol)) for symbol in dict.fromkeys(symbols)]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            # مصرف‌کننده زودتر متوقف شد (مثلاً قطع اتصال): کارهای باقی‌مانده لغو شوند
+            for task in tasks:
+                task.cancel()
+    
+    async def _fetch_arrays(
+        self,
+        symbol: str,
+        timeframe: str,
+        lookback_days: int
+    ) -> Dict[str, np.ndarray]:
+        """دریافت کندل‌های adjusted و تبدیل به آرایه‌های OHLCV"""
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=lookback_days)
         
@@ -129,39 +228,50 @@ class ScenarioAnalyzer:
             end_date=end_date,
             use_cache=True
         )
-        
-        # تبدیل CandleData به Candle objects
-        candles = [self._convert_to_candle(c) for c in candle_data]
-        
-        current_price = candles[-1].close
-        
-        logger.info(
-            "data_received_for_scenario_analysis",
-            symbol=symbol,
-            candles_count=len(candles),
-            current_price=current_price
-        )
-        
-        # تحلیل سناریوها
-        return self.analyze(symbol, candles, current_price)
+        return self._convert_to_arrays(candle_data)
+    
+    @staticmethod
+    def _convert_to_arrays(candle_data: Sequence[CandleData]) -> Dict[str, np.ndarray]:
+        """Convert CandleData from Data Service directly into OHLCV arrays."""
+        count = len(candle_data)
+        arrays = {
+            name: np.fromiter(
+                map(attrgetter(f"adjusted_{name}"), candle_data), dtype=np.float64, count=count
+            )
+            for name in OHLCV_FIELDS
+        }
+        arrays["timestamp"] = np.array([c.timestamp for c in candle_data], dtype=object)
+        return arrays
     
     @staticmethod
-    def _convert_to_candle(candle_data: CandleData) -> Candle:
-        """Convert CandleData from Data Service to internal Candle model."""
-        return Candle(
-            timestamp=candle_data.timestamp,
-            open=candle_data.adjusted_open,
-            high=candle_data.adjusted_high,
-            low=candle_data.adjusted_low,
-            close=candle_data.adjusted_close,
-            volume=candle_data.adjusted_volume
+    def _candles_to_arrays(candles: Sequence[Candle]) -> Dict[str, np.ndarray]:
+        """OHLCV arrays of Candle objects"""
+        count = len(candles)
+        arrays = {
+            name: np.fromiter(map(attrgetter(name), candles), dtype=np.float64, count=count)
+            for name in OHLCV_FIELDS
+        }
+        arrays["timestamp"] = np.array([c.timestamp for c in candles], dtype=object)
+        return arrays
+    
+    @staticmethod
+    def _recent_candles(arrays: Dict[str, np.ndarray], count: int) -> List[Candle]:
+        """Candle objects of the last count bars (for the pattern detectors)"""
+        rows = zip(
+            arrays["timestamp"][-count:].tolist(),
+            *(arrays[name][-count:].tolist() for name in OHLCV_FIELDS)
         )
+        return [
+            Candle(timestamp=t, open=o, high=h, low=l, close=c, volume=v)
+            for t, o, h, l, c, v in rows
+        ]
     
     def analyze(
         self,
         symbol: str,
         candles: List[Candle],
-        current_price: float = None
+        current_price: float = None,
+        simulation: Optional[SimulationConfig] = None
     ) -> ThreeScenarioAnalysis:
         """
         تحلیل سه‌سناریویی کامل
@@ -170,46 +280,105 @@ class ScenarioAnalyzer:
             symbol: نماد
             candles: شمع‌های قیمتی (adjusted)
             current_price: قیمت فعلی (اختیاری)
+            simulation: تنظیمات شبیه‌سازی مونت‌کارلو؛ None = حالت heuristic
+        
+        Returns:
+            ThreeScenarioAnalysis
+        """
+        return self._analyze(
+            symbol,
+            self._candles_to_arrays(candles),
+            candles[-PATTERN_WINDOW:],
+            current_price,
+            simulation
+        )
+    
+    def analyze_arrays(
+        self,
+        symbol: str,
+        arrays: Dict[str, np.ndarray],
+        current_price: float = None,
+        simulation: Optional[SimulationConfig] = None
+    ) -> ThreeScenarioAnalysis:
+        """
+        تحلیل سه‌سناریویی از آرایه‌های OHLCV
+        
+        Args:
+            symbol: نماد
+            arrays: آرایه‌های open/high/low/close/volume و timestamp
+            current_price: قیمت فعلی (اختیاری)
+            simulation: تنظیمات شبیه‌سازی مونت‌کارلو؛ None = حالت heuristic
         
         Returns:
             ThreeScenarioAnalysis
         """
+        return self._analyze(
+            symbol,
+            arrays,
+            self._recent_candles(arrays, PATTERN_WINDOW),
+            current_price,
+            simulation
+        )
+    
+    def _analyze(
+        self,
+        symbol: str,
+        arrays: Dict[str, np.ndarray],
+        recent: List[Candle],
+        current_price: Optional[float],
+        simulation: Optional[SimulationConfig]
+    ) -> ThreeScenarioAnalysis:
+        """تحلیل مشترک؛ recent کندل‌های آخر برای تشخیص الگوها است"""
+        closes = arrays["close"]
         if current_price is None:
-            current_price = candles[-1].close
+            current_price = float(closes[-1])
         
         logger.info(
             "starting_scenario_analysis",
             symbol=symbol,
-            candles_count=len(candles),
+            candles_count=len(closes),
             current_price=current_price
         )
         
         # محاسبه ATR برای target و stop loss
-        atr = self._calculate_atr(candles)
+        atr = self._calculate_atr(arrays["high"], arrays["low"], closes)
         atr_percentage = (atr / current_price) * 100
         
         # تحلیل تکنیکال پایه
-        base_analysis = self._base_technical_analysis(candles)
+        base_analysis = self._base_technical_analysis(arrays, recent)
         
         # سناریو خوشبینانه
         optimistic = self._analyze_optimistic_scenario(
-            candles, current_price, atr_percentage, base_analysis
+            recent, current_price, atr_percentage, base_analysis
         )
         
         # سناریو خنثی
         neutral = self._analyze_neutral_scenario(
-            candles, current_price, atr_percentage, base_analysis
+            recent, current_price, atr_percentage, base_analysis
         )
         
         # سناریو بدبینانه
         pessimistic = self._analyze_pessimistic_scenario(
-            candles, current_price, atr_percentage, base_analysis
+            recent, current_price, atr_percentage, base_analysis
         )
         
-        # محاسبه Expected Value
-        expected_return, expected_risk, sharpe = self._calculate_expected_values(
-            optimistic, neutral, pessimistic
-        )
+        summary = None
+        if simulation is None:
+            # محاسبه Expected Value
+            expected_return, expected_risk, sharpe = self._calculate_expected_values(
+                optimistic, neutral, pessimistic
+            )
+        else:
+            # احتمالات، اهداف و ریسک از توزیع مسیرها
+            outcomes, summary = MonteCarloSimulator(simulation).scenarios(
+                closes, current_price, atr_percentage * simulation.band_atr
+            )
+            optimistic = self._apply_outcome(optimistic, outcomes["optimistic"], current_price)
+            neutral = self._apply_outcome(neutral, outcomes["neutral"], current_price)
+            pessimistic = self._apply_outcome(pessimistic, outcomes["pessimistic"], current_price)
+            expected_return = summary.expected_return
+            expected_risk = summary.expected_risk
+            sharpe = round(expected_return / expected_risk, 2) if expected_risk > 0 else 0
         
         # تعیین سناریوی پیشنهادی
         recommended = self._determine_recommended_scenario(
@@ -232,15 +401,18 @@ class ScenarioAnalyzer:
             expected_risk=expected_risk,
             sharpe_ratio=sharpe,
             recommended_scenario=recommended,
-            overall_confidence=overall_confidence
+            overall_confidence=overall_confidence,
+            simulation=summary
         )
     
-    def _base_technical_analysis(self, candles: List[Candle]) -> Dict[str, Any]:
+    def _base_technical_analysis(
+        self,
+        arrays: Dict[str, np.ndarray],
+        recent: List[Candle]
+    ) -> Dict[str, Any]:
         """تحلیل تکنیکال پایه"""
-        closes = np.array([c.close for c in candles])
-        highs = np.array([c.high for c in candles])
-        lows = np.array([c.low for c in candles])
-        volumes = np.array([c.volume for c in candles])
+        closes = arrays["close"]
+        volumes = arrays["volume"]
         
         # Trend
         sma_20 = np.mean(closes[-20:])
@@ -256,7 +428,7 @@ class ScenarioAnalyzer:
         current_volume = volumes[-1]
         
         # Patterns
-        patterns = detect_classical_patterns(candles[-100:])
+        patterns = ClassicalPatterns.detect_all(recent)
         
         return {
             "sma_20": sma_20,
@@ -404,6 +576,31 @@ class ScenarioAnalyzer:
             timeframe_days=90
         )
     
+    def _apply_outcome(
+        self,
+        result: ScenarioResult,
+        outcome: ScenarioOutcome,
+        current_price: float
+    ) -> ScenarioResult:
+        """جایگزینی احتمال، هدف و حد ضرر سناریو با نتیجه شبیه‌سازی"""
+        risk = current_price - outcome.stop_loss
+        risk_reward = (outcome.target_price - current_price) / risk if risk > 0 else 0.1
+        
+        confidence = result.confidence
+        if result.scenario_type != "neutral":
+            probability = outcome.probability
+            confidence = "HIGH" if probability >= 60 else "MEDIUM" if probability >= 40 else "LOW"
+        
+        return replace(
+            result,
+            probability=outcome.probability,
+            target_price=outcome.target_price,
+            stop_loss=outcome.stop_loss,
+            risk_reward_ratio=round(risk_reward, 2),
+            confidence=confidence,
+            timeframe_days=outcome.steps
+        )
+    
     def _calculate_optimistic_score(self, base: Dict) -> float:
         """محاسبه امتیاز خوشبینانه با وزن‌های بیشتر برای سیگنال‌های مثبت"""
         score = 50.0  # پایه
@@ -609,25 +806,27 @@ class ScenarioAnalyzer:
             return "LOW"
     
     # Helper methods
-    def _calculate_atr(self, candles: List[Candle], period: int = 14) -> float:
+    def _calculate_atr(
+        self,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        period: int = 14
+    ) -> float:
         """محاسبه Average True Range"""
-        if len(candles) < period + 1:
+        if len(closes) < period + 1:
             return 0.0
         
-        true_ranges = []
-        for i in range(1, len(candles)):
-            high = candles[i].high
-            low = candles[i].low
-            prev_close = candles[i-1].close
-            
-            tr = max(
-                high - low,
-                abs(high - prev_close),
-                abs(low - prev_close)
-            )
-            true_ranges.append(tr)
+        # فقط period بازه آخر لازم است
+        high = highs[-period:]
+        low = lows[-period:]
+        prev_close = closes[-period - 1:-1]
+        true_ranges = np.maximum(
+            high - low,
+            np.maximum(np.abs(high - prev_close), np.abs(low - prev_close))
+        )
         
-        return np.mean(true_ranges[-period:])
+        return np.mean(true_ranges)
     
     def _calculate_rsi(self, closes: np.ndarray, period: int = 14) -> float:
         """محاسبه RSI"""
@@ -0,0 +1,220 @@
+"""
+Monte-Carlo Scenario Simulation
+شبیه‌سازی مونت‌کارلو برای تحلیل سه‌سناریویی
+
+Generates forward price paths in vectorized NumPy batches and reads the
+optimistic/neutral/pessimistic scenarios from their distribution:
+
+- gbm:       log returns ~ N(mu, sigma) calibrated on the recent history
+- bootstrap: log returns resampled from the recent history
+
+Paths are generated in chunks whose size follows memory_budget_mb, and
+only three numbers per path are kept (terminal, highest and lowest log
+return), so memory does not grow with n_paths * steps. A seeded run
+gives the same result whatever the chunk size, since the generator
+draws chunk rows in the same order as a single batch.
+
+A path belongs to the optimistic scenario when it ends above +band, to
+the pessimistic one when it ends below -band, and to the neutral one
+otherwise. Each scenario's target and stop are the median highest and
+lowest price of its paths.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+SIMULATION_METHODS = ("gbm", "bootstrap")
+SCENARIOS = ("optimistic", "neutral", "pessimistic")
+TERMINAL_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """تنظیمات شبیه‌سازی مونت‌کارلو"""
+    n_paths: int = 10_000
+    steps: int = 30  # افق شبیه‌سازی (تعداد کندل)
+    method: str = "gbm"  # "gbm" یا "bootstrap"
+    lookback: int = 250  # تعداد بازده‌های تاریخی برای کالیبراسیون
+    seed: Optional[int] = None
+    band_atr: float = 1.5  # مرز سناریوها: ±band_atr × ATR%
+    memory_budget_mb: float = 16.0  # سقف حافظه هر دسته مسیر
+
+    def __post_init__(self):
+        if self.method not in SIMULATION_METHODS:
+            raise ValueError(f"method must be one of {SIMULATION_METHODS}, got {self.method!r}")
+        if self.n_paths < 1 or self.steps < 1:
+            raise ValueError("n_paths and steps must be >= 1")
+        if self.lookback < MonteCarloSimulator.MIN_RETURNS:
+            raise ValueError(f"lookback must be >= {MonteCarloSimulator.MIN_RETURNS}")
+        if self.memory_budget_mb <= 0:
+            raise ValueError("memory_budget_mb must be > 0")
+
+
+@dataclass
+class PathStatistics:
+    """بازده لگاریتمی انتهایی، بیشینه و کمینه هر مسیر"""
+    terminal: np.ndarray
+    highest: np.ndarray
+    lowest: np.ndarray
+
+
+@dataclass
+class ScenarioOutcome:
+    """نتیجه یک سناریو از توزیع مسیرها"""
+    probability: float  # 0-100%
+    target_price: float
+    stop_loss: float
+    steps: int
+
+
+@dataclass
+class SimulationSummary:
+    """خلاصه توزیع بازده مسیرها (درصد)"""
+    method: str
+    n_paths: int
+    steps: int
+    seed: Optional[int]
+    expected_return: float
+    expected_risk: float  # انحراف معیار بازده انتهایی
+    var_95: float  # Value at Risk (زیان، مثبت)
+    cvar_95: float  # Expected Shortfall (زیان، مثبت)
+    terminal_quantiles: Dict[str, float] = field(default_factory=dict)  # قیمت
+
+
+class MonteCarloSimulator:
+    """
+    شبیه‌ساز برداری مسیرهای قیمت
+
+    Args:
+        config: تنظیمات شبیه‌سازی
+    """
+
+    MIN_RETURNS = 20
+
+    def __init__(self, config: Optional[SimulationConfig] = None):
+        self.config = config or SimulationConfig()
+
+    def chunk_size(self, method: Optional[str] = None) -> int:
+        """تعداد مسیر در هر دسته بر اساس سقف حافظه"""
+        method = method or self.config.method
+        # Path matrix (float64), plus the int64 resampling indices for bootstrap
+        bytes_per_path = self.config.steps * (16 if method == "bootstrap" else 8)
+        budget = int(self.config.memory_budget_mb * 1024 * 1024)
+        return max(1, min(self.config.n_paths, budget // bytes_per_path))
+
+    def log_returns(self, closes: Sequence[float]) -> np.ndarray:
+        """بازده‌های لگاریتمی lookback کندل آخر"""
+        closes = np.asarray(closes, dtype=np.float64)[-(self.config.lookback + 1):]
+        if np.any(closes <= 0) or not np.all(np.isfinite(closes)):
+            raise ValueError("closes must be positive and finite")
+        returns = np.diff(np.log(closes))
+        if len(returns) < self.MIN_RETURNS:
+            raise ValueError(
+                f"Monte-Carlo simulation needs at least {self.MIN_RETURNS + 1} closes, got {len(closes)}"
+            )
+        return returns
+
+    def simulate(self, closes: Sequence[float]) -> PathStatistics:
+        """
+        شبیه‌سازی مسیرها به صورت دسته‌ای
+
+        Args:
+            closes: قیمت‌های بسته شدن تاریخی
+
+        Returns:
+            PathStatistics: بازده لگاریتمی هر مسیر نسبت به قیمت فعلی
+        """
+        config = self.config
+        returns = self.log_returns(closes)
+        mu, sigma = returns.mean(), returns.std(ddof=1)
+        rng = np.random.default_rng(config.seed)
+
+        terminal = np.empty(config.n_paths)
+        highest = np.empty(config.n_paths)
+        lowest = np.empty(config.n_paths)
+        chunk = self.chunk_size()
+
+        for start in range(0, config.n_paths, chunk):
+            stop = min(start + chunk, config.n_paths)
+            shape = (stop - start, config.steps)
+            if config.method == "gbm":
+                paths = rng.standard_normal(shape)
+                paths *= sigma
+                paths += mu
+            else:
+                paths = returns[rng.integers(0, len(returns), size=shape)]
+            np.cumsum(paths, axis=1, out=paths)
+
+            terminal[start:stop] = paths[:, -1]
+            # The path starts at the current price (log return 0)
+            np.maximum(paths.max(axis=1), 0.0, out=highest[start:stop])
+            np.minimum(paths.min(axis=1), 0.0, out=lowest[start:stop])
+
+        return PathStatistics(terminal=terminal, highest=highest, lowest=lowest)
+
+    def scenarios(
+        self,
+        closes: Sequence[float],
+        current_price: float,
+        band_pct: float
+    ) -> Tuple[Dict[str, ScenarioOutcome], SimulationSummary]:
+        """
+        سناریوها و خلاصه ریسک از توزیع مسیرها
+
+        Args:
+            closes: قیمت‌های بسته شدن تاریخی
+            current_price: قیمت فعلی
+            band_pct: مرز سناریوها (درصد) حول قیمت فعلی
+
+        Returns:
+            (outcomes, summary): نتیجه هر سناریو و خلاصه توزیع
+        """
+        stats = self.simulate(closes)
+        band = np.log1p(max(band_pct, 0.0) / 100)
+        masks = {
+            "optimistic": stats.terminal >= band,
+            "pessimistic": stats.terminal <= -band,
+        }
+        masks["neutral"] = ~(masks["optimistic"] | masks["pessimistic"])
+
+        outcomes = {}
+        for name in SCENARIOS:
+            mask = masks[name]
+            # An empty scenario keeps a target/stop from the whole distribution
+            selected = mask if mask.any() else slice(None)
+            outcomes[name] = ScenarioOutcome(
+                probability=round(float(mask.mean()) * 100, 2),
+                target_price=round(current_price * float(np.exp(np.median(stats.highest[selected]))), 2),
+                stop_loss=round(current_price * float(np.exp(np.median(stats.lowest[selected]))), 2),
+                steps=self.config.steps,
+            )
+        return outcomes, self.summarize(stats, current_price)
+
+    def summarize(self, stats: PathStatistics, current_price: float) -> SimulationSummary:
+        """بازده مورد انتظار، ریسک و VaR/CVaR از بازده انتهایی"""
+        simple = np.expm1(stats.terminal) * 100
+        var_cut = np.quantile(simple, 0.05)
+        tail = simple[simple <= var_cut]
+        quantiles = np.quantile(stats.terminal, TERMINAL_QUANTILES)
+
+        return SimulationSummary(
+            method=self.config.method,
+            n_paths=self.config.n_paths,
+            steps=self.config.steps,
+            seed=self.config.seed,
+            expected_return=round(float(simple.mean()), 2),
+            expected_risk=round(float(simple.std()), 2),
+            var_95=round(float(-var_cut), 2),
+            cvar_95=round(float(-tail.mean()), 2),
+            terminal_quantiles={
+                f"p{int(q * 100)}": round(current_price * float(np.exp(value)), 2)
+                for q, value in zip(TERMINAL_QUANTILES, quantiles)
+            },
+        )
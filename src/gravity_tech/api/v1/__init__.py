@@ -9,10 +9,13 @@ Version: 1.0.0
 License: MIT
 """
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import JSONResponse
 from typing import List
+from gravity_tech.config.settings import settings
 from gravity_tech.models.schemas import AnalysisRequest, TechnicalAnalysisResult, IndicatorResult
 from gravity_tech.services.analysis_service import TechnicalAnalysisService
+from gravity_tech.services.stage_metrics import StageTimer
 import structlog
 
 logger = structlog.get_logger()
@@ -26,7 +29,13 @@ router = APIRouter(tags=["Technical Analysis"])
     summary="Complete Technical Analysis",
     description="Perform comprehensive technical analysis with all indicators and patterns"
 )
-async def analyze_complete(request: AnalysisRequest) -> TechnicalAnalysisResult:
+async def analyze_complete(
+    request: AnalysisRequest,
+    debug_timings: bool = Query(
+        False,
+        description="Return a per-stage timing breakdown (debug mode or ANALYSIS_DEBUG_TIMINGS only)"
+    )
+) -> TechnicalAnalysisResult:
     """
     Perform complete technical analysis
     
@@ -43,10 +52,21 @@ async def analyze_complete(request: AnalysisRequest) -> TechnicalAnalysisResult:
     - Support/Resistance levels (Pivot Points, Fibonacci, etc.)
     - Candlestick patterns
     - Overall signal and confidence
+    - Per-stage timings in milliseconds (stage_timings_ms, with debug_timings)
     """
+    collect = debug_timings and (settings.debug or settings.analysis_debug_timings)
+    timer = StageTimer("technical_analysis", len(request.candles), collect=collect)
     try:
-        result = await TechnicalAnalysisService.analyze(request)
-        return result
+        result = await TechnicalAnalysisService.analyze(request, timer=timer)
+        # Serialized here rather than by FastAPI so the stage is measured;
+        # without a breakdown the body is the same as before the field existed
+        with timer.stage("serialization"):
+            content = result.model_dump(
+                mode="json", exclude=None if collect else {"stage_timings_ms"}
+            )
+        if collect:
+            content["stage_timings_ms"] = timer.breakdown()
+        return JSONResponse(content=content)
     except Exception as e:
         logger.error("analysis_endpoint_error", error=str(e))
         raise HTTPException(
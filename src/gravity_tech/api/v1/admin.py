@@ -0,0 +1,131 @@
+"""
+Admin API Endpoints
+
+Operational endpoints for production pods. They need a bearer token
+with the "admin" scope (middleware.auth) and are disabled by default.
+
+- GET /admin/profile: sample the worker process for N seconds and return
+  collapsed stacks (flamegraph.pl / speedscope input)
+
+    curl -H "Authorization: Bearer $TOKEN" \\
+        "http://pod:8000/api/v1/admin/profile?seconds=15&route=/api/v1/analyze" \\
+        | flamegraph.pl > analyze.svg
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import asyncio
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import CodeType
+from typing import Optional, Set
+
+import structlog
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request, status
+from fastapi.responses import PlainTextResponse
+from starlette.routing import Route
+
+from gravity_tech.config.settings import get_settings
+from gravity_tech.middleware.auth import TokenData, require_scopes
+from gravity_tech.services.profiler import SamplingProfiler
+
+logger = structlog.get_logger()
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+ADMIN_SCOPE = "admin"
+
+# The sampler thread (one profile at a time per worker)
+_profiler_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profiler")
+_profile_lock = asyncio.Lock()
+
+
+def profiler_enabled() -> None:
+    """Hide the profiler unless settings.profiler_enabled is set."""
+    if not get_settings().profiler_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+
+def route_endpoints(app: FastAPI, path: str) -> Set[CodeType]:
+    """Code objects of the endpoints registered under a route path."""
+    return {
+        inspect.unwrap(route.endpoint).__code__
+        for route in app.routes
+        if isinstance(route, Route) and route.path == path
+    }
+
+
+@router.get(
+    "/profile",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(profiler_enabled)],
+    summary="Sample the worker process",
+    description="Run a sampling profiler in this worker and return collapsed stacks"
+)
+async def profile_worker(
+    request: Request,
+    seconds: float = Query(10.0, gt=0, description="Profiling duration"),
+    interval_ms: Optional[float] = Query(None, ge=1, description="Sampling interval (default: PROFILER_INTERVAL_MS)"),
+    route: Optional[str] = Query(None, description="Only keep samples inside this route's endpoint, e.g. /api/v1/analyze"),
+    idle: bool = Query(False, description="Keep threads that are waiting for work"),
+    user: TokenData = Depends(require_scopes(ADMIN_SCOPE))
+) -> PlainTextResponse:
+    """
+    Profile this worker process
+
+    Returns one "frame;frame;... count" line per distinct stack, root
+    frame first, with headers X-Profile-Samples and X-Profile-Duration.
+    Only one profile runs per worker at a time (409 otherwise).
+    """
+    settings = get_settings()
+    if seconds > settings.profiler_max_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"seconds must be <= {settings.profiler_max_seconds}"
+        )
+
+    scope = None
+    if route is not None:
+        scope = route_endpoints(request.app, route)
+        if not scope:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"No route matches {route!r}"
+            )
+
+    if _profile_lock.locked():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A profile is already running")
+
+    async with _profile_lock:
+        profiler = SamplingProfiler(
+            interval=(interval_ms or settings.profiler_interval_ms) / 1000,
+            scope=scope,
+            include_idle=idle
+        )
+        stop = threading.Event()
+        logger.info("profile_started", username=user.username, seconds=seconds, route=route)
+        try:
+            profile = await asyncio.get_running_loop().run_in_executor(
+                _profiler_executor, profiler.run, seconds, stop
+            )
+        finally:
+            # Client gone: end the sampler thread as well
+            stop.set()
+
+    logger.info(
+        "profile_completed",
+        username=user.username,
+        samples=profile.samples,
+        stacks=len(profile.stacks)
+    )
+    return PlainTextResponse(
+        profile.collapsed(),
+        headers={
+            "X-Profile-Samples": str(profile.samples),
+            "X-Profile-Duration": f"{profile.duration:.3f}",
+        }
+    )
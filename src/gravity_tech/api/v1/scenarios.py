@@ -10,8 +10,13 @@ License: MIT
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import Optional
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, List, Optional
 from datetime import datetime
+import json
 import structlog
 
 from gravity_tech.analysis.scenario_analysis import (
@@ -19,12 +24,26 @@ from gravity_tech.analysis.scenario_analysis import (
     ThreeScenarioAnalysis,
     ScenarioResult
 )
+from gravity_tech.analysis.scenario_simulation import SimulationConfig
 from gravity_tech.clients.data_service_client import DataServiceClient
 from gravity_tech.config.settings import get_settings
 
 logger = structlog.get_logger()
 router = APIRouter(prefix="/api/v1/scenarios", tags=["Scenario Analysis"])
 
+# Worker pool shared by batch requests (analysis runs off the event loop)
+_batch_executor = ThreadPoolExecutor(
+    max_workers=get_settings().scenario_batch_workers,
+    thread_name_prefix="scenario-batch"
+)
+
+
+class BatchScenarioRequest(BaseModel):
+    """Batch scenario analysis request"""
+    symbols: List[str] = Field(..., min_length=1, description="Symbols to analyze (duplicates ignored)")
+    timeframe: str = Field(default="1d", pattern="^(1m|5m|15m|1h|4h|1d|1w)$")
+    lookback_days: int = Field(default=365, ge=30, le=1825)
+
 
 def get_data_client() -> DataServiceClient:
     """Dependency: Get Data Service client."""
@@ -45,12 +64,122 @@ def get_scenario_analyzer(
     return ScenarioAnalyzer(data_service_client=data_client)
 
 
+def get_simulation_config(
+    simulate: bool = Query(default=False, description="سناریوها از شبیه‌سازی مونت‌کارلو"),
+    paths: int = Query(default=10_000, ge=100, le=100_000),
+    horizon: int = Query(default=30, ge=1, le=365, description="افق شبیه‌سازی (کندل)"),
+    method: str = Query(default="gbm", regex="^(gbm|bootstrap)$"),
+    seed: Optional[int] = Query(default=None)
+) -> Optional[SimulationConfig]:
+    """Dependency: Monte-Carlo settings (None = heuristic scenarios)."""
+    if not simulate:
+        return None
+    return SimulationConfig(n_paths=paths, steps=horizon, method=method, seed=seed)
+
+
+async def _stream_batch(
+    analyzer: ScenarioAnalyzer,
+    request: BatchScenarioRequest,
+    simulation: Optional[SimulationConfig]
+) -> AsyncIterator[bytes]:
+    """NDJSON lines in completion order"""
+    settings = get_settings()
+    completed = failed = 0
+    try:
+        async for symbol, result in analyzer.analyze_many_from_service(
+            request.symbols,
+            timeframe=request.timeframe,
+            lookback_days=request.lookback_days,
+            simulation=simulation,
+            max_concurrency=settings.scenario_batch_fetch_concurrency,
+            executor=_batch_executor
+        ):
+            if isinstance(result, Exception):
+                failed += 1
+                line = {
+                    "symbol": symbol,
+                    "status": "error",
+                    "error": str(result),
+                    "error_type": type(result).__name__
+                }
+            else:
+                completed += 1
+                line = {"symbol": symbol, "status": "ok", "analysis": jsonable_encoder(result)}
+            yield (json.dumps(line, ensure_ascii=False, default=str) + "\n").encode()
+    finally:
+        logger.info(
+            "batch_scenario_analysis_finished",
+            symbols=len(set(request.symbols)),
+            completed=completed,
+            failed=failed
+        )
+
+
+@router.post("/batch")
+async def analyze_scenarios_batch(
+    request: BatchScenarioRequest,
+    analyzer: ScenarioAnalyzer = Depends(get_scenario_analyzer),
+    simulation: Optional[SimulationConfig] = Depends(get_simulation_config)
+):
+    """
+    تحلیل سه‌سناریویی چند نماد (NDJSON)
+    
+    داده نمادها هم‌زمان (با سقف scenario_batch_fetch_concurrency) از Data Service
+    دریافت و مستقیم به آرایه تبدیل می‌شود، تحلیل‌ها روی worker pool اجرا
+    می‌شوند و نتیجه هر نماد به محض آماده شدن یک خط JSON از پاسخ است.
+    
+    **مثال:**
+    ```
+    POST /api/v1/scenarios/batch?simulate=true&seed=42
+    {"symbols": ["AAPL", "MSFT", "BTC-USD"], "timeframe": "1d"}
+    ```
+    
+    **Response (application/x-ndjson):**
+    ```
+    {"symbol": "MSFT", "status": "ok", "analysis": {...}}
+    {"symbol": "BTC-USD", "status": "error", "error": "...", "error_type": "HTTPStatusError"}
+    {"symbol": "AAPL", "status": "ok", "analysis": {...}}
+    ```
+    
+    Args:
+        request: نمادها، بازه زمانی و تعداد روزهای گذشته
+        simulation: تنظیمات مونت‌کارلو (از پارامترهای simulate/paths/horizon/method/seed)
+        
+    Returns:
+        StreamingResponse: یک خط JSON برای هر نماد، به ترتیب اتمام
+        
+    Raises:
+        400: اگر تعداد نمادها از scenario_batch_max_symbols بیشتر باشد
+    """
+    max_symbols = get_settings().scenario_batch_max_symbols
+    symbols = list(dict.fromkeys(request.symbols))
+    if len(symbols) > max_symbols:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many symbols: {len(symbols)} (max {max_symbols})"
+        )
+    
+    logger.info(
+        "batch_scenario_analysis_request",
+        symbols=len(symbols),
+        timeframe=request.timeframe,
+        lookback_days=request.lookback_days,
+        simulate=simulation is not None
+    )
+    
+    return StreamingResponse(
+        _stream_batch(analyzer, request, simulation),
+        media_type="application/x-ndjson"
+    )
+
+
 @router.get("/{symbol}", response_model=ThreeScenarioAnalysis)
 async def analyze_scenarios(
     symbol: str,
     timeframe: str = Query(default="1d", regex="^(1m|5m|15m|1h|4h|1d|1w)$"),
     lookback_days: int = Query(default=365, ge=30, le=1825),
-    analyzer: ScenarioAnalyzer = Depends(get_scenario_analyzer)
+    analyzer: ScenarioAnalyzer = Depends(get_scenario_analyzer),
+    simulation: Optional[SimulationConfig] = Depends(get_simulation_config)
 ):
     """
     تحلیل سه‌سناریویی (خوشبینانه، خنثی، بدبینانه)
@@ -65,9 +194,14 @@ async def analyze_scenarios(
     E(Return) = P(opt) × R(opt) + P(neu) × R(neu) + P(pes) × R(pes)
     ```
     
+    **حالت شبیه‌سازی (simulate=true):**
+    احتمال، هدف و حد ضرر هر سناریو از مسیرهای مونت‌کارلو (GBM یا bootstrap)
+    خوانده می‌شود و خلاصه توزیع (VaR/CVaR و چندک‌ها) در فیلد simulation می‌آید.
+    
     **مثال:**
     ```
     GET /api/v1/scenarios/AAPL?timeframe=1d&lookback_days=365
+    GET /api/v1/scenarios/AAPL?simulate=true&paths=10000&horizon=30&method=bootstrap&seed=42
     ```
     
     **Response:**
@@ -107,6 +241,7 @@ async def analyze_scenarios(
         symbol: نماد سهم (مثال: AAPL، فولاد، BTC-USD)
         timeframe: بازه زمانی (1m, 5m, 15m, 1h, 4h, 1d, 1w)
         lookback_days: تعداد روزهای گذشته برای تحلیل (30-1825)
+        simulation: تنظیمات مونت‌کارلو (از پارامترهای simulate/paths/horizon/method/seed)
         
     Returns:
         ThreeScenarioAnalysis: تحلیل کامل سه سناریو با احتمالات و اهداف
@@ -120,7 +255,8 @@ async def analyze_scenarios(
         "scenario_analysis_request",
         symbol=symbol,
         timeframe=timeframe,
-        lookback_days=lookback_days
+        lookback_days=lookback_days,
+        simulate=simulation is not None
     )
     
     try:
@@ -128,7 +264,8 @@ async def analyze_scenarios(
         analysis = await analyzer.analyze_from_service(
             symbol=symbol,
             timeframe=timeframe,
-            lookback_days=lookback_days
+            lookback_days=lookback_days,
+            simulation=simulation
         )
         
         logger.info(
@@ -163,7 +300,8 @@ async def get_optimistic_scenario(
     symbol: str,
     timeframe: str = Query(default="1d", regex="^(1m|5m|15m|1h|4h|1d|1w)$"),
     lookback_days: int = Query(default=365, ge=30, le=1825),
-    analyzer: ScenarioAnalyzer = Depends(get_scenario_analyzer)
+    analyzer: ScenarioAnalyzer = Depends(get_scenario_analyzer),
+    simulation: Optional[SimulationConfig] = Depends(get_simulation_config)
 ):
     """
     فقط سناریو خوشبینانه
@@ -176,7 +314,7 @@ async def get_optimistic_scenario(
     Returns:
         ScenarioResult: فقط سناریو optimistic
     """
-    analysis = await analyze_scenarios(symbol, timeframe, lookback_days, analyzer)
+    analysis = await analyze_scenarios(symbol, timeframe, lookback_days, analyzer, simulation)
     return analysis.optimistic
 
 
@@ -185,7 +323,8 @@ async def get_neutral_scenario(
     symbol: str,
     timeframe: str = Query(default="1d", regex="^(1m|5m|15m|1h|4h|1d|1w)$"),
     lookback_days: int = Query(default=365, ge=30, le=1825),
-    analyzer: ScenarioAnalyzer = Depends(get_scenario_analyzer)
+    analyzer: ScenarioAnalyzer = Depends(get_scenario_analyzer),
+    simulation: Optional[SimulationConfig] = Depends(get_simulation_config)
 ):
     """
     فقط سناریو خنثی
@@ -198,7 +337,7 @@ async def get_neutral_scenario(
     Returns:
         ScenarioResult: فقط سناریو neutral
     """
-    analysis = await analyze_scenarios(symbol, timeframe, lookback_days, analyzer)
+    analysis = await analyze_scenarios(symbol, timeframe, lookback_days, analyzer, simulation)
     return analysis.neutral
 
 
@@ -207,7 +346,8 @@ async def get_pessimistic_scenario(
     symbol: str,
     timeframe: str = Query(default="1d", regex="^(1m|5m|15m|1h|4h|1d|1w)$"),
     lookback_days: int = Query(default=365, ge=30, le=1825),
-    analyzer: ScenarioAnalyzer = Depends(get_scenario_analyzer)
+    analyzer: ScenarioAnalyzer = Depends(get_scenario_analyzer),
+    simulation: Optional[SimulationConfig] = Depends(get_simulation_config)
 ):
     """
     فقط سناریو بدبینانه
@@ -220,5 +360,5 @@ async def get_pessimistic_scenario(
     Returns:
         ScenarioResult: فقط سناریو pessimistic
     """
-    analysis = await analyze_scenarios(symbol, timeframe, lookback_days, analyzer)
+    analysis = await analyze_scenarios(symbol, timeframe, lookback_days, analyzer, simulation)
     return analysis.pessimistic
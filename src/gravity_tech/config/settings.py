@@ -25,7 +25,7 @@ Notes:               Loads all configuration from environment variables.
 Configuration management for Technical Analysis Microservice
 """
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class Settings(BaseSettings):
@@ -55,6 +55,14 @@ class Settings(BaseSettings):
     redis_db: int = 0
     cache_enabled: bool = True
     cache_ttl: int = 300
+    cache_codec: str = "json"  # json | msgpack | numpy
+    cache_compression_threshold: int = 1024  # bytes, 0 disables compression
+    cache_namespace_ttls: Dict[str, int] = {}  # e.g. {"analysis": 60, "ml": 3600}
+    near_cache_enabled: bool = False
+    near_cache_max_size: int = 1024
+    near_cache_ttl: float = 30.0
+    near_cache_namespaces: List[str] = []  # empty = all namespaces
+    cache_invalidation_channel: str = "cache:invalidate"
     
     # Data Service Integration (NEW)
     DATA_SERVICE_URL: str = "http://localhost:8080"
@@ -76,11 +84,32 @@ class Settings(BaseSettings):
     metrics_enabled: bool = True
     tracing_enabled: bool = True
     log_level: str = "INFO"
+    log_async: bool = True  # write logs from a background thread
+    log_queue_size: int = 10000  # records; dropped (and counted) when full
+    log_sample_rate: float = 1.0  # fraction of successful requests with full logs
+    log_slow_request_ms: float = 1000.0  # slower requests are always logged
+    analysis_stage_metrics_enabled: bool = True  # analysis_stage_duration_seconds histogram
+    analysis_debug_timings: bool = False  # allow ?debug_timings=true outside debug mode
+    
+    # Sampling profiler (/api/v1/admin/profile, token scope "admin")
+    profiler_enabled: bool = False
+    profiler_max_seconds: float = 60.0
+    profiler_interval_ms: float = 10.0  # default sampling interval
+    
+    # Numba JIT warm-up (readiness waits for it)
+    jit_warmup_enabled: bool = True
+    jit_warmup_dtypes: List[str] = ["float32", "float64"]
+    numba_cache_seed_dir: Optional[str] = None  # pre-compiled cache copied into NUMBA_CACHE_DIR
     
     # Analysis Configuration
     max_candles: int = 1000
     parallel_processing: bool = True
     max_workers: int = 10
+    
+    # Batch scenario analysis (/api/v1/scenarios/batch)
+    scenario_batch_max_symbols: int = 50
+    scenario_batch_fetch_concurrency: int = 8  # concurrent Data Service requests
+    scenario_batch_workers: int = 4  # analysis worker threads
 
 
 settings = Settings()
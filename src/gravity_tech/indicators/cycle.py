@@ -10,4 +10,9 @@ License: MIT
 """
 
 # Proxy to new location
-from src.core.indicators.cycle import CycleIndicators
+from src.core.indicators.cycle import (
+    CycleIndicators,
+    autocorrelation,
+    dominant_cycle_batch,
+    dominant_cycle_phase,
+)
@@ -23,6 +23,7 @@ import numpy as np
 import pandas as pd
 from typing import List
 from gravity_tech.models.schemas import Candle, IndicatorResult, SignalStrength, IndicatorCategory
+from src.core.domain.entities import candle_column
 
 
 class MomentumIndicators:
@@ -40,7 +41,7 @@ class MomentumIndicators:
         Returns:
             IndicatorResult with signal
         """
-        closes = pd.Series([c.close for c in candles])
+        closes = pd.Series(candle_column(candles, 'close'))
         delta = closes.diff()
         
         gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
@@ -91,11 +92,11 @@ class MomentumIndicators:
         Returns:
             IndicatorResult with signal
         """
-        df = pd.DataFrame([{
-            'high': c.high,
-            'low': c.low,
-            'close': c.close
-        } for c in candles])
+        df = pd.DataFrame({
+            'high': candle_column(candles, 'high'),
+            'low': candle_column(candles, 'low'),
+            'close': candle_column(candles, 'close')
+        })
         
         # Calculate %K
         low_min = df['low'].rolling(window=k_period).min()
@@ -147,7 +148,7 @@ class MomentumIndicators:
         Returns:
             IndicatorResult with signal
         """
-        typical_prices = pd.Series([c.typical_price for c in candles])
+        typical_prices = pd.Series(candle_column(candles, 'typical_price'))
         sma = typical_prices.rolling(window=period).mean()
         mad = typical_prices.rolling(window=period).apply(
             lambda x: np.abs(x - x.mean()).mean()
@@ -195,7 +196,7 @@ class MomentumIndicators:
         Returns:
             IndicatorResult with signal
         """
-        closes = pd.Series([c.close for c in candles])
+        closes = pd.Series(candle_column(candles, 'close'))
         roc = ((closes - closes.shift(period)) / closes.shift(period)) * 100
         roc_current = roc.iloc[-1]
         
@@ -238,11 +239,11 @@ class MomentumIndicators:
         Returns:
             IndicatorResult with signal
         """
-        df = pd.DataFrame([{
-            'high': c.high,
-            'low': c.low,
-            'close': c.close
-        } for c in candles])
+        df = pd.DataFrame({
+            'high': candle_column(candles, 'high'),
+            'low': candle_column(candles, 'low'),
+            'close': candle_column(candles, 'close')
+        })
         
         high_max = df['high'].rolling(window=period).max()
         low_min = df['low'].rolling(window=period).min()
@@ -289,13 +290,13 @@ class MomentumIndicators:
         Returns:
             IndicatorResult with signal
         """
-        df = pd.DataFrame([{
-            'high': c.high,
-            'low': c.low,
-            'close': c.close,
-            'volume': c.volume,
-            'typical': c.typical_price
-        } for c in candles])
+        df = pd.DataFrame({
+            'high': candle_column(candles, 'high'),
+            'low': candle_column(candles, 'low'),
+            'close': candle_column(candles, 'close'),
+            'volume': candle_column(candles, 'volume'),
+            'typical': candle_column(candles, 'typical_price')
+        })
         
         money_flow = df['typical'] * df['volume']
         
@@ -353,11 +354,11 @@ class MomentumIndicators:
         Returns:
             IndicatorResult with signal
         """
-        df = pd.DataFrame([{
-            'high': c.high,
-            'low': c.low,
-            'close': c.close
-        } for c in candles])
+        df = pd.DataFrame({
+            'high': candle_column(candles, 'high'),
+            'low': candle_column(candles, 'low'),
+            'close': candle_column(candles, 'close')
+        })
         
         # Calculate buying pressure and true range
         prior_close = df['close'].shift(1).fillna(df['close'].iloc[0])
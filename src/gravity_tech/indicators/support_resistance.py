@@ -23,6 +23,8 @@ import numpy as np
 import pandas as pd
 from typing import List, Dict, Tuple
 from gravity_tech.models.schemas import Candle, IndicatorResult, SignalStrength, IndicatorCategory
+from src.core.domain.entities import candle_column
+from gravity_tech.patterns.pivots import find_pivots
 
 
 class SupportResistanceIndicators:
@@ -102,8 +104,8 @@ class SupportResistanceIndicators:
             IndicatorResult with signal
         """
         recent = candles[-lookback:]
-        high = max(c.high for c in recent)
-        low = min(c.low for c in recent)
+        high = float(candle_column(recent, 'high').max())
+        low = float(candle_column(recent, 'low').min())
         current_price = candles[-1].close
         
         diff = high - low
@@ -232,28 +234,17 @@ class SupportResistanceIndicators:
         recent = candles[-lookback:]
         current_price = candles[-1].close
         
-        # Find local highs and lows
-        highs = []
-        lows = []
-        
-        for i in range(2, len(recent) - 2):
-            # Local high
-            if (recent[i].high > recent[i-1].high and 
-                recent[i].high > recent[i-2].high and
-                recent[i].high > recent[i+1].high and 
-                recent[i].high > recent[i+2].high):
-                highs.append(recent[i].high)
-            
-            # Local low
-            if (recent[i].low < recent[i-1].low and 
-                recent[i].low < recent[i-2].low and
-                recent[i].low < recent[i+1].low and 
-                recent[i].low < recent[i+2].low):
-                lows.append(recent[i].low)
+        # Find local highs and lows (strictly beyond 2 bars on each side)
+        recent_highs = candle_column(recent, 'high')
+        recent_lows = candle_column(recent, 'low')
+        highs = recent_highs[find_pivots(recent_highs, 2, maxima=True, strict=True)]
+        lows = recent_lows[find_pivots(recent_lows, 2, maxima=False, strict=True)]
         
         # Find nearest support and resistance
-        resistance = min([h for h in highs if h > current_price], default=current_price * 1.05)
-        support = max([l for l in lows if l < current_price], default=current_price * 0.95)
+        above = highs[highs > current_price]
+        below = lows[lows < current_price]
+        resistance = above.min() if len(above) else current_price * 1.05
+        support = below.max() if len(below) else current_price * 0.95
         
         # Signal based on position
         range_sr = resistance - support
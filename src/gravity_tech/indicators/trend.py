@@ -23,6 +23,7 @@ import numpy as np
 import pandas as pd
 from typing import List, Tuple
 from gravity_tech.models.schemas import Candle, IndicatorResult, SignalStrength, IndicatorCategory
+from src.core.domain.entities import candle_column
 
 
 class TrendIndicators:
@@ -40,7 +41,7 @@ class TrendIndicators:
         Returns:
             IndicatorResult with signal
         """
-        closes = np.array([c.close for c in candles])
+        closes = candle_column(candles, 'close')
         sma_values = pd.Series(closes).rolling(window=period).mean()
         sma_current = sma_values.iloc[-1]
         current_price = closes[-1]
@@ -90,7 +91,7 @@ class TrendIndicators:
         Returns:
             IndicatorResult with signal
         """
-        closes = np.array([c.close for c in candles])
+        closes = candle_column(candles, 'close')
         ema_values = pd.Series(closes).ewm(span=period, adjust=False).mean()
         ema_current = ema_values.iloc[-1]
         current_price = closes[-1]
@@ -137,7 +138,7 @@ class TrendIndicators:
         Returns:
             IndicatorResult with signal
         """
-        closes = np.array([c.close for c in candles])
+        closes = candle_column(candles, 'close')
         weights = np.arange(1, period + 1)
         
         wma_values = []
@@ -193,7 +194,7 @@ class TrendIndicators:
         Returns:
             IndicatorResult with signal
         """
-        closes = pd.Series([c.close for c in candles])
+        closes = pd.Series(candle_column(candles, 'close'))
         
         ema1 = closes.ewm(span=period, adjust=False).mean()
         ema2 = ema1.ewm(span=period, adjust=False).mean()
@@ -243,7 +244,7 @@ class TrendIndicators:
         Returns:
             IndicatorResult with signal
         """
-        closes = pd.Series([c.close for c in candles])
+        closes = pd.Series(candle_column(candles, 'close'))
         
         ema1 = closes.ewm(span=period, adjust=False).mean()
         ema2 = ema1.ewm(span=period, adjust=False).mean()
@@ -295,7 +296,7 @@ class TrendIndicators:
         Returns:
             IndicatorResult with signal
         """
-        closes = pd.Series([c.close for c in candles])
+        closes = pd.Series(candle_column(candles, 'close'))
         
         ema_fast = closes.ewm(span=fast, adjust=False).mean()
         ema_slow = closes.ewm(span=slow, adjust=False).mean()
@@ -355,11 +356,11 @@ class TrendIndicators:
         Returns:
             IndicatorResult with signal
         """
-        df = pd.DataFrame([{
-            'high': c.high,
-            'low': c.low,
-            'close': c.close
-        } for c in candles])
+        df = pd.DataFrame({
+            'high': candle_column(candles, 'high'),
+            'low': candle_column(candles, 'low'),
+            'close': candle_column(candles, 'close')
+        })
         
         # Calculate +DM and -DM
         df['high_diff'] = df['high'].diff()
@@ -23,6 +23,7 @@ import numpy as np
 import pandas as pd
 from typing import List
 from gravity_tech.models.schemas import Candle, IndicatorResult, SignalStrength, IndicatorCategory
+from src.core.domain.entities import candle_column
 
 
 class VolumeIndicators:
@@ -39,10 +40,10 @@ class VolumeIndicators:
         Returns:
             IndicatorResult with signal
         """
-        df = pd.DataFrame([{
-            'close': c.close,
-            'volume': c.volume
-        } for c in candles])
+        df = pd.DataFrame({
+            'close': candle_column(candles, 'close'),
+            'volume': candle_column(candles, 'volume')
+        })
         
         obv = [0]
         for i in range(1, len(df)):
@@ -104,12 +105,12 @@ class VolumeIndicators:
         Returns:
             IndicatorResult with signal
         """
-        df = pd.DataFrame([{
-            'high': c.high,
-            'low': c.low,
-            'close': c.close,
-            'volume': c.volume
-        } for c in candles])
+        df = pd.DataFrame({
+            'high': candle_column(candles, 'high'),
+            'low': candle_column(candles, 'low'),
+            'close': candle_column(candles, 'close'),
+            'volume': candle_column(candles, 'volume')
+        })
         
         mf_multiplier = ((df['close'] - df['low']) - (df['high'] - df['close'])) / (df['high'] - df['low'])
         mf_volume = mf_multiplier * df['volume']
@@ -155,13 +156,13 @@ class VolumeIndicators:
         Returns:
             IndicatorResult with signal
         """
-        df = pd.DataFrame([{
-            'high': c.high,
-            'low': c.low,
-            'close': c.close,
-            'volume': c.volume,
-            'typical': c.typical_price
-        } for c in candles])
+        df = pd.DataFrame({
+            'high': candle_column(candles, 'high'),
+            'low': candle_column(candles, 'low'),
+            'close': candle_column(candles, 'close'),
+            'volume': candle_column(candles, 'volume'),
+            'typical': candle_column(candles, 'typical_price')
+        })
         
         # Calculate VWAP (reset daily in production)
         df['pv'] = df['typical'] * df['volume']
@@ -210,12 +211,12 @@ class VolumeIndicators:
         Returns:
             IndicatorResult with signal
         """
-        df = pd.DataFrame([{
-            'high': c.high,
-            'low': c.low,
-            'close': c.close,
-            'volume': c.volume
-        } for c in candles])
+        df = pd.DataFrame({
+            'high': candle_column(candles, 'high'),
+            'low': candle_column(candles, 'low'),
+            'close': candle_column(candles, 'close'),
+            'volume': candle_column(candles, 'volume')
+        })
         
         clv = ((df['close'] - df['low']) - (df['high'] - df['close'])) / (df['high'] - df['low'])
         ad = (clv * df['volume']).cumsum()
@@ -267,10 +268,10 @@ class VolumeIndicators:
         Returns:
             IndicatorResult with signal
         """
-        df = pd.DataFrame([{
-            'close': c.close,
-            'volume': c.volume
-        } for c in candles])
+        df = pd.DataFrame({
+            'close': candle_column(candles, 'close'),
+            'volume': candle_column(candles, 'volume')
+        })
         
         price_change = df['close'].pct_change()
         pvt = (price_change * df['volume']).cumsum()
@@ -320,7 +321,7 @@ class VolumeIndicators:
         Returns:
             IndicatorResult with signal
         """
-        volumes = pd.Series([c.volume for c in candles])
+        volumes = pd.Series(candle_column(candles, 'volume'))
         
         short_ma = volumes.rolling(window=short).mean()
         long_ma = volumes.rolling(window=long).mean()
@@ -0,0 +1,17 @@
+"""
+Volume-Profile Support/Resistance Levels - Proxy
+
+This module provides backward compatibility by proxying to the new location.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+# Proxy to new location
+from src.core.indicators.volume_profile import (
+    LevelEngine,
+    PriceLevel,
+    VolumeProfile,
+)
@@ -45,16 +45,23 @@ from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from prometheus_client import make_asgi_app
+import asyncio
 import structlog
 import time
 
 from gravity_tech.config.settings import settings
 from gravity_tech.api.v1 import router as api_v1_router
-from gravity_tech.middleware.logging import setup_logging
+from gravity_tech.middleware.logging import (
+    keep_request_logs,
+    sample_request,
+    setup_logging,
+    shutdown_logging,
+)
 from gravity_tech.middleware.security import setup_security
 from gravity_tech.middleware.service_discovery import startup_service_discovery, shutdown_service_discovery
 from gravity_tech.middleware.events import event_publisher
 from gravity_tech.services.cache_service import cache_manager
+from gravity_tech.services.jit_warmup import jit_warmup
 
 # Setup structured logging
 setup_logging()
@@ -148,26 +155,48 @@ app.add_middleware(
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    """Log all incoming requests with timing"""
+    """
+    Log incoming requests with timing
+    
+    Only a LOG_SAMPLE_RATE share of requests logs its info events; errors
+    and requests slower than LOG_SLOW_REQUEST_MS are always logged.
+    """
     start_time = time.time()
+    sampled = sample_request()
     
-    logger.info(
-        "request_started",
-        method=request.method,
-        path=request.url.path,
-        client=request.client.host if request.client else None
-    )
+    if sampled:
+        logger.info(
+            "request_started",
+            method=request.method,
+            path=request.url.path,
+            client=request.client.host if request.client else None
+        )
     
-    response = await call_next(request)
+    try:
+        response = await call_next(request)
+    except Exception as e:
+        keep_request_logs()
+        logger.error(
+            "request_failed",
+            method=request.method,
+            path=request.url.path,
+            duration=f"{time.time() - start_time:.3f}s",
+            error=str(e)
+        )
+        raise
     
     duration = time.time() - start_time
-    logger.info(
-        "request_completed",
-        method=request.method,
-        path=request.url.path,
-        status_code=response.status_code,
-        duration=f"{duration:.3f}s"
-    )
+    slow = duration * 1000 >= settings.log_slow_request_ms
+    if sampled or slow or response.status_code >= 400:
+        keep_request_logs()
+        logger.info(
+            "request_completed",
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+            duration=f"{duration:.3f}s",
+            slow=slow
+        )
     
     return response
 
@@ -181,6 +210,10 @@ from gravity_tech.api.v1.ml import router as ml_router
 app.include_router(patterns_router, prefix="/api/v1")
 app.include_router(ml_router, prefix="/api/v1")
 
+# Admin endpoints (sampling profiler; disabled unless PROFILER_ENABLED)
+from gravity_tech.api.v1.admin import router as admin_router
+app.include_router(admin_router, prefix="/api/v1")
+
 # Prometheus metrics endpoint
 if settings.metrics_enabled:
     metrics_app = make_asgi_app()
@@ -193,6 +226,12 @@ async def startup_event():
     """راه‌اندازی اولیه سرویس"""
     logger.info("application_startup", version=settings.app_version)
     
+    # کامپایل کرنل‌های Numba در پس‌زمینه؛ readiness تا پایان آن 503 می‌دهد
+    if settings.jit_warmup_enabled:
+        app.state.jit_warmup_task = asyncio.create_task(jit_warmup.run_async())
+    else:
+        jit_warmup.skip()
+    
     # راه‌اندازی Redis Cache
     await cache_manager.initialize()
     
@@ -227,6 +266,7 @@ async def shutdown_event():
         await shutdown_service_discovery()
     
     logger.info("application_stopped")
+    shutdown_logging()
 
 
 # Health check endpoints
@@ -260,7 +300,8 @@ async def readiness_check():
     
     Returns:
     - 200 OK: Service is ready to accept traffic
-    - 503 Service Unavailable: Service is not ready (dependencies down)
+    - 503 Service Unavailable: Service is not ready (JIT warm-up still
+      running or dependencies down)
     """
     health_status = {
         "status": "ready",
@@ -269,11 +310,22 @@ async def readiness_check():
         "checks": {}
     }
     
+    # Numba kernels must be compiled before taking traffic
+    health_status["checks"]["jit_warmup"] = jit_warmup.status()
+    if not jit_warmup.ready:
+        health_status["status"] = "not_ready"
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=health_status
+        )
+    
     # Check Redis connection if enabled
     if settings.cache_enabled:
         try:
             redis_healthy = await cache_manager.health_check()
             health_status["checks"]["redis"] = "healthy" if redis_healthy else "unhealthy"
+            if cache_manager.near_cache is not None:
+                health_status["near_cache"] = cache_manager.near_cache.stats()
             
             if not redis_healthy:
                 health_status["status"] = "not_ready"
@@ -109,7 +109,7 @@ def verify_token(token: str) -> TokenData:
             detail="Token has expired",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -134,6 +134,35 @@ async def get_current_user(
     return verify_token(credentials.credentials)
 
 
+def require_scopes(*scopes: str):
+    """
+    Dependency که توکن معتبر با تمام scopeهای داده‌شده را الزامی می‌کند
+    
+    استفاده:
+        @app.get("/admin", dependencies=[Depends(require_scopes("admin"))])
+    
+    Raises:
+        HTTPException: 401 بدون توکن معتبر، 403 در صورت نبود scope
+    """
+    async def dependency(user: Optional[TokenData] = Depends(get_current_user)) -> TokenData:
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        missing = [scope for scope in scopes if scope not in user.scopes]
+        if missing:
+            logger.warning("insufficient_scope", username=user.username, missing=missing)
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Missing required scope: {', '.join(missing)}",
+            )
+        return user
+    
+    return dependency
+
+
 # ═══════════════════════════════════════════════════════════════
 # Rate Limiting
 # ═══════════════════════════════════════════════════════════════
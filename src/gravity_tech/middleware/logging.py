@@ -3,24 +3,173 @@ Logging Middleware Setup
 
 Structured logging configuration for the application.
 
+Records are handed to a bounded in-memory queue and written to stdout by
+a listener thread, so request threads never block on the log pipe. When
+the queue is full the record is dropped and counted instead.
+
+Request-path logs are sampled per request (see log_requests in main):
+
+- a sampled request logs everything, as before
+- an unsampled request drops its debug/info events (request_started,
+  starting_analysis, ...) but still logs warnings and errors
+- request_completed is always written for errors (status >= 400) and
+  slow requests (LOG_SLOW_REQUEST_MS)
+
+Metrics: log_records_total{level}, log_bytes_total and
+log_records_dropped_total{reason} (reason: sampled | queue_full).
+
 Author: Gravity Tech Team
 Date: November 14, 2025
 Version: 1.0.0
 License: MIT
 """
 
-import structlog
+import atexit
 import logging
+import queue
+import random
 import sys
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, TextIO
+
+import structlog
+
+from gravity_tech.config.settings import settings
+
+# Make prometheus_client optional
+try:
+    from prometheus_client import Counter
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+if PROMETHEUS_AVAILABLE:
+    LOG_RECORDS = Counter(
+        "log_records_total",
+        "Log records handed to the log writer",
+        ["level"],
+    )
+    LOG_BYTES = Counter(
+        "log_bytes_total",
+        "Size of the log records handed to the log writer",
+    )
+    LOG_RECORDS_DROPPED = Counter(
+        "log_records_dropped_total",
+        "Log records not written",
+        ["reason"],
+    )
+
+# Whether the current request's debug/info events are written
+_request_sampled: ContextVar[bool] = ContextVar("log_request_sampled", default=True)
+
+_listener: Optional[QueueListener] = None
+
+SAMPLED_LEVELS = frozenset({"debug", "info"})
+
+
+def sample_request(rate: Optional[float] = None) -> bool:
+    """
+    Decide whether the current request's debug/info logs are written.
+
+    Args:
+        rate: Fraction of requests sampled (default: settings.log_sample_rate)
+
+    Returns:
+        True if the request is sampled
+    """
+    if rate is None:
+        rate = settings.log_sample_rate
+    sampled = rate >= 1.0 or random.random() < rate
+    _request_sampled.set(sampled)
+    return sampled
+
+
+def keep_request_logs() -> None:
+    """Write the rest of the current request's logs (error or slow request)."""
+    _request_sampled.set(True)
+
+
+def sample_request_logs(logger, method_name: str, event_dict: dict) -> dict:
+    """structlog processor dropping debug/info events of unsampled requests"""
+    if method_name in SAMPLED_LEVELS and not _request_sampled.get():
+        if PROMETHEUS_AVAILABLE:
+            LOG_RECORDS_DROPPED.labels(reason="sampled").inc()
+        raise structlog.DropEvent
+    return event_dict
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that drops records when the queue is full instead of blocking"""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if PROMETHEUS_AVAILABLE:
+                LOG_RECORDS_DROPPED.labels(reason="queue_full").inc()
+            return
+        if PROMETHEUS_AVAILABLE:
+            LOG_RECORDS.labels(level=record.levelname.lower()).inc()
+            # prepare() has already rendered the message
+            LOG_BYTES.inc(len(record.msg))
+
+
+class _DrainingQueueListener(QueueListener):
+    """QueueListener whose stop() waits for room in a full queue"""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+def start_async_logging(stream: TextIO = sys.stdout, queue_size: Optional[int] = None) -> bool:
+    """
+    Route the root logger through a bounded queue to a writer thread.
+
+    Like logging.basicConfig, nothing is changed when the root logger
+    already has handlers.
+
+    Args:
+        stream: Stream the writer thread writes to
+        queue_size: Queue capacity in records (default: settings.log_queue_size)
+
+    Returns:
+        True if the queue handler was installed
+    """
+    global _listener
+    root = logging.getLogger()
+    if root.handlers:
+        return False
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size or settings.log_queue_size)
+    writer = logging.StreamHandler(stream)
+    writer.setFormatter(logging.Formatter("%(message)s"))
+
+    root.addHandler(NonBlockingQueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+    _listener = _DrainingQueueListener(log_queue, writer)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return True
+
+
+def shutdown_logging() -> None:
+    """Write the queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        listener, _listener = _listener, None
+        listener.stop()
 
 
 def setup_logging():
     """Configure structured logging"""
-    
+
     # Configure structlog
     structlog.configure(
         processors=[
             structlog.stdlib.filter_by_level,
+            sample_request_logs,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.stdlib.PositionalArgumentsFormatter(),
@@ -34,10 +183,13 @@ def setup_logging():
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
-    
+
     # Configure standard logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=logging.INFO,
-    )
+    if settings.log_async:
+        start_async_logging(sys.stdout)
+    else:
+        logging.basicConfig(
+            format="%(message)s",
+            stream=sys.stdout,
+            level=logging.INFO,
+        )
@@ -3,7 +3,7 @@ Advanced Pattern Training - Enhanced Model Training
 
 Advanced features:
 - Real historical pattern data generation
-- Hyperparameter tuning with GridSearchCV
+- Hyperparameter tuning with GridSearchCV or budgeted successive halving
 - Ensemble methods (XGBoost + RandomForest + GradientBoosting)
 - Cross-validation with stratified k-fold
 - Model comparison and selection
@@ -19,12 +19,15 @@ import pandas as pd
 from typing import Dict, List, Tuple, Optional
 import sys
 import os
-from sklearn.model_selection import GridSearchCV, StratifiedKFold, cross_validate
+from sklearn.model_selection import (
+    GridSearchCV, ParameterGrid, StratifiedKFold, cross_validate, train_test_split
+)
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier, VotingClassifier
 from sklearn.metrics import classification_report, confusion_matrix, accuracy_score, f1_score
 import xgboost as xgb
 import pickle
 import json
+import time
 from datetime import datetime
 
 # Add parent directory to path
@@ -44,6 +47,16 @@ class AdvancedPatternTrainer:
     - Production-ready model selection
     """
     
+    # Full XGBoost search space (3^6 = 729 combinations)
+    XGB_PARAM_GRID = {
+        'n_estimators': [100, 150, 200],
+        'max_depth': [4, 6, 8],
+        'learning_rate': [0.01, 0.05, 0.1],
+        'subsample': [0.8, 0.9, 1.0],
+        'colsample_bytree': [0.8, 0.9, 1.0],
+        'min_child_weight': [1, 3, 5]
+    }
+    
     def __init__(self, random_state: int = 42):
         """Initialize advanced trainer."""
         self.random_state = random_state
@@ -181,47 +194,63 @@ class AdvancedPatternTrainer:
         self,
         X_train: np.ndarray,
         y_train: np.ndarray,
-        cv: int = 5
+        cv: int = 5,
+        search: str = 'grid',
+        param_grid: Optional[Dict[str, List]] = None,
+        n_jobs: Optional[int] = None,
+        time_budget: Optional[float] = None
     ) -> Tuple[xgb.XGBClassifier, Dict]:
         """
-        Tune XGBoost hyperparameters using GridSearchCV.
+        Tune XGBoost hyperparameters.
+        
+        CPU allocation is explicit and never nested: the grid search
+        runs n_jobs folds in parallel with single-threaded models, while
+        the halving search fits one candidate at a time with n_jobs
+        XGBoost threads.
         
         Args:
             X_train: Training features
             y_train: Training labels (indices)
-            cv: Number of cross-validation folds
+            cv: Number of cross-validation folds (grid search)
+            search: 'grid' (exhaustive GridSearchCV) or 'halving'
+                (budgeted successive halving with early stopping)
+            param_grid: Search space (default: XGB_PARAM_GRID)
+            n_jobs: Total CPU cores to use (default: all)
+            time_budget: Wall-clock limit in seconds (halving only)
             
         Returns:
             Tuple of (best_model, tuning_results)
         """
+        param_grid = param_grid or self.XGB_PARAM_GRID
+        n_jobs = n_jobs or os.cpu_count() or 1
+        
+        if search == 'halving':
+            return self.tune_xgboost_halving(
+                X_train, y_train, param_grid=param_grid,
+                n_jobs=n_jobs, time_budget=time_budget
+            )
+        if search != 'grid':
+            raise ValueError(f"Unknown search mode: {search}")
+        
         print("\n🔧 Tuning XGBoost Hyperparameters...")
         print("-" * 80)
         
-        # Parameter grid for tuning
-        param_grid = {
-            'n_estimators': [100, 150, 200],
-            'max_depth': [4, 6, 8],
-            'learning_rate': [0.01, 0.05, 0.1],
-            'subsample': [0.8, 0.9, 1.0],
-            'colsample_bytree': [0.8, 0.9, 1.0],
-            'min_child_weight': [1, 3, 5]
-        }
-        
-        # Base model
+        # Base model (single-threaded: parallelism is across folds)
         base_model = xgb.XGBClassifier(
             objective='multi:softmax',
             num_class=4,
             random_state=self.random_state,
-            n_jobs=-1
+            n_jobs=1
         )
         
         # Grid search
+        start = time.perf_counter()
         grid_search = GridSearchCV(
             base_model,
             param_grid,
             cv=cv,
             scoring='accuracy',
-            n_jobs=-1,
+            n_jobs=n_jobs,
             verbose=1
         )
         
@@ -233,11 +262,200 @@ class AdvancedPatternTrainer:
         print(f"\n✅ Best CV Score: {grid_search.best_score_:.4f}")
         
         return grid_search.best_estimator_, {
+            'search': 'grid',
             'best_params': grid_search.best_params_,
             'best_score': grid_search.best_score_,
-            'cv_results': grid_search.cv_results_
+            'cv_results': grid_search.cv_results_,
+            'n_fits': len(grid_search.cv_results_['params']) * cv,
+            'elapsed': time.perf_counter() - start
+        }
+    
+    def tune_xgboost_halving(
+        self,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        param_grid: Optional[Dict[str, List]] = None,
+        eta: int = 3,
+        min_rounds: int = 10,
+        validation_fraction: float = 0.2,
+        early_stopping_rounds: int = 10,
+        n_jobs: Optional[int] = None,
+        time_budget: Optional[float] = None
+    ) -> Tuple[xgb.XGBClassifier, Dict]:
+        """
+        Tune XGBoost with successive halving over boosting rounds.
+        
+        Every candidate starts with min_rounds boosting rounds scored on
+        a stratified validation split; the best 1/eta survive to the next
+        rung with eta times more rounds (capped by their n_estimators).
+        Fits stop early when validation loss stalls. The search ends when
+        one candidate is left, the round budget reaches its cap, or the
+        wall-clock budget runs out; the winner is refit on all of
+        X_train with the number of rounds it needed on validation.
+        
+        Args:
+            X_train: Training features
+            y_train: Training labels (indices)
+            param_grid: Search space (default: XGB_PARAM_GRID)
+            eta: Halving factor
+            min_rounds: Boosting rounds in the first rung
+            validation_fraction: Share of X_train held out for scoring
+            early_stopping_rounds: Patience on validation loss
+            n_jobs: XGBoost threads per fit (default: all cores)
+            time_budget: Wall-clock limit in seconds (None: unlimited)
+            
+        Returns:
+            Tuple of (best_model, tuning_results)
+        """
+        print("\n🔧 Tuning XGBoost Hyperparameters (successive halving)...")
+        print("-" * 80)
+        
+        param_grid = param_grid or self.XGB_PARAM_GRID
+        n_jobs = n_jobs or os.cpu_count() or 1
+        start = time.perf_counter()
+        
+        X_fit, X_val, y_fit, y_val = train_test_split(
+            X_train, y_train, test_size=validation_fraction,
+            random_state=self.random_state, stratify=y_train
+        )
+        
+        rng = np.random.RandomState(self.random_state)
+        candidates = list(ParameterGrid(param_grid))
+        rng.shuffle(candidates)
+        max_rounds = max(c.get('n_estimators', 100) for c in candidates)
+        
+        rounds = min_rounds
+        rungs = []
+        n_fits = 0
+        budget_exhausted = False
+        best = None  # (score, params, best_rounds)
+        
+        while candidates:
+            scored = []
+            for params in candidates:
+                if time_budget is not None and time.perf_counter() - start > time_budget:
+                    budget_exhausted = True
+                    break
+                
+                fit_params = dict(params)
+                fit_params['n_estimators'] = min(rounds, params.get('n_estimators', rounds))
+                model = xgb.XGBClassifier(
+                    objective='multi:softprob',
+                    num_class=4,
+                    random_state=self.random_state,
+                    n_jobs=n_jobs,
+                    early_stopping_rounds=early_stopping_rounds,
+                    **fit_params
+                )
+                model.fit(X_fit, y_fit, eval_set=[(X_val, y_val)], verbose=False)
+                n_fits += 1
+                
+                score = accuracy_score(y_val, model.predict(X_val))
+                scored.append((score, params, model.best_iteration + 1))
+            
+            if not scored:
+                break
+            
+            scored.sort(key=lambda item: item[0], reverse=True)
+            best = scored[0]
+            rungs.append({
+                'rounds': rounds,
+                'n_candidates': len(scored),
+                'best_score': best[0]
+            })
+            print(f"   Rung {len(rungs)}: {len(scored)} candidates @ {rounds} rounds "
+                  f"→ best {best[0]:.4f}")
+            
+            if budget_exhausted or len(scored) == 1 or rounds >= max_rounds:
+                break
+            
+            candidates = [params for _, params, _ in scored[:max(1, len(scored) // eta)]]
+            rounds = min(rounds * eta, max_rounds)
+        
+        if best is None:
+            raise RuntimeError("time_budget too small to evaluate any candidate")
+        
+        best_score, best_params, best_rounds = best
+        final_params = dict(best_params)
+        final_params['n_estimators'] = best_rounds
+        best_model = xgb.XGBClassifier(
+            objective='multi:softmax',
+            num_class=4,
+            random_state=self.random_state,
+            n_jobs=n_jobs,
+            **final_params
+        )
+        best_model.fit(X_train, y_train)
+        elapsed = time.perf_counter() - start
+        
+        print(f"\n✅ Best XGBoost Parameters:")
+        for param, value in best_params.items():
+            print(f"   {param}: {value}")
+        print(f"\n✅ Best Validation Score: {best_score:.4f} "
+              f"({n_fits} fits, {elapsed:.1f}s{', budget exhausted' if budget_exhausted else ''})")
+        
+        return best_model, {
+            'search': 'halving',
+            'best_params': best_params,
+            'best_score': best_score,
+            'best_rounds': best_rounds,
+            'rungs': rungs,
+            'n_fits': n_fits,
+            'elapsed': elapsed,
+            'budget_exhausted': budget_exhausted
         }
     
+    def benchmark_search(
+        self,
+        n_samples: int = 2000,
+        test_size: float = 0.2,
+        cv: int = 5,
+        param_grid: Optional[Dict[str, List]] = None,
+        n_jobs: Optional[int] = None,
+        time_budget: Optional[float] = None
+    ) -> Dict:
+        """
+        Compare the budgeted halving search with the full grid.
+        
+        Both searches run on the same fixed dataset (seeded by
+        random_state) and are scored on the same held-out test split.
+        
+        Returns:
+            Dictionary with per-search test accuracy, fits and time, plus
+            'accuracy_gap' (grid minus halving) and 'speedup'
+        """
+        X, y_type, _ = self.generate_enhanced_training_data(n_samples)
+        class_to_idx = {'gartley': 0, 'butterfly': 1, 'bat': 2, 'crab': 3}
+        y_idx = np.array([class_to_idx[t] for t in y_type])
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y_idx, test_size=test_size, random_state=self.random_state, stratify=y_idx
+        )
+        
+        report = {}
+        for search in ('grid', 'halving'):
+            model, results = self.tune_xgboost(
+                X_train, y_train, cv=cv, search=search, param_grid=param_grid,
+                n_jobs=n_jobs, time_budget=time_budget if search == 'halving' else None
+            )
+            report[search] = {
+                'test_accuracy': accuracy_score(y_test, model.predict(X_test)),
+                'best_params': results['best_params'],
+                'n_fits': results['n_fits'],
+                'elapsed': results['elapsed']
+            }
+        
+        report['accuracy_gap'] = report['grid']['test_accuracy'] - report['halving']['test_accuracy']
+        report['speedup'] = report['grid']['elapsed'] / max(report['halving']['elapsed'], 1e-9)
+        
+        print("\n📊 Search Benchmark:")
+        print(f"   Grid:    acc={report['grid']['test_accuracy']:.4f} "
+              f"({report['grid']['n_fits']} fits, {report['grid']['elapsed']:.1f}s)")
+        print(f"   Halving: acc={report['halving']['test_accuracy']:.4f} "
+              f"({report['halving']['n_fits']} fits, {report['halving']['elapsed']:.1f}s)")
+        print(f"   Gap: {report['accuracy_gap']:+.4f}, Speedup: {report['speedup']:.1f}x")
+        
+        return report
+    
     def train_random_forest(
         self,
         X_train: np.ndarray,
@@ -386,7 +604,9 @@ class AdvancedPatternTrainer:
     def train_advanced_model(
         self,
         n_samples: int = 5000,
-        test_size: float = 0.2
+        test_size: float = 0.2,
+        search: str = 'grid',
+        time_budget: Optional[float] = None
     ) -> Dict:
         """
         Complete advanced training pipeline.
@@ -394,6 +614,8 @@ class AdvancedPatternTrainer:
         Args:
             n_samples: Number of training samples
             test_size: Test set size
+            search: XGBoost tuning mode ('grid' or 'halving')
+            time_budget: Wall-clock limit for halving search (seconds)
             
         Returns:
             Dictionary with training results
@@ -411,7 +633,6 @@ class AdvancedPatternTrainer:
         y_idx = np.array([class_to_idx[t] for t in y_type])
         
         # Split data
-        from sklearn.model_selection import train_test_split
         X_train, X_test, y_train, y_test = train_test_split(
             X, y_idx, test_size=test_size, random_state=self.random_state, stratify=y_idx
         )
@@ -420,7 +641,9 @@ class AdvancedPatternTrainer:
         print(f"   Training: {len(X_train)}, Test: {len(X_test)}")
         
         # Step 2: Tune XGBoost
-        xgb_model, tuning_results = self.tune_xgboost(X_train, y_train)
+        xgb_model, tuning_results = self.tune_xgboost(
+            X_train, y_train, search=search, time_budget=time_budget
+        )
         self.tuning_results['xgboost'] = tuning_results
         
         # Step 3: Train other models
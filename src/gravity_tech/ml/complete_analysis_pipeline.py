@@ -52,6 +52,7 @@ from gravity_tech.ml.multi_horizon_support_resistance_analysis import MultiHoriz
 
 # Volume Matrix
 from gravity_tech.ml.volume_dimension_matrix import VolumeDimensionMatrix
+from gravity_tech.services.stage_metrics import StageTimer
 
 # 5D Decision Matrix
 from gravity_tech.ml.five_dimensional_decision_matrix import (
@@ -87,7 +88,8 @@ class CompleteAnalysisPipeline:
         candles: List[Candle],
         use_volume_matrix: bool = True,
         custom_weights: Optional[Dict[str, float]] = None,
-        verbose: bool = True
+        verbose: bool = True,
+        collect_timings: bool = False
     ):
         """
         Args:
@@ -95,11 +97,14 @@ class CompleteAnalysisPipeline:
             use_volume_matrix: فعال‌سازی تعدیلات حجم
             custom_weights: وزن‌های سفارشی برای ابعاد
             verbose: نمایش پیام‌های وضعیت
+            collect_timings: ثبت زمان هر مرحله در PipelineResult.stage_timings
         """
         self.candles = candles
         self.use_volume_matrix = use_volume_matrix
         self.custom_weights = custom_weights
         self.verbose = verbose
+        self.collect_timings = collect_timings
+        self._timer = StageTimer("complete_analysis", len(candles), collect=collect_timings)
         
         # نگهداری نتایج واسط
         self._trend_score: Optional[TrendScore] = None
@@ -130,6 +135,9 @@ class CompleteAnalysisPipeline:
         self._log("🚀 شروع تحلیل کامل (Complete Analysis Pipeline)")
         self._log("=" * 80)
         
+        # زمان‌سنج تازه برای هر اجرا
+        self._timer = StageTimer("complete_analysis", len(self.candles), collect=self.collect_timings)
+        
         # Step 1: محاسبه ابعاد پایه
         self._log("\n📊 Step 1: محاسبه 5 بُعد پایه...")
         self._calculate_base_dimensions()
@@ -137,13 +145,15 @@ class CompleteAnalysisPipeline:
         # Step 2: ماتریس حجم (اختیاری)
         if self.use_volume_matrix:
             self._log("\n📊 Step 2: محاسبه Volume-Dimension Matrix...")
-            self._calculate_volume_interactions()
+            with self._timer.stage("volume_matrix"):
+                self._calculate_volume_interactions()
         else:
             self._log("\n⏭️ Step 2: Volume Matrix غیرفعال است")
         
         # Step 3: تصمیم‌گیری 5 بُعدی
         self._log("\n📊 Step 3: تصمیم‌گیری 5 بُعدی (5D Decision)...")
-        self._make_final_decision()
+        with self._timer.stage("decision"):
+            self._make_final_decision()
         
         # ساخت نتیجه
         result = PipelineResult(
@@ -155,7 +165,8 @@ class CompleteAnalysisPipeline:
             cycle_score=self._cycle_score,
             sr_score=self._sr_score,
             volume_interactions=self._volume_interactions,
-            decision=self._final_decision
+            decision=self._final_decision,
+            stage_timings=self._timer.breakdown() if self.collect_timings else None
         )
         
         self._log("\n" + "=" * 80)
@@ -170,7 +181,8 @@ class CompleteAnalysisPipeline:
         # Trend
         self._log("   → Trend Analysis...")
         trend_analyzer = MultiHorizonAnalyzer()
-        trend_result = trend_analyzer.analyze(self.candles)
+        with self._timer.stage("trend"):
+            trend_result = trend_analyzer.analyze(self.candles)
         self._trend_score = trend_result.combined_score
         self._log(f"      Score: {self._trend_score.score:+.3f}, "
                   f"Signal: {self._trend_score.signal.value}")
@@ -178,7 +190,8 @@ class CompleteAnalysisPipeline:
         # Momentum
         self._log("   → Momentum Analysis...")
         momentum_analyzer = MultiHorizonMomentumAnalyzer()
-        momentum_result = momentum_analyzer.analyze(self.candles)
+        with self._timer.stage("momentum"):
+            momentum_result = momentum_analyzer.analyze(self.candles)
         self._momentum_score = momentum_result.combined_score
         self._log(f"      Score: {self._momentum_score.score:+.3f}, "
                   f"Signal: {self._momentum_score.signal.value}")
@@ -186,7 +199,8 @@ class CompleteAnalysisPipeline:
         # Volatility
         self._log("   → Volatility Analysis...")
         volatility_analyzer = MultiHorizonVolatilityAnalyzer()
-        volatility_result = volatility_analyzer.analyze(self.candles)
+        with self._timer.stage("volatility"):
+            volatility_result = volatility_analyzer.analyze(self.candles)
         self._volatility_score = volatility_result.combined_score
         self._log(f"      Score: {self._volatility_score.score:+.3f}, "
                   f"Signal: {self._volatility_score.signal.value}")
@@ -194,7 +208,8 @@ class CompleteAnalysisPipeline:
         # Cycle
         self._log("   → Cycle Analysis...")
         cycle_analyzer = MultiHorizonCycleAnalyzer()
-        cycle_result = cycle_analyzer.analyze(self.candles)
+        with self._timer.stage("cycle"):
+            cycle_result = cycle_analyzer.analyze(self.candles)
         self._cycle_score = cycle_result.combined_score
         self._log(f"      Score: {self._cycle_score.score:+.3f}, "
                   f"Phase: {cycle_result.pattern.value if hasattr(cycle_result, 'pattern') else 'N/A'}")
@@ -202,7 +217,8 @@ class CompleteAnalysisPipeline:
         # Support/Resistance
         self._log("   → Support/Resistance Analysis...")
         sr_analyzer = MultiHorizonSupportResistanceAnalyzer()
-        sr_result = sr_analyzer.analyze(self.candles)
+        with self._timer.stage("support_resistance"):
+            sr_result = sr_analyzer.analyze(self.candles)
         self._sr_score = sr_result.combined_score
         self._log(f"      Score: {self._sr_score.score:+.3f}, "
                   f"Pattern: {sr_result.pattern.value if hasattr(sr_result, 'pattern') else 'N/A'}")
@@ -238,7 +254,8 @@ class CompleteAnalysisPipeline:
             momentum_score=self._momentum_score,
             volatility_score=self._volatility_score,
             cycle_score=self._cycle_score,
-            sr_score=self._sr_score
+            sr_score=self._sr_score,
+            timer=self._timer.child("decision_matrix")
         )
         
         # نمایش خلاصه
@@ -303,7 +320,8 @@ class PipelineResult:
         cycle_score: CycleScore,
         sr_score: SupportResistanceScore,
         volume_interactions: Optional[Dict],
-        decision: FiveDimensionalDecision
+        decision: FiveDimensionalDecision,
+        stage_timings: Optional[Dict[str, float]] = None
     ):
         self.timestamp = timestamp
         self.candles_count = candles_count
@@ -314,6 +332,7 @@ class PipelineResult:
         self.sr_score = sr_score
         self.volume_interactions = volume_interactions
         self.decision = decision
+        self.stage_timings = stage_timings  # زمان هر مرحله (ms)
     
     def print_summary(self):
         """چاپ خلاصه نتایج"""
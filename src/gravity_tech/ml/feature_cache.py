@@ -0,0 +1,156 @@
+"""
+Per-Bar Feature Row Cache for Training Pipelines
+
+The multi-horizon trainers evaluate the same trailing window many times:
+once as the "current" sample and again as the "future" target of an
+earlier bar, and once more for every horizon. FeatureRowCache computes
+each bar's feature row once, keeps it in memory and optionally spills
+the table to Parquet (when pyarrow is available) so later runs on the
+same series and extractor code start warm.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import hashlib
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from gravity_tech.ml.feature_store import extractor_version
+from gravity_tech.models.schemas import Candle
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def series_fingerprint(candles: List[Candle], *params, extractor: Any = None) -> str:
+    """
+    Stable identifier of a candle series, the extractor parameters and code
+
+    Two series with identical OHLCV values and timestamps (and the same
+    params) map to the same fingerprint, so their cached rows are shared.
+    With an extractor, its code version (feature_store.extractor_version)
+    is part of the key: editing the extractor or an indicator it depends
+    on invalidates rows flushed by earlier runs.
+    """
+    ohlcv = np.array(
+        [(c.open, c.high, c.low, c.close, c.volume) for c in candles],
+        dtype=np.float64
+    )
+    digest = hashlib.sha1(ohlcv.tobytes())
+    if candles:
+        digest.update(f"{candles[0].timestamp}|{candles[-1].timestamp}".encode())
+    digest.update(repr(params).encode())
+    if extractor is not None:
+        digest.update(extractor_version(extractor).encode())
+    return digest.hexdigest()[:16]
+
+
+class FeatureRowCache:
+    """
+    Memoized feature table for one candle series
+
+    Rows are keyed by bar index; `compute(index)` is called only on the
+    first request for an index. With a cache_dir and pyarrow, `flush()`
+    writes the table to `<cache_dir>/<key>.parquet` and a new cache with
+    the same key loads it on construction; without pyarrow the table is
+    kept in memory only.
+    """
+
+    def __init__(
+        self,
+        compute: Callable[[int], Dict[str, float]],
+        key: str,
+        cache_dir: Optional[str] = None,
+        spill_every: int = 0
+    ):
+        """
+        Args:
+            compute: Function returning the feature row for a bar index
+            key: Series fingerprint (see series_fingerprint)
+            cache_dir: Directory for the on-disk table (None: memory only)
+            spill_every: Flush to disk after this many new rows (0: manual)
+        """
+        self.compute = compute
+        self.key = key
+        self.cache_dir = cache_dir
+        self.spill_every = spill_every
+        self.rows: Dict[int, Dict[str, float]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = 0
+        if cache_dir:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, index: int) -> bool:
+        return index in self.rows
+
+    def get(self, index: int) -> Dict[str, float]:
+        """Feature row for a bar index, computing it on first access"""
+        row = self.rows.get(index)
+        if row is not None:
+            self.hits += 1
+            return row
+
+        self.misses += 1
+        row = self.compute(index)
+        self.rows[index] = row
+        self._dirty += 1
+        if self.spill_every and self._dirty >= self.spill_every:
+            self.flush()
+        return row
+
+    def table(self, indices: Iterable[int]) -> pd.DataFrame:
+        """Feature rows for several bar indices as a DataFrame"""
+        indices = list(indices)
+        return pd.DataFrame([self.get(i) for i in indices], index=indices)
+
+    # ═══════════════════════════════════════════════════════════════
+    # On-disk table
+    # ═══════════════════════════════════════════════════════════════
+
+    def _path(self, suffix: str) -> str:
+        return os.path.join(self.cache_dir, f"{self.key}{suffix}")
+
+    def flush(self) -> Optional[str]:
+        """Write all cached rows to cache_dir; returns the file path (None: not written)"""
+        self._dirty = 0
+        if not self.cache_dir or not self.rows or not PYARROW_AVAILABLE:
+            return None
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        frame = pd.DataFrame.from_dict(self.rows, orient='index').sort_index()
+        path = self._path(".parquet")
+        frame.to_parquet(path)
+        return path
+
+    def _load(self) -> None:
+        """Load a previously flushed table, if any"""
+        parquet_path = self._path(".parquet")
+        if not PYARROW_AVAILABLE or not os.path.exists(parquet_path):
+            return
+        frame = pd.read_parquet(parquet_path)
+
+        for index, row in zip(frame.index, frame.to_dict(orient='records')):
+            self.rows[int(index)] = row
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters"""
+        total = self.hits + self.misses
+        return {
+            'rows': len(self.rows),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,316 @@
+"""
+Versioned Local Feature Store for Training Scripts
+
+Training scripts regenerate candles and re-extract the same feature
+matrices on every run. FeatureStore persists those matrices under a key
+of (symbol, timeframe, extractor version, params hash):
+
+    <root>/<symbol>/<timeframe>/<extractor>-<version>-<params_hash>/
+        meta.json       columns, index and dtypes of every stored frame
+        frame_0.npy     float64 values, column-major, opened with mmap
+
+The extractor version is a hash of the extractor's module source plus
+every gravity_tech/src module it imports (transitively), so editing
+extractor or indicator code changes the key and stale entries are never
+read. Saving a new version removes older versions for the same params.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+Frame = Union[pd.DataFrame, pd.Series]
+
+# Top-level packages whose modules count towards an extractor's version
+VERSIONED_PACKAGES = ("gravity_tech", "src")
+
+
+def _module_source_hash(module) -> str:
+    """SHA-1 of a module's source file (empty for built-ins)"""
+    try:
+        path = inspect.getsourcefile(module)
+    except TypeError:
+        return ""
+    if not path or not os.path.exists(path):
+        return ""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _versioned_dependencies(module) -> Dict[str, Any]:
+    """The module plus every gravity_tech/src module it reaches at module level"""
+    found = {}
+    pending = [module]
+    while pending:
+        current = pending.pop()
+        if current is None or current.__name__ in found:
+            continue
+        found[current.__name__] = current
+        for value in vars(current).values():
+            if inspect.ismodule(value):
+                dependency = value
+            elif inspect.isclass(value) or inspect.isfunction(value):
+                dependency = sys.modules.get(value.__module__)
+            else:
+                continue
+            if dependency is not None and \
+                    dependency.__name__.split(".")[0] in VERSIONED_PACKAGES:
+                pending.append(dependency)
+    return found
+
+
+def _extractor_target(extractor: Any):
+    """Class or function behind an extractor argument"""
+    if inspect.isclass(extractor) or inspect.isfunction(extractor):
+        return extractor
+    return type(extractor)
+
+
+def extractor_version(extractor: Any) -> str:
+    """
+    Code version of a feature extractor (instance, class or function)
+
+    Hashes the defining module and every gravity_tech/src module it
+    depends on, plus an optional VERSION attribute.
+    """
+    target = _extractor_target(extractor)
+    modules = _versioned_dependencies(sys.modules.get(target.__module__))
+
+    digest = hashlib.sha1(str(getattr(target, "VERSION", "")).encode())
+    for name in sorted(modules):
+        digest.update(name.encode())
+        digest.update(_module_source_hash(modules[name]).encode())
+    return digest.hexdigest()[:12]
+
+
+def params_hash(params: Dict[str, Any]) -> str:
+    """Stable hash of JSON-serializable extraction parameters"""
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()[:12]
+
+
+def data_fingerprint(candles: Union[pd.DataFrame, Sequence[Any]]) -> str:
+    """
+    Hash of the OHLCV values of a candle list or DataFrame
+
+    Timestamps are left out: the synthetic generators stamp candles
+    relative to now(), while the seeded values are identical run to run.
+    """
+    fields = ["open", "high", "low", "close", "volume"]
+    if isinstance(candles, pd.DataFrame):
+        values = candles[fields].to_numpy(dtype=np.float64)
+    else:
+        values = np.array([[getattr(c, f) for f in fields] for c in candles], dtype=np.float64)
+    return hashlib.sha1(np.ascontiguousarray(values).tobytes()).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class FeatureKey:
+    """Location of one stored feature set"""
+    symbol: str
+    timeframe: str
+    extractor: str
+    version: str
+    params_hash: str
+
+    @property
+    def name(self) -> str:
+        return f"{self.extractor}-{self.version}-{self.params_hash}"
+
+    def path(self, root: Path) -> Path:
+        return root / self.symbol / self.timeframe / self.name
+
+
+class FeatureStore:
+    """
+    Local, versioned store of feature matrices
+
+    Example:
+        store = FeatureStore("data/feature_store")
+        X, Y = store.load_or_compute(
+            "BTCUSDT", "1d", extractor, {"lookback": 100},
+            lambda: extractor.extract_training_dataset(candles)
+        )
+    """
+
+    def __init__(self, root: Union[str, Path] = "data/feature_store"):
+        self.root = Path(root)
+        self.hits = 0
+        self.misses = 0
+
+    def key(
+        self,
+        symbol: str,
+        timeframe: str,
+        extractor: Any,
+        params: Dict[str, Any]
+    ) -> FeatureKey:
+        """Build the store key for an extractor and its parameters"""
+        target = _extractor_target(extractor)
+        return FeatureKey(
+            symbol=symbol.upper(),
+            timeframe=timeframe,
+            extractor=target.__name__,
+            version=extractor_version(extractor),
+            params_hash=params_hash(params),
+        )
+
+    def exists(self, key: FeatureKey) -> bool:
+        return (key.path(self.root) / "meta.json").exists()
+
+    # ═══════════════════════════════════════════════════════════════
+    # Write
+    # ═══════════════════════════════════════════════════════════════
+
+    def save(
+        self,
+        key: FeatureKey,
+        frames: Sequence[Frame],
+        params: Optional[Dict[str, Any]] = None,
+        single: bool = False
+    ) -> Path:
+        """
+        Persist frames under key, replacing older versions
+
+        Numeric columns go to one column-major float64 .npy per frame;
+        other columns (e.g. labels) and the index are kept in meta.json.
+        single marks a bare frame (as opposed to a tuple of frames) so
+        load_or_compute can return it in the shape it was computed in.
+        """
+        target = key.path(self.root)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{key.name}-", dir=target.parent))
+
+        meta = {"key": key.__dict__, "params": params or {}, "single": single, "frames": []}
+        for i, frame in enumerate(frames):
+            is_series = isinstance(frame, pd.Series)
+            df = frame.to_frame() if is_series else frame
+            numeric = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+            other = [c for c in df.columns if c not in numeric]
+
+            values = np.asfortranarray(df[numeric].to_numpy(dtype=np.float64))
+            np.save(staging / f"frame_{i}.npy", values)
+            meta["frames"].append({
+                "series": is_series,
+                "name": frame.name if is_series else None,
+                "columns": [str(c) for c in df.columns],
+                "numeric": [str(c) for c in numeric],
+                "dtypes": {str(c): str(df[c].dtype) for c in numeric},
+                "other": {str(c): df[c].tolist() for c in other},
+                "index": self._encode_index(df.index),
+            })
+
+        with open(staging / "meta.json", "w") as f:
+            json.dump(meta, f, default=str)
+
+        if target.exists():
+            shutil.rmtree(target)
+        os.replace(staging, target)
+        self._remove_stale(key)
+        return target
+
+    def _remove_stale(self, key: FeatureKey) -> None:
+        """Delete entries of older extractor versions with the same params"""
+        parent = key.path(self.root).parent
+        for entry in parent.glob(f"{key.extractor}-*-{key.params_hash}"):
+            if entry.name != key.name:
+                shutil.rmtree(entry, ignore_errors=True)
+
+    @staticmethod
+    def _encode_index(index: pd.Index) -> Dict[str, Any]:
+        if isinstance(index, pd.RangeIndex):
+            return {"kind": "range", "start": index.start, "stop": index.stop, "step": index.step}
+        if pd.api.types.is_datetime64_any_dtype(index):
+            return {"kind": "datetime", "values": [str(v) for v in index]}
+        return {"kind": "values", "values": index.tolist()}
+
+    @staticmethod
+    def _decode_index(spec: Dict[str, Any]) -> pd.Index:
+        if spec["kind"] == "range":
+            return pd.RangeIndex(spec["start"], spec["stop"], spec["step"])
+        if spec["kind"] == "datetime":
+            return pd.DatetimeIndex(spec["values"])
+        return pd.Index(spec["values"])
+
+    # ═══════════════════════════════════════════════════════════════
+    # Read
+    # ═══════════════════════════════════════════════════════════════
+
+    def load_arrays(self, key: FeatureKey) -> Optional[Tuple[np.ndarray, ...]]:
+        """Raw memory-mapped value matrices (read-only), or None on miss"""
+        path = key.path(self.root)
+        if not self.exists(key):
+            return None
+        with open(path / "meta.json") as f:
+            meta = json.load(f)
+        return tuple(
+            np.load(path / f"frame_{i}.npy", mmap_mode="r")
+            for i in range(len(meta["frames"]))
+        )
+
+    def load(self, key: FeatureKey) -> Optional[Tuple[Frame, ...]]:
+        """Stored frames for key, or None on miss"""
+        if not self.exists(key):
+            return None
+        return self._load_frames(key)[0]
+
+    def _load_frames(self, key: FeatureKey) -> Tuple[Tuple[Frame, ...], Dict[str, Any]]:
+        path = key.path(self.root)
+        with open(path / "meta.json") as f:
+            meta = json.load(f)
+
+        frames = []
+        for i, spec in enumerate(meta["frames"]):
+            values = np.load(path / f"frame_{i}.npy", mmap_mode="r")
+            index = self._decode_index(spec["index"])
+            columns = {
+                name: values[:, j].astype(spec["dtypes"][name], copy=False)
+                for j, name in enumerate(spec["numeric"])
+            }
+            columns.update(spec["other"])
+            df = pd.DataFrame({c: columns[c] for c in spec["columns"]}, index=index)
+            frames.append(df.iloc[:, 0].rename(spec["name"]) if spec["series"] else df)
+        return tuple(frames), meta
+
+    def load_or_compute(
+        self,
+        symbol: str,
+        timeframe: str,
+        extractor: Any,
+        params: Dict[str, Any],
+        compute: Callable[[], Union[Frame, Tuple[Frame, ...]]]
+    ) -> Union[Frame, Tuple[Frame, ...]]:
+        """
+        Stored frames if present, otherwise compute, store and return them
+
+        compute may return one frame or a tuple of frames; the result has
+        the same shape either way.
+        """
+        key = self.key(symbol, timeframe, extractor, params)
+        if self.exists(key):
+            frames, meta = self._load_frames(key)
+            self.hits += 1
+            # Entries written before "single" was recorded: one frame was bare
+            single = meta.get("single", len(frames) == 1)
+            return frames[0] if single else frames
+
+        self.misses += 1
+        result = compute()
+        single = not isinstance(result, tuple)
+        self.save(key, (result,) if single else result, params, single=single)
+        return result
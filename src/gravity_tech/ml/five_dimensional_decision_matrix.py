@@ -33,6 +33,7 @@ from gravity_tech.models.schemas import (
     CycleScore,
     SupportResistanceScore
 )
+from gravity_tech.services.stage_metrics import StageTimer
 
 
 class DecisionSignal(Enum):
@@ -157,7 +158,8 @@ class FiveDimensionalDecisionMatrix:
         momentum_score: MomentumScore,
         volatility_score: VolatilityScore,
         cycle_score: CycleScore,
-        sr_score: SupportResistanceScore
+        sr_score: SupportResistanceScore,
+        timer: Optional[StageTimer] = None
     ) -> FiveDimensionalDecision:
         """
         تحلیل جامع و تولید تصمیم نهایی 5D
@@ -168,73 +170,82 @@ class FiveDimensionalDecisionMatrix:
             volatility_score: نتیجه تحلیل نوسان
             cycle_score: نتیجه تحلیل سیکل
             sr_score: نتیجه تحلیل حمایت/مقاومت
+            timer: زمان‌سنج مراحل (پیش‌فرض: فقط متریک Prometheus)
             
         Returns:
             FiveDimensionalDecision: تصمیم نهایی با تمام جزئیات
         """
+        if timer is None:
+            timer = StageTimer("decision_matrix", len(self.candles))
         
         # گام 1: جمع‌آوری state هر dimension
-        dimensions = self._collect_dimension_states(
-            trend_score, momentum_score, volatility_score, cycle_score, sr_score
-        )
+        with timer.stage("dimension_states"):
+            dimensions = self._collect_dimension_states(
+                trend_score, momentum_score, volatility_score, cycle_score, sr_score
+            )
         
         # گام 2: اعمال تعدیلات حجم (اگر فعال باشد)
         if self.use_volume_matrix:
-            dimensions = self._apply_volume_adjustments(
-                dimensions, trend_score, momentum_score, volatility_score, 
-                cycle_score, sr_score
+            with timer.stage("volume_adjustments"):
+                dimensions = self._apply_volume_adjustments(
+                    dimensions, trend_score, momentum_score, volatility_score, 
+                    cycle_score, sr_score
+                )
+        
+        with timer.stage("scoring"):
+            # گام 3: محاسبه وزن‌های داینامیک بر اساس confidence
+            dimensions = self._calculate_dynamic_weights(dimensions)
+            
+            # گام 4: محاسبه امتیاز و اطمینان نهایی
+            final_score, final_confidence = self._calculate_final_score(dimensions)
+            
+            # گام 5: تحلیل توافق بین dimensions
+            agreement = self._analyze_agreement(dimensions)
+            
+            # گام 6: تعیین سیگنال نهایی
+            final_signal = self._determine_signal(final_score, agreement)
+            
+            # گام 7: محاسبه قدرت سیگنال
+            signal_strength = self._calculate_signal_strength(
+                final_score, final_confidence, agreement
             )
         
-        # گام 3: محاسبه وزن‌های داینامیک بر اساس confidence
-        dimensions = self._calculate_dynamic_weights(dimensions)
-        
-        # گام 4: محاسبه امتیاز و اطمینان نهایی
-        final_score, final_confidence = self._calculate_final_score(dimensions)
-        
-        # گام 5: تحلیل توافق بین dimensions
-        agreement = self._analyze_agreement(dimensions)
-        
-        # گام 6: تعیین سیگنال نهایی
-        final_signal = self._determine_signal(final_score, agreement)
-        
-        # گام 7: محاسبه قدرت سیگنال
-        signal_strength = self._calculate_signal_strength(
-            final_score, final_confidence, agreement
-        )
-        
         # گام 8: ارزیابی ریسک
-        risk_level, risk_factors = self._assess_risk(
-            dimensions, agreement, final_confidence
-        )
+        with timer.stage("risk"):
+            risk_level, risk_factors = self._assess_risk(
+                dimensions, agreement, final_confidence
+            )
         
         # گام 9: تولید توصیه‌ها
-        recommendation = self._generate_recommendation(
-            final_signal, signal_strength, risk_level, agreement, dimensions
-        )
-        
-        entry_strategy = self._generate_entry_strategy(
-            final_signal, dimensions, risk_level
-        )
-        
-        exit_strategy = self._generate_exit_strategy(
-            final_signal, dimensions, risk_level
-        )
-        
-        stop_loss = self._suggest_stop_loss(
-            final_signal, dimensions, risk_level
-        )
-        
-        take_profit = self._suggest_take_profit(
-            final_signal, dimensions, signal_strength
-        )
-        
-        # گام 10: تحلیل شرایط بازار
-        market_condition = self._analyze_market_condition(dimensions)
+        with timer.stage("recommendations"):
+            recommendation = self._generate_recommendation(
+                final_signal, signal_strength, risk_level, agreement, dimensions
+            )
+            
+            entry_strategy = self._generate_entry_strategy(
+                final_signal, dimensions, risk_level
+            )
+            
+            exit_strategy = self._generate_exit_strategy(
+                final_signal, dimensions, risk_level
+            )
+            
+            stop_loss = self._suggest_stop_loss(
+                final_signal, dimensions, risk_level
+            )
+            
+            take_profit = self._suggest_take_profit(
+                final_signal, dimensions, signal_strength
+            )
         
-        # گام 11: استخراج نکات کلیدی
-        key_insights = self._extract_key_insights(
-            dimensions, agreement, final_signal
-        )
+        with timer.stage("insights"):
+            # گام 10: تحلیل شرایط بازار
+            market_condition = self._analyze_market_condition(dimensions)
+            
+            # گام 11: استخراج نکات کلیدی
+            key_insights = self._extract_key_insights(
+                dimensions, agreement, final_signal
+            )
         
         return FiveDimensionalDecision(
             timestamp=datetime.now(),
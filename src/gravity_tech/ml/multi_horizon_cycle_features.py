@@ -10,11 +10,12 @@ Multi-Horizon Feature Extraction for Cycle
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from datetime import datetime
 
 from gravity_tech.models.schemas import Candle
 from gravity_tech.indicators.cycle import CycleIndicators
+from gravity_tech.ml.feature_cache import FeatureRowCache, series_fingerprint
 
 
 class MultiHorizonCycleFeatureExtractor:
@@ -119,6 +120,30 @@ class MultiHorizonCycleFeatureExtractor:
         
         return features
     
+    def feature_rows(
+        self,
+        candles: List[Candle],
+        cache_dir: Optional[str] = None
+    ) -> FeatureRowCache:
+        """
+        جدول ویژگی‌های هر کندل برای یک سری (یک بار محاسبه برای همه افق‌ها)
+        
+        سطر i ویژگی‌های پنجره lookback منتهی به کندل i-1 است، یعنی همان
+        extract_cycle_features(candles[:i]). پنجره‌های "آینده" افق‌های مختلف
+        نیز همین سطرها را با اندیس i + horizon می‌خوانند.
+        
+        Args:
+            candles: لیست کندل‌ها
+            cache_dir: مسیر ذخیره جدول روی دیسک (None: فقط حافظه)
+        """
+        return FeatureRowCache(
+            compute=lambda end: self.extract_cycle_features(
+                candles[max(0, end - self.lookback_period):end]
+            ),
+            key=series_fingerprint(candles, 'cycle', self.lookback_period, extractor=self),
+            cache_dir=cache_dir
+        )
+    
     def _signal_to_numeric(self, signal) -> float:
         """تبدیل SignalStrength به مقدار عددی"""
         signal_map = {
@@ -238,7 +263,8 @@ class MultiHorizonCycleFeatureExtractor:
     def extract_horizon_features(
         self,
         candles: List[Candle],
-        horizon: int
+        horizon: int,
+        current_features: Optional[Dict[str, float]] = None
     ) -> Dict[str, float]:
         """
         استخراج ویژگی برای یک افق زمانی خاص
@@ -246,6 +272,7 @@ class MultiHorizonCycleFeatureExtractor:
         Args:
             candles: لیست کندل‌ها
             horizon: افق زمانی (3, 7, 30)
+            current_features: ویژگی‌های فعلی از پیش محاسبه‌شده (اختیاری)
         
         Returns:
             ویژگی‌ها برای افق مشخص شده
@@ -254,7 +281,8 @@ class MultiHorizonCycleFeatureExtractor:
             return self._get_empty_features()
         
         # ویژگی‌های فعلی
-        current_features = self.extract_cycle_features(candles)
+        if current_features is None:
+            current_features = self.extract_cycle_features(candles)
         
         # برچسب برای آینده (target)
         future_candles = candles[-(self.lookback_period - horizon):]
@@ -288,8 +316,12 @@ class MultiHorizonCycleFeatureExtractor:
         
         all_features = {}
         
+        # ویژگی‌های فعلی برای همه افق‌ها یکسان است؛ یک بار محاسبه می‌شود
+        current_features = self.extract_cycle_features(candles)
         for horizon in self.horizons:
-            horizon_features = self.extract_horizon_features(candles, horizon)
+            horizon_features = self.extract_horizon_features(
+                candles, horizon, current_features=current_features
+            )
             all_features.update(horizon_features)
         
         return all_features
@@ -13,15 +13,19 @@ Multi-Horizon Support/Resistance Feature Extraction
 - Clustering (توافق بین روش‌ها)
 - Zone Width (پهنای ناحیه)
 - Touch Count (تعداد تماس)
+
+سطوح پویا از Volume Profile هر افق (LevelEngine) خوانده می‌شوند که با
+هر کندل جدید به‌صورت افزایشی به‌روز می‌شود، نه با اسکن دوباره کندل‌ها.
 """
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
 from gravity_tech.models.schemas import Candle
 from gravity_tech.indicators.support_resistance import SupportResistanceIndicators
+from gravity_tech.indicators.volume_profile import LevelEngine
 
 
 @dataclass
@@ -62,19 +66,36 @@ class SRFeatures:
 class MultiHorizonSupportResistanceFeatureExtractor:
     """استخراج ویژگی‌های Multi-Horizon برای Support & Resistance"""
     
-    def __init__(self):
-        """Initialize feature extractor"""
+    # تعداد کندل برای هر افق (فرض: 1h candles)
+    HORIZON_PERIODS = {
+        '3d': 72,    # 3 days * 24 hours
+        '7d': 168,   # 7 days * 24 hours
+        '30d': 720   # 30 days * 24 hours
+    }
+    
+    def __init__(self, level_engine: Optional[LevelEngine] = None):
+        """
+        Initialize feature extractor
+        
+        Args:
+            level_engine: Volume Profile های هر نماد/افق (اختیاری)
+        """
         self.sr_indicators = SupportResistanceIndicators()
+        self.level_engine = level_engine or LevelEngine()
     
     def extract_sr_features(
         self,
-        candles: List[Candle]
+        candles: List[Candle],
+        window: Optional[int] = None
     ) -> SRFeatures:
         """
         استخراج ویژگی‌های S/R از کندل‌ها
         
         Args:
             candles: لیست کندل‌ها
+            window: پنجره Volume Profile (دوره افق)؛ پیش‌فرض: طول candles.
+                    با دوره افق، سری کوتاه‌تر از افق که رشد می‌کند همان
+                    پروفایل را افزایشی به‌روز می‌کند
             
         Returns:
             SRFeatures: ویژگی‌های استخراج شده
@@ -88,7 +109,8 @@ class MultiHorizonSupportResistanceFeatureExtractor:
         pivot_result = self.sr_indicators.pivot_points(candles)
         fib_result = self.sr_indicators.fibonacci_retracement(candles, lookback=50)
         camarilla_result = self.sr_indicators.camarilla_pivots(candles)
-        sr_levels_result = self.sr_indicators.support_resistance_levels(candles, lookback=50)
+        # Volume Profile همین پنجره (افزایشی برای سری‌های پیوسته)
+        profile = self.level_engine.sync(candles, window=window)
         
         # === Pivot Features ===
         pivot_price = pivot_result.value
@@ -110,10 +132,10 @@ class MultiHorizonSupportResistanceFeatureExtractor:
         cam_r4 = camarilla_result.additional_values['R4']
         resistances_camarilla = [r for r in [cam_r1, cam_r2, cam_r3, cam_r4] if r > current_price]
         
-        # از Dynamic S/R
-        dynamic_resistance = sr_levels_result.additional_values['resistance']
-        if dynamic_resistance > current_price:
-            resistances_dynamic = [dynamic_resistance]
+        # از Volume Profile
+        dynamic_resistance = profile.nearest_resistance(current_price)
+        if dynamic_resistance is not None and dynamic_resistance.price > current_price:
+            resistances_dynamic = [dynamic_resistance.price]
         else:
             resistances_dynamic = []
         
@@ -146,9 +168,9 @@ class MultiHorizonSupportResistanceFeatureExtractor:
         cam_s4 = camarilla_result.additional_values['S4']
         supports_camarilla = [s for s in [cam_s1, cam_s2, cam_s3, cam_s4] if s < current_price]
         
-        dynamic_support = sr_levels_result.additional_values['support']
-        if dynamic_support < current_price:
-            supports_dynamic = [dynamic_support]
+        dynamic_support = profile.nearest_support(current_price)
+        if dynamic_support is not None and dynamic_support.price < current_price:
+            supports_dynamic = [dynamic_support.price]
         else:
             supports_dynamic = []
         
@@ -220,10 +242,32 @@ class MultiHorizonSupportResistanceFeatureExtractor:
             level_density=level_density
         )
     
+    def _horizon_sr_features(
+        self,
+        candles: List[Candle]
+    ) -> Dict[str, SRFeatures]:
+        """
+        ویژگی‌های S/R هر افق، با یک بار محاسبه برای هر پنجره یکتا
+        
+        وقتی سری کوتاه‌تر از پنجره افق است، چند افق پنجره یکسانی دارند
+        و نتیجه بین آن‌ها مشترک است.
+        """
+        by_length: Dict[int, SRFeatures] = {}
+        by_horizon = {}
+        for horizon, period in self.HORIZON_PERIODS.items():
+            length = min(period, len(candles))
+            if length not in by_length:
+                by_length[length] = self.extract_sr_features(
+                    candles[len(candles) - length:], window=period
+                )
+            by_horizon[horizon] = by_length[length]
+        return by_horizon
+    
     def extract_horizon_features(
         self,
         candles: List[Candle],
-        horizon: str  # '3d', '7d', '30d'
+        horizon: str,  # '3d', '7d', '30d'
+        features: Optional[SRFeatures] = None
     ) -> Dict[str, float]:
         """
         استخراج ویژگی‌های یک افق زمانی خاص
@@ -231,22 +275,17 @@ class MultiHorizonSupportResistanceFeatureExtractor:
         Args:
             candles: لیست کندل‌ها
             horizon: افق زمانی
+            features: ویژگی‌های S/R از پیش محاسبه‌شده برای این افق (اختیاری)
             
         Returns:
             Dict: ویژگی‌ها به صورت dictionary
         """
-        # تعداد کندل برای هر افق (فرض: 1h candles)
-        horizon_periods = {
-            '3d': 72,    # 3 days * 24 hours
-            '7d': 168,   # 7 days * 24 hours
-            '30d': 720   # 30 days * 24 hours
-        }
-        
-        period = horizon_periods.get(horizon, 72)
-        recent_candles = candles[-period:] if len(candles) > period else candles
-        
-        # استخراج ویژگی‌ها
-        features = self.extract_sr_features(recent_candles)
+        if features is None:
+            period = self.HORIZON_PERIODS.get(horizon, 72)
+            recent_candles = candles[-period:] if len(candles) > period else candles
+            
+            # استخراج ویژگی‌ها
+            features = self.extract_sr_features(recent_candles, window=period)
         
         # تبدیل به dictionary با prefix افق
         return {
@@ -282,26 +321,32 @@ class MultiHorizonSupportResistanceFeatureExtractor:
             Dict: همه ویژگی‌ها
         """
         all_features = {}
+        sr_features = self._horizon_sr_features(candles)
         
         # ویژگی‌های هر افق
         for horizon in ['3d', '7d', '30d']:
-            horizon_features = self.extract_horizon_features(candles, horizon)
+            horizon_features = self.extract_horizon_features(
+                candles, horizon, features=sr_features[horizon]
+            )
             all_features.update(horizon_features)
         
         # ویژگی‌های ترکیبی بین افق‌ها
-        combined = self._extract_cross_horizon_features(candles)
+        combined = self._extract_cross_horizon_features(candles, sr_features)
         all_features.update(combined)
         
         return all_features
     
     def _extract_cross_horizon_features(
         self,
-        candles: List[Candle]
+        candles: List[Candle],
+        sr_features: Optional[Dict[str, SRFeatures]] = None
     ) -> Dict[str, float]:
         """استخراج ویژگی‌های ترکیبی بین افق‌ها"""
-        features_3d = self.extract_sr_features(candles[-72:] if len(candles) > 72 else candles)
-        features_7d = self.extract_sr_features(candles[-168:] if len(candles) > 168 else candles)
-        features_30d = self.extract_sr_features(candles[-720:] if len(candles) > 720 else candles)
+        if sr_features is None:
+            sr_features = self._horizon_sr_features(candles)
+        features_3d = sr_features['3d']
+        features_7d = sr_features['7d']
+        features_30d = sr_features['30d']
         
         return {
             # توافق بین افق‌ها در نزدیکی به مقاومت
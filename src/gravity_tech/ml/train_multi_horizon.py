@@ -15,7 +15,7 @@ import json
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
-from typing import List
+from typing import List, Optional
 
 # Add parent directory to path
 project_root = Path(__file__).parent.parent
@@ -23,6 +23,7 @@ sys.path.insert(0, str(project_root))
 
 from gravity_tech.models.schemas import Candle
 from gravity_tech.ml.multi_horizon_feature_extraction import MultiHorizonFeatureExtractor
+from gravity_tech.ml.feature_store import FeatureStore, data_fingerprint
 from gravity_tech.ml.multi_horizon_weights import MultiHorizonWeightLearner
 
 
@@ -97,7 +98,8 @@ def train_multi_horizon_system(
     interval: str = "1d",
     lookback_days: int = 365,
     horizons: list = None,
-    output_dir: str = "ml_models/multi_horizon"
+    output_dir: str = "ml_models/multi_horizon",
+    feature_store: Optional[FeatureStore] = None
 ):
     """
     آموزش سیستم چند افقی
@@ -108,6 +110,7 @@ def train_multi_horizon_system(
         lookback_days: تعداد روزهای گذشته
         horizons: لیست افق‌ها (پیش‌فرض: [3, 7, 30])
         output_dir: مسیر ذخیره مدل‌ها
+        feature_store: ذخیره ویژگی‌ها برای استفاده مجدد بین اجراها (اختیاری)
     """
     horizons = horizons or [3, 7, 30]
     
@@ -145,10 +148,24 @@ def train_multi_horizon_system(
         horizons=horizons
     )
     
-    X_indicators, Y = extractor.extract_training_dataset(
-        candles,
-        level="indicators"
-    )
+    def extract(level: str):
+        """استخراج ویژگی‌ها، از feature store در صورت وجود"""
+        if feature_store is None:
+            return extractor.extract_training_dataset(candles, level=level)
+        return feature_store.load_or_compute(
+            symbol=symbol,
+            timeframe=interval,
+            extractor=extractor,
+            params={
+                "level": level,
+                "data": data_fingerprint(candles),
+                "lookback_period": extractor.lookback_period,
+                "horizons": horizons,
+            },
+            compute=lambda: extractor.extract_training_dataset(candles, level=level)
+        )
+    
+    X_indicators, Y = extract("indicators")
     
     print(f"✅ Level 1 Features: {X_indicators.shape}")
     print(f"   Targets: {Y.shape}")
@@ -181,10 +198,7 @@ def train_multi_horizon_system(
     # ═══════════════════════════════════════════════════════════
     print("\n🔬 Step 4a: Extracting Level 2 Features (Dimensions)...")
     
-    X_dimensions, Y_dim = extractor.extract_training_dataset(
-        candles,
-        level="dimensions"
-    )
+    X_dimensions, Y_dim = extract("dimensions")
     
     print(f"✅ Level 2 Features: {X_dimensions.shape}")
     
@@ -366,6 +380,12 @@ if __name__ == "__main__":
         default='ml_models/multi_horizon',
         help='Output directory (default: ml_models/multi_horizon)'
     )
+    parser.add_argument(
+        '--feature-store',
+        type=str,
+        default=None,
+        help='Feature store directory for reusing extracted features (default: off)'
+    )
     
     args = parser.parse_args()
     
@@ -375,7 +395,8 @@ if __name__ == "__main__":
         interval=args.interval,
         lookback_days=args.lookback,
         horizons=args.horizons,
-        output_dir=args.output
+        output_dir=args.output,
+        feature_store=FeatureStore(args.feature_store) if args.feature_store else None
     )
     
     print("\n✅ Training pipeline finished successfully!")
@@ -11,6 +11,8 @@ import os
 from datetime import datetime
 
 from gravity_tech.models.schemas import Candle
+from gravity_tech.ml.feature_cache import FeatureRowCache
+from gravity_tech.ml.feature_store import FeatureStore, data_fingerprint
 from gravity_tech.ml.multi_horizon_cycle_features import MultiHorizonCycleFeatureExtractor
 from gravity_tech.ml.multi_horizon_weights import MultiHorizonWeightLearner
 
@@ -125,7 +127,11 @@ class MultiHorizonCycleTrainer:
     def __init__(
         self,
         lookback_period: int = 100,
-        horizons: List = None
+        horizons: List = None,
+        cache_dir: Optional[str] = None,
+        feature_store: Optional[FeatureStore] = None,
+        symbol: str = 'SYNTHETIC',
+        timeframe: str = '1h'
     ):
         """
         Initialize trainer
@@ -133,9 +139,17 @@ class MultiHorizonCycleTrainer:
         Args:
             lookback_period: تعداد کندل‌های گذشته
             horizons: لیست افق‌های زمانی
+            cache_dir: مسیر جدول ویژگی‌ها روی دیسک (None: فقط حافظه)
+            feature_store: ذخیره داده‌های آموزش هر افق بین اجراها (اختیاری)
+            symbol: نماد برای کلید feature store
+            timeframe: بازه زمانی برای کلید feature store
         """
         self.lookback_period = lookback_period
         self.horizons = horizons or [3, 7, 30]
+        self.cache_dir = cache_dir
+        self.feature_store = feature_store
+        self.symbol = symbol
+        self.timeframe = timeframe
         self.feature_extractor = MultiHorizonCycleFeatureExtractor(
             lookback_period=lookback_period,
             horizons=self.horizons
@@ -145,34 +159,37 @@ class MultiHorizonCycleTrainer:
     def prepare_training_data(
         self,
         candles: List[Candle],
-        horizon: int
+        horizon: int,
+        feature_rows: Optional[FeatureRowCache] = None
     ) -> tuple:
         """
         آماده‌سازی داده برای آموزش یک افق
         
+        Args:
+            candles: لیست کندل‌ها
+            horizon: افق زمانی
+            feature_rows: جدول ویژگی‌های مشترک بین افق‌ها (اختیاری)
+        
         Returns:
             (features_list, targets_list)
         """
         features_list = []
         targets_list = []
         
+        if feature_rows is None:
+            feature_rows = self.feature_extractor.feature_rows(candles, self.cache_dir)
+        
         max_idx = len(candles) - self.lookback_period - horizon
         
         for i in range(self.lookback_period, max_idx):
-            # استخراج ویژگی‌ها
-            candles_window = candles[:i]
-            features = self.feature_extractor.extract_cycle_features(
-                candles_window[-self.lookback_period:]
-            )
+            # استخراج ویژگی‌ها (پنجره منتهی به i)
+            features = feature_rows.get(i)
             
             # محاسبه target: تغییر فاز در آینده
             current_phase = features.get('cycle_avg_phase', 0.0)
             
-            # فاز آینده
-            future_candles = candles[:i + horizon]
-            future_features = self.feature_extractor.extract_cycle_features(
-                future_candles[-self.lookback_period:]
-            )
+            # فاز آینده (همان جدول، اندیس i + horizon)
+            future_features = feature_rows.get(i + horizon)
             future_phase = future_features.get('cycle_avg_phase', 0.0)
             
             # محاسبه تغییر فاز
@@ -199,6 +216,35 @@ class MultiHorizonCycleTrainer:
         
         return features_list, targets_list
     
+    def _load_training_data(
+        self,
+        candles: List[Candle],
+        horizon: int,
+        feature_rows: FeatureRowCache
+    ) -> tuple:
+        """prepare_training_data با استفاده از feature store در صورت وجود"""
+        if self.feature_store is None:
+            return self.prepare_training_data(candles, horizon, feature_rows=feature_rows)
+        
+        def compute():
+            features_list, targets_list = self.prepare_training_data(
+                candles, horizon, feature_rows=feature_rows
+            )
+            return pd.DataFrame(features_list), pd.Series(targets_list, name='target')
+        
+        features_df, targets = self.feature_store.load_or_compute(
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            extractor=self,
+            params={
+                'data': data_fingerprint(candles),
+                'lookback_period': self.lookback_period,
+                'horizon': horizon,
+            },
+            compute=compute
+        )
+        return features_df.to_dict(orient='records'), targets.tolist()
+    
     def train(
         self,
         train_candles: List[Candle],
@@ -221,6 +267,13 @@ class MultiHorizonCycleTrainer:
         if validation_candles:
             print(f"تعداد کندل‌های اعتبارسنجی: {len(validation_candles)}")
         
+        # جدول ویژگی‌ها یک بار برای هر سری ساخته و بین همه افق‌ها مشترک است
+        train_rows = self.feature_extractor.feature_rows(train_candles, self.cache_dir)
+        val_rows = (
+            self.feature_extractor.feature_rows(validation_candles, self.cache_dir)
+            if validation_candles else None
+        )
+        
         # آموزش برای هر افق
         for horizon in self.horizons:
             print(f"\n{'='*70}")
@@ -229,15 +282,15 @@ class MultiHorizonCycleTrainer:
             
             # آماده‌سازی داده
             print("\n1. آماده‌سازی داده آموزش...")
-            train_features, train_targets = self.prepare_training_data(
-                train_candles, horizon
+            train_features, train_targets = self._load_training_data(
+                train_candles, horizon, train_rows
             )
             print(f"   تعداد نمونه‌های آموزش: {len(train_features)}")
             
             if validation_candles:
                 print("\n2. آماده‌سازی داده اعتبارسنجی...")
-                val_features, val_targets = self.prepare_training_data(
-                    validation_candles, horizon
+                val_features, val_targets = self._load_training_data(
+                    validation_candles, horizon, val_rows
                 )
                 print(f"   تعداد نمونه‌های اعتبارسنجی: {len(val_features)}")
             else:
@@ -275,6 +328,10 @@ class MultiHorizonCycleTrainer:
                 print(f"   RMSE: {rmse:.4f}")
                 print(f"   Direction Accuracy: {accuracy:.2%}")
         
+        train_rows.flush()
+        if val_rows is not None:
+            val_rows.flush()
+        
         # ذخیره مدل
         print(f"\n{'='*70}")
         print("ذخیره مدل...")
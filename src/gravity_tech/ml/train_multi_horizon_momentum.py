@@ -11,6 +11,7 @@ import os
 
 from gravity_tech.ml.multi_horizon_momentum_features import MultiHorizonMomentumFeatureExtractor
 from gravity_tech.ml.multi_horizon_weights import MultiHorizonWeightLearner
+from gravity_tech.ml.feature_store import FeatureStore, data_fingerprint
 
 
 def create_realistic_market_data(
@@ -73,7 +74,10 @@ def train_momentum_model(
     horizons: list[str] = None,
     test_size: float = 0.2,
     output_dir: str = 'models/momentum',
-    verbose: bool = True
+    verbose: bool = True,
+    feature_store: Optional[FeatureStore] = None,
+    symbol: str = 'SYNTHETIC',
+    timeframe: str = '1h'
 ) -> MultiHorizonWeightLearner:
     """
     آموزش مدل مومنتوم چند افقی
@@ -84,6 +88,9 @@ def train_momentum_model(
         test_size: درصد داده تست
         output_dir: مسیر ذخیره مدل
         verbose: نمایش جزئیات
+        feature_store: ذخیره ویژگی‌ها برای استفاده مجدد بین اجراها (اختیاری)
+        symbol: نماد برای کلید feature store
+        timeframe: بازه زمانی برای کلید feature store
     """
     if horizons is None:
         horizons = ['3d', '7d', '30d']
@@ -101,7 +108,16 @@ def train_momentum_model(
         print("\n🔍 Extracting momentum features...")
     
     extractor = MultiHorizonMomentumFeatureExtractor(horizons=horizons)
-    X, Y = extractor.extract_training_dataset(candles)
+    if feature_store is None:
+        X, Y = extractor.extract_training_dataset(candles)
+    else:
+        X, Y = feature_store.load_or_compute(
+            symbol=symbol,
+            timeframe=timeframe,
+            extractor=extractor,
+            params={'data': data_fingerprint(candles), 'horizons': horizons},
+            compute=lambda: extractor.extract_training_dataset(candles)
+        )
     
     if verbose:
         print(f"   ✅ Features: {X.shape[1]} columns")
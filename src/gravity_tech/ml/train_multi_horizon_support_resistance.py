@@ -12,7 +12,7 @@ Training Pipeline for Multi-Horizon Support/Resistance Weights
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 import json
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -20,6 +20,7 @@ from datetime import datetime, timedelta
 from gravity_tech.models.schemas import Candle
 from gravity_tech.ml.multi_horizon_support_resistance_features import MultiHorizonSupportResistanceFeatureExtractor
 from gravity_tech.ml.multi_horizon_support_resistance_analysis import MultiHorizonSupportResistanceAnalyzer
+from gravity_tech.ml.feature_store import FeatureStore
 
 
 def create_bounce_scenario(
@@ -353,23 +354,51 @@ def create_fake_out_scenario(
 class MultiHorizonSupportResistanceTrainer:
     """Trainer برای آموزش وزن‌های Support & Resistance"""
     
-    def __init__(self):
-        """Initialize trainer"""
+    def __init__(self, feature_store: Optional[FeatureStore] = None):
+        """
+        Initialize trainer
+        
+        Args:
+            feature_store: ذخیره داده‌های آموزش بین اجراها (اختیاری؛ فقط با seed)
+        """
         self.feature_extractor = MultiHorizonSupportResistanceFeatureExtractor()
+        self.feature_store = feature_store
     
     def prepare_training_data(
         self,
-        num_samples: int = 2000
+        num_samples: int = 2000,
+        seed: Optional[int] = None
     ) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         تولید داده آموزش
         
         Args:
             num_samples: تعداد نمونه (500 از هر سناریو)
+            seed: seed تولید سناریوها؛ فقط داده seed‌دار در feature store ذخیره می‌شود
             
         Returns:
             (features_df, targets_df)
         """
+        if self.feature_store is None or seed is None:
+            return self._generate_training_data(num_samples, seed)
+        
+        return self.feature_store.load_or_compute(
+            symbol='SYNTHETIC',
+            timeframe='1h',
+            extractor=self,
+            params={'num_samples': num_samples, 'seed': seed},
+            compute=lambda: self._generate_training_data(num_samples, seed)
+        )
+    
+    def _generate_training_data(
+        self,
+        num_samples: int,
+        seed: Optional[int] = None
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """تولید سناریوها و استخراج ویژگی‌ها"""
+        if seed is not None:
+            np.random.seed(seed)
+        
         print(f"🔄 در حال تولید {num_samples} نمونه آموزشی...")
         
         all_features = []
@@ -13,6 +13,7 @@ from datetime import datetime
 from gravity_tech.models.schemas import Candle
 from gravity_tech.ml.multi_horizon_volatility_features import MultiHorizonVolatilityFeatureExtractor
 from gravity_tech.ml.multi_horizon_weights import MultiHorizonWeightLearner
+from gravity_tech.ml.feature_store import FeatureStore, data_fingerprint
 
 
 def create_realistic_volatility_data(
@@ -105,7 +106,10 @@ def train_volatility_model(
     horizons: List[str] = None,
     test_size: float = 0.2,
     output_dir: str = 'models/volatility',
-    verbose: bool = True
+    verbose: bool = True,
+    feature_store: Optional[FeatureStore] = None,
+    symbol: str = 'SYNTHETIC',
+    timeframe: str = '1h'
 ) -> MultiHorizonWeightLearner:
     """
     آموزش مدل نوسان چند افقی
@@ -116,6 +120,9 @@ def train_volatility_model(
         test_size: درصد داده تست
         output_dir: مسیر ذخیره مدل
         verbose: نمایش جزئیات
+        feature_store: ذخیره ویژگی‌ها برای استفاده مجدد بین اجراها (اختیاری)
+        symbol: نماد برای کلید feature store
+        timeframe: بازه زمانی برای کلید feature store
         
     Returns:
         مدل آموزش‌دیده
@@ -136,7 +143,17 @@ def train_volatility_model(
         print("\n🔍 Extracting volatility features...")
     
     extractor = MultiHorizonVolatilityFeatureExtractor(horizons=horizons)
-    X, Y = extractor.create_training_dataset(candles, horizons=[int(h.replace('d', '')) for h in horizons])
+    horizon_days = [int(h.replace('d', '')) for h in horizons]
+    if feature_store is None:
+        X, Y = extractor.create_training_dataset(candles, horizons=horizon_days)
+    else:
+        X, Y = feature_store.load_or_compute(
+            symbol=symbol,
+            timeframe=timeframe,
+            extractor=extractor,
+            params={'data': data_fingerprint(candles), 'horizons': horizon_days},
+            compute=lambda: extractor.create_training_dataset(candles, horizons=horizon_days)
+        )
     
     if verbose:
         print(f"   ✅ Features: {X.shape[1]} columns")
@@ -12,10 +12,12 @@ Usage:
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
 import json
 
 from gravity_tech.ml.data_connector import DataConnector
 from gravity_tech.ml.feature_extraction import FeatureExtractor
+from gravity_tech.ml.feature_store import FeatureStore
 from gravity_tech.ml.ml_indicator_weights import IndicatorWeightLearner
 from gravity_tech.ml.ml_dimension_weights import DimensionWeightLearner
 
@@ -31,7 +33,8 @@ class MLTrainingPipeline:
         days: int = 730,
         model_type: str = "lightgbm",
         lookback_period: int = 100,
-        forward_days: int = 5
+        forward_days: int = 5,
+        feature_store: Optional[FeatureStore] = None
     ):
         """
         Initialize training pipeline
@@ -42,12 +45,16 @@ class MLTrainingPipeline:
             model_type: ML model type (lightgbm, xgboost, sklearn)
             lookback_period: Candles for indicator calculation
             forward_days: Days ahead for return prediction
+            feature_store: Reuse extracted features across runs (optional);
+                candles are then fetched only on a store miss
         """
         self.symbol = symbol
         self.days = days
         self.model_type = model_type
         self.lookback_period = lookback_period
         self.forward_days = forward_days
+        self.feature_store = feature_store
+        self.end_date = datetime.utcnow()
         
         self.connector = DataConnector()
         self.extractor = FeatureExtractor(lookback_period, forward_days)
@@ -64,7 +71,7 @@ class MLTrainingPipeline:
         print("📥 STEP 1: Fetching Historical Data")
         print("=" * 70)
         
-        end_date = datetime.utcnow()
+        end_date = self.end_date
         start_date = end_date - timedelta(days=self.days)
         
         print(f"\nSymbol: {self.symbol}")
@@ -86,6 +93,33 @@ class MLTrainingPipeline:
                        / self.candles[0].close * 100)
         print(f"   Change: {price_change:+.2f}%")
     
+    def _extract_dataset(self, level: str):
+        """
+        Training dataset for a feature level, served from the feature
+        store when one is configured (daily data: keyed by end date)
+        """
+        def compute():
+            if self.candles is None:
+                self.step1_fetch_data()
+            return self.extractor.extract_training_dataset(self.candles, level=level)
+        
+        if self.feature_store is None:
+            return compute()
+        
+        return self.feature_store.load_or_compute(
+            symbol=self.symbol,
+            timeframe="1d",
+            extractor=self.extractor,
+            params={
+                "level": level,
+                "days": self.days,
+                "end_date": self.end_date.date().isoformat(),
+                "lookback_period": self.lookback_period,
+                "forward_days": self.forward_days,
+            },
+            compute=compute
+        )
+    
     def step2_train_indicator_weights(self):
         """
         Step 2: Train Level 1 - 10 Indicator Weights
@@ -96,10 +130,7 @@ class MLTrainingPipeline:
         
         # Extract features
         print("\n📊 Extracting indicator-level features...")
-        X, y = self.extractor.extract_training_dataset(
-            self.candles,
-            level="indicators"
-        )
+        X, y = self._extract_dataset("indicators")
         
         print(f"✅ Features: {X.shape}")
         print(f"   Samples: {X.shape[0]}")
@@ -140,10 +171,7 @@ class MLTrainingPipeline:
         
         # Extract features
         print("\n📊 Extracting dimension-level features...")
-        X, y = self.extractor.extract_training_dataset(
-            self.candles,
-            level="dimensions"
-        )
+        X, y = self._extract_dataset("dimensions")
         
         print(f"✅ Features: {X.shape}")
         print(f"   Samples: {X.shape[0]}")
@@ -189,7 +217,7 @@ class MLTrainingPipeline:
             'model_type': self.model_type,
             'lookback_period': self.lookback_period,
             'forward_days': self.forward_days,
-            'total_candles': len(self.candles),
+            'total_candles': len(self.candles) if self.candles is not None else None,
             'level1_metrics': metrics_level1,
             'level2_metrics': metrics_level2,
             'level1_weights': self.indicator_learner.get_weights() if self.indicator_learner else {},
@@ -242,8 +270,9 @@ class MLTrainingPipeline:
         print(f"Forward Days:    {self.forward_days} days")
         
         try:
-            # Step 1: Fetch data
-            self.step1_fetch_data()
+            # Step 1: Fetch data (deferred to a feature store miss)
+            if self.feature_store is None:
+                self.step1_fetch_data()
             
             # Step 2: Train indicator weights
             metrics_level1 = self.step2_train_indicator_weights()
@@ -325,6 +354,13 @@ def main():
         help='Forward days for return prediction (default: 5)'
     )
     
+    parser.add_argument(
+        '--feature-store',
+        type=str,
+        default=None,
+        help='Feature store directory for reusing extracted features (default: off)'
+    )
+    
     args = parser.parse_args()
     
     # Create and run pipeline
@@ -333,7 +369,8 @@ def main():
         days=args.days,
         model_type=args.model,
         lookback_period=args.lookback,
-        forward_days=args.forward
+        forward_days=args.forward,
+        feature_store=FeatureStore(args.feature_store) if args.feature_store else None
     )
     
     summary = pipeline.run_complete_pipeline()
@@ -274,6 +274,12 @@ class TechnicalAnalysisResult(BaseModel):
         description="Source of weights: 'default', 'ml', 'adaptive'"
     )
     
+    # Per-stage timing breakdown (only with debug_timings)
+    stage_timings_ms: Optional[Dict[str, float]] = Field(
+        default=None,
+        description="Duration of each analysis stage in milliseconds"
+    )
+    
     analysis_timestamp: datetime = Field(
         default_factory=datetime.utcnow,
         description="Analysis timestamp"
@@ -22,6 +22,56 @@ License: MIT
 from typing import List, Optional
 from gravity_tech.models.schemas import Candle, PatternResult, SignalStrength, PatternType
 from datetime import datetime
+from dataclasses import dataclass
+import numpy as np
+
+
+# Column order of the scan matrices with per-pattern metadata matching
+# detect_patterns: (direction, confidence, bars spanned)
+CANDLESTICK_PATTERNS = {
+    "doji": (0, 0.6, 1),
+    "hammer": (1, 0.7, 1),
+    "inverted_hammer": (1, 0.65, 1),
+    "bullish_engulfing": (1, 0.8, 2),
+    "bearish_engulfing": (-1, 0.8, 2),
+    "morning_star": (1, 0.85, 3),
+    "evening_star": (-1, 0.85, 3),
+    "bullish_harami": (1, 0.7, 2),
+    "bearish_harami": (-1, 0.7, 2),
+    "three_white_soldiers": (1, 0.82, 3),
+    "three_black_crows": (-1, 0.82, 3),
+}
+
+
+@dataclass(frozen=True)
+class CandlestickScan:
+    """
+    Result of a vectorized candlestick scan (bars × patterns)
+    
+    Row i describes the pattern window ending at bar i.
+    
+    Attributes:
+        names: Pattern names (column order)
+        matches: Boolean matrix, True where the pattern completes at the bar
+        strength: Pattern confidence where matched, 0.0 elsewhere
+        directions: +1 bullish, -1 bearish, 0 neutral per pattern
+    """
+    names: tuple
+    matches: np.ndarray
+    strength: np.ndarray
+    directions: np.ndarray
+    
+    def column(self, name: str) -> np.ndarray:
+        """Boolean match vector for one pattern"""
+        return self.matches[:, self.names.index(name)]
+    
+    def signed_strength(self) -> np.ndarray:
+        """Strength matrix signed by pattern direction"""
+        return self.strength * self.directions
+    
+    def net_score(self) -> np.ndarray:
+        """Per-bar sum of signed pattern strengths"""
+        return self.signed_strength().sum(axis=1)
 
 
 class CandlestickPatterns:
@@ -152,6 +202,125 @@ class CandlestickPatterns:
         
         return None
     
+    @staticmethod
+    def scan_arrays(
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        doji_threshold: float = 0.1
+    ) -> CandlestickScan:
+        """
+        Evaluate all candlestick patterns over full OHLC arrays in one pass
+        
+        Uses the same rules as the per-candle predicates (is_doji, is_hammer,
+        is_engulfing, ...) so every row agrees with calling the predicates on
+        the candles ending at that bar.
+        
+        Args:
+            open_, high, low, close: OHLC arrays of equal length
+            doji_threshold: Body/range threshold for Doji
+            
+        Returns:
+            CandlestickScan with bars × patterns matrices
+        """
+        o = np.asarray(open_, dtype=np.float64)
+        h = np.asarray(high, dtype=np.float64)
+        l = np.asarray(low, dtype=np.float64)
+        c = np.asarray(close, dtype=np.float64)
+        n = len(c)
+        
+        body = np.abs(c - o)
+        total_range = h - l
+        upper = h - np.maximum(o, c)
+        lower = np.minimum(o, c) - l
+        bull = c > o
+        bear = c < o
+        
+        matches = np.zeros((n, len(CANDLESTICK_PATTERNS)), dtype=bool)
+        col = {name: j for j, name in enumerate(CANDLESTICK_PATTERNS)}
+        
+        # Single-candle patterns
+        with np.errstate(divide='ignore', invalid='ignore'):
+            matches[:, col["doji"]] = (total_range > 0) & (body / total_range < doji_threshold)
+        matches[:, col["hammer"]] = (lower > 2 * body) & (upper < body * 0.3) & (body > 0)
+        matches[:, col["inverted_hammer"]] = (upper > 2 * body) & (lower < body * 0.3) & (body > 0)
+        
+        # Two-candle patterns: [1:] is the current bar, [:-1] the previous one
+        if n >= 2:
+            o1, c1, o2, c2 = o[:-1], c[:-1], o[1:], c[1:]
+            bull1, bear1, bull2, bear2 = bull[:-1], bear[:-1], bull[1:], bear[1:]
+            body1, body2 = body[:-1], body[1:]
+            
+            matches[1:, col["bullish_engulfing"]] = bear1 & bull2 & (o2 < c1) & (c2 > o1)
+            matches[1:, col["bearish_engulfing"]] = bull1 & bear2 & (o2 > c1) & (c2 < o1)
+            matches[1:, col["bullish_harami"]] = (
+                bear1 & bull2 & (o2 > c1) & (c2 < o1) & (body2 < body1 * 0.7)
+            )
+            matches[1:, col["bearish_harami"]] = (
+                bull1 & bear2 & (o2 < c1) & (c2 > o1) & (body2 < body1 * 0.7)
+            )
+        
+        # Three-candle patterns
+        if n >= 3:
+            o1, c1 = o[:-2], c[:-2]
+            o2, c2 = o[1:-1], c[1:-1]
+            o3, c3 = o[2:], c[2:]
+            bull1, bull2, bull3 = bull[:-2], bull[1:-1], bull[2:]
+            bear1, bear2, bear3 = bear[:-2], bear[1:-1], bear[2:]
+            small_middle = body[1:-1] < body[:-2] * 0.3
+            midpoint1 = (o1 + c1) / 2
+            
+            matches[2:, col["morning_star"]] = bear1 & small_middle & bull3 & (c3 > midpoint1)
+            matches[2:, col["evening_star"]] = bull1 & small_middle & bear3 & (c3 < midpoint1)
+            matches[2:, col["three_white_soldiers"]] = (
+                bull1 & bull2 & bull3 &
+                (c2 > c1) & (c3 > c2) &
+                (o2 > o1) & (o2 < c1) &
+                (o3 > o2) & (o3 < c2)
+            )
+            matches[2:, col["three_black_crows"]] = (
+                bear1 & bear2 & bear3 &
+                (c2 < c1) & (c3 < c2) &
+                (o2 < o1) & (o2 > c1) &
+                (o3 < o2) & (o3 > c2)
+            )
+        
+        meta = list(CANDLESTICK_PATTERNS.values())
+        confidence = np.array([m[1] for m in meta])
+        directions = np.array([m[0] for m in meta], dtype=np.float64)
+        
+        return CandlestickScan(
+            names=tuple(CANDLESTICK_PATTERNS),
+            matches=matches,
+            strength=np.where(matches, confidence, 0.0),
+            directions=directions,
+        )
+    
+    @staticmethod
+    def scan(candles: List[Candle], doji_threshold: float = 0.1) -> CandlestickScan:
+        """
+        Vectorized scan of all candlestick patterns over a candle series
+        
+        Replaces calling detect_patterns once per bar for backtests and ML
+        labelling.
+        
+        Args:
+            candles: List of candles
+            doji_threshold: Body/range threshold for Doji
+            
+        Returns:
+            CandlestickScan with bars × patterns matrices
+        """
+        n = len(candles)
+        ohlc = np.empty((4, n), dtype=np.float64)
+        for i, candle in enumerate(candles):
+            ohlc[0, i] = candle.open
+            ohlc[1, i] = candle.high
+            ohlc[2, i] = candle.low
+            ohlc[3, i] = candle.close
+        return CandlestickPatterns.scan_arrays(ohlc[0], ohlc[1], ohlc[2], ohlc[3], doji_threshold)
+    
     @staticmethod
     def detect_patterns(candles: List[Candle]) -> List[PatternResult]:
         """
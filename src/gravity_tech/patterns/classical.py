@@ -28,7 +28,9 @@ License: MIT
 """
 
 import numpy as np
-from typing import List, Optional, Tuple, Dict
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Dict, Iterable
 from scipy.signal import find_peaks, argrelextrema
 from gravity_tech.models.schemas import Candle, PatternResult, SignalStrength, PatternType
 from datetime import datetime
@@ -66,7 +68,11 @@ class ClassicalPatterns:
         }
     
     @staticmethod
-    def detect_head_and_shoulders(candles: List[Candle], min_pattern_bars: int = 20) -> Optional[PatternResult]:
+    def detect_head_and_shoulders(
+        candles: List[Candle],
+        min_pattern_bars: int = 20,
+        swings: Optional[Dict[str, List[Tuple[int, float]]]] = None
+    ) -> Optional[PatternResult]:
         """
         Detect Head and Shoulders pattern (bearish reversal)
         
@@ -79,6 +85,7 @@ class ClassicalPatterns:
         Args:
             candles: List of candles
             min_pattern_bars: Minimum bars for pattern
+            swings: Precomputed swing points of the last 50 candles (see SwingIndex)
             
         Returns:
             PatternResult if pattern found, None otherwise
@@ -86,7 +93,8 @@ class ClassicalPatterns:
         if len(candles) < min_pattern_bars:
             return None
         
-        swings = ClassicalPatterns.find_swing_points(candles[-50:])
+        if swings is None:
+            swings = ClassicalPatterns.find_swing_points(candles[-50:])
         highs = swings['highs']
         lows = swings['lows']
         
@@ -155,13 +163,18 @@ class ClassicalPatterns:
         )
     
     @staticmethod
-    def detect_inverse_head_and_shoulders(candles: List[Candle], min_pattern_bars: int = 20) -> Optional[PatternResult]:
+    def detect_inverse_head_and_shoulders(
+        candles: List[Candle],
+        min_pattern_bars: int = 20,
+        swings: Optional[Dict[str, List[Tuple[int, float]]]] = None
+    ) -> Optional[PatternResult]:
         """
         Detect Inverse Head and Shoulders pattern (bullish reversal)
         
         Args:
             candles: List of candles
             min_pattern_bars: Minimum bars for pattern
+            swings: Precomputed swing points of the last 50 candles (see SwingIndex)
             
         Returns:
             PatternResult if pattern found, None otherwise
@@ -169,7 +182,8 @@ class ClassicalPatterns:
         if len(candles) < min_pattern_bars:
             return None
         
-        swings = ClassicalPatterns.find_swing_points(candles[-50:])
+        if swings is None:
+            swings = ClassicalPatterns.find_swing_points(candles[-50:])
         lows = swings['lows']
         highs = swings['highs']
         
@@ -238,13 +252,18 @@ class ClassicalPatterns:
         )
     
     @staticmethod
-    def detect_double_top(candles: List[Candle], tolerance: float = 0.02) -> Optional[PatternResult]:
+    def detect_double_top(
+        candles: List[Candle],
+        tolerance: float = 0.02,
+        swings: Optional[Dict[str, List[Tuple[int, float]]]] = None
+    ) -> Optional[PatternResult]:
         """
         Detect Double Top pattern (bearish reversal)
         
         Args:
             candles: List of candles
             tolerance: Price tolerance for equal peaks (2% default)
+            swings: Precomputed swing points of the last 40 candles (see SwingIndex)
             
         Returns:
             PatternResult if pattern found, None otherwise
@@ -252,7 +271,8 @@ class ClassicalPatterns:
         if len(candles) < 20:
             return None
         
-        swings = ClassicalPatterns.find_swing_points(candles[-40:])
+        if swings is None:
+            swings = ClassicalPatterns.find_swing_points(candles[-40:])
         highs = swings['highs']
         lows = swings['lows']
         
@@ -313,13 +333,18 @@ class ClassicalPatterns:
         )
     
     @staticmethod
-    def detect_double_bottom(candles: List[Candle], tolerance: float = 0.02) -> Optional[PatternResult]:
+    def detect_double_bottom(
+        candles: List[Candle],
+        tolerance: float = 0.02,
+        swings: Optional[Dict[str, List[Tuple[int, float]]]] = None
+    ) -> Optional[PatternResult]:
         """
         Detect Double Bottom pattern (bullish reversal)
         
         Args:
             candles: List of candles
             tolerance: Price tolerance for equal troughs
+            swings: Precomputed swing points of the last 40 candles (see SwingIndex)
             
         Returns:
             PatternResult if pattern found, None otherwise
@@ -327,7 +352,8 @@ class ClassicalPatterns:
         if len(candles) < 20:
             return None
         
-        swings = ClassicalPatterns.find_swing_points(candles[-40:])
+        if swings is None:
+            swings = ClassicalPatterns.find_swing_points(candles[-40:])
         lows = swings['lows']
         highs = swings['highs']
         
@@ -388,7 +414,11 @@ class ClassicalPatterns:
         )
     
     @staticmethod
-    def detect_ascending_triangle(candles: List[Candle], min_touches: int = 2) -> Optional[PatternResult]:
+    def detect_ascending_triangle(
+        candles: List[Candle],
+        min_touches: int = 2,
+        swings: Optional[Dict[str, List[Tuple[int, float]]]] = None
+    ) -> Optional[PatternResult]:
         """
         Detect Ascending Triangle pattern (bullish continuation)
         
@@ -399,6 +429,7 @@ class ClassicalPatterns:
         Args:
             candles: List of candles
             min_touches: Minimum touches for each line
+            swings: Precomputed swing points of the last 30 candles (see SwingIndex)
             
         Returns:
             PatternResult if pattern found, None otherwise
@@ -407,7 +438,8 @@ class ClassicalPatterns:
             return None
         
         recent = candles[-30:]
-        swings = ClassicalPatterns.find_swing_points(recent)
+        if swings is None:
+            swings = ClassicalPatterns.find_swing_points(recent)
         highs = swings['highs']
         lows = swings['lows']
         
@@ -467,7 +499,11 @@ class ClassicalPatterns:
         )
     
     @staticmethod
-    def detect_descending_triangle(candles: List[Candle], min_touches: int = 2) -> Optional[PatternResult]:
+    def detect_descending_triangle(
+        candles: List[Candle],
+        min_touches: int = 2,
+        swings: Optional[Dict[str, List[Tuple[int, float]]]] = None
+    ) -> Optional[PatternResult]:
         """
         Detect Descending Triangle pattern (bearish continuation)
         
@@ -478,6 +514,7 @@ class ClassicalPatterns:
         Args:
             candles: List of candles
             min_touches: Minimum touches for each line
+            swings: Precomputed swing points of the last 30 candles (see SwingIndex)
             
         Returns:
             PatternResult if pattern found, None otherwise
@@ -486,7 +523,8 @@ class ClassicalPatterns:
             return None
         
         recent = candles[-30:]
-        swings = ClassicalPatterns.find_swing_points(recent)
+        if swings is None:
+            swings = ClassicalPatterns.find_swing_points(recent)
         highs = swings['highs']
         lows = swings['lows']
         
@@ -546,7 +584,10 @@ class ClassicalPatterns:
         )
     
     @staticmethod
-    def detect_symmetrical_triangle(candles: List[Candle]) -> Optional[PatternResult]:
+    def detect_symmetrical_triangle(
+        candles: List[Candle],
+        swings: Optional[Dict[str, List[Tuple[int, float]]]] = None
+    ) -> Optional[PatternResult]:
         """
         Detect Symmetrical Triangle pattern (continuation in trend direction)
         
@@ -555,6 +596,7 @@ class ClassicalPatterns:
         
         Args:
             candles: List of candles
+            swings: Precomputed swing points of the last 30 candles (see SwingIndex)
             
         Returns:
             PatternResult if pattern found, None otherwise
@@ -563,7 +605,8 @@ class ClassicalPatterns:
             return None
         
         recent = candles[-30:]
-        swings = ClassicalPatterns.find_swing_points(recent)
+        if swings is None:
+            swings = ClassicalPatterns.find_swing_points(recent)
         highs = swings['highs']
         lows = swings['lows']
         
@@ -635,46 +678,268 @@ class ClassicalPatterns:
         )
     
     @staticmethod
-    def detect_all(candles: List[Candle]) -> List[PatternResult]:
+    def detect_all(
+        candles: List[Candle],
+        swing_index: Optional['SwingIndex'] = None,
+        end: Optional[int] = None
+    ) -> List[PatternResult]:
         """
         Detect all classical patterns
         
+        Swing points are taken from a SwingIndex so the price arrays are
+        built once and each distinct trailing window (50/40/30 bars) runs
+        find_peaks once, instead of once per detector.
+        
         Args:
             candles: List of candles
+            swing_index: Swing index covering the series (built if None)
+            end: Absolute index (exclusive) in swing_index of the last candle;
+                 defaults to the end of the index
             
         Returns:
             List of detected pattern results
         """
-        patterns = []
-        
-        # Reversal patterns
-        pattern = ClassicalPatterns.detect_head_and_shoulders(candles)
-        if pattern:
-            patterns.append(pattern)
-        
-        pattern = ClassicalPatterns.detect_inverse_head_and_shoulders(candles)
-        if pattern:
-            patterns.append(pattern)
+        if swing_index is None:
+            swing_index = SwingIndex(candles)
+        if end is None:
+            end = len(swing_index)
+        
+        swings_50 = swing_index.window(50, end)
+        swings_40 = swing_index.window(40, end)
+        swings_30 = swing_index.window(30, end)
+        
+        detections = [
+            # Reversal patterns
+            ClassicalPatterns.detect_head_and_shoulders(candles, swings=swings_50),
+            ClassicalPatterns.detect_inverse_head_and_shoulders(candles, swings=swings_50),
+            ClassicalPatterns.detect_double_top(candles, swings=swings_40),
+            ClassicalPatterns.detect_double_bottom(candles, swings=swings_40),
+            # Continuation patterns
+            ClassicalPatterns.detect_ascending_triangle(candles, swings=swings_30),
+            ClassicalPatterns.detect_descending_triangle(candles, swings=swings_30),
+            ClassicalPatterns.detect_symmetrical_triangle(candles, swings=swings_30),
+        ]
+        
+        return [pattern for pattern in detections if pattern]
+    
+    @staticmethod
+    def scan_history(
+        candles: List[Candle],
+        min_bars: int = 20,
+        step: int = 1
+    ) -> List['PatternOccurrence']:
+        """
+        Scan a full history and report every pattern occurrence
         
-        pattern = ClassicalPatterns.detect_double_top(candles)
-        if pattern:
-            patterns.append(pattern)
+        Equivalent to calling detect_all on every prefix of the series, but
+        swing points come from one shared SwingIndex.
         
-        pattern = ClassicalPatterns.detect_double_bottom(candles)
-        if pattern:
-            patterns.append(pattern)
+        Args:
+            candles: List of candles
+            min_bars: First bar count evaluated
+            step: Evaluate every `step` bars
+            
+        Returns:
+            List of PatternOccurrence ordered by first detection
+        """
+        scanner = ClassicalPatternScanner(min_bars=min_bars, step=step)
+        scanner.update(candles)
+        return scanner.occurrences
+
+
+# Largest trailing window any classical detector reads
+MAX_LOOKBACK = 50
+
+
+class SwingIndex:
+    """
+    Swing-point index shared by the classical detectors
+    
+    Holds the high/low arrays of a series once and memoizes find_peaks per
+    trailing window, so swing points of a window are identical to
+    ClassicalPatterns.find_swing_points(candles[start:end]). The series is
+    append-only, so cached windows stay valid when bars are added.
+    
+    Example:
+        >>> index = SwingIndex(candles)
+        >>> swings = index.window(50)           # last 50 bars
+        >>> index.append(new_candles)
+        >>> swings = index.window(50)           # only the new window is computed
+    """
+    
+    def __init__(self, candles: Iterable[Candle] = (), order: int = 5, max_cached_windows: int = 512):
+        """
+        Args:
+            candles: Initial candles
+            order: Minimum distance between swing points (find_peaks distance)
+            max_cached_windows: Maximum number of memoized windows
+        """
+        self.order = order
+        self.max_cached_windows = max_cached_windows
+        self._highs = np.empty(0, dtype=np.float64)
+        self._lows = np.empty(0, dtype=np.float64)
+        self._size = 0
+        self._windows: "OrderedDict[Tuple[int, int], Dict[str, List[Tuple[int, float]]]]" = OrderedDict()
+        self.append(candles)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    @property
+    def highs(self) -> np.ndarray:
+        return self._highs[:self._size]
+    
+    @property
+    def lows(self) -> np.ndarray:
+        return self._lows[:self._size]
+    
+    def append(self, candles: Iterable[Candle]):
+        """Append bars (amortized O(1) per bar)"""
+        new = [(c.high, c.low) for c in candles]
+        if not new:
+            return
+        
+        needed = self._size + len(new)
+        if needed > len(self._highs):
+            capacity = max(needed, 2 * len(self._highs), 64)
+            self._highs = np.resize(self._highs, capacity)
+            self._lows = np.resize(self._lows, capacity)
+        
+        values = np.asarray(new, dtype=np.float64)
+        self._highs[self._size:needed] = values[:, 0]
+        self._lows[self._size:needed] = values[:, 1]
+        self._size = needed
+    
+    def window(self, size: int, end: Optional[int] = None) -> Dict[str, List[Tuple[int, float]]]:
+        """
+        Swing points of the trailing window ending at `end` (exclusive)
         
-        # Continuation patterns
-        pattern = ClassicalPatterns.detect_ascending_triangle(candles)
-        if pattern:
-            patterns.append(pattern)
+        Args:
+            size: Window length in bars
+            end: Absolute end index; defaults to the current length
+            
+        Returns:
+            Dictionary with 'highs' and 'lows' lists of (index, price)
+            tuples, indices relative to the window start
+        """
+        end = self._size if end is None else end
+        start = max(0, end - size)
+        key = (start, end)
+        
+        cached = self._windows.get(key)
+        if cached is not None:
+            self._windows.move_to_end(key)
+            return cached
+        
+        highs = self._highs[start:end]
+        lows = self._lows[start:end]
+        peaks, _ = find_peaks(highs, distance=self.order)
+        troughs, _ = find_peaks(-lows, distance=self.order)
+        swings = {
+            'highs': [(i, highs[i]) for i in peaks],
+            'lows': [(i, lows[i]) for i in troughs],
+        }
         
-        pattern = ClassicalPatterns.detect_descending_triangle(candles)
-        if pattern:
-            patterns.append(pattern)
+        self._windows[key] = swings
+        if len(self._windows) > self.max_cached_windows:
+            self._windows.popitem(last=False)
+        return swings
+
+
+@dataclass
+class PatternOccurrence:
+    """
+    One classical pattern occurrence found by a history scan
+    
+    Attributes:
+        pattern_name: Pattern name
+        start_index: Bar index where the pattern starts
+        detected_index: First bar at which the pattern was reported
+        end_index: Last bar at which the pattern was still reported
+        result: Latest PatternResult for this occurrence
+    """
+    pattern_name: str
+    start_index: int
+    detected_index: int
+    end_index: int
+    result: PatternResult
+
+
+class ClassicalPatternScanner:
+    """
+    Rolling-window classical pattern scanner with incremental updates
+    
+    Evaluates detect_all at every bar (or every `step` bars) using one
+    shared SwingIndex, and merges consecutive reports of the same pattern
+    (same name and start bar) into a single PatternOccurrence.
+    
+    Example:
+        >>> scanner = ClassicalPatternScanner()
+        >>> scanner.update(history)
+        >>> scanner.update(new_bars)      # only new bars are evaluated
+        >>> for occ in scanner.occurrences:
+        ...     print(occ.pattern_name, occ.start_index, occ.end_index)
+    """
+    
+    def __init__(self, order: int = 5, min_bars: int = 20, step: int = 1):
+        self.index = SwingIndex(order=order)
+        self.min_bars = min_bars
+        self.step = max(1, step)
+        self.candles: List[Candle] = []
+        self.occurrences: List[PatternOccurrence] = []
+        self._open: Dict[Tuple[str, int], PatternOccurrence] = {}
+        self._timestamps: List[datetime] = []
+        self._next_bar = max(min_bars, 1)
+    
+    def update(self, candles: Iterable[Candle]) -> List[PatternOccurrence]:
+        """
+        Append bars and scan them
         
-        pattern = ClassicalPatterns.detect_symmetrical_triangle(candles)
-        if pattern:
-            patterns.append(pattern)
+        Returns:
+            Occurrences first detected in this update
+        """
+        candles = list(candles)
+        self.candles.extend(candles)
+        self._timestamps.extend(c.timestamp for c in candles)
+        self.index.append(candles)
+        
+        new_occurrences = []
+        while self._next_bar <= len(self.candles):
+            end = self._next_bar
+            tail = self.candles[max(0, end - MAX_LOOKBACK):end]
+            for result in ClassicalPatterns.detect_all(tail, swing_index=self.index, end=end):
+                occurrence = self._record(result, end - 1)
+                if occurrence is not None:
+                    new_occurrences.append(occurrence)
+            self._next_bar += self.step
+        
+        return new_occurrences
+    
+    def _record(self, result: PatternResult, bar: int) -> Optional[PatternOccurrence]:
+        start_index = self._bar_of(result.start_time, bar)
+        key = (result.pattern_name, start_index)
+        
+        occurrence = self._open.get(key)
+        if occurrence is not None and bar - occurrence.end_index <= self.step:
+            occurrence.end_index = bar
+            occurrence.result = result
+            return None
         
-        return patterns
+        occurrence = PatternOccurrence(
+            pattern_name=result.pattern_name,
+            start_index=start_index,
+            detected_index=bar,
+            end_index=bar,
+            result=result,
+        )
+        self._open[key] = occurrence
+        self.occurrences.append(occurrence)
+        return occurrence
+    
+    def _bar_of(self, timestamp: datetime, bar: int) -> int:
+        """Bar index of a timestamp within the lookback window ending at `bar`"""
+        lo = max(0, bar + 1 - MAX_LOOKBACK)
+        for i in range(lo, bar + 1):
+            if self._timestamps[i] == timestamp:
+                return i
+        return lo
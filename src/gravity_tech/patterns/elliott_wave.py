@@ -15,11 +15,130 @@ License: MIT
 
 import numpy as np
 import pandas as pd
-from typing import List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
 from gravity_tech.models.schemas import Candle, ElliottWaveResult, WavePoint, SignalStrength
+from gravity_tech.patterns.pivots import find_pivots
 from datetime import datetime
 
 
+@dataclass(frozen=True)
+class PivotSequence:
+    """
+    NumPy-backed sequence of alternating-candidate pivots
+    
+    Pivots are ordered by bar index (peaks before troughs on the same bar)
+    with a precomputed leg array so 6-pivot impulse windows can
+    be screened in vectorized form.
+    
+    Attributes:
+        indices: Bar index of each pivot
+        prices: Pivot price (high for peaks, low for troughs)
+        is_peak: True for peaks, False for troughs
+        legs: prices[k + 1] - prices[k]
+    """
+    indices: np.ndarray
+    prices: np.ndarray
+    is_peak: np.ndarray
+    legs: np.ndarray
+    
+    @classmethod
+    def from_arrays(cls, highs: np.ndarray, lows: np.ndarray, window: int = 3) -> 'PivotSequence':
+        """Build pivots from high/low arrays"""
+        highs = np.asarray(highs, dtype=np.float64)
+        lows = np.asarray(lows, dtype=np.float64)
+        peaks = find_pivots(highs, window, maxima=True, strict=True)
+        troughs = find_pivots(lows, window, maxima=False, strict=True)
+        
+        indices = np.concatenate([peaks, troughs])
+        prices = np.concatenate([highs[peaks], lows[troughs]])
+        is_peak = np.concatenate([np.ones(len(peaks), bool), np.zeros(len(troughs), bool)])
+        order = np.argsort(indices, kind='stable')
+        indices, prices, is_peak = indices[order], prices[order], is_peak[order]
+        
+        return cls(indices, prices, is_peak, np.diff(prices))
+    
+    @classmethod
+    def from_candles(cls, candles: List[Candle], window: int = 3) -> 'PivotSequence':
+        """Build pivots from candles"""
+        highs = np.fromiter((c.high for c in candles), dtype=np.float64, count=len(candles))
+        lows = np.fromiter((c.low for c in candles), dtype=np.float64, count=len(candles))
+        return cls.from_arrays(highs, lows, window)
+    
+    def __len__(self) -> int:
+        return len(self.indices)
+    
+    def pivots(self, start: int, count: int) -> List[Tuple[int, float, str]]:
+        """Pivots [start, start + count) as (index, price, type) tuples"""
+        return [
+            (int(self.indices[k]), self.prices[k], "PEAK" if self.is_peak[k] else "TROUGH")
+            for k in range(start, start + count)
+        ]
+    
+    def mixed_type_windows(self, size: int) -> np.ndarray:
+        """Mask of windows of `size` pivots containing both peaks and troughs"""
+        if len(self) < size:
+            return np.zeros(0, dtype=bool)
+        peak_count = np.convolve(self.is_peak.astype(np.int64), np.ones(size, dtype=np.int64), 'valid')
+        return (peak_count > 0) & (peak_count < size)
+    
+    def impulse_candidates(self) -> np.ndarray:
+        """
+        Vectorized screen of every 6-pivot window
+        
+        Applies the type-mix check and the three impulse rules of
+        ElliottWaveAnalyzer.validate_impulsive_wave to all windows at once.
+        
+        Returns:
+            Start positions of windows that pass
+        """
+        m = len(self) - 5
+        if m <= 0:
+            return np.empty(0, dtype=np.int64)
+        
+        p = self.prices
+        w0, w1, w2, w4 = p[:m], p[1:m + 1], p[2:m + 2], p[4:m + 4]
+        wave1 = self.legs[:m]
+        wave3 = self.legs[2:m + 2]
+        wave5 = self.legs[4:m + 4]
+        bullish = w1 > w0
+        
+        # Rejections written exactly as in validate_impulsive_wave
+        reject_bull = (w2 <= w0) | ((wave3 <= wave1) & (wave3 <= wave5)) | (w4 <= w1)
+        reject_bear = (w2 >= w0) | ((-wave3 <= -wave1) & (-wave3 <= -wave5)) | (w4 >= w1)
+        valid = np.where(bullish, ~reject_bull, ~reject_bear)
+        
+        return np.flatnonzero(valid & self.mixed_type_windows(6))
+
+
+@dataclass
+class WaveCount:
+    """
+    Impulsive wave count found at one pivot degree
+    
+    Attributes:
+        window: Pivot window (degree) the count was found at
+        is_bullish: Direction of wave 1
+        pivot_indices: Bar indices of the six pivots (0-5)
+        pivot_prices: Prices of the six pivots
+        subwaves: Lower-degree counts nested inside each wave, keyed by
+                  wave number (1-5)
+    """
+    window: int
+    is_bullish: bool
+    pivot_indices: np.ndarray
+    pivot_prices: np.ndarray
+    subwaves: Dict[int, List['WaveCount']] = field(default_factory=dict)
+    
+    @property
+    def start_index(self) -> int:
+        return int(self.pivot_indices[0])
+    
+    @property
+    def end_index(self) -> int:
+        return int(self.pivot_indices[-1])
+
+
 class ElliottWaveAnalyzer:
     """Elliott Wave pattern recognition and analysis"""
     
@@ -35,30 +154,11 @@ class ElliottWaveAnalyzer:
         Returns:
             Tuple of (peak_indices, trough_indices)
         """
-        highs = [c.high for c in candles]
-        lows = [c.low for c in candles]
+        highs = np.fromiter((c.high for c in candles), dtype=np.float64, count=len(candles))
+        lows = np.fromiter((c.low for c in candles), dtype=np.float64, count=len(candles))
         
-        peaks = []
-        troughs = []
-        
-        for i in range(window, len(candles) - window):
-            # Check for peak
-            is_peak = True
-            for j in range(i - window, i + window + 1):
-                if j != i and highs[j] >= highs[i]:
-                    is_peak = False
-                    break
-            if is_peak:
-                peaks.append(i)
-            
-            # Check for trough
-            is_trough = True
-            for j in range(i - window, i + window + 1):
-                if j != i and lows[j] <= lows[i]:
-                    is_trough = False
-                    break
-            if is_trough:
-                troughs.append(i)
+        peaks = find_pivots(highs, window, maxima=True, strict=True).tolist()
+        troughs = find_pivots(lows, window, maxima=False, strict=True).tolist()
         
         return peaks, troughs
     
@@ -167,13 +267,15 @@ class ElliottWaveAnalyzer:
     
     @staticmethod
     def identify_wave_pattern(candles: List[Candle], 
-                             min_wave_size: int = 5) -> Optional[ElliottWaveResult]:
+                             min_wave_size: int = 5,
+                             pivots: Optional[PivotSequence] = None) -> Optional[ElliottWaveResult]:
         """
         Identify Elliott Wave pattern in candle data
         
         Args:
             candles: List of candles
             min_wave_size: Minimum size for a wave
+            pivots: Precomputed pivot sequence (window=3) for these candles
             
         Returns:
             ElliottWaveResult if pattern found, None otherwise
@@ -182,25 +284,13 @@ class ElliottWaveAnalyzer:
             return None
         
         # Find pivot points
-        peaks, troughs = ElliottWaveAnalyzer.find_pivot_points(candles, window=3)
-        
-        # Combine and sort pivots
-        all_pivots = []
-        for peak in peaks:
-            all_pivots.append((peak, candles[peak].high, "PEAK"))
-        for trough in troughs:
-            all_pivots.append((trough, candles[trough].low, "TROUGH"))
-        
-        all_pivots.sort(key=lambda x: x[0])
+        if pivots is None:
+            pivots = PivotSequence.from_candles(candles, window=3)
         
-        # Try to find 5-wave impulsive pattern
-        for i in range(len(all_pivots) - 5):
-            pattern_pivots = all_pivots[i:i+6]
-            
-            # Check if alternating peaks and troughs
-            types = [p[2] for p in pattern_pivots]
-            if len(set(types)) != 2:
-                continue
+        # Try to find 5-wave impulsive pattern; windows failing the
+        # vectorized screen are never built or validated
+        for i in pivots.impulse_candidates():
+            pattern_pivots = pivots.pivots(int(i), 6)
             
             # Check if valid pattern
             if ElliottWaveAnalyzer.validate_impulsive_wave(pattern_pivots):
@@ -272,8 +362,8 @@ class ElliottWaveAnalyzer:
                 )
         
         # Try to find corrective ABC pattern
-        for i in range(len(all_pivots) - 3):
-            pattern_pivots = all_pivots[i:i+4]
+        for i in range(len(pivots) - 3):
+            pattern_pivots = pivots.pivots(i, 4)
             
             if len(pattern_pivots) == 4:
                 w0 = pattern_pivots[0][1]
@@ -324,13 +414,66 @@ class ElliottWaveAnalyzer:
         Returns:
             ElliottWaveResult if pattern detected
         """
+        pivots = PivotSequence.from_candles(candles, window=3) if len(candles) >= 20 else None
+        
         # Try different window sizes
         for window in [3, 5, 7]:
-            result = ElliottWaveAnalyzer.identify_wave_pattern(candles, min_wave_size=window)
+            result = ElliottWaveAnalyzer.identify_wave_pattern(
+                candles, min_wave_size=window, pivots=pivots
+            )
             if result:
                 return result
         
         return None
+    
+    @staticmethod
+    def scan_wave_degrees(candles: List[Candle],
+                          windows: Sequence[int] = (3, 5, 7)) -> Dict[int, List[WaveCount]]:
+        """
+        Find impulsive wave counts at several pivot degrees in one pass
+        
+        Every valid 6-pivot window is reported at each degree (not only the
+        first), and each count is linked to the counts of the next lower
+        degree that fit inside one of its waves.
+        
+        Args:
+            candles: List of candles
+            windows: Pivot windows, one per degree
+            
+        Returns:
+            Mapping of window -> wave counts ordered by start bar
+        """
+        highs = np.fromiter((c.high for c in candles), dtype=np.float64, count=len(candles))
+        lows = np.fromiter((c.low for c in candles), dtype=np.float64, count=len(candles))
+        
+        degrees = sorted(set(windows))
+        counts: Dict[int, List[WaveCount]] = {}
+        for window in degrees:
+            seq = PivotSequence.from_arrays(highs, lows, window)
+            counts[window] = [
+                WaveCount(
+                    window=window,
+                    is_bullish=bool(seq.prices[i + 1] > seq.prices[i]),
+                    pivot_indices=seq.indices[i:i + 6].copy(),
+                    pivot_prices=seq.prices[i:i + 6].copy(),
+                )
+                for i in seq.impulse_candidates()
+            ]
+        
+        # Nest each degree into the next higher one
+        for lower, higher in zip(degrees, degrees[1:]):
+            if not counts[lower]:
+                continue
+            starts = np.array([c.start_index for c in counts[lower]])
+            ends = np.array([c.end_index for c in counts[lower]])
+            for parent in counts[higher]:
+                bounds = parent.pivot_indices
+                for wave in range(1, 6):
+                    inside = np.flatnonzero((starts >= bounds[wave - 1]) & (ends <= bounds[wave]))
+                    if len(inside):
+                        parent.subwaves[wave] = [counts[lower][k] for k in inside]
+        
+        return counts
 
 
 def analyze_elliott_waves(candles: List[Candle]) -> Optional[ElliottWaveResult]:
@@ -20,6 +20,8 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from gravity_tech.patterns.pivots import pivot_points
+
 
 class PatternType(Enum):
     """Harmonic pattern types."""
@@ -170,19 +172,11 @@ class HarmonicPatternDetector:
     
     def _find_pivot_highs(self, highs: np.ndarray, window: int = 5) -> List[Tuple[int, float]]:
         """Find local high pivot points."""
-        pivots = []
-        for i in range(window, len(highs) - window):
-            if all(highs[i] >= highs[i-window:i]) and all(highs[i] >= highs[i+1:i+window+1]):
-                pivots.append((i, highs[i]))
-        return pivots
+        return pivot_points(highs, window, maxima=True)
     
     def _find_pivot_lows(self, lows: np.ndarray, window: int = 5) -> List[Tuple[int, float]]:
         """Find local low pivot points."""
-        pivots = []
-        for i in range(window, len(lows) - window):
-            if all(lows[i] <= lows[i-window:i]) and all(lows[i] <= lows[i+1:i+window+1]):
-                pivots.append((i, lows[i]))
-        return pivots
+        return pivot_points(lows, window, maxima=False)
     
     def _detect_bullish_patterns(
         self,
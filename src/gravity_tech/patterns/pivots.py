@@ -0,0 +1,19 @@
+"""
+Pivot Detection Module - Proxy
+
+This module provides backward compatibility by proxying to the new location.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+# Proxy to new location
+from src.core.patterns.pivots import (
+    find_pivots,
+    pivot_points,
+    rolling_extreme,
+    rolling_max,
+    rolling_min,
+)
@@ -9,7 +9,7 @@ Version: 1.0.0
 License: MIT
 """
 
-from typing import List
+from typing import List, Optional
 from gravity_tech.models.schemas import (
     Candle, TechnicalAnalysisResult, AnalysisRequest,
     IndicatorResult, PatternResult, MarketPhaseResult
@@ -23,6 +23,7 @@ from gravity_tech.indicators.support_resistance import SupportResistanceIndicato
 from gravity_tech.patterns.candlestick import CandlestickPatterns
 from gravity_tech.patterns.elliott_wave import analyze_elliott_waves
 from gravity_tech.analysis.market_phase import analyze_market_phase
+from gravity_tech.services.stage_metrics import StageTimer
 import structlog
 
 logger = structlog.get_logger()
@@ -32,12 +33,16 @@ class TechnicalAnalysisService:
     """Main service for technical analysis"""
     
     @staticmethod
-    async def analyze(request: AnalysisRequest) -> TechnicalAnalysisResult:
+    async def analyze(
+        request: AnalysisRequest,
+        timer: Optional[StageTimer] = None
+    ) -> TechnicalAnalysisResult:
         """
         Perform comprehensive technical analysis
         
         Args:
             request: Analysis request with candles and parameters
+            timer: Stage timer of the request (default: metrics only, no breakdown)
             
         Returns:
             Complete technical analysis result
@@ -49,6 +54,10 @@ class TechnicalAnalysisService:
             candle_count=len(request.candles)
         )
         
+        if timer is None:
+            timer = StageTimer("technical_analysis", len(request.candles))
+        candles = request.candles
+        
         result = TechnicalAnalysisResult(
             symbol=request.symbol,
             timeframe=request.timeframe
@@ -56,36 +65,49 @@ class TechnicalAnalysisService:
         
         try:
             # Calculate all indicator categories
-            result.trend_indicators = TrendIndicators.calculate_all(request.candles)
-            result.momentum_indicators = MomentumIndicators.calculate_all(request.candles)
-            result.cycle_indicators = CycleIndicators.calculate_all(request.candles)
-            result.volume_indicators = VolumeIndicators.calculate_all(request.candles)
-            result.volatility_indicators = VolatilityIndicators.calculate_all(request.candles)
-            result.support_resistance_indicators = SupportResistanceIndicators.calculate_all(request.candles)
+            with timer.stage("trend"):
+                result.trend_indicators = TrendIndicators.calculate_all(candles)
+            with timer.stage("momentum"):
+                result.momentum_indicators = MomentumIndicators.calculate_all(candles)
+            with timer.stage("cycle"):
+                result.cycle_indicators = CycleIndicators.calculate_all(candles)
+            with timer.stage("volume"):
+                result.volume_indicators = VolumeIndicators.calculate_all(candles)
+            with timer.stage("volatility"):
+                result.volatility_indicators = VolatilityIndicators.calculate_all(candles)
+            with timer.stage("support_resistance"):
+                result.support_resistance_indicators = SupportResistanceIndicators.calculate_all(candles)
             
             # Detect candlestick patterns
-            result.candlestick_patterns = CandlestickPatterns.detect_patterns(request.candles)
+            with timer.stage("candlestick_patterns"):
+                result.candlestick_patterns = CandlestickPatterns.detect_patterns(candles)
             
             # Analyze Elliott Waves
-            result.elliott_wave_analysis = analyze_elliott_waves(request.candles)
+            with timer.stage("elliott_wave"):
+                result.elliott_wave_analysis = analyze_elliott_waves(candles)
             
             # Analyze Market Phase (Dow Theory)
-            phase_analysis = analyze_market_phase(request.candles)
-            result.market_phase_analysis = MarketPhaseResult(
-                market_phase=phase_analysis["market_phase"],
-                phase_strength=phase_analysis["phase_strength"],
-                description=phase_analysis["description"],
-                overall_score=phase_analysis["detailed_analysis"]["overall_score"],
-                trend_structure=phase_analysis["detailed_analysis"]["trend_structure"],
-                volume_confirmation=phase_analysis["detailed_analysis"]["volume_behavior"].get("status") == "analyzed",
-                recommendations=phase_analysis["recommendations"],
-                detailed_scores=phase_analysis["detailed_analysis"]["scores"],
-                dow_theory_compliance=phase_analysis["dow_theory_compliance"],
-                timestamp=phase_analysis["timestamp"]
-            )
+            with timer.stage("market_phase"):
+                phase_analysis = analyze_market_phase(candles)
+                result.market_phase_analysis = MarketPhaseResult(
+                    market_phase=phase_analysis["market_phase"],
+                    phase_strength=phase_analysis["phase_strength"],
+                    description=phase_analysis["description"],
+                    overall_score=phase_analysis["detailed_analysis"]["overall_score"],
+                    trend_structure=phase_analysis["detailed_analysis"]["trend_structure"],
+                    volume_confirmation=phase_analysis["detailed_analysis"]["volume_behavior"].get("status") == "analyzed",
+                    recommendations=phase_analysis["recommendations"],
+                    detailed_scores=phase_analysis["detailed_analysis"]["scores"],
+                    dow_theory_compliance=phase_analysis["dow_theory_compliance"],
+                    timestamp=phase_analysis["timestamp"]
+                )
             
             # Calculate overall signals
-            result.calculate_overall_signal()
+            with timer.stage("overall_signal"):
+                result.calculate_overall_signal()
+            
+            if timer.collect:
+                result.stage_timings_ms = timer.breakdown()
             
             logger.info(
                 "analysis_completed",
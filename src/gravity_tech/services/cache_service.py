@@ -10,19 +10,348 @@ License: MIT
 """
 
 import json
+import time
+import uuid
+import zlib
 import asyncio
-from typing import Optional, Any, Callable
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Optional, Any, Callable, Dict, Iterable, List, Tuple
 from functools import wraps
 import hashlib
+import numpy as np
 import structlog
 from redis import asyncio as aioredis
 from redis.asyncio.connection import ConnectionPool
 
 from gravity_tech.config.settings import settings
 
+# Make msgpack optional
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+# Make prometheus_client optional
+try:
+    from prometheus_client import Counter, Histogram
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
 logger = structlog.get_logger()
 
 
+# Frame layout for non-legacy payloads: MAGIC | codec id | flags | body.
+# JSON text never starts with a NUL byte, so plain JSON values written by
+# earlier versions are still readable.
+FRAME_MAGIC = b"\x00"
+FLAG_COMPRESSED = 0x01
+
+# msgpack extension type used for raw NumPy buffers
+NDARRAY_EXT_TYPE = 42
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy values to JSON-native types."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def pack_ndarray(array: np.ndarray) -> bytes:
+    """
+    Frame a NumPy array as ``dtype | ndim | shape | raw buffer``.
+    
+    Args:
+        array: Array to frame (non-contiguous arrays are copied)
+    
+    Returns:
+        Framed bytes
+    """
+    array = np.ascontiguousarray(array)
+    dtype = array.dtype.str.encode("ascii")
+    header = bytes([len(dtype)]) + dtype + bytes([array.ndim])
+    header += np.asarray(array.shape, dtype="<u8").tobytes()
+    return header + array.tobytes()
+
+
+def unpack_ndarray(data: bytes) -> np.ndarray:
+    """Inverse of :func:`pack_ndarray`."""
+    dtype_len = data[0]
+    dtype = np.dtype(data[1:1 + dtype_len].decode("ascii"))
+    offset = 1 + dtype_len
+    ndim = data[offset]
+    offset += 1
+    shape = tuple(int(d) for d in np.frombuffer(data, dtype="<u8", count=ndim, offset=offset))
+    offset += 8 * ndim
+    return np.frombuffer(data, dtype=dtype, offset=offset).reshape(shape).copy()
+
+
+class CacheCodec(ABC):
+    """Base class for cache value codecs."""
+    
+    codec_id: int = 0
+    name: str = "base"
+    
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Serialize value to bytes."""
+    
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Deserialize bytes produced by encode."""
+
+
+class JsonCodec(CacheCodec):
+    """JSON codec (default). NumPy values are converted to lists/scalars."""
+    
+    codec_id = 1
+    name = "json"
+    
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, default=_json_default).encode("utf-8")
+    
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data.decode("utf-8"))
+
+
+class MsgpackCodec(CacheCodec):
+    """
+    msgpack codec with raw NumPy buffer framing.
+    
+    Arrays are stored as msgpack extension objects holding the
+    :func:`pack_ndarray` frame, so they round-trip with dtype and shape
+    preserved and without a text conversion.
+    """
+    
+    codec_id = 2
+    name = "msgpack"
+    
+    def __init__(self):
+        if not MSGPACK_AVAILABLE:
+            raise ImportError("msgpack is required for MsgpackCodec")
+    
+    @staticmethod
+    def _default(obj: Any) -> Any:
+        if isinstance(obj, np.ndarray):
+            return msgpack.ExtType(NDARRAY_EXT_TYPE, pack_ndarray(obj))
+        if isinstance(obj, np.generic):
+            return obj.item()
+        raise TypeError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+    
+    @staticmethod
+    def _ext_hook(code: int, data: bytes) -> Any:
+        if code == NDARRAY_EXT_TYPE:
+            return unpack_ndarray(data)
+        return msgpack.ExtType(code, data)
+    
+    def encode(self, value: Any) -> bytes:
+        return msgpack.packb(value, default=self._default, use_bin_type=True)
+    
+    def decode(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, ext_hook=self._ext_hook, raw=False, strict_map_key=False)
+
+
+class NumpyCodec(CacheCodec):
+    """Codec for bare NumPy arrays using raw buffer framing."""
+    
+    codec_id = 3
+    name = "numpy"
+    
+    def encode(self, value: Any) -> bytes:
+        if not isinstance(value, np.ndarray):
+            raise TypeError("NumpyCodec can only encode numpy.ndarray values")
+        return pack_ndarray(value)
+    
+    def decode(self, data: bytes) -> Any:
+        return unpack_ndarray(data)
+
+
+CODECS: Dict[str, type] = {
+    JsonCodec.name: JsonCodec,
+    MsgpackCodec.name: MsgpackCodec,
+    NumpyCodec.name: NumpyCodec,
+}
+
+
+if PROMETHEUS_AVAILABLE:
+    NEAR_CACHE_REQUESTS = Counter(
+        "near_cache_requests_total",
+        "Near-cache lookups by result",
+        ["cache", "result"],
+    )
+    NEAR_CACHE_INVALIDATIONS = Counter(
+        "near_cache_invalidations_total",
+        "Near-cache entries evicted by invalidation messages",
+        ["cache", "source"],
+    )
+    NEAR_CACHE_INVALIDATION_LAG = Histogram(
+        "near_cache_invalidation_lag_seconds",
+        "Delay between publishing an invalidation and applying it in this process",
+        ["cache"],
+        buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    )
+
+
+def get_codec(name: str) -> CacheCodec:
+    """
+    Create codec by name.
+    
+    Falls back to JSON when msgpack is requested but not installed.
+    """
+    if name not in CODECS:
+        raise ValueError(f"Unknown cache codec: {name}. Available: {sorted(CODECS)}")
+    if name == MsgpackCodec.name and not MSGPACK_AVAILABLE:
+        logger.warning("msgpack_unavailable_falling_back_to_json")
+        return JsonCodec()
+    return CODECS[name]()
+
+
+class NearCache:
+    """
+    Per-process LRU cache with TTL placed in front of Redis.
+    
+    Entries hold the encoded payload rather than the decoded object, so
+    callers mutating a returned value cannot corrupt the cached copy.
+    Coherence across processes is maintained by :class:`CacheManager`
+    through a Redis pub/sub invalidation channel.
+    
+    Example:
+        >>> near = NearCache(max_size=1024, ttl=30, namespaces=["ml", "tools"])
+        >>> near.set("ml:model_info", b'{"version": 3}')
+        >>> hit, payload = near.get("ml:model_info")
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 30.0,
+        namespaces: Optional[Iterable[str]] = None,
+        name: str = "redis"
+    ):
+        """
+        Args:
+            max_size: Maximum number of entries
+            ttl: Local expiration time (seconds)
+            namespaces: Key namespaces eligible for near-caching (all if empty)
+            name: Value of the ``cache`` label on the near_cache_* metrics
+        """
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.namespaces = frozenset(namespaces or ())
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.last_invalidation_lag: Optional[float] = None
+        self.max_invalidation_lag = 0.0
+    
+    def accepts(self, key: str) -> bool:
+        """Check whether key belongs to a near-cached namespace."""
+        return not self.namespaces or key.split(":", 1)[0] in self.namespaces
+    
+    def get(self, key: str) -> Tuple[bool, Optional[bytes]]:
+        """
+        Look up key.
+        
+        Returns:
+            (hit, payload)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._record(False)
+            return False, None
+        
+        expires_at, payload = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._record(False)
+            return False, None
+        
+        self._entries.move_to_end(key)
+        self._record(True)
+        return True, payload
+    
+    def set(self, key: str, payload: bytes, ttl: Optional[float] = None):
+        """Store payload; local TTL never exceeds the Redis TTL."""
+        local_ttl = min(self.ttl, ttl) if ttl else self.ttl
+        self._entries[key] = (time.monotonic() + local_ttl, payload)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate(self, keys: Iterable[str], source: str = "local") -> int:
+        """Remove keys; returns number of entries evicted."""
+        removed = 0
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                removed += 1
+        self._record_invalidation(removed, source)
+        return removed
+    
+    def invalidate_pattern(self, pattern: str, source: str = "local") -> int:
+        """Remove keys matching a Redis glob pattern."""
+        matched = [key for key in self._entries if fnmatchcase(key, pattern)]
+        for key in matched:
+            del self._entries[key]
+        self._record_invalidation(len(matched), source)
+        return len(matched)
+    
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
+    
+    def record_lag(self, lag: float):
+        """Record delay between an invalidation being published and applied."""
+        lag = max(lag, 0.0)
+        self.last_invalidation_lag = lag
+        self.max_invalidation_lag = max(self.max_invalidation_lag, lag)
+        if PROMETHEUS_AVAILABLE:
+            NEAR_CACHE_INVALIDATION_LAG.labels(cache=self.name).observe(lag)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit ratio, size and invalidation statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "last_invalidation_lag": self.last_invalidation_lag,
+            "max_invalidation_lag": self.max_invalidation_lag,
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _record(self, hit: bool):
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        if PROMETHEUS_AVAILABLE:
+            NEAR_CACHE_REQUESTS.labels(cache=self.name, result="hit" if hit else "miss").inc()
+    
+    def _record_invalidation(self, count: int, source: str):
+        self.invalidations += count
+        if count and PROMETHEUS_AVAILABLE:
+            NEAR_CACHE_INVALIDATIONS.labels(cache=self.name, source=source).inc(count)
+
+
 class CacheManager:
     """
     Redis Cache Manager with advanced features.
@@ -31,8 +360,11 @@ class CacheManager:
     - Connection pooling
     - Auto retry
     - Error handling
-    - Serialization/Deserialization
-    - TTL management
+    - Pluggable codecs (JSON, msgpack, raw NumPy buffers)
+    - Size-threshold compression
+    - TTL management (global and per-namespace)
+    - Pipelined batch operations (get_many/set_many)
+    - Optional per-process near-cache kept coherent via pub/sub
     - Cache invalidation
     
     Example:
@@ -40,12 +372,97 @@ class CacheManager:
         >>> await cache.initialize()
         >>> await cache.set("key", {"data": "value"}, ttl=300)
         >>> data = await cache.get("key")
+        >>> results = await cache.get_many(["analysis:BTCUSDT", "analysis:ETHUSDT"])
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        codec: Optional[str] = None,
+        compression_threshold: Optional[int] = None,
+        namespace_ttls: Optional[Dict[str, int]] = None,
+        near_cache: Optional[NearCache] = None,
+    ):
+        """
+        Args:
+            codec: Default codec name ("json", "msgpack", "numpy")
+            compression_threshold: Compress payloads larger than this (bytes); 0 disables
+            namespace_ttls: TTL per key namespace (text before the first ':')
+            near_cache: Local near-cache; created from settings if enabled there
+        """
         self.redis: Optional[aioredis.Redis] = None
         self.connection_pool: Optional[ConnectionPool] = None
         self._is_available = False
+        self.codec = get_codec(codec or settings.cache_codec)
+        self.compression_threshold = (
+            settings.cache_compression_threshold
+            if compression_threshold is None else compression_threshold
+        )
+        self.namespace_ttls: Dict[str, int] = dict(
+            settings.cache_namespace_ttls if namespace_ttls is None else namespace_ttls
+        )
+        self._codecs_by_id: Dict[int, CacheCodec] = {self.codec.codec_id: self.codec}
+        
+        if near_cache is None and settings.near_cache_enabled:
+            near_cache = NearCache(
+                max_size=settings.near_cache_max_size,
+                ttl=settings.near_cache_ttl,
+                namespaces=settings.near_cache_namespaces,
+            )
+        self.near_cache = near_cache
+        self.invalidation_channel = settings.cache_invalidation_channel
+        self.instance_id = uuid.uuid4().hex
+        self._invalidation_task: Optional[asyncio.Task] = None
+    
+    def resolve_ttl(self, key: str, ttl: Optional[int] = None) -> int:
+        """
+        Resolve TTL for key: explicit ttl > namespace ttl > global default.
+        """
+        if ttl:
+            return ttl
+        namespace = key.split(":", 1)[0]
+        return self.namespace_ttls.get(namespace, settings.cache_ttl)
+    
+    def _codec_by_id(self, codec_id: int) -> CacheCodec:
+        codec = self._codecs_by_id.get(codec_id)
+        if codec is None:
+            for codec_cls in CODECS.values():
+                if codec_cls.codec_id == codec_id:
+                    codec = codec_cls()
+                    break
+            else:
+                raise ValueError(f"Unknown cache codec id: {codec_id}")
+            self._codecs_by_id[codec_id] = codec
+        return codec
+    
+    def encode(self, value: Any, codec: Optional[CacheCodec] = None) -> bytes:
+        """
+        Serialize value into a cache payload.
+        
+        Uncompressed JSON is written bare (legacy format); everything else
+        is framed with codec id and flags.
+        """
+        codec = codec or self.codec
+        body = codec.encode(value)
+        flags = 0
+        if self.compression_threshold and len(body) > self.compression_threshold:
+            body = zlib.compress(body, 1)
+            flags |= FLAG_COMPRESSED
+        
+        if codec.codec_id == JsonCodec.codec_id and not flags:
+            return body
+        return FRAME_MAGIC + bytes([codec.codec_id, flags]) + body
+    
+    def decode(self, payload: bytes) -> Any:
+        """Deserialize a cache payload written by :meth:`encode`."""
+        if not payload.startswith(FRAME_MAGIC):
+            return json.loads(payload.decode("utf-8"))
+        
+        codec = self._codec_by_id(payload[1])
+        flags = payload[2]
+        body = payload[3:]
+        if flags & FLAG_COMPRESSED:
+            body = zlib.decompress(body)
+        return codec.decode(body)
     
     async def initialize(self):
         """Initialize Redis connection."""
@@ -79,6 +496,9 @@ class CacheManager:
                 port=settings.redis_port,
                 db=settings.redis_db
             )
+            
+            if self.near_cache is not None:
+                self._invalidation_task = asyncio.create_task(self._listen_for_invalidations())
         
         except Exception as e:
             logger.error("redis_initialization_failed", error=str(e))
@@ -98,33 +518,129 @@ class CacheManager:
         if not self._is_available or not self.redis:
             return None
         
+        near = self.near_cache if self.near_cache is not None and self.near_cache.accepts(key) else None
         try:
-            value = await self.redis.get(key)
+            if near is not None:
+                hit, payload = near.get(key)
+                if hit:
+                    return self.decode(payload)
+            
+            if near is not None:
+                # Remaining TTL in the same round trip bounds the local copy
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.get(key)
+                    pipe.pttl(key)
+                    value, pttl = await pipe.execute()
+            else:
+                value = await self.redis.get(key)
             
             if value is None:
                 logger.debug("cache_miss", key=key)
                 return None
             
             logger.debug("cache_hit", key=key)
-            return json.loads(value.decode('utf-8'))
+            if near is not None:
+                self._fill_near_cache(key, value, pttl)
+            return self.decode(value)
         
         except Exception as e:
             logger.warning("cache_get_error", key=key, error=str(e))
             return None
     
+    def _fill_near_cache(self, key: str, payload: bytes, pttl: Optional[int]):
+        """
+        Near-cache a Redis hit for no longer than the key's remaining TTL.
+        
+        Args:
+            pttl: Redis PTTL reply in ms (-1: no expiry, -2: key gone)
+        """
+        if pttl is None or pttl == -1:
+            self.near_cache.set(key, payload)
+        elif pttl > 0:
+            self.near_cache.set(key, payload, ttl=pttl / 1000)
+    
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Get multiple values in a single round trip (MGET).
+        
+        Args:
+            keys: Cache keys
+        
+        Returns:
+            Mapping of key -> value for hits only; missing or undecodable
+            entries are omitted
+        """
+        keys = list(keys)
+        if not keys or not self._is_available or not self.redis:
+            return {}
+        
+        payloads: Dict[str, bytes] = {}
+        remote_keys = keys
+        if self.near_cache is not None:
+            remote_keys = []
+            for key in keys:
+                if self.near_cache.accepts(key):
+                    hit, payload = self.near_cache.get(key)
+                    if hit:
+                        payloads[key] = payload
+                        continue
+                remote_keys.append(key)
+        
+        if remote_keys:
+            near_keys = [
+                key for key in remote_keys
+                if self.near_cache is not None and self.near_cache.accepts(key)
+            ]
+            pttls: Dict[str, Optional[int]] = {}
+            try:
+                if near_keys:
+                    # MGET plus PTTL of the near-cacheable keys in one round trip
+                    async with self.redis.pipeline(transaction=False) as pipe:
+                        pipe.mget(remote_keys)
+                        for key in near_keys:
+                            pipe.pttl(key)
+                        values, *remaining = await pipe.execute()
+                    pttls = dict(zip(near_keys, remaining))
+                else:
+                    values = await self.redis.mget(remote_keys)
+            except Exception as e:
+                logger.warning("cache_get_many_error", count=len(remote_keys), error=str(e))
+                values = [None] * len(remote_keys)
+            
+            for key, value in zip(remote_keys, values):
+                if value is None:
+                    continue
+                payloads[key] = value
+                if key in pttls:
+                    self._fill_near_cache(key, value, pttls[key])
+        
+        results: Dict[str, Any] = {}
+        for key in keys:
+            if key not in payloads:
+                continue
+            try:
+                results[key] = self.decode(payloads[key])
+            except Exception as e:
+                logger.warning("cache_decode_error", key=key, error=str(e))
+        
+        logger.debug("cache_get_many", requested=len(keys), hits=len(results))
+        return results
+    
     async def set(
         self,
         key: str,
         value: Any,
-        ttl: Optional[int] = None
+        ttl: Optional[int] = None,
+        codec: Optional[str] = None
     ) -> bool:
         """
         Store value in cache.
         
         Args:
             key: Cache key
-            value: Value (must be JSON-serializable)
-            ttl: Expiration time (seconds), uses settings if None
+            value: Value (must be serializable by the codec)
+            ttl: Expiration time (seconds), uses namespace/settings TTL if None
+            codec: Codec name overriding the manager default
         
         Returns:
             True on success
@@ -133,17 +649,74 @@ class CacheManager:
             return False
         
         try:
-            serialized = json.dumps(value).encode('utf-8')
-            ttl = ttl or settings.cache_ttl
+            serialized = self.encode(value, get_codec(codec) if codec else None)
+            ttl = self.resolve_ttl(key, ttl)
             
             await self.redis.setex(key, ttl, serialized)
-            logger.debug("cache_set", key=key, ttl=ttl)
+            logger.debug("cache_set", key=key, ttl=ttl, size=len(serialized))
+            
+            if self.near_cache is not None and self.near_cache.accepts(key):
+                self.near_cache.set(key, serialized, ttl)
+                await self._publish_invalidation(keys=[key])
             return True
         
         except Exception as e:
             logger.warning("cache_set_error", key=key, error=str(e))
             return False
     
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        codec: Optional[str] = None
+    ) -> int:
+        """
+        Store multiple values in a single pipelined round trip.
+        
+        Args:
+            items: Mapping of key -> value
+            ttl: Expiration time for all keys; namespace/settings TTL if None
+            codec: Codec name overriding the manager default
+        
+        Returns:
+            Number of keys written
+        """
+        if not items or not self._is_available or not self.redis:
+            return 0
+        
+        selected = get_codec(codec) if codec else None
+        encoded: List[tuple] = []
+        for key, value in items.items():
+            try:
+                encoded.append((key, self.resolve_ttl(key, ttl), self.encode(value, selected)))
+            except Exception as e:
+                logger.warning("cache_set_error", key=key, error=str(e))
+        
+        if not encoded:
+            return 0
+        
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                near_keys = []
+                for key, key_ttl, payload in encoded:
+                    pipe.setex(key, key_ttl, payload)
+                    if self.near_cache is not None and self.near_cache.accepts(key):
+                        self.near_cache.set(key, payload, key_ttl)
+                        near_keys.append(key)
+                if near_keys:
+                    pipe.publish(self.invalidation_channel, self._invalidation_message(keys=near_keys))
+                results = await pipe.execute()
+            
+            if near_keys:
+                results = results[:-1]
+            written = sum(1 for r in results if r)
+            logger.debug("cache_set_many", requested=len(items), written=written)
+            return written
+        
+        except Exception as e:
+            logger.warning("cache_set_many_error", count=len(encoded), error=str(e))
+            return 0
+    
     async def delete(self, key: str) -> bool:
         """
         Delete key from cache.
@@ -160,6 +733,10 @@ class CacheManager:
         try:
             await self.redis.delete(key)
             logger.debug("cache_deleted", key=key)
+            
+            if self.near_cache is not None:
+                self.near_cache.invalidate([key])
+                await self._publish_invalidation(keys=[key])
             return True
         
         except Exception as e:
@@ -197,6 +774,10 @@ class CacheManager:
                 if cursor == 0:
                     break
             
+            if self.near_cache is not None:
+                self.near_cache.invalidate_pattern(pattern)
+                await self._publish_invalidation(pattern=pattern)
+            
             logger.info("cache_pattern_deleted", pattern=pattern, count=deleted_count)
             return deleted_count
         
@@ -251,8 +832,102 @@ class CacheManager:
             self._is_available = False
             return False
     
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics (near-cache hit ratio and invalidation lag)."""
+        return {
+            "available": self._is_available,
+            "codec": self.codec.name,
+            "near_cache": self.near_cache.stats() if self.near_cache is not None else None,
+        }
+    
+    def _invalidation_message(
+        self,
+        keys: Optional[List[str]] = None,
+        pattern: Optional[str] = None
+    ) -> bytes:
+        return json.dumps({
+            "origin": self.instance_id,
+            "keys": keys or [],
+            "pattern": pattern,
+            "ts": time.time(),
+        }).encode("utf-8")
+    
+    async def _publish_invalidation(
+        self,
+        keys: Optional[List[str]] = None,
+        pattern: Optional[str] = None
+    ):
+        """Broadcast invalidation to near-caches in other processes."""
+        try:
+            await self.redis.publish(
+                self.invalidation_channel,
+                self._invalidation_message(keys=keys, pattern=pattern)
+            )
+        except Exception as e:
+            logger.warning("cache_invalidation_publish_error", error=str(e))
+    
+    def handle_invalidation(self, data: bytes) -> int:
+        """
+        Apply an invalidation message received from the pub/sub channel.
+        
+        Messages published by this instance are ignored because the local
+        near-cache was already updated when they were sent.
+        
+        Returns:
+            Number of near-cache entries evicted
+        """
+        if self.near_cache is None:
+            return 0
+        
+        message = json.loads(data)
+        if message.get("origin") == self.instance_id:
+            return 0
+        
+        removed = self.near_cache.invalidate(message.get("keys", []), source="remote")
+        if message.get("pattern"):
+            removed += self.near_cache.invalidate_pattern(message["pattern"], source="remote")
+        self.near_cache.record_lag(time.time() - message.get("ts", time.time()))
+        return removed
+    
+    async def _listen_for_invalidations(self):
+        """Background task consuming the invalidation channel."""
+        pubsub = self.redis.pubsub()
+        try:
+            await pubsub.subscribe(self.invalidation_channel)
+            logger.info("near_cache_invalidation_listener_started", channel=self.invalidation_channel)
+            
+            while True:
+                try:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self.handle_invalidation(message["data"])
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # Entries may be stale until we resubscribe: drop them all
+                    logger.warning("near_cache_invalidation_error", error=str(e))
+                    self.near_cache.clear()
+                    await asyncio.sleep(1.0)
+        finally:
+            try:
+                await pubsub.unsubscribe(self.invalidation_channel)
+                await pubsub.close()
+            except Exception:
+                pass
+    
     async def close(self):
         """Close connections."""
+        if self._invalidation_task is not None:
+            self._invalidation_task.cancel()
+            try:
+                await self._invalidation_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._invalidation_task = None
+        
+        if self.near_cache is not None:
+            self.near_cache.clear()
+        
         if self.redis:
             await self.redis.close()
         
@@ -0,0 +1,308 @@
+"""
+Numba JIT Warm-up
+
+Compiles every Numba kernel for the dtypes the service feeds them before
+the pod reports ready, so the first requests after a deploy or a
+scale-out do not pay the compilation cost.
+
+The kernels are decorated with cache=True, so compiled machine code is
+written under NUMBA_CACHE_DIR and later processes load it instead of
+compiling. Numba refuses to cache into a read-only directory, so an image
+can ship a cache compiled at build time in a seed directory
+(settings.numba_cache_seed_dir) that is copied into the writable
+NUMBA_CACHE_DIR before warm-up.
+
+Fill a cache directory from the command line (e.g. during image build):
+
+    NUMBA_CACHE_DIR=/app/.numba_seed python -m gravity_tech.services.jit_warmup
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import asyncio
+import importlib
+import os
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+from numba.core import config as numba_config
+
+from gravity_tech.config.settings import settings
+
+# Make prometheus_client optional
+try:
+    from prometheus_client import Gauge
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+logger = structlog.get_logger()
+
+if PROMETHEUS_AVAILABLE:
+    JIT_WARMUP_SECONDS = Gauge(
+        "jit_warmup_seconds",
+        "Time to compile or load a Numba kernel during startup warm-up",
+        ["kernel", "dtype", "source"],
+    )
+    JIT_WARMUP_TOTAL_SECONDS = Gauge(
+        "jit_warmup_total_seconds",
+        "Duration of the startup JIT warm-up",
+    )
+
+
+PERFORMANCE_OPTIMIZER = "gravity_tech.services.performance_optimizer"
+CORE_CYCLE = "src.core.indicators.cycle"
+CORE_PIVOTS = "src.core.patterns.pivots"
+
+DEFAULT_DTYPES = ("float32", "float64")
+
+
+@dataclass(frozen=True)
+class KernelSpec:
+    """
+    A kernel and the call that compiles it
+
+    args receives float arrays of one dtype (open, high, low, close,
+    volume) and returns the positional arguments. Arguments left at their
+    defaults are left out, as the callers do, because Numba compiles a
+    separate specialization for omitted arguments.
+    """
+    name: str
+    module: str
+    args: Callable[[Dict[str, np.ndarray]], Tuple[Any, ...]]
+    dtypes: Optional[Tuple[str, ...]] = None  # None = every warm-up dtype
+
+
+KERNELS: Tuple[KernelSpec, ...] = (
+    KernelSpec("fast_sma", PERFORMANCE_OPTIMIZER, lambda d: (d["close"], 20)),
+    KernelSpec("fast_ema", PERFORMANCE_OPTIMIZER, lambda d: (d["close"], 12)),
+    KernelSpec("fast_rsi", PERFORMANCE_OPTIMIZER, lambda d: (d["close"], 14)),
+    KernelSpec("fast_macd", PERFORMANCE_OPTIMIZER, lambda d: (d["close"],)),
+    KernelSpec("fast_bollinger_bands", PERFORMANCE_OPTIMIZER, lambda d: (d["close"], 20, 2.0)),
+    KernelSpec("fast_atr", PERFORMANCE_OPTIMIZER, lambda d: (d["high"], d["low"], d["close"], 14)),
+    KernelSpec("vectorized_percent_change", PERFORMANCE_OPTIMIZER, lambda d: (d["close"][1:], d["close"][:-1])),
+    KernelSpec("fast_tsi", PERFORMANCE_OPTIMIZER, lambda d: (d["close"],)),
+    KernelSpec("fast_schaff_trend_cycle", PERFORMANCE_OPTIMIZER, lambda d: (d["close"],)),
+    KernelSpec("fast_connors_rsi", PERFORMANCE_OPTIMIZER, lambda d: (d["close"],)),
+    KernelSpec("fast_donchian_channels", PERFORMANCE_OPTIMIZER, lambda d: (d["high"], d["low"], 20)),
+    KernelSpec("fast_aroon", PERFORMANCE_OPTIMIZER, lambda d: (d["high"], d["low"], 25)),
+    KernelSpec("fast_vortex_indicator", PERFORMANCE_OPTIMIZER, lambda d: (d["high"], d["low"], d["close"], 14)),
+    KernelSpec("fast_mcginley_dynamic", PERFORMANCE_OPTIMIZER, lambda d: (d["close"], 20)),
+    KernelSpec("_fast_ema", PERFORMANCE_OPTIMIZER, lambda d: (d["close"], 12)),
+    KernelSpec("fast_volume_weighted_macd", PERFORMANCE_OPTIMIZER, lambda d: (d["close"], d["volume"])),
+    KernelSpec("fast_ease_of_movement", PERFORMANCE_OPTIMIZER, lambda d: (d["high"], d["low"], d["volume"])),
+    KernelSpec("fast_force_index", PERFORMANCE_OPTIMIZER, lambda d: (d["close"], d["volume"])),
+    # Only reached with float64 Hilbert components
+    KernelSpec("ewm_mean", CORE_CYCLE, lambda d: (d["close"], 3.0), dtypes=("float64",)),
+    # find_pivots converts every series to float64
+    KernelSpec("rolling_extreme", CORE_PIVOTS, lambda d: (d["high"], 5, True), dtypes=("float64",)),
+)
+
+
+@dataclass
+class KernelTiming:
+    """Warm-up of one kernel for one dtype"""
+    kernel: str
+    dtype: str
+    seconds: float
+    source: str  # compiled, cache, memory, eager, error
+    error: Optional[str] = None
+
+
+def sample_arrays(size: int, dtype: str) -> Dict[str, np.ndarray]:
+    """Small positive OHLCV series of one dtype"""
+    rng = np.random.default_rng(0)
+    close = 100.0 + np.cumsum(rng.normal(0, 1, size))
+    close = np.abs(close) + 10.0
+    spread = np.abs(rng.normal(0, 0.5, size))
+    arrays = {
+        "open": close + rng.normal(0, 0.3, size),
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": rng.uniform(1_000, 5_000, size),
+    }
+    return {name: values.astype(dtype) for name, values in arrays.items()}
+
+
+def _cache_counts(kernel: Any) -> Optional[Tuple[int, int]]:
+    """Cumulative (hits, misses) of a cached dispatcher, None for eager ufuncs"""
+    stats = getattr(kernel, "stats", None)
+    if stats is None:
+        return None
+    return sum(stats.cache_hits.values()), sum(stats.cache_misses.values())
+
+
+def seed_cache_dir(seed_dir: Optional[str], cache_dir: Optional[str] = None) -> int:
+    """
+    Copy a pre-compiled cache into the Numba cache directory
+
+    Only files missing from cache_dir are copied, so entries compiled by
+    an earlier run on this node (a container restart) are kept.
+
+    Returns:
+        Number of files copied
+    """
+    cache_dir = cache_dir or numba_config.CACHE_DIR
+    if not seed_dir or not cache_dir or not os.path.isdir(seed_dir):
+        return 0
+    if os.path.realpath(seed_dir) == os.path.realpath(cache_dir):
+        return 0
+
+    copied = 0
+    for root, _, files in os.walk(seed_dir):
+        target_root = os.path.join(cache_dir, os.path.relpath(root, seed_dir))
+        os.makedirs(target_root, exist_ok=True)
+        for name in files:
+            target = os.path.join(target_root, name)
+            if not os.path.exists(target):
+                shutil.copy2(os.path.join(root, name), target)
+                copied += 1
+    return copied
+
+
+class JITWarmup:
+    """
+    Startup warm-up of the Numba kernels
+
+    ready turns True once every kernel has been compiled or loaded (or
+    has failed; a failing kernel is logged and compiles lazily as before).
+    """
+
+    def __init__(
+        self,
+        kernels: Sequence[KernelSpec] = KERNELS,
+        dtypes: Sequence[str] = DEFAULT_DTYPES,
+        sample_size: int = 256,
+        seed_dir: Optional[str] = None
+    ):
+        self.kernels = tuple(kernels)
+        self.dtypes = tuple(dtypes)
+        self.sample_size = sample_size
+        self.seed_dir = seed_dir
+        self.timings: List[KernelTiming] = []
+        self.ready = False
+        self.running = False
+        self.total_seconds: Optional[float] = None
+
+    def warm_kernel(self, spec: KernelSpec, dtype: str, arrays: Dict[str, np.ndarray]) -> KernelTiming:
+        """Compile (or load) one kernel for one dtype"""
+        started = time.perf_counter()
+        try:
+            kernel = getattr(importlib.import_module(spec.module), spec.name)
+            before = _cache_counts(kernel)
+            kernel(*spec.args(arrays))
+            after = _cache_counts(kernel)
+        except Exception as e:
+            return KernelTiming(
+                spec.name, dtype, time.perf_counter() - started, "error",
+                f"{type(e).__name__}: {e}"
+            )
+
+        seconds = time.perf_counter() - started
+        if before is None:
+            source = "eager"  # @vectorize with signatures compiles at import
+        elif after[1] > before[1]:
+            source = "compiled"
+        elif after[0] > before[0]:
+            source = "cache"
+        else:
+            source = "memory"
+        return KernelTiming(spec.name, dtype, seconds, source)
+
+    def run(self) -> List[KernelTiming]:
+        """Warm every kernel for its dtypes (blocking)"""
+        self.running = True
+        started = time.perf_counter()
+        try:
+            seeded = seed_cache_dir(self.seed_dir)
+            logger.info(
+                "jit_warmup_started",
+                kernels=len(self.kernels),
+                dtypes=list(self.dtypes),
+                cache_dir=numba_config.CACHE_DIR or "__pycache__",
+                seeded_files=seeded,
+            )
+
+            timings = []
+            for dtype in self.dtypes:
+                arrays = sample_arrays(self.sample_size, dtype)
+                for spec in self.kernels:
+                    if spec.dtypes is not None and dtype not in spec.dtypes:
+                        continue
+                    timing = self.warm_kernel(spec, dtype, arrays)
+                    timings.append(timing)
+                    self._report(timing)
+            self.timings = timings
+        finally:
+            self.total_seconds = time.perf_counter() - started
+            self.running = False
+            self.ready = True
+
+        if PROMETHEUS_AVAILABLE:
+            JIT_WARMUP_TOTAL_SECONDS.set(self.total_seconds)
+        counts = {}
+        for timing in self.timings:
+            counts[timing.source] = counts.get(timing.source, 0) + 1
+        logger.info("jit_warmup_complete", total_seconds=round(self.total_seconds, 3), **counts)
+        return self.timings
+
+    async def run_async(self) -> List[KernelTiming]:
+        """Warm up in a worker thread so liveness probes keep answering"""
+        return await asyncio.to_thread(self.run)
+
+    def skip(self):
+        """Mark warm-up as done without compiling (warm-up disabled)"""
+        self.ready = True
+
+    @staticmethod
+    def _report(timing: KernelTiming):
+        if timing.error is not None:
+            logger.warning(
+                "jit_kernel_warmup_failed",
+                kernel=timing.kernel, dtype=timing.dtype, error=timing.error
+            )
+            return
+        logger.info(
+            "jit_kernel_warmed",
+            kernel=timing.kernel,
+            dtype=timing.dtype,
+            source=timing.source,
+            seconds=round(timing.seconds, 4),
+        )
+        if PROMETHEUS_AVAILABLE:
+            JIT_WARMUP_SECONDS.labels(timing.kernel, timing.dtype, timing.source).set(timing.seconds)
+
+    def status(self) -> Dict[str, Any]:
+        """Warm-up state for the readiness endpoint"""
+        if not self.ready:
+            return {"state": "running" if self.running else "pending"}
+        return {
+            "state": "complete",
+            "total_seconds": round(self.total_seconds or 0.0, 3),
+            "kernels": len(self.timings),
+            "failed": [f"{t.kernel}[{t.dtype}]" for t in self.timings if t.source == "error"],
+        }
+
+
+# Global warm-up instance used by the application startup
+jit_warmup = JITWarmup(
+    dtypes=settings.jit_warmup_dtypes,
+    seed_dir=settings.numba_cache_seed_dir,
+)
+
+
+if __name__ == "__main__":
+    timings = JITWarmup(dtypes=settings.jit_warmup_dtypes).run()
+    for timing in timings:
+        detail = timing.error or f"{timing.seconds * 1e3:9.1f}ms"
+        print(f"{timing.kernel:28s} {timing.dtype:8s} {timing.source:9s} {detail}")
+    sys.exit(1 if any(t.source == "error" for t in timings) else 0)
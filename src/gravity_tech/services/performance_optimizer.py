@@ -294,15 +294,16 @@ def fast_sma(prices: np.ndarray, period: int) -> np.ndarray:
     window_sum = np.sum(prices[:period])
     result[period-1] = window_sum / period
     
-    # Sliding window (O(n) instead of O(n*period))
-    for i in prange(period, n):
+    # Sliding window (O(n) instead of O(n*period)); each step depends on
+    # the previous sum, so the loop is sequential
+    for i in range(period, n):
         window_sum = window_sum - prices[i-period] + prices[i]
         result[i] = window_sum / period
     
     return result
 
 
-@jit(nopython=True, cache=True, parallel=True)
+@jit(nopython=True, cache=True)
 def fast_ema(prices: np.ndarray, period: int) -> np.ndarray:
     """
     Ultra-fast Exponential Moving Average
@@ -316,8 +317,8 @@ def fast_ema(prices: np.ndarray, period: int) -> np.ndarray:
     # Initialize with first valid price
     result[0] = prices[0]
     
-    # Exponential smoothing
-    for i in prange(1, n):
+    # Exponential smoothing (sequential recurrence)
+    for i in range(1, n):
         result[i] = alpha * prices[i] + (1 - alpha) * result[i-1]
     
     return result
@@ -351,9 +352,9 @@ def fast_rsi(prices: np.ndarray, period: int = 14) -> np.ndarray:
         rs = avg_gain / avg_loss
         result[period] = 100.0 - (100.0 / (1.0 + rs))
     
-    # Smoothed RSI
+    # Smoothed RSI (sequential recurrence)
     alpha = 1.0 / period
-    for i in prange(period + 1, n):
+    for i in range(period + 1, n):
         avg_gain = (1 - alpha) * avg_gain + alpha * gains[i-1]
         avg_loss = (1 - alpha) * avg_loss + alpha * losses[i-1]
         
@@ -375,10 +376,10 @@ def fast_macd(prices: np.ndarray, fast_period: int = 12,
     Returns: (macd_line, signal_line, histogram)
     Speed: 700x faster
     """
-    fast_ema = fast_ema(prices, fast_period)
-    slow_ema = fast_ema(prices, slow_period)
+    fast_line = fast_ema(prices, fast_period)
+    slow_line = fast_ema(prices, slow_period)
     
-    macd_line = fast_ema - slow_ema
+    macd_line = fast_line - slow_line
     signal_line = fast_ema(macd_line, signal_period)
     histogram = macd_line - signal_line
     
@@ -440,7 +441,8 @@ def fast_atr(high: np.ndarray, low: np.ndarray, close: np.ndarray,
 # 2. Vectorized Operations (10-100x faster)
 # ═══════════════════════════════════════════════════════════════
 
-@vectorize(['float64(float64, float64)'], target='parallel')
+@vectorize(['float32(float32, float32)', 'float64(float64, float64)'],
+           target='parallel', cache=True)
 def vectorized_percent_change(current: float, previous: float) -> float:
     """Vectorized percent change calculation"""
     if previous == 0:
@@ -0,0 +1,154 @@
+"""
+In-Process Sampling Profiler
+
+Samples the Python stacks of every thread in the worker process at a
+fixed interval (sys._current_frames) and aggregates them as collapsed
+stacks, the input format of flamegraph.pl, speedscope and Pyroscope:
+
+    module:function;module:function;... <samples>
+
+The sampler runs in its own thread and only reads frames, so the
+profiled code is not instrumented; the cost is one stack walk per
+thread and interval while a profile is running, and nothing otherwise.
+
+Samples can be restricted to code running under given functions (the
+endpoint of a route): a sample is kept only when one of their code
+objects is on the thread's stack. Threads waiting for work (event-loop
+selector, idle pool workers, condition waits) are dropped unless
+include_idle is set.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from types import CodeType
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+# Leaf frames of threads that are blocked waiting for work
+IDLE_FRAMES = frozenset({
+    ("selectors", "EpollSelector.select"),
+    ("selectors", "PollSelector.select"),
+    ("selectors", "SelectSelector.select"),
+    ("selectors", "KqueueSelector.select"),
+    ("selectors", "DevpollSelector.select"),
+    ("threading", "Condition.wait"),
+    ("threading", "Event.wait"),
+    ("threading", "Thread._wait_for_tstate_lock"),
+    ("queue", "Queue.get"),
+    ("concurrent.futures.thread", "_worker"),
+})
+
+MAX_STACK_DEPTH = 256
+
+
+@dataclass
+class Profile:
+    """Result of one profiling run"""
+    duration: float  # seconds
+    interval: float  # seconds between samples
+    samples: int = 0  # sampling ticks
+    stacks: Counter = field(default_factory=Counter)  # (frame, ...) root first -> count
+
+    def collapsed(self) -> str:
+        """Collapsed-stack text, heaviest stack first."""
+        lines = [
+            f"{';'.join(stack)} {count}"
+            for stack, count in sorted(self.stacks.items(), key=lambda item: (-item[1], item[0]))
+        ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+
+class SamplingProfiler:
+    """
+    Wall-clock sampling profiler for the current process.
+
+    Args:
+        interval: Seconds between samples
+        scope: Code objects a kept sample must have on its stack (None: all)
+        include_idle: Keep threads that are waiting for work
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.01,
+        scope: Optional[Iterable[CodeType]] = None,
+        include_idle: bool = False
+    ):
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        self.interval = interval
+        self.scope: Optional[FrozenSet[CodeType]] = frozenset(scope) if scope is not None else None
+        self.include_idle = include_idle
+        self._labels: Dict[CodeType, str] = {}
+        self._idle: Dict[CodeType, bool] = {}
+
+    def run(self, duration: float, stop: Optional[threading.Event] = None) -> Profile:
+        """
+        Sample all other threads for duration seconds (blocking).
+
+        Args:
+            duration: Profiling time in seconds
+            stop: Event ending the run early
+
+        Returns:
+            Profile with the aggregated stacks
+        """
+        stop = stop or threading.Event()
+        own_thread = threading.get_ident()
+        profile = Profile(duration=0.0, interval=self.interval)
+
+        start = time.perf_counter()
+        deadline = start + duration
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or stop.wait(min(self.interval, remaining)):
+                break
+            profile.samples += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                stack = self._stack(frame)
+                if stack is not None:
+                    profile.stacks[stack] += 1
+
+        profile.duration = time.perf_counter() - start
+        return profile
+
+    def _stack(self, frame) -> Optional[Tuple[str, ...]]:
+        """Frame labels of one thread, root first, or None if filtered out."""
+        labels = self._labels
+        if not self.include_idle:
+            idle = self._idle.get(frame.f_code)
+            if idle is None:
+                idle = self._idle[frame.f_code] = self._frame_key(frame) in IDLE_FRAMES
+            if idle:
+                return None
+
+        stack = []
+        in_scope = self.scope is None
+        while frame is not None and len(stack) < MAX_STACK_DEPTH:
+            code = frame.f_code
+            if not in_scope and code in self.scope:
+                in_scope = True
+            label = labels.get(code)
+            if label is None:
+                label = labels[code] = "{}:{}".format(*self._frame_key(frame))
+            stack.append(label)
+            frame = frame.f_back
+        if not in_scope:
+            return None
+        stack.reverse()
+        return tuple(stack)
+
+    @staticmethod
+    def _frame_key(frame) -> Tuple[str, str]:
+        """(module, qualified function name) of a frame."""
+        code = frame.f_code
+        return frame.f_globals.get("__name__", "?"), getattr(code, "co_qualname", code.co_name)
@@ -0,0 +1,176 @@
+"""
+Analysis Stage Metrics
+
+Per-stage latency of the analysis pipelines (TechnicalAnalysisService,
+CompleteAnalysisPipeline, FiveDimensionalDecisionMatrix), exported as the
+Prometheus histogram analysis_stage_duration_seconds with the labels
+pipeline, stage and candles (a candle-count bucket).
+
+    timer = StageTimer("technical_analysis", len(candles), collect=True)
+    with timer.stage("trend"):
+        ...
+    timer.breakdown()  # {"trend": 12.345} (ms)
+
+When metrics are disabled (settings.analysis_stage_metrics_enabled or
+prometheus_client missing) and no breakdown is collected, stage() hands
+out one shared no-op context manager, so an instrumented stage costs a
+method call and no clock reads.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import time
+from typing import Dict, Optional, Tuple
+
+from gravity_tech.config.settings import settings
+
+# Make prometheus_client optional
+try:
+    from prometheus_client import Histogram
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+
+# Upper bounds of the candle-count label buckets
+CANDLE_BUCKETS = (100, 500, 1000, 5000)
+
+if PROMETHEUS_AVAILABLE:
+    ANALYSIS_STAGE_SECONDS = Histogram(
+        "analysis_stage_duration_seconds",
+        "Duration of one analysis pipeline stage",
+        ["pipeline", "stage", "candles"],
+        buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    )
+
+# Histogram children by (pipeline, stage, candles), so the hot path skips
+# the label lookup of prometheus_client
+_observers: Dict[Tuple[str, str, str], object] = {}
+
+
+def candle_bucket(count: int) -> str:
+    """
+    Candle-count label of a request.
+
+    Args:
+        count: Number of candles analyzed
+
+    Returns:
+        "<=100", "<=500", "<=1000", "<=5000" or ">5000"
+    """
+    for bound in CANDLE_BUCKETS:
+        if count <= bound:
+            return f"<={bound}"
+    return f">{CANDLE_BUCKETS[-1]}"
+
+
+class _NullStage:
+    """Shared no-op stage for disabled timers."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """Times one stage and reports it to its timer."""
+
+    __slots__ = ("timer", "name", "start")
+
+    def __init__(self, timer: "StageTimer", name: str):
+        self.timer = timer
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.timer.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class StageTimer:
+    """
+    Stage timer of one pipeline run.
+
+    Args:
+        pipeline: Pipeline label (e.g. "technical_analysis")
+        candle_count: Number of candles analyzed (bucketed for the label)
+        collect: Keep a per-stage breakdown for the response
+        enabled: Export to Prometheus (default: settings.analysis_stage_metrics_enabled)
+    """
+
+    def __init__(
+        self,
+        pipeline: str,
+        candle_count: int,
+        collect: bool = False,
+        enabled: Optional[bool] = None
+    ):
+        if enabled is None:
+            enabled = settings.analysis_stage_metrics_enabled
+        self.pipeline = pipeline
+        self.candles = candle_bucket(candle_count)
+        self.collect = collect
+        self.enabled = enabled and PROMETHEUS_AVAILABLE
+        self.timings: Dict[str, float] = {}
+        self._prefix = ""
+
+    @property
+    def active(self) -> bool:
+        """Whether stages are timed at all."""
+        return self.enabled or self.collect
+
+    def stage(self, name: str):
+        """
+        Context manager timing one stage.
+
+        A stage entered several times in one run adds up in the breakdown.
+        """
+        if not (self.enabled or self.collect):
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a stage duration measured elsewhere."""
+        if self.enabled:
+            key = (self.pipeline, name, self.candles)
+            observer = _observers.get(key)
+            if observer is None:
+                observer = _observers[key] = ANALYSIS_STAGE_SECONDS.labels(*key)
+            observer.observe(seconds)
+        if self.collect:
+            name = self._prefix + name
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def child(self, pipeline: str) -> "StageTimer":
+        """
+        Timer for a nested pipeline.
+
+        Its stages are exported under their own pipeline label and show up
+        in this timer's breakdown as "<pipeline>.<stage>".
+        """
+        child = StageTimer.__new__(StageTimer)
+        child.pipeline = pipeline
+        child.candles = self.candles
+        child.collect = self.collect
+        child.enabled = self.enabled
+        child.timings = self.timings
+        child._prefix = f"{self._prefix}{pipeline}."
+        return child
+
+    def breakdown(self) -> Dict[str, float]:
+        """Collected stage durations in milliseconds."""
+        return {name: round(seconds * 1000, 3) for name, seconds in self.timings.items()}
@@ -0,0 +1,278 @@
+"""
+Tool Indicator Engine
+
+Batched indicator and pattern calculation behind the custom-tool analysis
+of ToolRecommendationService. Candles are converted once per request, all
+requested tools are computed in one pass that shares results between tools
+backed by the same calculation (aliases, support/resistance zones), and
+every tool is timed against a request deadline.
+
+Calculators receive a read-only CandleArray built once per pass: the
+indicators read its OHLCV columns (candle_column) instead of each
+extracting its own arrays from the candle list.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.domain.entities import Candle, CandleArray
+from gravity_tech.indicators.trend import TrendIndicators
+from gravity_tech.indicators.momentum import MomentumIndicators
+from gravity_tech.indicators.volatility import VolatilityIndicators
+from gravity_tech.indicators.volume import VolumeIndicators
+from gravity_tech.indicators.cycle import CycleIndicators
+from gravity_tech.indicators.support_resistance import SupportResistanceIndicators
+from gravity_tech.patterns.candlestick import CandlestickPatterns
+from gravity_tech.patterns.classical import ClassicalPatterns
+
+
+# Signal name -> score in [-1, 1] (covers both signal enums in the tree)
+SIGNAL_SCORES = {
+    "VERY_BULLISH": 1.0,
+    "BULLISH": 0.5,
+    "BULLISH_BROKEN": 0.25,
+    "SLIGHTLY_BULLISH": 0.25,
+    "NEUTRAL": 0.0,
+    "SLIGHTLY_BEARISH": -0.25,
+    "BEARISH_BROKEN": -0.25,
+    "BEARISH": -0.5,
+    "VERY_BEARISH": -1.0,
+}
+
+Calculator = Callable[[CandleArray], Any]
+
+# Calculation key -> (tool catalog category, calculator). Tools map onto
+# these keys, so tools backed by the same calculation share one result
+# per request.
+CALCULATORS: Dict[str, Tuple[str, Calculator]] = {
+    # Trend
+    "sma": ("trend_indicators", lambda c: TrendIndicators.sma(c, 20)),
+    "ema": ("trend_indicators", lambda c: TrendIndicators.ema(c, 20)),
+    "wma": ("trend_indicators", lambda c: TrendIndicators.wma(c, 20)),
+    "dema": ("trend_indicators", lambda c: TrendIndicators.dema(c, 20)),
+    "tema": ("trend_indicators", lambda c: TrendIndicators.tema(c, 20)),
+    "macd": ("trend_indicators", lambda c: TrendIndicators.macd(c)),
+    "adx": ("trend_indicators", lambda c: TrendIndicators.adx(c, 14)),
+    # Momentum
+    "rsi": ("momentum_indicators", lambda c: MomentumIndicators.rsi(c, 14)),
+    "stochastic": ("momentum_indicators", lambda c: MomentumIndicators.stochastic(c, 14, 3)),
+    "cci": ("momentum_indicators", lambda c: MomentumIndicators.cci(c, 20)),
+    "williams_r": ("momentum_indicators", lambda c: MomentumIndicators.williams_r(c, 14)),
+    "roc": ("momentum_indicators", lambda c: MomentumIndicators.roc(c, 12)),
+    "mfi": ("momentum_indicators", lambda c: MomentumIndicators.mfi(c, 14)),
+    "ultimate_oscillator": ("momentum_indicators", lambda c: MomentumIndicators.ultimate_oscillator(c)),
+    # Volatility
+    "bollinger": ("volatility_indicators", lambda c: VolatilityIndicators.bollinger_bands(c, 20, 2.0)),
+    "atr": ("volatility_indicators", lambda c: VolatilityIndicators.atr(c, 14)),
+    "keltner": ("volatility_indicators", lambda c: VolatilityIndicators.keltner_channel(c, 20)),
+    "donchian": ("volatility_indicators", lambda c: VolatilityIndicators.donchian_channel(c, 20)),
+    "std_dev": ("volatility_indicators", lambda c: VolatilityIndicators.standard_deviation(c, 20)),
+    "historical_volatility": ("volatility_indicators", lambda c: VolatilityIndicators.historical_volatility(c, 20)),
+    "chaikin_volatility": ("volatility_indicators", lambda c: VolatilityIndicators.chaikin_volatility(c)),
+    # Volume
+    "obv": ("volume_indicators", lambda c: VolumeIndicators.obv(c)),
+    "vwap": ("volume_indicators", lambda c: VolumeIndicators.vwap(c)),
+    "ad_line": ("volume_indicators", lambda c: VolumeIndicators.ad_line(c)),
+    "cmf": ("volume_indicators", lambda c: VolumeIndicators.cmf(c, 20)),
+    "volume_oscillator": ("volume_indicators", lambda c: VolumeIndicators.volume_oscillator(c)),
+    # Cycle
+    "dpo": ("cycle_indicators", lambda c: CycleIndicators.dpo(c, 20)),
+    "stc": ("cycle_indicators", lambda c: CycleIndicators.schaff_trend_cycle(c)),
+    "hilbert": ("cycle_indicators", lambda c: CycleIndicators.hilbert_transform_phase(c)),
+    "cycle_period": ("cycle_indicators", lambda c: CycleIndicators.ehlers_cycle_period(c)),
+    "dominant_cycle": ("cycle_indicators", lambda c: CycleIndicators.dominant_cycle(c)),
+    "phase_accumulation": ("cycle_indicators", lambda c: CycleIndicators.phase_accumulation(c)),
+    "sine_wave": ("cycle_indicators", lambda c: CycleIndicators.sine_wave(c, 20)),
+    # Support / Resistance
+    "pivot": ("support_resistance", lambda c: SupportResistanceIndicators.pivot_points(c)),
+    "fibonacci": ("support_resistance", lambda c: SupportResistanceIndicators.fibonacci_retracement(c, 50)),
+    "camarilla": ("support_resistance", lambda c: SupportResistanceIndicators.camarilla_pivots(c)),
+    "sr_levels": ("support_resistance", lambda c: SupportResistanceIndicators.support_resistance_levels(c, 50)),
+}
+
+# Tool name (upper case, as in the tool catalog) -> calculation key
+TOOL_ALIASES: Dict[str, str] = {
+    "SMA": "sma", "EMA": "ema", "WMA": "wma", "DEMA": "dema", "TEMA": "tema",
+    "MACD": "macd", "ADX": "adx",
+    "RSI": "rsi", "STOCHASTIC": "stochastic", "CCI": "cci",
+    "WILLIAMS_R": "williams_r", "ROC": "roc",
+    "MFI": "mfi", "MONEY_FLOW_INDEX": "mfi",
+    "ULTIMATE_OSCILLATOR": "ultimate_oscillator",
+    "BOLLINGER_BANDS": "bollinger", "BOLLINGER": "bollinger", "BB": "bollinger",
+    "ATR": "atr", "KELTNER_CHANNELS": "keltner", "DONCHIAN_CHANNELS": "donchian",
+    "STANDARD_DEVIATION": "std_dev", "HISTORICAL_VOLATILITY": "historical_volatility",
+    "CHAIKIN_VOLATILITY": "chaikin_volatility",
+    "OBV": "obv", "VWAP": "vwap",
+    "ACCUMULATION_DISTRIBUTION": "ad_line", "AD_LINE": "ad_line",
+    "CHAIKIN_MONEY_FLOW": "cmf", "CMF": "cmf",
+    "VOLUME_OSCILLATOR": "volume_oscillator",
+    "DETRENDED_PRICE": "dpo", "DPO": "dpo",
+    "SCHAFF_TREND_CYCLE": "stc", "STC": "stc",
+    "HILBERT_TRANSFORM": "hilbert", "CYCLE_PERIOD": "cycle_period",
+    "DOMINANT_CYCLE": "dominant_cycle", "PHASE_ACCUMULATION": "phase_accumulation",
+    "SINE_WAVE": "sine_wave", "SINE": "sine_wave",
+    "PIVOT_POINTS": "pivot", "FLOOR_PIVOTS": "pivot", "PIVOT": "pivot",
+    "FIBONACCI_RETRACEMENT": "fibonacci", "FIBONACCI": "fibonacci",
+    "CAMARILLA_PIVOTS": "camarilla",
+    "SUPPORT_ZONES": "sr_levels", "RESISTANCE_ZONES": "sr_levels",
+}
+
+# Pattern detectors run concurrently by the service
+PATTERN_DETECTORS: Dict[str, Callable[[List[Candle]], list]] = {
+    "candlestick": CandlestickPatterns.detect_patterns,
+    "classical": ClassicalPatterns.detect_all,
+}
+
+
+def normalize_tool_name(tool: str) -> str:
+    """Catalog form of a tool name: 'bollinger bands' -> 'BOLLINGER_BANDS'"""
+    return tool.strip().upper().replace(" ", "_").replace("-", "_")
+
+
+def signal_score(signal: Any) -> float:
+    """Score in [-1, 1] of a signal enum member"""
+    return SIGNAL_SCORES.get(getattr(signal, "name", str(signal)), 0.0)
+
+
+class ToolIndicatorEngine:
+    """
+    Batched calculation of user-selected tools
+
+    Example:
+        engine = ToolIndicatorEngine()
+        candles = engine.to_candles(candles_df, "BTCUSDT", "1d")
+        results, timings = engine.compute(candles, ["MACD", "RSI", "ADX"])
+    """
+
+    @staticmethod
+    def to_candles(
+        candles: pd.DataFrame,
+        symbol: str = "UNKNOWN",
+        timeframe: str = "1h"
+    ) -> List[Candle]:
+        """Convert an OHLCV DataFrame to Candle entities (once per request)"""
+        timestamps = pd.to_datetime(candles["timestamp"]).dt.to_pydatetime()
+        values = candles[["open", "high", "low", "close", "volume"]].to_numpy(dtype=np.float64)
+        return [
+            Candle(ts, o, h, l, c, v, symbol=symbol, timeframe=timeframe)
+            for ts, (o, h, l, c, v) in zip(timestamps, values.tolist())
+        ]
+
+    @staticmethod
+    def columns(candles: List[Candle]) -> CandleArray:
+        """OHLCV columns shared by all calculators of one pass (read-only)"""
+        shared = CandleArray.from_candles(candles)
+        for column in (shared.timestamp, shared.open, shared.high, shared.low, shared.close, shared.volume):
+            column.flags.writeable = False
+        return shared
+
+    @staticmethod
+    def resolve(tool: str) -> Optional[str]:
+        """Calculation key of a tool, or None when no implementation exists"""
+        return TOOL_ALIASES.get(normalize_tool_name(tool))
+
+    def compute(
+        self,
+        candles: List[Candle],
+        tools: List[str],
+        deadline: Optional[float] = None
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, float]]:
+        """
+        Compute all requested tools in one pass
+
+        Args:
+            candles: Candles (see to_candles)
+            tools: Tool names as requested
+            deadline: time.perf_counter() value after which remaining tools
+                      are skipped
+
+        Returns:
+            (results by tool, milliseconds spent per tool)
+        """
+        batch: Dict[str, Any] = {}
+        results: Dict[str, Dict[str, Any]] = {}
+        timings: Dict[str, float] = {}
+        shared = self.columns(candles)
+
+        for tool in tools:
+            key = self.resolve(tool)
+            if key is None:
+                results[tool] = {"status": "unsupported", "signal": "neutral"}
+                continue
+            category, calculator = CALCULATORS[key]
+
+            if key not in batch:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    results[tool] = {"status": "skipped", "signal": "neutral", "category": category}
+                    continue
+                started = time.perf_counter()
+                try:
+                    batch[key] = self._to_dict(calculator(shared), category)
+                except Exception as e:
+                    batch[key] = e
+                timings[tool] = round((time.perf_counter() - started) * 1000, 3)
+            else:
+                timings[tool] = 0.0
+
+            outcome = batch[key]
+            if isinstance(outcome, Exception):
+                results[tool] = {
+                    "status": "error", "signal": "neutral",
+                    "category": category, "error": str(outcome)
+                }
+            else:
+                results[tool] = dict(outcome)
+
+        return results, timings
+
+    @staticmethod
+    def _to_dict(result: Any, category: str) -> Dict[str, Any]:
+        """Flatten an IndicatorResult / VolatilityResult / CycleResult"""
+        details = dict(getattr(result, "additional_values", None) or {})
+        for attr in ("normalized", "percentile", "phase", "cycle_period"):
+            if hasattr(result, attr):
+                details[attr] = getattr(result, attr)
+        return {
+            "status": "ok",
+            "category": category,
+            "value": float(result.value),
+            "signal": result.signal.name.lower(),
+            "score": signal_score(result.signal),
+            "confidence": float(result.confidence),
+            "details": {k: float(v) for k, v in details.items()},
+            "description": getattr(result, "description", None),
+        }
+
+    @staticmethod
+    def detect(
+        name: str,
+        candles: List[Candle]
+    ) -> Tuple[List[Dict[str, Any]], float]:
+        """Run one pattern detector; returns (patterns, milliseconds)"""
+        started = time.perf_counter()
+        found = PATTERN_DETECTORS[name](candles)
+        index = {c.timestamp: i for i, c in enumerate(candles)}
+
+        patterns = []
+        for pattern in found:
+            score = signal_score(pattern.signal)
+            patterns.append({
+                "type": pattern.pattern_name,
+                "family": name,
+                "confidence": float(pattern.confidence),
+                "location": "recent",
+                "candle_index": index.get(pattern.end_time, len(candles) - 1),
+                "significance": "high" if pattern.confidence >= 0.75 else "medium",
+                "expected_move": "bullish" if score > 0 else "bearish" if score < 0 else "neutral",
+                "price_target": pattern.price_target,
+                "stop_loss": pattern.stop_loss,
+            })
+        return patterns, round((time.perf_counter() - started) * 1000, 3)
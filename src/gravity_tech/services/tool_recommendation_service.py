@@ -11,17 +11,27 @@ License: MIT
 """
 
 import asyncio
+import time
 from typing import List, Dict, Optional, Any, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
 import numpy as np
 import pandas as pd
 from pathlib import Path
+import structlog
+
+from gravity_tech.services.cache_service import CacheManager, NearCache, cache_manager
+from gravity_tech.services.tool_indicator_engine import (
+    PATTERN_DETECTORS,
+    ToolIndicatorEngine,
+)
 
 # TODO: Import actual modules when ready
 # from ml.ml_tool_recommender import DynamicToolRecommender, MarketContext, ToolRecommendation
 # from src.gravity_tech.clients.data_service_client import DataServiceClient
 # from database.tool_performance_manager import ToolPerformanceManager
 
+logger = structlog.get_logger()
+
 
 class ToolRecommendationService:
     """
@@ -39,7 +49,12 @@ class ToolRecommendationService:
         self,
         data_service_url: Optional[str] = None,
         redis_url: Optional[str] = None,
-        db_connection_string: Optional[str] = None
+        db_connection_string: Optional[str] = None,
+        custom_analysis_budget_ms: float = 2000.0,
+        cache: Optional[CacheManager] = None,
+        local_cache_size: int = 512,
+        recommendation_ttl: int = 300,
+        stale_ttl: int = 600
     ):
         """
         Initialize Tool Recommendation Service.
@@ -48,18 +63,38 @@ class ToolRecommendationService:
             data_service_url: Data service URL
             redis_url: Redis URL for cache
             db_connection_string: Database connection string
+            custom_analysis_budget_ms: Default latency budget of one
+                custom-tool analysis request
+            cache: Shared Redis cache (global cache_manager if None)
+            local_cache_size: Entries kept in the in-process LRU
+            recommendation_ttl: Seconds a recommendation is fresh
+            stale_ttl: Seconds an expired recommendation may still be
+                served while it is refreshed in the background
         """
         self.data_service_url = data_service_url or "http://localhost:8001"
         self.redis_url = redis_url
         self.db_connection = db_connection_string
+        self.custom_analysis_budget_ms = custom_analysis_budget_ms
+        self.indicator_engine = ToolIndicatorEngine()
         
         # TODO: Initialize actual components
         # self.data_client = DataServiceClient(self.data_service_url)
         # self.recommender = DynamicToolRecommender(model_type="lightgbm")
         # self.performance_manager = ToolPerformanceManager(self.db_connection)
-        # self.cache = CacheService(self.redis_url)
         
-        self._cache = {}  # Simple in-memory cache for now
+        # Two-level cache: in-process LRU in front of the shared Redis cache.
+        # Entries live for ttl + stale_ttl; past ttl they are served stale
+        # and refreshed in the background.
+        self.cache = cache if cache is not None else cache_manager
+        self.recommendation_ttl = recommendation_ttl
+        self.stale_ttl = stale_ttl
+        self._local_cache = NearCache(
+            max_size=local_cache_size,
+            ttl=recommendation_ttl + stale_ttl,
+            name="tool_recommendations"
+        )
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self.stale_hits = 0
     
     async def get_tool_recommendations(
         self,
@@ -85,16 +120,42 @@ class ToolRecommendationService:
             Complete dictionary with recommendations
         """
         
-        # 1. Check cache
-        cache_key = f"tool_rec:{symbol}:{timeframe}:{analysis_goal}"
-        cached = self._get_from_cache(cache_key)
-        if cached:
-            return cached
+        cache_key = (
+            f"tools:rec:{symbol}:{timeframe}:{analysis_goal}:"
+            f"{trading_style}:{limit_candles}:{top_n}"
+        )
+        params = dict(
+            symbol=symbol, timeframe=timeframe, analysis_goal=analysis_goal,
+            trading_style=trading_style, limit_candles=limit_candles, top_n=top_n
+        )
+        
+        # 1. Check cache; stale entries are served while a refresh runs
+        entry = await self._cache_get(cache_key)
+        if entry is not None:
+            if time.time() >= entry["fresh_until"]:
+                self.stale_hits += 1
+                self._refresh(cache_key, params)
+            return self._entry_response(entry)
+        
+        # 2. Miss: compute (concurrent misses share one computation)
+        entry = await asyncio.shield(self._refresh(cache_key, params))
+        return self._entry_response(entry)
+    
+    async def _compute_recommendations(
+        self,
+        symbol: str,
+        timeframe: str,
+        analysis_goal: str,
+        trading_style: str,
+        limit_candles: int,
+        top_n: int
+    ) -> Dict[str, Any]:
+        """Compute a recommendation response (everything but the timestamp)."""
         
-        # 2. Fetch market data from Data Service
+        # 1. Fetch market data from Data Service
         candles_df = await self._fetch_market_data(symbol, timeframe, limit_candles)
         
-        # 3. Analyze market context
+        # 2. Analyze market context
         market_context = self._analyze_market_context(
             symbol=symbol,
             candles=candles_df,
@@ -102,25 +163,25 @@ class ToolRecommendationService:
             trading_style=trading_style
         )
         
-        # 4. Get ML weights for current regime
+        # 3. Get ML weights for current regime
         ml_weights = self._get_ml_weights(market_context["regime"])
         
-        # 5. Get tool recommendations
+        # 4. Get tool recommendations
         recommendations = self._get_recommendations(
             market_context=market_context,
             ml_weights=ml_weights,
             top_n=top_n
         )
         
-        # 6. Build dynamic strategy
+        # 5. Build dynamic strategy
         strategy = self._build_strategy(
             recommendations=recommendations,
             market_context=market_context,
             analysis_goal=analysis_goal
         )
         
-        # 7. Prepare response
-        response = {
+        # 6. Prepare response
+        return {
             "symbol": symbol,
             "market_context": market_context,
             "analysis_goal": analysis_goal,
@@ -131,14 +192,8 @@ class ToolRecommendationService:
                 "regime_weights": ml_weights,
                 "total_tools_analyzed": 95,
                 "timestamp": datetime.utcnow().isoformat()
-            },
-            "timestamp": datetime.utcnow()
+            }
         }
-        
-        # 8. Cache result
-        self._save_to_cache(cache_key, response, ttl=300)  # 5 minutes
-        
-        return response
     
     async def analyze_with_custom_tools(
         self,
@@ -147,11 +202,17 @@ class ToolRecommendationService:
         selected_tools: List[str],
         include_ml_scoring: bool = True,
         include_patterns: bool = True,
-        limit_candles: int = 200
+        limit_candles: int = 200,
+        latency_budget_ms: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Analysis with user-selected tools.
         
+        Candles are converted once; the selected tools are computed in one
+        batched pass in a worker thread while pattern detectors run
+        concurrently. Tools not started before the latency budget runs out
+        are reported as skipped, and late pattern results are dropped.
+        
         Args:
             symbol: Asset symbol
             timeframe: Time frame
@@ -159,33 +220,55 @@ class ToolRecommendationService:
             include_ml_scoring: Include ML scoring
             include_patterns: Include pattern detection
             limit_candles: Number of candles
+            latency_budget_ms: Request budget (defaults to the service budget)
         
         Returns:
-            Analysis results
+            Analysis results with per-tool timings in "metadata"
         """
+        started = time.perf_counter()
+        budget_ms = latency_budget_ms or self.custom_analysis_budget_ms
+        deadline = started + budget_ms / 1000
         
-        # 1. Fetch market data
+        # 1. Fetch market data and convert it once
         candles_df = await self._fetch_market_data(symbol, timeframe, limit_candles)
+        candles = self.indicator_engine.to_candles(candles_df, symbol, timeframe)
+        
+        # 2. Pattern detection runs concurrently with the indicators
+        pattern_task = None
+        if include_patterns:
+            pattern_task = asyncio.ensure_future(self._detect_patterns(candles))
         
-        # 2. Calculate selected indicators
-        tool_results = {}
-        for tool in selected_tools:
-            result = await self._calculate_indicator(tool, candles_df)
-            tool_results[tool] = result
+        # 3. Calculate selected indicators in one batched pass
+        tool_results, tool_timings = await asyncio.to_thread(
+            self.indicator_engine.compute, candles, selected_tools, deadline
+        )
         
-        # 3. ML Scoring (if requested)
+        # 4. ML Scoring (if requested)
         ml_scoring = None
         if include_ml_scoring:
-            ml_scoring = self._calculate_ml_scoring(tool_results, candles_df)
-        
-        # 4. Pattern Detection (if requested)
+            market_context = self._analyze_market_context(
+                symbol=symbol,
+                candles=candles_df,
+                timeframe=timeframe
+            )
+            ml_scoring = self._calculate_ml_scoring(tool_results, market_context["regime"])
+        
+        # 5. Pattern Detection (if requested)
         patterns = None
-        if include_patterns:
-            patterns = await self._detect_patterns(candles_df)
-        
-        # 5. Summary
+        pattern_timings = {}
+        pattern_errors = {}
+        if pattern_task is not None:
+            try:
+                patterns, pattern_timings, pattern_errors = await asyncio.wait_for(
+                    pattern_task, timeout=max(deadline - time.perf_counter(), 0.0)
+                )
+            except asyncio.TimeoutError:
+                patterns = None
+        
+        # 6. Summary
         summary = self._create_summary(tool_results, ml_scoring, patterns)
         
+        elapsed_ms = (time.perf_counter() - started) * 1000
         return {
             "symbol": symbol,
             "timeframe": timeframe,
@@ -194,6 +277,23 @@ class ToolRecommendationService:
             "ml_scoring": ml_scoring,
             "patterns_detected": patterns,
             "summary": summary,
+            "metadata": {
+                "latency_budget_ms": budget_ms,
+                "elapsed_ms": round(elapsed_ms, 3),
+                "budget_exceeded": elapsed_ms > budget_ms,
+                "tool_timings_ms": tool_timings,
+                "pattern_timings_ms": pattern_timings,
+                "pattern_errors": pattern_errors,
+                "skipped_tools": [
+                    tool for tool, result in tool_results.items()
+                    if result["status"] == "skipped"
+                ],
+                "unsupported_tools": [
+                    tool for tool, result in tool_results.items()
+                    if result["status"] == "unsupported"
+                ],
+                "patterns_timed_out": include_patterns and patterns is None
+            },
             "timestamp": datetime.utcnow()
         }
     
@@ -238,7 +338,7 @@ class ToolRecommendationService:
         symbol: str,
         candles: pd.DataFrame,
         timeframe: str,
-        trading_style: str
+        trading_style: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Analyze market context.
@@ -446,90 +546,99 @@ class ToolRecommendationService:
             "analysis_goal": analysis_goal
         }
     
-    async def _calculate_indicator(
-        self,
-        tool_name: str,
-        candles: pd.DataFrame
-    ) -> Dict[str, Any]:
-        """
-        Calculate an indicator.
-        
-        TODO: Use actual indicator calculators
-        """
-        
-        # Currently simulated results
-        if tool_name.upper() == "MACD":
-            return {
-                "macd": 125.3,
-                "signal": 118.7,
-                "histogram": 6.6,
-                "signal_type": "bullish",
-                "strength": 0.72
-            }
-        elif tool_name.upper() == "RSI":
-            return {
-                "value": 58.3,
-                "signal": "neutral",
-                "overbought": False,
-                "oversold": False
-            }
-        elif tool_name.upper() == "ADX":
-            return {
-                "adx": 32.5,
-                "plus_di": 28.3,
-                "minus_di": 18.7,
-                "trend_strength": "strong",
-                "direction": "bullish"
-            }
-        else:
-            return {
-                "value": 0.0,
-                "signal": "neutral"
-            }
-    
     def _calculate_ml_scoring(
         self,
         tool_results: Dict[str, Any],
-        candles: pd.DataFrame
+        regime: str
     ) -> Dict[str, Any]:
         """
         ML scoring based on tool results.
         
-        TODO: Use actual ML scoring models
+        Each category score is the confidence-weighted mean signal of its
+        tools mapped to 0-100; the combined score weights categories by
+        the ML weights of the market regime (from _analyze_market_context).
         """
+        ml_weights = self._get_ml_weights(regime)
+        
+        by_category: Dict[str, List[Tuple[float, float]]] = {}
+        for result in tool_results.values():
+            if result["status"] == "ok":
+                by_category.setdefault(result["category"], []).append(
+                    (result["score"], result["confidence"])
+                )
+        
+        category_scores = {}
+        for category, values in by_category.items():
+            scores, confidences = np.array(values).T
+            weight = confidences.sum()
+            mean = float(np.dot(scores, confidences) / weight) if weight > 0 else 0.0
+            category_scores[category] = 50.0 + 50.0 * mean
+        
+        weights = {category: ml_weights.get(category, 0.0) for category in category_scores}
+        total_weight = sum(weights.values())
+        if total_weight > 0:
+            combined = sum(category_scores[c] * w for c, w in weights.items()) / total_weight
+        elif category_scores:
+            combined = float(np.mean(list(category_scores.values())))
+        else:
+            combined = 50.0
+        
+        confidences = [
+            result["confidence"] for result in tool_results.values()
+            if result["status"] == "ok"
+        ]
+        
+        if combined >= 60:
+            signal = "buy"
+        elif combined <= 40:
+            signal = "sell"
+        else:
+            signal = "hold"
         
         return {
-            "trend_score": 72.5,
-            "momentum_score": 68.3,
-            "volatility_score": 55.2,
-            "volume_score": 65.0,
-            "combined_score": 67.8,
-            "signal": "buy",
-            "confidence": 0.78,
-            "ml_model": "lightgbm",
+            "trend_score": category_scores.get("trend_indicators"),
+            "momentum_score": category_scores.get("momentum_indicators"),
+            "volatility_score": category_scores.get("volatility_indicators"),
+            "volume_score": category_scores.get("volume_indicators"),
+            "cycle_score": category_scores.get("cycle_indicators"),
+            "support_resistance_score": category_scores.get("support_resistance"),
+            "combined_score": float(combined),
+            "signal": signal,
+            "confidence": float(np.mean(confidences)) if confidences else 0.0,
+            "regime": regime,
+            "ml_model": "regime_weights",
             "version": "1.0.0"
         }
     
     async def _detect_patterns(
         self,
-        candles: pd.DataFrame
-    ) -> List[Dict[str, Any]]:
+        candles: List[Any]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, float], Dict[str, Dict[str, str]]]:
         """
         Detect price patterns.
         
-        TODO: Use actual pattern detection
+        Every detector runs in its own worker thread; returns the patterns,
+        the milliseconds spent per detector and the detectors that failed.
+        A failing detector is reported instead of failing the request.
         """
-        
-        return [
-            {
-                "type": "Bullish_Engulfing",
-                "confidence": 0.85,
-                "location": "recent",
-                "candle_index": len(candles) - 2,
-                "significance": "high",
-                "expected_move": "bullish"
-            }
-        ]
+        names = list(PATTERN_DETECTORS)
+        outcomes = await asyncio.gather(*[
+            asyncio.to_thread(self.indicator_engine.detect, name, candles)
+            for name in names
+        ], return_exceptions=True)
+        
+        patterns = []
+        timings = {}
+        errors = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning("pattern_detector_failed", detector=name, error=str(outcome))
+                errors[name] = {"status": "error", "error": str(outcome)}
+                continue
+            found, elapsed_ms = outcome
+            patterns.extend(found)
+            timings[name] = elapsed_ms
+        return patterns, timings, errors
     
     def _create_summary(
         self,
@@ -544,7 +653,12 @@ class ToolRecommendationService:
         bearish_count = 0
         neutral_count = 0
         
-        for tool, result in tool_results.items():
+        analyzed = {
+            tool: result for tool, result in tool_results.items()
+            if result.get("status", "ok") == "ok"
+        }
+        
+        for tool, result in analyzed.items():
             signal = result.get("signal_type") or result.get("signal", "neutral")
             if "bull" in signal.lower():
                 bullish_count += 1
@@ -556,13 +670,13 @@ class ToolRecommendationService:
         # Determine overall signal
         if bullish_count > bearish_count:
             overall_signal = "bullish"
-            if bullish_count >= len(tool_results) * 0.7:
+            if bullish_count >= len(analyzed) * 0.7:
                 consensus = "strong_buy"
             else:
                 consensus = "buy"
         elif bearish_count > bullish_count:
             overall_signal = "bearish"
-            if bearish_count >= len(tool_results) * 0.7:
+            if bearish_count >= len(analyzed) * 0.7:
                 consensus = "strong_sell"
             else:
                 consensus = "sell"
@@ -573,7 +687,7 @@ class ToolRecommendationService:
         return {
             "overall_signal": overall_signal,
             "consensus": consensus,
-            "tools_analyzed": len(tool_results),
+            "tools_analyzed": len(analyzed),
             "bullish_tools": bullish_count,
             "bearish_tools": bearish_count,
             "neutral_tools": neutral_count,
@@ -581,21 +695,76 @@ class ToolRecommendationService:
             "patterns_found": len(patterns) if patterns else 0
         }
     
-    def _get_from_cache(self, key: str) -> Optional[Dict]:
-        """Get from cache."""
-        cached_item = self._cache.get(key)
-        if cached_item:
-            data, expiry = cached_item
-            if datetime.utcnow() < expiry:
-                return data
-            else:
-                del self._cache[key]
-        return None
+    # ═══════════════════════════════════════════════════════════════
+    # Cache
+    # ═══════════════════════════════════════════════════════════════
+    
+    @staticmethod
+    def _entry_response(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Response of a cache entry, stamped with its computation time."""
+        response = dict(entry["value"])
+        response["timestamp"] = datetime.utcfromtimestamp(entry["created_at"])
+        return response
+    
+    async def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Entry from the local LRU, else from Redis (promoted to local)."""
+        hit, payload = self._local_cache.get(key)
+        if hit:
+            return self.cache.decode(payload)
+        
+        entry = await self.cache.get(key)
+        if entry is None:
+            return None
+        remaining = entry["fresh_until"] + self.stale_ttl - time.time()
+        if remaining <= 0:
+            return None
+        self._local_cache.set(key, self.cache.encode(entry), remaining)
+        return entry
+    
+    async def _cache_set(self, key: str, value: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a freshly computed value in both levels."""
+        now = time.time()
+        entry = {
+            "value": value,
+            "created_at": now,
+            "fresh_until": now + self.recommendation_ttl,
+        }
+        ttl = self.recommendation_ttl + self.stale_ttl
+        self._local_cache.set(key, self.cache.encode(entry), ttl)
+        await self.cache.set(key, entry, ttl=ttl)
+        return entry
+    
+    def _refresh(self, key: str, params: Dict[str, Any]) -> asyncio.Task:
+        """
+        Recompute key in a background task.
+        
+        At most one refresh per key runs at a time; callers asking again
+        get the running task.
+        """
+        task = self._refreshing.get(key)
+        if task is not None:
+            return task
+        
+        async def refresh() -> Dict[str, Any]:
+            value = await self._compute_recommendations(**params)
+            return await self._cache_set(key, value)
+        
+        task = asyncio.ensure_future(refresh())
+        self._refreshing[key] = task
+        task.add_done_callback(lambda t: self._refresh_done(key, t))
+        return task
+    
+    def _refresh_done(self, key: str, task: asyncio.Task):
+        self._refreshing.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("tool_recommendation_refresh_failed", key=key, error=str(task.exception()))
     
-    def _save_to_cache(self, key: str, data: Dict, ttl: int = 300):
-        """Save to cache."""
-        expiry = datetime.utcnow() + timedelta(seconds=ttl)
-        self._cache[key] = (data, expiry)
+    def cache_stats(self) -> Dict[str, Any]:
+        """Local LRU statistics plus stale-while-revalidate counters."""
+        stats = self._local_cache.stats()
+        stats["stale_hits"] = self.stale_hits
+        stats["refreshing"] = len(self._refreshing)
+        return stats
     
     async def record_tool_performance(
         self,
@@ -0,0 +1,10 @@
+"""
+Benchmark Suite Package
+
+Run with `python -m tests.benchmarks --help` from the repository root.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
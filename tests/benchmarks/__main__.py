@@ -0,0 +1,129 @@
+"""
+Benchmark Command Line
+
+Usage (from the repository root):
+
+    python -m tests.benchmarks list
+    python -m tests.benchmarks run --sizes 100 1000 --output bench/current.json
+    python -m tests.benchmarks run --filter "indicators.*" "patterns.*"
+    python -m tests.benchmarks compare bench/baseline.json bench/current.json --threshold 0.25
+
+`compare` exits with status 1 when a tracked benchmark regressed beyond
+the threshold or stopped running.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import argparse
+import sys
+
+from tests.benchmarks import suite  # noqa: F401  (registers the benchmarks)
+from tests.benchmarks.harness import (
+    DEFAULT_SIZES,
+    compare,
+    format_seconds,
+    load_results,
+    run_suite,
+    save_results,
+    select,
+)
+
+
+def _print_result(result):
+    if result.status == "ok":
+        detail = f"{format_seconds(result.median_s):>10}  (x{result.repeats})"
+    elif result.status == "error":
+        detail = f"ERROR {result.error}"
+    else:
+        detail = "skipped"
+    print(f"{result.name:45s} {result.size:>7d}  {detail}", flush=True)
+
+
+def cmd_list(args) -> int:
+    for bench in select(args.filter):
+        limit = f"max {bench.max_size}" if bench.max_size else "all sizes"
+        tracked = "" if bench.tracked else "  (untracked)"
+        print(f"{bench.name:45s} {bench.group:12s} {limit}{tracked}")
+    return 0
+
+
+def cmd_run(args) -> int:
+    benchmarks = select(args.filter)
+    if not benchmarks:
+        print("No benchmarks match the filter")
+        return 2
+    document = run_suite(
+        benchmarks,
+        sizes=args.sizes,
+        min_time=args.min_time,
+        max_repeats=args.max_repeats,
+        progress=_print_result,
+    )
+    path = save_results(document, args.output)
+    print(f"\nResults written to {path}")
+    return 0
+
+
+def cmd_compare(args) -> int:
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+    comparisons = compare(
+        baseline, current,
+        threshold=args.threshold,
+        metric=args.metric,
+        min_delta_s=args.min_delta,
+        only_tracked=not args.all,
+    )
+
+    for comp in sorted(comparisons, key=lambda c: c.key):
+        ratio = f"{comp.ratio:.2f}x" if comp.ratio is not None else "-"
+        print(
+            f"{comp.status.upper():10s} {comp.key:55s} "
+            f"{format_seconds(comp.baseline_s):>10} -> {format_seconds(comp.current_s):>10}  "
+            f"{ratio:>7} {comp.note}"
+        )
+
+    failed = [comp for comp in comparisons if comp.failed]
+    print(f"\n{len(comparisons)} compared, {len(failed)} failed "
+          f"(threshold {args.threshold:.0%} on {args.metric})")
+    return 1 if failed else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="List registered benchmarks")
+    list_parser.add_argument("--filter", nargs="*", help="Glob patterns on benchmark names")
+    list_parser.set_defaults(handler=cmd_list)
+
+    run_parser = commands.add_parser("run", help="Run benchmarks and write JSON results")
+    run_parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    run_parser.add_argument("--filter", nargs="*", help="Glob patterns on benchmark names")
+    run_parser.add_argument("--output", default="benchmark-results.json")
+    run_parser.add_argument("--min-time", type=float, default=0.2,
+                            help="Minimum timed seconds per benchmark and size")
+    run_parser.add_argument("--max-repeats", type=int, default=20)
+    run_parser.set_defaults(handler=cmd_run)
+
+    compare_parser = commands.add_parser("compare", help="Fail on regressions against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.25,
+                                help="Allowed slowdown as a fraction (0.25 = 25%%)")
+    compare_parser.add_argument("--metric", choices=["median_s", "min_s", "mean_s"], default="median_s")
+    compare_parser.add_argument("--min-delta", type=float, default=1e-4,
+                                help="Ignore slowdowns smaller than this many seconds")
+    compare_parser.add_argument("--all", action="store_true",
+                                help="Also gate untracked benchmarks")
+    compare_parser.set_defaults(handler=cmd_compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
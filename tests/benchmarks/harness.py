@@ -0,0 +1,344 @@
+"""
+Benchmark Harness
+
+Registry, timing loop, JSON result files and regression comparison for
+the benchmark suite in tests/benchmarks/suite.py.
+
+Every benchmark is timed at several series lengths on deterministic
+synthetic candles. A run writes one JSON file; `compare` checks a run
+against a baseline file and reports tracked benchmarks that got slower
+than the allowed threshold.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+for _path in (PROJECT_ROOT / "src", PROJECT_ROOT):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from src.core.domain.entities import Candle  # noqa: E402
+
+SCHEMA_VERSION = 1
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000)
+
+
+# ═══════════════════════════════════════════════════════════════
+# Inputs
+# ═══════════════════════════════════════════════════════════════
+
+@lru_cache(maxsize=8)
+def make_candles(n: int, seed: int = 42) -> List[Candle]:
+    """Deterministic random-walk candles (cached per size)"""
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0, 1, n))
+    close = np.abs(close) + 10.0
+    open_ = close + rng.normal(0, 0.3, n)
+    high = np.maximum(open_, close) + np.abs(rng.normal(0, 0.5, n))
+    low = np.minimum(open_, close) - np.abs(rng.normal(0, 0.5, n))
+    volume = rng.integers(1_000, 5_000, n).astype(np.float64)
+
+    base = datetime(2020, 1, 1)
+    return [
+        Candle(base + timedelta(hours=i), o, h, l, c, v)
+        for i, (o, h, l, c, v) in enumerate(zip(
+            open_.tolist(), high.tolist(), low.tolist(), close.tolist(), volume.tolist()
+        ))
+    ]
+
+
+def candle_arrays(n: int) -> Dict[str, np.ndarray]:
+    """OHLCV arrays of make_candles(n)"""
+    candles = make_candles(n)
+    return {
+        field_name: np.array([getattr(c, field_name) for c in candles])
+        for field_name in ("open", "high", "low", "close", "volume")
+    }
+
+
+# ═══════════════════════════════════════════════════════════════
+# Registry
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass
+class Benchmark:
+    """One registered benchmark"""
+    name: str
+    group: str
+    func: Callable[[Any], Any]
+    setup: Callable[[int], Any] = make_candles
+    max_size: Optional[int] = None
+    tracked: bool = True
+
+    def supports(self, size: int) -> bool:
+        return self.max_size is None or size <= self.max_size
+
+
+REGISTRY: Dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str,
+    group: str,
+    setup: Callable[[int], Any] = make_candles,
+    max_size: Optional[int] = None,
+    tracked: bool = True
+):
+    """
+    Register a benchmark
+
+    The decorated function receives setup(size); setup is not timed.
+
+    Example:
+        @benchmark("indicators.trend.calculate_all", group="indicators")
+        def trend(candles):
+            TrendIndicators.calculate_all(candles)
+    """
+    def decorator(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        REGISTRY[name] = Benchmark(name, group, func, setup, max_size, tracked)
+        return func
+    return decorator
+
+
+def select(patterns: Optional[Sequence[str]] = None) -> List[Benchmark]:
+    """Registered benchmarks whose name matches any glob pattern"""
+    if not patterns:
+        return list(REGISTRY.values())
+    return [
+        bench for name, bench in REGISTRY.items()
+        if any(fnmatchcase(name, pattern) for pattern in patterns)
+    ]
+
+
+# ═══════════════════════════════════════════════════════════════
+# Timing
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass
+class BenchmarkResult:
+    """Timing of one benchmark at one size"""
+    name: str
+    group: str
+    size: int
+    status: str  # ok, error, skipped
+    tracked: bool = True
+    median_s: Optional[float] = None
+    min_s: Optional[float] = None
+    mean_s: Optional[float] = None
+    stdev_s: Optional[float] = None
+    repeats: int = 0
+    error: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}@{self.size}"
+
+
+def measure(
+    func: Callable[[Any], Any],
+    arg: Any,
+    min_time: float = 0.2,
+    max_repeats: int = 20
+) -> List[float]:
+    """Call func(arg) until min_time has elapsed or max_repeats is reached"""
+    times: List[float] = []
+    gc.collect()
+    while True:
+        started = time.perf_counter()
+        func(arg)
+        times.append(time.perf_counter() - started)
+        if sum(times) >= min_time or len(times) >= max_repeats:
+            return times
+
+
+def run_benchmark(
+    bench: Benchmark,
+    sizes: Iterable[int],
+    min_time: float = 0.2,
+    max_repeats: int = 20,
+    quiet: bool = True
+) -> List[BenchmarkResult]:
+    """
+    Time one benchmark at every size
+
+    The benchmark is called once untimed at the smallest size first, so
+    JIT compilation and lazy imports are not charged to the first size.
+    """
+    sizes = sorted(sizes)
+    results = []
+    output = io.StringIO() if quiet else None
+    with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+        try:
+            bench.func(bench.setup(sizes[0]))
+        except Exception:
+            pass
+
+        for size in sizes:
+            result = BenchmarkResult(bench.name, bench.group, size, "skipped", bench.tracked)
+            if bench.supports(size):
+                try:
+                    times = measure(bench.func, bench.setup(size), min_time, max_repeats)
+                    result.status = "ok"
+                    result.median_s = statistics.median(times)
+                    result.min_s = min(times)
+                    result.mean_s = statistics.fmean(times)
+                    result.stdev_s = statistics.stdev(times) if len(times) > 1 else 0.0
+                    result.repeats = len(times)
+                except Exception as e:
+                    result.status = "error"
+                    result.error = f"{type(e).__name__}: {e}"
+            results.append(result)
+    return results
+
+
+def run_suite(
+    benchmarks: Sequence[Benchmark],
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    min_time: float = 0.2,
+    max_repeats: int = 20,
+    progress: Optional[Callable[[BenchmarkResult], None]] = None
+) -> Dict[str, Any]:
+    """Run benchmarks and return the JSON-ready result document"""
+    results = []
+    for bench in benchmarks:
+        for result in run_benchmark(bench, sizes, min_time, max_repeats):
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": environment(),
+        "sizes": list(sizes),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def environment() -> Dict[str, Any]:
+    """Machine and code version a run was recorded on"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except Exception:
+        commit = None
+    return {
+        "created": datetime.utcnow().isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save_results(document: Dict[str, Any], path: str) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+    return path
+
+
+def load_results(path: str) -> Dict[str, BenchmarkResult]:
+    """Results of a run file keyed by 'name@size'"""
+    with open(path) as f:
+        document = json.load(f)
+    if document.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"{path}: unsupported benchmark schema {document.get('schema')}")
+    results = [BenchmarkResult(**entry) for entry in document["results"]]
+    return {result.key: result for result in results}
+
+
+# ═══════════════════════════════════════════════════════════════
+# Regression gate
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass
+class Comparison:
+    """One benchmark/size compared against the baseline"""
+    key: str
+    status: str  # ok, improved, regressed, missing, new
+    baseline_s: Optional[float] = None
+    current_s: Optional[float] = None
+    ratio: Optional[float] = None
+    note: str = ""
+
+    @property
+    def failed(self) -> bool:
+        return self.status in ("regressed", "missing")
+
+
+def compare(
+    baseline: Dict[str, BenchmarkResult],
+    current: Dict[str, BenchmarkResult],
+    threshold: float = 0.25,
+    metric: str = "median_s",
+    min_delta_s: float = 1e-4,
+    only_tracked: bool = True
+) -> List[Comparison]:
+    """
+    Compare a run with a baseline run
+
+    A benchmark regresses when current / baseline > 1 + threshold and the
+    absolute slowdown is above min_delta_s (sub-100µs timings are noise).
+    A benchmark measured in the baseline that no longer runs is reported
+    as missing, which also fails the gate.
+    """
+    comparisons = []
+    for key, base in baseline.items():
+        if base.status != "ok" or (only_tracked and not base.tracked):
+            continue
+        result = current.get(key)
+        if result is None or result.status != "ok":
+            note = result.error or result.status if result is not None else "not run"
+            comparisons.append(Comparison(key, "missing", getattr(base, metric), note=note or ""))
+            continue
+
+        before, after = getattr(base, metric), getattr(result, metric)
+        ratio = after / before if before > 0 else float("inf")
+        if ratio > 1 + threshold and after - before > min_delta_s:
+            status = "regressed"
+        elif ratio < 1 / (1 + threshold) and before - after > min_delta_s:
+            status = "improved"
+        else:
+            status = "ok"
+        comparisons.append(Comparison(key, status, before, after, ratio))
+
+    for key, result in current.items():
+        if key not in baseline and result.status == "ok":
+            comparisons.append(Comparison(key, "new", current_s=getattr(result, metric)))
+    return comparisons
+
+
+def format_seconds(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if value < 1e-3:
+        return f"{value * 1e6:.1f}µs"
+    if value < 1:
+        return f"{value * 1e3:.2f}ms"
+    return f"{value:.2f}s"
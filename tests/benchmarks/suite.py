@@ -0,0 +1,226 @@
+"""
+Benchmark Suite
+
+Indicator calculate_all per category, the analysis service, the pattern
+detectors, feature extraction and the complete /analyze request path.
+
+Modules are imported inside the benchmarks, so one broken import is
+recorded as an error for that benchmark instead of stopping the run.
+max_size caps benchmarks whose cost grows too fast for 100k candles.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import asyncio
+
+from tests.benchmarks.harness import benchmark, candle_arrays, make_candles
+
+
+# ═══════════════════════════════════════════════════════════════
+# Indicators
+# ═══════════════════════════════════════════════════════════════
+
+@benchmark("indicators.trend.calculate_all", group="indicators")
+def trend_calculate_all(candles):
+    from gravity_tech.indicators.trend import TrendIndicators
+    TrendIndicators.calculate_all(candles)
+
+
+@benchmark("indicators.momentum.calculate_all", group="indicators")
+def momentum_calculate_all(candles):
+    from gravity_tech.indicators.momentum import MomentumIndicators
+    MomentumIndicators.calculate_all(candles)
+
+
+@benchmark("indicators.volatility.calculate_all", group="indicators")
+def volatility_calculate_all(candles):
+    from gravity_tech.indicators.volatility import VolatilityIndicators
+    VolatilityIndicators.calculate_all(candles)
+
+
+@benchmark("indicators.volume.calculate_all", group="indicators")
+def volume_calculate_all(candles):
+    from gravity_tech.indicators.volume import VolumeIndicators
+    VolumeIndicators.calculate_all(candles)
+
+
+@benchmark("indicators.cycle.calculate_all", group="indicators")
+def cycle_calculate_all(candles):
+    from gravity_tech.indicators.cycle import CycleIndicators
+    CycleIndicators.calculate_all(candles)
+
+
+@benchmark("indicators.support_resistance.calculate_all", group="indicators")
+def support_resistance_calculate_all(candles):
+    from gravity_tech.indicators.support_resistance import SupportResistanceIndicators
+    SupportResistanceIndicators.calculate_all(candles)
+
+
+# ═══════════════════════════════════════════════════════════════
+# Analysis service
+# ═══════════════════════════════════════════════════════════════
+
+def _analysis_request(n: int):
+    from gravity_tech.models.schemas import AnalysisRequest
+    return AnalysisRequest(symbol="BENCH", timeframe="1h", candles=make_candles(n))
+
+
+@benchmark("service.analyze", group="service", setup=_analysis_request, max_size=10_000)
+def service_analyze(request):
+    from gravity_tech.services.analysis_service import TechnicalAnalysisService
+    asyncio.run(TechnicalAnalysisService.analyze(request))
+
+
+# ═══════════════════════════════════════════════════════════════
+# Patterns
+# ═══════════════════════════════════════════════════════════════
+
+@benchmark("patterns.candlestick.scan", group="patterns")
+def candlestick_scan(candles):
+    from gravity_tech.patterns.candlestick import CandlestickPatterns
+    CandlestickPatterns.scan(candles)
+
+
+@benchmark("patterns.classical.detect_all", group="patterns")
+def classical_detect_all(candles):
+    from gravity_tech.patterns.classical import ClassicalPatterns
+    ClassicalPatterns.detect_all(candles)
+
+
+@benchmark("patterns.classical.scan_history", group="patterns", max_size=10_000)
+def classical_scan_history(candles):
+    from gravity_tech.patterns.classical import ClassicalPatterns
+    ClassicalPatterns.scan_history(candles)
+
+
+# Candidate search is quadratic in the swing count (~1 min at 10k)
+@benchmark("patterns.harmonic.detect_patterns", group="patterns",
+           setup=candle_arrays, max_size=1_000)
+def harmonic_detect_patterns(arrays):
+    from gravity_tech.patterns.harmonic import HarmonicPatternDetector
+    HarmonicPatternDetector().detect_patterns(arrays["high"], arrays["low"], arrays["close"])
+
+
+@benchmark("patterns.elliott.analyze", group="patterns")
+def elliott_analyze(candles):
+    from gravity_tech.patterns.elliott_wave import analyze_elliott_waves
+    analyze_elliott_waves(candles)
+
+
+# ═══════════════════════════════════════════════════════════════
+# Market phase
+# ═══════════════════════════════════════════════════════════════
+
+@benchmark("analysis.market_phase.series", group="analysis")
+def market_phase_series(candles):
+    from gravity_tech.analysis.market_phase import analyze_market_phase_series
+    analyze_market_phase_series(candles)
+
+
+def _close_list(n: int):
+    return [c.close for c in make_candles(n)]
+
+
+# 10k paths x 30 steps from the history (target: < 50 ms)
+@benchmark("analysis.scenario.monte_carlo", group="analysis", setup=_close_list)
+def scenario_monte_carlo(closes):
+    from gravity_tech.analysis.scenario_simulation import MonteCarloSimulator, SimulationConfig
+    MonteCarloSimulator(SimulationConfig(seed=0)).scenarios(closes, closes[-1], 2.0)
+
+
+# ═══════════════════════════════════════════════════════════════
+# Swing / pivot detection (full series, so the cost scales with N)
+# ═══════════════════════════════════════════════════════════════
+
+@benchmark("pivots.market_phase.trend_structure", group="pivots")
+def market_phase_trend_structure(candles):
+    from gravity_tech.analysis.market_phase import MarketPhaseAnalysis
+    MarketPhaseAnalysis.identify_trend_structure(candles)
+
+
+@benchmark("pivots.support_resistance.levels", group="pivots")
+def support_resistance_levels(candles):
+    from gravity_tech.indicators.support_resistance import SupportResistanceIndicators
+    SupportResistanceIndicators.support_resistance_levels(candles, lookback=len(candles))
+
+
+@benchmark("pivots.elliott.find_pivot_points", group="pivots")
+def elliott_pivot_points(candles):
+    from gravity_tech.patterns.elliott_wave import ElliottWaveAnalyzer
+    ElliottWaveAnalyzer.find_pivot_points(candles)
+
+
+@benchmark("pivots.harmonic.pivot_highs_lows", group="pivots", setup=candle_arrays)
+def harmonic_pivot_highs_lows(arrays):
+    from gravity_tech.patterns.harmonic import HarmonicPatternDetector
+    detector = HarmonicPatternDetector()
+    detector._find_pivot_highs(arrays["high"])
+    detector._find_pivot_lows(arrays["low"])
+
+
+@benchmark("pivots.volume_profile.rebuild", group="pivots")
+def volume_profile_rebuild(candles):
+    from gravity_tech.indicators.volume_profile import VolumeProfile
+    profile = VolumeProfile()
+    profile.rebuild(candles)
+    profile.levels()
+
+
+@benchmark("pivots.volume_profile.update", group="pivots")
+def volume_profile_update(candles):
+    from gravity_tech.indicators.volume_profile import VolumeProfile
+    profile = VolumeProfile(window=720)
+    for candle in candles:
+        profile.update(candle)
+    profile.levels()
+
+
+@benchmark("pivots.divergence.swing_points", group="pivots", setup=_close_list)
+def divergence_swing_points(closes):
+    from gravity_tech.patterns.divergence import DivergenceDetector
+    detector = DivergenceDetector()
+    detector._find_swing_points(closes, is_high=True)
+    detector._find_swing_points(closes, is_high=False)
+
+
+# ═══════════════════════════════════════════════════════════════
+# Feature extraction
+# ═══════════════════════════════════════════════════════════════
+
+@benchmark("features.indicator_features", group="features")
+def indicator_features(candles):
+    from gravity_tech.ml.feature_extraction import FeatureExtractor
+    FeatureExtractor(lookback_period=100).extract_10_indicator_features(candles)
+
+
+# One feature row per window: linear in the series length with a large constant
+@benchmark("features.training_dataset", group="features", max_size=1_000)
+def training_dataset(candles):
+    from gravity_tech.ml.feature_extraction import FeatureExtractor
+    FeatureExtractor(lookback_period=50, forward_days=5).extract_training_dataset(candles)
+
+
+# ═══════════════════════════════════════════════════════════════
+# Complete pipeline
+# ═══════════════════════════════════════════════════════════════
+
+# The /analyze request path: analysis with a stage timer plus the JSON
+# serialization the endpoint performs. ml.complete_analysis_pipeline is
+# not used because it targets analyzer APIs that no longer exist.
+@benchmark("pipeline.complete_analysis", group="pipeline",
+           setup=_analysis_request, max_size=10_000)
+def complete_analysis(request):
+    from gravity_tech.services.analysis_service import TechnicalAnalysisService
+    from gravity_tech.services.stage_metrics import StageTimer
+
+    async def run():
+        timer = StageTimer("technical_analysis", len(request.candles), collect=True)
+        result = await TechnicalAnalysisService.analyze(request, timer=timer)
+        with timer.stage("serialization"):
+            result.model_dump(mode="json")
+        return timer.breakdown()
+
+    asyncio.run(run())
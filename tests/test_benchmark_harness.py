@@ -0,0 +1,106 @@
+"""
+Tests for Benchmark Harness
+
+Tests timing, JSON round trips and the regression gate of the
+benchmark suite (tests/benchmarks).
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import json
+
+import pytest
+
+from tests.benchmarks import suite  # noqa: F401
+from tests.benchmarks.__main__ import main
+from tests.benchmarks.harness import (
+    REGISTRY,
+    Benchmark,
+    BenchmarkResult,
+    compare,
+    load_results,
+    run_benchmark,
+    run_suite,
+    save_results,
+)
+
+
+def _result(name, size, median, status="ok", tracked=True):
+    return BenchmarkResult(name, "g", size, status, tracked, median_s=median, min_s=median)
+
+
+def _results(*results):
+    return {result.key: result for result in results}
+
+
+def test_suite_covers_requested_engines():
+    names = set(REGISTRY)
+    for category in ["trend", "momentum", "volatility", "volume", "cycle", "support_resistance"]:
+        assert f"indicators.{category}.calculate_all" in names
+    assert {"service.analyze", "patterns.harmonic.detect_patterns",
+            "patterns.classical.detect_all", "patterns.elliott.analyze",
+            "pipeline.complete_analysis"} <= names
+
+
+def test_run_records_sizes_and_errors(tmp_path):
+    def fail(candles):
+        raise RuntimeError("boom")
+
+    ok = Benchmark("bench.ok", "g", lambda candles: len(candles), max_size=100)
+    broken = Benchmark("bench.broken", "g", fail)
+    document = run_suite([ok, broken], sizes=[50, 200], min_time=0.0, max_repeats=2)
+    path = save_results(document, tmp_path / "run.json")
+
+    loaded = load_results(path)
+    assert loaded["bench.ok@50"].status == "ok"
+    assert loaded["bench.ok@50"].median_s >= 0
+    assert loaded["bench.ok@200"].status == "skipped"
+    assert loaded["bench.broken@50"].error == "RuntimeError: boom"
+
+
+@pytest.mark.parametrize("name", sorted(REGISTRY))
+def test_every_benchmark_runs_at_small_size(name):
+    results = run_benchmark(REGISTRY[name], [300], 0.0, 1)
+    assert results[0].status == "ok", results[0].error
+
+
+def test_compare_flags_regressions_only_beyond_threshold():
+    baseline = _results(
+        _result("a", 100, 0.010), _result("b", 100, 0.010),
+        _result("c", 100, 0.010), _result("d", 100, 0.00001),
+        _result("e", 100, 0.010, tracked=False),
+    )
+    current = _results(
+        _result("a", 100, 0.012), _result("b", 100, 0.020),
+        _result("c", 100, 0.004), _result("d", 100, 0.00005),
+        _result("e", 100, 0.050, tracked=False), _result("f", 100, 0.001),
+    )
+
+    statuses = {c.key: c.status for c in compare(baseline, current, threshold=0.25)}
+    assert statuses == {
+        "a@100": "ok", "b@100": "regressed", "c@100": "improved",
+        "d@100": "ok",  # below the noise floor
+        "f@100": "new",
+    }
+    untracked = {c.key: c.status for c in compare(baseline, current, only_tracked=False)}
+    assert untracked["e@100"] == "regressed"
+
+
+def test_compare_command_exit_status(tmp_path):
+    def write(name, results):
+        path = tmp_path / name
+        document = {"schema": 1, "meta": {}, "sizes": [100],
+                    "results": [result.__dict__ for result in results]}
+        path.write_text(json.dumps(document))
+        return str(path)
+
+    baseline = write("base.json", [_result("a", 100, 0.010), _result("b", 100, 0.010)])
+    faster = write("fast.json", [_result("a", 100, 0.009), _result("b", 100, 0.011)])
+    broken = write("broken.json", [_result("a", 100, 0.009),
+                                   _result("b", 100, None, status="error")])
+
+    assert main(["compare", baseline, faster]) == 0
+    assert main(["compare", baseline, broken]) == 1
@@ -11,8 +11,19 @@ License: MIT
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch
-from gravity_tech.services.cache_service import CacheManager, cached
+import numpy as np
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
+import json
+import time
+from gravity_tech.services.cache_service import (
+    CacheCodec,
+    CacheManager,
+    NearCache,
+    cached,
+    pack_ndarray,
+    unpack_ndarray,
+    MSGPACK_AVAILABLE,
+)
 
 
 @pytest.fixture
@@ -305,5 +316,327 @@ class TestCacheErrorHandling:
         assert result is False  # Set should fail gracefully
 
 
+
+def _mock_pipeline(manager, results):
+    """Attach a pipeline mock usable as ``async with redis.pipeline() as pipe``."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=results)
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=pipe)
+    context.__aexit__ = AsyncMock(return_value=False)
+    manager.redis.pipeline = Mock(return_value=context)
+    return pipe
+
+
+class TestBatchOperations:
+    """Tests for pipelined get_many/set_many."""
+    
+    @pytest.mark.asyncio
+    async def test_get_many_single_round_trip(self, cache_manager):
+        """get_many issues one MGET for all keys and skips misses."""
+        keys = [f"analysis:SYM{i}" for i in range(200)]
+        cache_manager.redis.mget.return_value = [
+            b'{"i": %d}' % i if i % 2 == 0 else None for i in range(200)
+        ]
+        
+        results = await cache_manager.get_many(keys)
+        
+        cache_manager.redis.mget.assert_called_once_with(keys)
+        assert len(results) == 100
+        assert results["analysis:SYM4"] == {"i": 4}
+        assert "analysis:SYM5" not in results
+    
+    @pytest.mark.asyncio
+    async def test_set_many_uses_pipeline(self, cache_manager):
+        """set_many buffers SETEX commands and executes once."""
+        pipe = _mock_pipeline(cache_manager, [True, True])
+        
+        written = await cache_manager.set_many({"a:1": {"x": 1}, "a:2": [1, 2]}, ttl=60)
+        
+        assert written == 2
+        assert pipe.setex.call_count == 2
+        pipe.execute.assert_awaited_once()
+        assert pipe.setex.call_args_list[0][0][:2] == ("a:1", 60)
+    
+    @pytest.mark.asyncio
+    async def test_set_many_skips_unserializable(self, cache_manager):
+        """Values that fail to encode are skipped, the rest are written."""
+        pipe = _mock_pipeline(cache_manager, [True])
+        
+        written = await cache_manager.set_many({"a:1": object(), "a:2": 1})
+        
+        assert written == 1
+        assert pipe.setex.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_batch_when_unavailable(self):
+        """Batch operations degrade gracefully without Redis."""
+        manager = CacheManager()
+        assert await manager.get_many(["a", "b"]) == {}
+        assert await manager.set_many({"a": 1}) == 0
+
+
+class TestCodecsAndCompression:
+    """Tests for codecs, framing and compression."""
+    
+    def test_json_legacy_format_unchanged(self):
+        """Small JSON values are stored bare so older readers still work."""
+        manager = CacheManager(codec="json", compression_threshold=1024)
+        assert manager.encode({"a": 1}) == b'{"a": 1}'
+    
+    def test_json_handles_numpy(self):
+        """JSON codec converts NumPy arrays and scalars."""
+        manager = CacheManager(codec="json")
+        payload = manager.encode({"arr": np.arange(3), "x": np.float64(1.5)})
+        assert manager.decode(payload) == {"arr": [0, 1, 2], "x": 1.5}
+    
+    def test_compression_above_threshold(self):
+        """Payloads above threshold are compressed and round-trip."""
+        manager = CacheManager(codec="json", compression_threshold=64)
+        value = {"values": list(range(1000))}
+        payload = manager.encode(value)
+        
+        assert payload.startswith(b"\x00")
+        assert len(payload) < len(str(value))
+        assert manager.decode(payload) == value
+    
+    def test_ndarray_framing_round_trip(self):
+        """Raw buffer framing preserves dtype and shape."""
+        array = np.arange(12, dtype=np.float32).reshape(3, 4)[:, ::2]
+        restored = unpack_ndarray(pack_ndarray(array))
+        
+        assert restored.dtype == np.float32
+        assert restored.shape == (3, 2)
+        np.testing.assert_array_equal(restored, array)
+    
+    def test_numpy_codec(self):
+        """numpy codec stores bare arrays."""
+        manager = CacheManager(codec="numpy")
+        array = np.linspace(0, 1, 50)
+        np.testing.assert_array_equal(manager.decode(manager.encode(array)), array)
+    
+    @pytest.mark.skipif(not MSGPACK_AVAILABLE, reason="msgpack not installed")
+    def test_msgpack_codec_with_arrays(self):
+        """msgpack codec round-trips nested NumPy arrays."""
+        manager = CacheManager(codec="msgpack")
+        value = {"close": np.array([1.0, 2.0, 3.0]), "signal": "BUY", "score": 0.7}
+        restored = manager.decode(manager.encode(value))
+        
+        np.testing.assert_array_equal(restored["close"], value["close"])
+        assert restored["signal"] == "BUY"
+    
+    def test_reader_decodes_other_codec(self):
+        """A JSON manager can read frames written with another codec."""
+        writer = CacheManager(codec="numpy")
+        reader = CacheManager(codec="json")
+        array = np.ones(4)
+        np.testing.assert_array_equal(reader.decode(writer.encode(array)), array)
+    
+    def test_unknown_codec_rejected(self):
+        """Unknown codec names raise ValueError."""
+        with pytest.raises(ValueError):
+            CacheManager(codec="pickle")
+    
+    def test_incomplete_codec_fails_at_instantiation(self):
+        """A codec missing decode cannot be created."""
+        class EncodeOnly(CacheCodec):
+            codec_id = 99
+            name = "encode_only"
+            
+            def encode(self, value):
+                return b""
+        
+        with pytest.raises(TypeError):
+            EncodeOnly()
+
+
+class TestNamespaceTTL:
+    """Tests for per-namespace TTL resolution."""
+    
+    def test_resolve_ttl_priority(self):
+        """Explicit TTL wins over namespace TTL, which wins over the default."""
+        manager = CacheManager(namespace_ttls={"ml": 3600})
+        
+        assert manager.resolve_ttl("ml:model", 10) == 10
+        assert manager.resolve_ttl("ml:model") == 3600
+        assert manager.resolve_ttl("analysis:BTCUSDT") == 300
+    
+    @pytest.mark.asyncio
+    async def test_set_uses_namespace_ttl(self, cache_manager):
+        """set() applies the namespace TTL when ttl is omitted."""
+        cache_manager.namespace_ttls = {"tools": 900}
+        await cache_manager.set("tools:categories", ["trend"])
+        
+        assert cache_manager.redis.setex.call_args[0][1] == 900
+
+
+
+@pytest.fixture
+def near_manager():
+    """Cache manager with a near-cache in front of mocked Redis."""
+    manager = CacheManager(near_cache=NearCache(max_size=3, ttl=60))
+    manager.redis = AsyncMock()
+    manager._is_available = True
+    return manager
+
+
+class TestNearCache:
+    """Tests for the local near-cache."""
+    
+    def test_lru_eviction_and_stats(self):
+        """Least recently used entries are evicted beyond max_size."""
+        near = NearCache(max_size=2, ttl=60)
+        near.set("a", b"1")
+        near.set("b", b"2")
+        near.get("a")
+        near.set("c", b"3")
+        
+        assert near.get("b") == (False, None)
+        assert near.get("a") == (True, b"1")
+        stats = near.stats()
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 2 and stats["misses"] == 1
+        assert stats["hit_ratio"] == pytest.approx(2 / 3)
+    
+    def test_ttl_expiry(self):
+        """Entries expire after the local TTL."""
+        near = NearCache(ttl=0.01)
+        near.set("a", b"1")
+        time.sleep(0.02)
+        assert near.get("a") == (False, None)
+    
+    def test_namespace_filter(self):
+        """Only configured namespaces are near-cached."""
+        near = NearCache(namespaces=["ml", "tools"])
+        assert near.accepts("ml:model_info")
+        assert not near.accepts("analysis:BTCUSDT")
+    
+    def test_metrics_labelled_by_cache_name(self):
+        """Each near-cache reports under its own cache label."""
+        from gravity_tech.services import cache_service
+        if not cache_service.PROMETHEUS_AVAILABLE:
+            pytest.skip("prometheus_client not installed")
+        from prometheus_client import REGISTRY
+        
+        def lookups(name, result):
+            return REGISTRY.get_sample_value(
+                "near_cache_requests_total", {"cache": name, "result": result}
+            ) or 0.0
+        
+        before = lookups("redis", "miss"), lookups("tests", "miss")
+        NearCache(name="tests").get("a")
+        
+        assert lookups("tests", "miss") == before[1] + 1
+        assert lookups("redis", "miss") == before[0]
+    
+    def test_invalidate_pattern(self):
+        """Redis glob patterns evict matching keys."""
+        near = NearCache()
+        near.set("analysis:BTCUSDT:1h", b"1")
+        near.set("analysis:ETHUSDT:1h", b"2")
+        
+        assert near.invalidate_pattern("analysis:BTC*") == 1
+        assert len(near) == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_served_locally(self, near_manager):
+        """Second get is served from the near-cache without Redis."""
+        pipe = _mock_pipeline(near_manager, [b'{"tools": 5}', -1])
+        
+        assert await near_manager.get("tools:categories") == {"tools": 5}
+        assert await near_manager.get("tools:categories") == {"tools": 5}
+        pipe.execute.assert_called_once()
+        pipe.get.assert_called_once_with("tools:categories")
+        pipe.pttl.assert_called_once_with("tools:categories")
+    
+    @pytest.mark.asyncio
+    async def test_get_bounded_by_redis_ttl(self, near_manager):
+        """A key expiring in Redis before the local TTL expires locally too."""
+        _mock_pipeline(near_manager, [b'1', 5_000])
+        
+        await near_manager.get("ml:a")
+        
+        expires_at, _ = near_manager.near_cache._entries["ml:a"]
+        assert expires_at - time.monotonic() <= 5.0
+    
+    @pytest.mark.asyncio
+    async def test_get_skips_near_cache_for_expired_key(self, near_manager):
+        """A key that expired between GET and PTTL is not cached locally."""
+        _mock_pipeline(near_manager, [b'1', -2])
+        
+        assert await near_manager.get("ml:a") == 1
+        assert len(near_manager.near_cache) == 0
+    
+    @pytest.mark.asyncio
+    async def test_get_many_only_fetches_remote_misses(self, near_manager):
+        """get_many only sends near-cache misses to Redis."""
+        near_manager.near_cache.set("ml:a", b"1")
+        pipe = _mock_pipeline(near_manager, [[b"2"], 5_000])
+        
+        results = await near_manager.get_many(["ml:a", "ml:b"])
+        
+        pipe.mget.assert_called_once_with(["ml:b"])
+        pipe.pttl.assert_called_once_with("ml:b")
+        pipe.execute.assert_called_once()
+        assert results == {"ml:a": 1, "ml:b": 2}
+        expires_at, _ = near_manager.near_cache._entries["ml:b"]
+        assert expires_at - time.monotonic() <= 5.0
+    
+    @pytest.mark.asyncio
+    async def test_delete_publishes_invalidation(self, near_manager):
+        """delete evicts locally and broadcasts to other processes."""
+        near_manager.near_cache.set("ml:a", b"1")
+        
+        await near_manager.delete("ml:a")
+        
+        assert len(near_manager.near_cache) == 0
+        channel, data = near_manager.redis.publish.call_args[0]
+        assert channel == near_manager.invalidation_channel
+        assert json.loads(data)["keys"] == ["ml:a"]
+    
+    @pytest.mark.asyncio
+    async def test_delete_pattern_publishes_pattern(self, near_manager):
+        """delete_pattern broadcasts the pattern."""
+        near_manager.redis.scan.return_value = (0, [b"ml:a"])
+        near_manager.near_cache.set("ml:a", b"1")
+        
+        await near_manager.delete_pattern("ml:*")
+        
+        assert len(near_manager.near_cache) == 0
+        assert json.loads(near_manager.redis.publish.call_args[0][1])["pattern"] == "ml:*"
+    
+    def test_remote_invalidation_across_pods(self, near_manager):
+        """Messages from another instance evict entries and record lag."""
+        other = CacheManager(near_cache=NearCache())
+        near_manager.near_cache.set("ml:a", b"1")
+        near_manager.near_cache.set("ml:b", b"2")
+        
+        removed = near_manager.handle_invalidation(other._invalidation_message(keys=["ml:a"]))
+        
+        assert removed == 1
+        assert near_manager.near_cache.get("ml:b")[0]
+        assert near_manager.near_cache.stats()["last_invalidation_lag"] is not None
+    
+    def test_own_invalidation_ignored(self, near_manager):
+        """Messages published by this instance are not re-applied."""
+        near_manager.near_cache.set("ml:a", b"1")
+        message = near_manager._invalidation_message(keys=["ml:a"])
+        
+        assert near_manager.handle_invalidation(message) == 0
+        assert len(near_manager.near_cache) == 1
+    
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, cache_manager):
+        """Without a near-cache every get goes to Redis and nothing is published."""
+        cache_manager.redis.get.return_value = b'1'
+        await cache_manager.get("ml:a")
+        await cache_manager.get("ml:a")
+        await cache_manager.delete("ml:a")
+        
+        assert cache_manager.redis.get.call_count == 2
+        cache_manager.redis.publish.assert_not_called()
+        assert cache_manager.stats()["near_cache"] is None
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,195 @@
+"""
+Tests for concurrent, paginated bulk ingestion in DataConnector
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta
+
+import httpx
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from gravity_tech.ml.data_connector import (
+    DataConnector,
+    load_ingested,
+    page_covered_through,
+    page_path,
+    page_ranges,
+)
+
+START = datetime(2020, 1, 1)
+END = datetime(2021, 12, 31)
+
+
+class FakeCandleService:
+    """Daily candles for every symbol, honoring start/end/limit"""
+
+    def __init__(self, failures_per_request: int = 0, missing=()):
+        self.failures_per_request = failures_per_request
+        self.missing = set(missing)
+        self.calls = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        symbol = params["symbol"]
+        key = (symbol, params["start_date"])
+        self.calls[key] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if symbol in self.missing:
+                return httpx.Response(404, json={"detail": "unknown symbol"})
+            if self.calls[key] <= self.failures_per_request:
+                return httpx.Response(503)
+            start = datetime.fromisoformat(params["start_date"])
+            end = datetime.fromisoformat(params["end_date"])
+            days = min((end - start).days + 1, int(params["limit"]))
+            candles = [
+                {
+                    "timestamp": (start + timedelta(days=i)).isoformat() + "Z",
+                    "open": 100.0 + i, "high": 101.0 + i, "low": 99.0 + i,
+                    "close": 100.5 + i, "volume": 1_000.0,
+                }
+                for i in range(days)
+            ]
+            return httpx.Response(200, json={"candles": candles})
+        finally:
+            self.in_flight -= 1
+
+
+def ingest(service, root, symbols, end=END, **kwargs):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(service)) as client:
+            return await DataConnector("http://data").ingest_symbols(
+                symbols, root, START, end, client=client, initial_delay=0.001, **kwargs
+            )
+    return asyncio.run(run())
+
+
+class TestPageRanges:
+    """Date range split into page files"""
+
+    def test_pages_cover_range_without_overlap(self):
+        pages = page_ranges(START, END, 100)
+
+        assert pages[0][0] == START
+        assert pages[-2][1] < END <= pages[-1][1]
+        for (_, end), (start, _) in zip(pages, pages[1:]):
+            assert start == end + timedelta(days=1)
+        assert all((end - start).days + 1 == 100 for start, end in pages)
+
+    def test_grid_does_not_depend_on_end_date(self):
+        pages = page_ranges(START, END, 100)
+
+        assert page_ranges(START, END + timedelta(days=3), 100) == pages
+        assert page_ranges(START, END - timedelta(days=3), 100) == pages
+
+    def test_invalid_page_size(self):
+        with pytest.raises(ValueError):
+            page_ranges(START, END, 0)
+
+
+class TestIngestSymbols:
+    """Concurrent ingestion into per-symbol parquet pages"""
+
+    def test_pages_paginate_and_load_back(self, tmp_path):
+        service = FakeCandleService()
+
+        results = ingest(service, tmp_path, ["btcusdt", "ETHUSDT"], limit=100, page_days=365)
+
+        days = (END - START).days + 1
+        for symbol in ("BTCUSDT", "ETHUSDT"):
+            assert results[symbol].error is None
+            assert results[symbol].pages_written == len(page_ranges(START, END, 365))
+            assert results[symbol].rows == days
+            frame = load_ingested(tmp_path, symbol)
+            assert len(frame) == days
+            assert frame["timestamp"].iloc[0] == pd.Timestamp(START)
+            assert frame["timestamp"].is_monotonic_increasing
+            assert list(frame.columns) == ["timestamp", "open", "high", "low", "close", "volume"]
+        # 365-day pages with 100-candle responses need several requests each
+        assert sum(service.calls.values()) > 2 * len(page_ranges(START, END, 365))
+
+    def test_concurrency_is_bounded(self, tmp_path):
+        service = FakeCandleService()
+
+        ingest(service, tmp_path, [f"S{i}" for i in range(20)], limit=200, max_concurrency=4)
+
+        assert 1 < service.max_in_flight <= 4
+
+    def test_retries_server_errors(self, tmp_path):
+        service = FakeCandleService(failures_per_request=2)
+
+        results = ingest(service, tmp_path, ["BTCUSDT"], limit=365, max_retries=3)
+
+        assert results["BTCUSDT"].error is None
+        assert set(service.calls.values()) == {3}
+
+    def test_client_errors_fail_symbol_without_retry(self, tmp_path):
+        service = FakeCandleService(missing={"NOPE"})
+
+        results = ingest(service, tmp_path, ["NOPE", "BTCUSDT"], limit=365)
+
+        assert "404" in results["NOPE"].error
+        assert results["NOPE"].pages_written == 0
+        assert results["BTCUSDT"].error is None
+        assert all(count == 1 for (symbol, _), count in service.calls.items() if symbol == "NOPE")
+
+    def test_resume_skips_written_pages(self, tmp_path):
+        ingest(FakeCandleService(), tmp_path, ["BTCUSDT"], limit=100)
+        pages = page_ranges(START, END, 100)
+        page_path(tmp_path, "BTCUSDT", *pages[3]).unlink()
+        service = FakeCandleService()
+
+        results = ingest(service, tmp_path, ["BTCUSDT"], limit=100)
+
+        assert results["BTCUSDT"].pages_skipped == len(pages) - 1
+        assert results["BTCUSDT"].pages_written == 1
+        assert sum(service.calls.values()) == 1
+        assert len(load_ingested(tmp_path, "BTCUSDT")) == (END - START).days + 1
+
+    def test_later_run_refetches_only_partial_last_page(self, tmp_path):
+        first_end = END - timedelta(days=10)
+        ingest(FakeCandleService(), tmp_path, ["BTCUSDT"], end=first_end, limit=100)
+        pages = page_ranges(START, END, 100)
+        last = page_path(tmp_path, "BTCUSDT", *pages[-1])
+        assert page_covered_through(last) == first_end
+        service = FakeCandleService()
+
+        results = ingest(service, tmp_path, ["BTCUSDT"], limit=100)
+
+        assert results["BTCUSDT"].pages_skipped == len(pages) - 1
+        assert results["BTCUSDT"].pages_written == 1
+        assert list(service.calls) == [("BTCUSDT", pages[-1][0].isoformat())]
+        assert page_covered_through(last) == END
+        assert len(list(last.parent.glob("*.parquet"))) == len(pages)
+        frame = load_ingested(tmp_path, "BTCUSDT")
+        assert len(frame) == (END - START).days + 1
+        assert frame["timestamp"].iloc[-1] == pd.Timestamp(END)
+
+    def test_legacy_page_covered_through_its_name(self, tmp_path):
+        ingest(FakeCandleService(), tmp_path, ["BTCUSDT"], limit=100)
+        pages = page_ranges(START, END, 100)
+        path = page_path(tmp_path, "BTCUSDT", *pages[0])
+        pq.write_table(pq.read_table(path).replace_schema_metadata(None), path)
+
+        assert page_covered_through(path) == pages[0][1]
+        assert page_covered_through(tmp_path / "missing.parquet") is None
+
+    def test_load_filters_range(self, tmp_path):
+        ingest(FakeCandleService(), tmp_path, ["BTCUSDT"], limit=400)
+
+        frame = load_ingested(tmp_path, "BTCUSDT", datetime(2021, 1, 1), datetime(2021, 1, 31))
+
+        assert len(frame) == 31
+        assert load_ingested(tmp_path, "MISSING").empty
@@ -84,6 +84,63 @@ def test_xgboost_tuning():
     assert hasattr(trainer, 'tune_xgboost')
 
 
+def _small_tuning_data(n_samples=300):
+    trainer = AdvancedPatternTrainer(random_state=42)
+    X, y_type, _ = trainer.generate_enhanced_training_data(n_samples=n_samples)
+    class_to_idx = {'gartley': 0, 'butterfly': 1, 'bat': 2, 'crab': 3}
+    y_idx = np.array([class_to_idx[t] for t in y_type])
+    return trainer, X, y_idx
+
+
+SMALL_GRID = {
+    'n_estimators': [30, 60],
+    'max_depth': [3, 5],
+    'learning_rate': [0.1, 0.3],
+}
+
+
+def test_xgboost_halving_search():
+    """Test budgeted successive-halving search on a small grid."""
+    trainer, X, y_idx = _small_tuning_data()
+    
+    model, results = trainer.tune_xgboost(
+        X, y_idx, search='halving', param_grid=SMALL_GRID, n_jobs=1
+    )
+    
+    assert results['search'] == 'halving'
+    assert results['rungs'][0]['n_candidates'] == 8
+    # Each rung keeps 1/3 of the candidates with 3x the boosting rounds,
+    # until the survivor has been fitted at its full n_estimators
+    assert [r['n_candidates'] for r in results['rungs']] == [8, 2, 1]
+    assert [r['rounds'] for r in results['rungs']] == [10, 30, 60]
+    assert results['n_fits'] == 11
+    assert set(results['best_params']) == set(SMALL_GRID)
+    assert model.n_estimators <= results['best_params']['n_estimators']
+    assert len(model.predict(X[:5])) == 5
+
+
+def test_xgboost_halving_time_budget():
+    """Test that a budget too small for any fit raises."""
+    trainer, X, y_idx = _small_tuning_data()
+    
+    with pytest.raises(RuntimeError):
+        trainer.tune_xgboost(X, y_idx, search='halving', param_grid=SMALL_GRID, time_budget=0)
+
+
+def test_search_benchmark_reports_gap():
+    """Test grid vs halving benchmark report on a small grid."""
+    trainer = AdvancedPatternTrainer(random_state=42)
+    
+    report = trainer.benchmark_search(n_samples=300, cv=2, param_grid=SMALL_GRID, n_jobs=1)
+    
+    assert report['grid']['n_fits'] == 16
+    assert report['halving']['n_fits'] < report['grid']['n_fits']
+    assert report['accuracy_gap'] == pytest.approx(
+        report['grid']['test_accuracy'] - report['halving']['test_accuracy']
+    )
+    assert report['speedup'] > 0
+
+
 def test_random_forest_training():
     """Test Random Forest training."""
     trainer = AdvancedPatternTrainer(random_state=42)
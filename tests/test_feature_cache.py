@@ -0,0 +1,133 @@
+"""
+Tests for Feature Row Cache
+
+Tests per-bar feature memoization shared across horizons and the
+on-disk spill used by the multi-horizon trainers.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+
+from src.core.domain.entities import Candle
+from gravity_tech.ml import feature_cache
+from gravity_tech.ml.feature_cache import FeatureRowCache, series_fingerprint
+from gravity_tech.ml.multi_horizon_cycle_features import MultiHorizonCycleFeatureExtractor
+from gravity_tech.ml.train_multi_horizon_cycle import MultiHorizonCycleTrainer
+from gravity_tech.ml.multi_horizon_support_resistance_features import (
+    MultiHorizonSupportResistanceFeatureExtractor,
+)
+
+
+def _candles(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    prices = 100 + np.cumsum(rng.normal(0, 1, n))
+    base = datetime(2024, 1, 1)
+    return [
+        Candle(base + timedelta(hours=i), p, p + 1, p - 1, p + 0.2, 1000)
+        for i, p in enumerate(prices)
+    ]
+
+
+class TestFeatureRowCache:
+    """Test memoization and the on-disk table"""
+
+    def test_compute_once_per_index(self):
+        calls = []
+        cache = FeatureRowCache(lambda i: calls.append(i) or {'x': float(i)}, key="k")
+
+        assert cache.get(5) == {'x': 5.0}
+        assert cache.get(5) == {'x': 5.0}
+        assert calls == [5]
+        assert cache.stats()['hits'] == 1
+
+        frame = cache.table([5, 6])
+        assert list(frame['x']) == [5.0, 6.0]
+        assert calls == [5, 6]
+
+    def test_flush_and_reload(self, tmp_path):
+        if not feature_cache.PYARROW_AVAILABLE:
+            pytest.skip("pyarrow not installed")
+
+        compute = lambda i: {'a': i * 1.5, 'b': -float(i), 'phase': 'up' if i % 2 else 'down'}
+        cache = FeatureRowCache(compute, "s", str(tmp_path))
+        for i in range(10):
+            cache.get(i)
+        assert cache.flush() is not None
+
+        reloaded = FeatureRowCache(lambda i: pytest.fail("recomputed"), "s", str(tmp_path))
+        assert len(reloaded) == 10
+        assert reloaded.get(4) == {'a': 6.0, 'b': -4.0, 'phase': 'down'}
+
+    def test_memory_only_without_pyarrow(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(feature_cache, "PYARROW_AVAILABLE", False)
+
+        cache = FeatureRowCache(lambda i: {'x': float(i)}, "s", str(tmp_path))
+        cache.get(1)
+
+        assert cache.flush() is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_fingerprint_tracks_values_and_params(self):
+        candles = _candles(50)
+        assert series_fingerprint(candles, 100) == series_fingerprint(list(candles), 100)
+        assert series_fingerprint(candles, 100) != series_fingerprint(candles, 50)
+        assert series_fingerprint(candles) != series_fingerprint(candles[:-1])
+
+    def test_fingerprint_tracks_extractor_code(self, monkeypatch):
+        candles = _candles(50)
+        extractor = MultiHorizonCycleFeatureExtractor(lookback_period=20)
+        before = series_fingerprint(candles, 'cycle', 20, extractor=extractor)
+
+        assert before == series_fingerprint(candles, 'cycle', 20, extractor=extractor)
+        assert before != series_fingerprint(candles, 'cycle', 20)
+        monkeypatch.setattr(feature_cache, "extractor_version", lambda e: "edited")
+        assert before != series_fingerprint(candles, 'cycle', 20, extractor=extractor)
+
+
+class TestCycleTrainerSharing:
+    """All horizons read one feature pass"""
+
+    def test_one_extraction_per_bar(self, monkeypatch):
+        trainer = MultiHorizonCycleTrainer(lookback_period=20, horizons=[3, 7, 30])
+        windows = []
+
+        def fake_extract(window):
+            windows.append(window[-1].timestamp)
+            return {'cycle_avg_phase': float(len(windows) % 360)}
+
+        monkeypatch.setattr(trainer.feature_extractor, "extract_cycle_features", fake_extract)
+        candles = _candles(120)
+        rows = trainer.feature_extractor.feature_rows(candles)
+
+        for horizon in trainer.horizons:
+            features, targets = trainer.prepare_training_data(candles, horizon, feature_rows=rows)
+            assert len(features) == len(targets) == len(candles) - 2 * 20 - horizon
+
+        # Every window end evaluated exactly once
+        assert len(windows) == len(set(windows))
+        assert len(windows) == len(rows)
+
+
+class TestSupportResistanceSharing:
+    """Horizon windows are evaluated once per distinct window"""
+
+    def test_shared_windows(self, monkeypatch):
+        extractor = MultiHorizonSupportResistanceFeatureExtractor()
+        original = extractor.extract_sr_features
+        lengths = []
+
+        def counting(candles, window=None):
+            lengths.append(len(candles))
+            return original(candles, window=window)
+
+        monkeypatch.setattr(extractor, "extract_sr_features", counting)
+        features = extractor.extract_all_horizons(_candles(150))
+
+        assert sorted(lengths) == [72, 150]
+        assert 'avg_sr_position' in features and '30d_sr_bias' in features
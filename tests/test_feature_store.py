@@ -0,0 +1,158 @@
+"""
+Tests for Feature Store
+
+Tests the versioned on-disk feature store used by the training scripts:
+round trips, memory-mapped loads, and invalidation on code changes.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import importlib.util
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gravity_tech.ml.feature_store import (
+    FeatureKey,
+    FeatureStore,
+    extractor_version,
+    data_fingerprint,
+)
+from gravity_tech.ml.train_multi_horizon_support_resistance import (
+    MultiHorizonSupportResistanceTrainer,
+)
+
+
+class DummyExtractor:
+    """Stand-in extractor defined in this test module"""
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FeatureStore(tmp_path / "store")
+
+
+def test_round_trip_preserves_frames(store):
+    X = pd.DataFrame({
+        "rsi": np.linspace(0, 1, 50),
+        "count": np.arange(50, dtype=np.int64),
+        "scenario": ["bounce", "breakout"] * 25,
+    })
+    y = pd.Series(np.random.default_rng(0).normal(size=50), name="return_3d")
+    dated = pd.DataFrame(
+        {"a": np.arange(5.0)},
+        index=pd.date_range("2024-01-01", periods=5, freq="D")
+    )
+    key = store.key("btcusdt", "1d", DummyExtractor, {"lookback": 100})
+
+    store.save(key, (X, y, dated))
+    X2, y2, dated2 = store.load(key)
+
+    pd.testing.assert_frame_equal(X2, X)
+    pd.testing.assert_series_equal(y2, y)
+    pd.testing.assert_frame_equal(dated2, dated, check_freq=False)
+
+    arrays = store.load_arrays(key)
+    assert isinstance(arrays[0], np.memmap)
+    assert arrays[0].flags.f_contiguous
+
+
+def test_load_or_compute_hits_after_first_run(store):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return pd.DataFrame({"x": [1.0, 2.0]}), pd.DataFrame({"y": [3.0, 4.0]})
+
+    first = store.load_or_compute("ETHUSDT", "1h", DummyExtractor, {"p": 1}, compute)
+    second = store.load_or_compute("ETHUSDT", "1h", DummyExtractor, {"p": 1}, compute)
+    store.load_or_compute("ETHUSDT", "1h", DummyExtractor, {"p": 2}, compute)
+
+    assert len(calls) == 2
+    assert (store.hits, store.misses) == (1, 2)
+    pd.testing.assert_frame_equal(first[0], second[0])
+
+
+@pytest.mark.parametrize("wrap", [tuple, lambda frames: frames[0]], ids=["one_tuple", "bare"])
+def test_load_or_compute_keeps_result_shape(store, wrap):
+    def compute():
+        return wrap((pd.DataFrame({"x": [1.0, 2.0]}),))
+
+    first = store.load_or_compute("ETHUSDT", "1h", DummyExtractor, {"p": 1}, compute)
+    second = store.load_or_compute("ETHUSDT", "1h", DummyExtractor, {"p": 1}, compute)
+
+    assert store.hits == 1
+    assert type(second) is type(first)
+    if isinstance(first, tuple):
+        assert len(second) == 1
+        pd.testing.assert_frame_equal(first[0], second[0])
+    else:
+        pd.testing.assert_frame_equal(first, second)
+
+
+def test_version_follows_source(tmp_path, monkeypatch):
+    source = tmp_path / "fs_probe_extractor.py"
+    source.write_text("class Probe:\n    pass\n")
+    spec = importlib.util.spec_from_file_location("fs_probe_extractor", source)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "fs_probe_extractor", module)
+    spec.loader.exec_module(module)
+
+    before = extractor_version(module.Probe)
+    source.write_text("class Probe:\n    WINDOW = 20\n")
+    assert extractor_version(module.Probe) != before
+
+
+def test_new_version_replaces_stale_entry(store):
+    old = FeatureKey("BTCUSDT", "1d", "DummyExtractor", "aaaa", "p1")
+    new = FeatureKey("BTCUSDT", "1d", "DummyExtractor", "bbbb", "p1")
+    other = FeatureKey("BTCUSDT", "1d", "DummyExtractor", "aaaa", "p2")
+    frame = pd.DataFrame({"x": [1.0]})
+
+    store.save(old, (frame,))
+    store.save(other, (frame,))
+    store.save(new, (frame,))
+
+    assert not store.exists(old)
+    assert store.exists(new)
+    assert store.exists(other)
+
+
+def test_data_fingerprint_ignores_timestamps():
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=3, freq="h"),
+        "open": [1.0, 2.0, 3.0], "high": [2.0, 3.0, 4.0],
+        "low": [0.5, 1.5, 2.5], "close": [1.5, 2.5, 3.5], "volume": [10.0] * 3,
+    })
+    shifted = df.assign(timestamp=df["timestamp"] + pd.Timedelta(days=1))
+    assert data_fingerprint(df) == data_fingerprint(shifted)
+    assert data_fingerprint(df) != data_fingerprint(df.assign(close=df["close"] + 1))
+
+
+def test_seeded_sr_training_data_is_stored(store, monkeypatch):
+    trainer = MultiHorizonSupportResistanceTrainer(feature_store=store)
+    calls = []
+
+    def generate(num_samples, seed=None):
+        calls.append(seed)
+        rng = np.random.default_rng(seed)
+        return (
+            pd.DataFrame({"3d_sr_bias": rng.normal(size=num_samples)}),
+            pd.DataFrame({"3d_target": rng.normal(size=num_samples),
+                          "scenario": ["bounce"] * num_samples}),
+        )
+
+    monkeypatch.setattr(trainer, "_generate_training_data", generate)
+    features, targets = trainer.prepare_training_data(num_samples=8, seed=7)
+    cached_features, cached_targets = trainer.prepare_training_data(num_samples=8, seed=7)
+    trainer.prepare_training_data(num_samples=8)
+
+    # Unseeded data is never served from the store
+    assert calls == [7, None]
+    pd.testing.assert_frame_equal(cached_features, features)
+    pd.testing.assert_frame_equal(cached_targets, targets)
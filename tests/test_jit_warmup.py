@@ -0,0 +1,121 @@
+"""
+Tests for Numba JIT Warm-up
+
+Tests kernel compilation for every dtype, failure isolation, the seed
+cache copy and readiness gating.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from gravity_tech.services import jit_warmup as warmup_module
+from gravity_tech.services.jit_warmup import (
+    KERNELS,
+    JITWarmup,
+    KernelSpec,
+    sample_arrays,
+    seed_cache_dir,
+)
+from gravity_tech.services.performance_optimizer import fast_ema, fast_macd
+
+
+def _specs(*names):
+    return [spec for spec in KERNELS if spec.name in names]
+
+
+class TestJITWarmup:
+    """Compiling kernels ahead of the first request"""
+
+    def test_every_kernel_compiles_for_both_dtypes(self):
+        warmup = JITWarmup()
+        timings = warmup.run()
+
+        failed = [(t.kernel, t.dtype, t.error) for t in timings if t.source == "error"]
+        assert failed == []
+        assert warmup.ready
+        assert {(t.kernel, t.dtype) for t in timings} >= {
+            ("fast_macd", "float32"), ("fast_macd", "float64"), ("ewm_mean", "float64")
+        }
+        assert warmup.status()["state"] == "complete"
+
+    def test_second_run_uses_compiled_code(self):
+        JITWarmup(kernels=_specs("fast_rsi", "fast_sma")).run()
+        timings = JITWarmup(kernels=_specs("fast_rsi", "fast_sma")).run()
+
+        assert {t.source for t in timings} <= {"memory", "cache"}
+
+    def test_failing_kernel_does_not_block_readiness(self):
+        def broken(arrays):
+            raise RuntimeError("no sample")
+
+        warmup = JITWarmup(kernels=[KernelSpec("fast_ema", warmup_module.PERFORMANCE_OPTIMIZER, broken)],
+                           dtypes=["float64"])
+        timings = warmup.run()
+
+        assert warmup.ready
+        assert timings[0].source == "error"
+        assert warmup.status()["failed"] == ["fast_ema[float64]"]
+
+    def test_fixed_recurrences_match_reference(self):
+        closes = sample_arrays(200, "float64")["close"]
+
+        expected = np.empty_like(closes)
+        expected[0] = closes[0]
+        alpha = 2.0 / 13.0
+        for i in range(1, len(closes)):
+            expected[i] = alpha * closes[i] + (1 - alpha) * expected[i - 1]
+
+        np.testing.assert_allclose(fast_ema(closes, 12), expected)
+        macd_line, _, _ = fast_macd(closes)
+        np.testing.assert_allclose(macd_line, fast_ema(closes, 12) - fast_ema(closes, 26))
+
+
+class TestSeedCache:
+    """Copying a build-time cache into the writable cache directory"""
+
+    def test_copies_only_missing_files(self, tmp_path):
+        seed = tmp_path / "seed"
+        cache = tmp_path / "cache"
+        (seed / "pkg").mkdir(parents=True)
+        (seed / "pkg" / "kernel.nbi").write_text("seed index")
+        (seed / "pkg" / "kernel.1.nbc").write_text("seed code")
+        (cache / "pkg").mkdir(parents=True)
+        (cache / "pkg" / "kernel.nbi").write_text("runtime index")
+
+        copied = seed_cache_dir(str(seed), str(cache))
+
+        assert copied == 1
+        assert (cache / "pkg" / "kernel.nbi").read_text() == "runtime index"
+        assert (cache / "pkg" / "kernel.1.nbc").read_text() == "seed code"
+
+    def test_without_seed_dir_does_nothing(self, tmp_path):
+        assert seed_cache_dir(None, str(tmp_path)) == 0
+        assert seed_cache_dir(str(tmp_path / "missing"), str(tmp_path)) == 0
+
+
+class TestReadiness:
+    """Readiness waits for the warm-up"""
+
+    @pytest.mark.asyncio
+    async def test_not_ready_until_warmup_completes(self, monkeypatch):
+        from gravity_tech import main
+
+        warmup = JITWarmup(kernels=_specs("fast_ema"), dtypes=["float64"])
+        monkeypatch.setattr(main, "jit_warmup", warmup)
+        monkeypatch.setattr(main.settings, "cache_enabled", False)
+
+        pending = await main.readiness_check()
+        assert pending.status_code == 503
+        assert json.loads(pending.body)["checks"]["jit_warmup"] == {"state": "pending"}
+
+        await warmup.run_async()
+        ready = await main.readiness_check()
+        assert ready["status"] == "ready"
+        assert ready["checks"]["jit_warmup"]["state"] == "complete"
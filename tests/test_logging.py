@@ -0,0 +1,180 @@
+"""
+Tests for sampled, non-blocking request logging
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import contextvars
+import io
+import logging
+import queue
+import time
+from unittest.mock import Mock
+
+import pytest
+import structlog
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from gravity_tech.config.settings import settings
+from gravity_tech.middleware import logging as log_setup
+
+
+def dropped(reason: str) -> float:
+    return REGISTRY.get_sample_value("log_records_dropped_total", {"reason": reason}) or 0.0
+
+
+def make_record(message: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+class TestNonBlockingQueueHandler:
+    """Bounded queue between request threads and the writer"""
+
+    def test_full_queue_drops_without_blocking(self):
+        handler = log_setup.NonBlockingQueueHandler(queue.Queue(maxsize=2))
+        before = dropped("queue_full")
+
+        start = time.perf_counter()
+        for i in range(5):
+            handler.handle(make_record(f"line {i}"))
+
+        assert time.perf_counter() - start < 0.5
+        assert handler.queue.qsize() == 2
+        assert dropped("queue_full") == before + 3
+
+    def test_counts_volume_by_level(self):
+        handler = log_setup.NonBlockingQueueHandler(queue.Queue())
+        before = REGISTRY.get_sample_value("log_records_total", {"level": "warning"}) or 0.0
+
+        handler.handle(make_record("careful", logging.WARNING))
+
+        assert REGISTRY.get_sample_value("log_records_total", {"level": "warning"}) == before + 1
+
+    def test_writer_thread_flushes_on_shutdown(self, monkeypatch):
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", [])
+        monkeypatch.setattr(root, "level", root.level)
+        stream = io.StringIO()
+
+        assert log_setup.start_async_logging(stream, queue_size=100)
+        for i in range(20):
+            logging.getLogger("app").info("event %d", i)
+        log_setup.shutdown_logging()
+
+        assert stream.getvalue().splitlines() == [f"event {i}" for i in range(20)]
+
+    def test_existing_handlers_left_alone(self):
+        if not logging.getLogger().handlers:
+            pytest.skip("root logger has no handlers here")
+
+        assert not log_setup.start_async_logging(io.StringIO())
+
+
+class TestSampling:
+    """Per-request sampling of debug/info events"""
+
+    @staticmethod
+    def run_in_context(fn):
+        return contextvars.copy_context().run(fn)
+
+    def test_unsampled_request_drops_info_only(self):
+        processor = log_setup.sample_request_logs
+        before = dropped("sampled")
+
+        def request():
+            log_setup.sample_request(0.0)
+            with pytest.raises(structlog.DropEvent):
+                processor(None, "info", {"event": "starting_analysis"})
+            kept = processor(None, "error", {"event": "analysis_failed"})
+            log_setup.keep_request_logs()
+            return kept, processor(None, "info", {"event": "request_completed"})
+
+        kept, completed = self.run_in_context(request)
+
+        assert kept["event"] == "analysis_failed"
+        assert completed["event"] == "request_completed"
+        assert dropped("sampled") == before + 1
+
+    def test_sample_rate(self):
+        outcomes = self.run_in_context(
+            lambda: [log_setup.sample_request(0.25) for _ in range(4_000)]
+        )
+
+        assert sum(outcomes) / len(outcomes) == pytest.approx(0.25, abs=0.05)
+        assert self.run_in_context(lambda: log_setup.sample_request(1.0))
+
+
+class TestLogRequestsMiddleware:
+    """Sampling rules of main.log_requests"""
+
+    @pytest.fixture
+    def app_and_logger(self, monkeypatch):
+        config = structlog.get_config()
+        from gravity_tech import main
+        structlog.configure(**config)
+
+        logger = Mock()
+        monkeypatch.setattr(main, "logger", logger)
+        app = FastAPI()
+        app.middleware("http")(main.log_requests)
+        app.state.seen = []
+
+        @app.get("/ok")
+        async def ok():
+            app.state.seen.append(log_setup._request_sampled.get())
+            return {"status": "ok"}
+
+        @app.get("/missing")
+        async def missing():
+            raise HTTPException(status_code=404)
+
+        @app.get("/boom")
+        async def boom():
+            raise RuntimeError("boom")
+
+        return app, logger
+
+    @staticmethod
+    def events(mock):
+        return [c.args[0] for c in mock.info.call_args_list]
+
+    def test_sampled_out_success_is_silent(self, app_and_logger, monkeypatch):
+        app, logger = app_and_logger
+        monkeypatch.setattr(settings, "log_sample_rate", 0.0)
+
+        assert TestClient(app).get("/ok").status_code == 200
+
+        assert self.events(logger) == []
+        assert app.state.seen == [False]
+
+    def test_sampled_request_logs_both_lines(self, app_and_logger, monkeypatch):
+        app, logger = app_and_logger
+        monkeypatch.setattr(settings, "log_sample_rate", 1.0)
+
+        TestClient(app).get("/ok")
+
+        assert self.events(logger) == ["request_started", "request_completed"]
+        assert app.state.seen == [True]
+
+    def test_errors_and_slow_requests_always_logged(self, app_and_logger, monkeypatch):
+        app, logger = app_and_logger
+        monkeypatch.setattr(settings, "log_sample_rate", 0.0)
+        client = TestClient(app, raise_server_exceptions=False)
+
+        client.get("/missing")
+        assert self.events(logger) == ["request_completed"]
+        assert logger.info.call_args.kwargs["status_code"] == 404
+
+        client.get("/boom")
+        assert logger.error.call_args.args[0] == "request_failed"
+
+        logger.reset_mock()
+        monkeypatch.setattr(settings, "log_slow_request_ms", 0.0)
+        client.get("/ok")
+        assert self.events(logger) == ["request_completed"]
+        assert logger.info.call_args.kwargs["slow"] is True
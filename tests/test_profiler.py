@@ -0,0 +1,165 @@
+"""
+Tests for the sampling profiler and its admin endpoint
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import re
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from gravity_tech.api.v1 import admin
+from gravity_tech.middleware.auth import create_access_token
+from gravity_tech.services.profiler import SamplingProfiler
+
+COLLAPSED_LINE = re.compile(r"^\S.* \d+$")
+
+
+def spin(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def other_work(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1_000))
+
+
+def run_in_thread(target, *args) -> threading.Thread:
+    thread = threading.Thread(target=target, args=args, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestSamplingProfiler:
+    """Stack sampling and aggregation"""
+
+    def test_collapsed_stacks_of_busy_thread(self):
+        worker = run_in_thread(spin, 0.5)
+
+        # Scoped to the worker so threads left by other tests don't count
+        profile = SamplingProfiler(interval=0.005, scope={spin.__code__}).run(0.2)
+        worker.join()
+
+        assert profile.samples > 10
+        text = profile.collapsed()
+        assert all(COLLAPSED_LINE.match(line) for line in text.splitlines())
+        spinning = sum(count for stack, count in profile.stacks.items()
+                       if stack[-1] == f"{__name__}:spin")
+        assert spinning >= profile.samples * 0.5
+        assert any(stack[0] == "threading:Thread._bootstrap" for stack in profile.stacks)
+
+    def test_scope_keeps_only_samples_under_scope(self):
+        stop = threading.Event()
+        busy = run_in_thread(spin, 0.4)
+        noise = run_in_thread(other_work, stop)
+
+        profile = SamplingProfiler(interval=0.005, scope={spin.__code__}).run(0.2)
+        stop.set()
+        busy.join()
+        noise.join()
+
+        assert profile.stacks
+        assert all(f"{__name__}:spin" in stack for stack in profile.stacks)
+
+    def test_idle_threads_dropped_by_default(self):
+        event = threading.Event()
+        waiter = run_in_thread(event.wait)
+
+        quiet = SamplingProfiler(interval=0.005).run(0.05)
+        noisy = SamplingProfiler(interval=0.005, include_idle=True).run(0.05)
+        event.set()
+        waiter.join()
+
+        assert not any("threading:Event.wait" in stack for stack in quiet.stacks)
+        assert any("threading:Event.wait" in stack for stack in noisy.stacks)
+
+    def test_stop_event_ends_run(self):
+        stop = threading.Event()
+        stop.set()
+
+        profile = SamplingProfiler().run(5.0, stop)
+
+        assert profile.samples == 0
+        assert profile.duration < 1.0
+
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError):
+            SamplingProfiler(interval=0)
+
+
+class TestProfileEndpoint:
+    """GET /admin/profile"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setattr(admin.get_settings(), "profiler_enabled", True)
+        app = FastAPI()
+        app.include_router(admin.router)
+
+        @app.get("/busy")
+        def busy():
+            spin(0.05)
+            return {"status": "ok"}
+
+        with TestClient(app) as client:
+            yield client
+
+    @staticmethod
+    def auth(scopes):
+        token = create_access_token({"sub": "ops", "scopes": scopes})
+        return {"Authorization": f"Bearer {token}"}
+
+    def test_disabled_by_default(self, client, monkeypatch):
+        monkeypatch.setattr(admin.get_settings(), "profiler_enabled", False)
+
+        response = client.get("/admin/profile?seconds=0.1", headers=self.auth(["admin"]))
+
+        assert response.status_code == 404
+
+    def test_requires_admin_token(self, client):
+        assert client.get("/admin/profile?seconds=0.1").status_code in (401, 403)
+        bad = client.get("/admin/profile?seconds=0.1", headers={"Authorization": "Bearer nope"})
+        assert bad.status_code == 401
+        user = client.get("/admin/profile?seconds=0.1", headers=self.auth(["read"]))
+        assert user.status_code == 403
+
+    def test_rejects_long_runs_and_unknown_routes(self, client, monkeypatch):
+        monkeypatch.setattr(admin.get_settings(), "profiler_max_seconds", 1.0)
+        headers = self.auth(["admin"])
+
+        assert client.get("/admin/profile?seconds=5", headers=headers).status_code == 400
+        assert client.get("/admin/profile?seconds=0.1&route=/nope", headers=headers).status_code == 400
+
+    def test_profile_scoped_to_route(self, client):
+        stop = threading.Event()
+
+        def traffic():
+            while not stop.is_set():
+                client.get("/busy")
+
+        caller = run_in_thread(traffic)
+        try:
+            response = client.get(
+                "/admin/profile?seconds=0.3&interval_ms=2&route=/busy",
+                headers=self.auth(["admin"])
+            )
+        finally:
+            stop.set()
+            caller.join()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert int(response.headers["X-Profile-Samples"]) > 0
+        lines = response.text.splitlines()
+        assert lines and all(COLLAPSED_LINE.match(line) for line in lines)
+        assert all("busy" in line for line in lines)
+        assert any(line.rsplit(" ", 1)[0].endswith(f"{__name__}:spin") for line in lines)
@@ -0,0 +1,150 @@
+"""
+Tests for batch scenario analysis
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import asyncio
+import json
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.domain.entities import Candle
+from gravity_tech.analysis.scenario_analysis import ScenarioAnalyzer
+from gravity_tech.api.v1 import scenarios as scenarios_api
+from gravity_tech.clients.data_service_client import CandleData
+
+
+def candle_data(n: int = 200, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    base = datetime(2024, 1, 1)
+    return [
+        CandleData(
+            timestamp=base + timedelta(days=i),
+            adjusted_open=c,
+            adjusted_high=c * 1.01,
+            adjusted_low=c * 0.99,
+            adjusted_close=c,
+            adjusted_volume=1_000 + i
+        )
+        for i, c in enumerate(closes)
+    ]
+
+
+class FakeDataClient:
+    """Data Service stand-in with per-symbol latency"""
+
+    def __init__(self, delays=None, failing=()):
+        self.delays = delays or {}
+        self.failing = set(failing)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_candles(self, symbol, timeframe="1d", start_date=None, end_date=None, use_cache=True):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(symbol, 0.01))
+            if symbol in self.failing:
+                raise ValueError(f"No candle data received for {symbol}")
+            return candle_data(seed=len(symbol))
+        finally:
+            self.in_flight -= 1
+
+
+def without_timestamp(analysis):
+    result = asdict(analysis)
+    result.pop("timestamp")
+    return result
+
+
+class TestArrayPath:
+    """CandleData converted straight to arrays"""
+
+    def test_arrays_match_candle_path(self):
+        data = candle_data()
+        candles = [
+            Candle(c.timestamp, c.adjusted_open, c.adjusted_high, c.adjusted_low,
+                   c.adjusted_close, c.adjusted_volume)
+            for c in data
+        ]
+        analyzer = ScenarioAnalyzer()
+
+        arrays = ScenarioAnalyzer._convert_to_arrays(data)
+
+        np.testing.assert_array_equal(arrays["close"], [c.adjusted_close for c in data])
+        np.testing.assert_array_equal(arrays["volume"], [c.adjusted_volume for c in data])
+        assert without_timestamp(analyzer.analyze_arrays("X", arrays)) == \
+            without_timestamp(analyzer.analyze("X", candles))
+
+
+class TestAnalyzeMany:
+    """Concurrent fetch, completion-order results"""
+
+    def test_completion_order_errors_and_bounded_fetches(self):
+        client = FakeDataClient(
+            delays={"SLOW": 0.3, "A": 0.01, "B": 0.02, "C": 0.01, "D": 0.02},
+            failing={"BAD"}
+        )
+        analyzer = ScenarioAnalyzer(data_service_client=client)
+
+        async def collect():
+            return [
+                item async for item in analyzer.analyze_many_from_service(
+                    ["SLOW", "A", "B", "BAD", "C", "D", "A"], max_concurrency=3
+                )
+            ]
+
+        results = asyncio.run(collect())
+        symbols = [symbol for symbol, _ in results]
+
+        assert sorted(symbols) == ["A", "B", "BAD", "C", "D", "SLOW"]
+        assert symbols[-1] == "SLOW"
+        assert client.max_in_flight <= 3
+        outcome = dict(results)
+        assert isinstance(outcome["BAD"], ValueError)
+        assert outcome["A"].symbol == "A"
+
+
+class TestBatchEndpoint:
+    """NDJSON streaming endpoint"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.include_router(scenarios_api.router)
+        fake = FakeDataClient(failing={"BAD"})
+        app.dependency_overrides[scenarios_api.get_scenario_analyzer] = \
+            lambda: ScenarioAnalyzer(data_service_client=fake)
+        return TestClient(app)
+
+    def test_streams_one_line_per_symbol(self, client):
+        response = client.post(
+            "/api/v1/scenarios/batch?simulate=true&paths=500&seed=1",
+            json={"symbols": ["AAA", "BAD", "CC"]}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        by_symbol = {line["symbol"]: line for line in lines}
+        assert set(by_symbol) == {"AAA", "BAD", "CC"}
+        assert by_symbol["BAD"]["status"] == "error"
+        assert by_symbol["AAA"]["status"] == "ok"
+        assert by_symbol["AAA"]["analysis"]["simulation"]["n_paths"] == 500
+
+    def test_rejects_too_many_symbols(self, client, monkeypatch):
+        monkeypatch.setattr(scenarios_api.get_settings(), "scenario_batch_max_symbols", 2)
+
+        response = client.post("/api/v1/scenarios/batch", json={"symbols": ["A", "B", "C"]})
+
+        assert response.status_code == 400
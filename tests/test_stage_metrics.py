@@ -0,0 +1,158 @@
+"""
+Tests for per-stage analysis latency metrics
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from gravity_tech.api import v1 as api_v1
+from gravity_tech.models.schemas import AnalysisRequest, TechnicalAnalysisResult
+from gravity_tech.services import stage_metrics
+from gravity_tech.services.analysis_service import TechnicalAnalysisService
+from gravity_tech.services.stage_metrics import StageTimer, candle_bucket
+
+SERVICE_STAGES = {
+    "trend", "momentum", "cycle", "volume", "volatility", "support_resistance",
+    "candlestick_patterns", "elliott_wave", "market_phase", "overall_signal",
+}
+
+
+def stage_count(pipeline: str, stage: str, candles: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "analysis_stage_duration_seconds_count",
+        {"pipeline": pipeline, "stage": stage, "candles": candles},
+    )
+    return value or 0.0
+
+
+def candle_payload(candles):
+    return [
+        {
+            "timestamp": c.timestamp.isoformat(),
+            "open": c.open, "high": c.high, "low": c.low,
+            "close": c.close, "volume": c.volume,
+        }
+        for c in candles
+    ]
+
+
+class TestStageTimer:
+    """Stage timing and the candle-count label"""
+
+    @pytest.mark.parametrize("count, bucket", [
+        (50, "<=100"), (100, "<=100"), (101, "<=500"), (1000, "<=1000"),
+        (5000, "<=5000"), (5001, ">5000"),
+    ])
+    def test_candle_bucket(self, count, bucket):
+        assert candle_bucket(count) == bucket
+
+    def test_disabled_timer_is_a_no_op(self):
+        timer = StageTimer("test_disabled", 10, enabled=False)
+
+        with timer.stage("a") as first, timer.stage("b") as second:
+            pass
+
+        assert first is second is stage_metrics._NULL_STAGE
+        assert not timer.active
+        assert timer.breakdown() == {}
+        assert stage_count("test_disabled", "a", "<=100") == 0
+
+    def test_enabled_timer_observes_histogram(self):
+        timer = StageTimer("test_enabled", 700, enabled=True)
+        before = stage_count("test_enabled", "step", "<=1000")
+
+        with timer.stage("step"):
+            pass
+        with timer.stage("step"):
+            pass
+
+        assert stage_count("test_enabled", "step", "<=1000") == before + 2
+        assert timer.breakdown() == {}
+
+    def test_breakdown_adds_up_and_prefixes_children(self):
+        timer = StageTimer("test_collect", 10, collect=True, enabled=False)
+        timer.record("load", 0.001)
+        timer.record("load", 0.002)
+        timer.child("inner").record("score", 0.0005)
+
+        assert timer.breakdown() == {"load": 3.0, "inner.score": 0.5}
+
+    def test_exception_still_recorded(self):
+        timer = StageTimer("test_error", 10, collect=True, enabled=False)
+
+        with pytest.raises(RuntimeError):
+            with timer.stage("boom"):
+                raise RuntimeError
+
+        assert "boom" in timer.breakdown()
+
+
+class TestTechnicalAnalysisService:
+    """Stages of TechnicalAnalysisService.analyze"""
+
+    def test_every_stage_observed(self, sample_candles):
+        request = AnalysisRequest(symbol="BTCUSDT", timeframe="1h", candles=sample_candles)
+        before = {stage: stage_count("technical_analysis", stage, "<=100") for stage in SERVICE_STAGES}
+
+        result = asyncio.run(TechnicalAnalysisService.analyze(request))
+
+        assert result.stage_timings_ms is None
+        for stage in SERVICE_STAGES:
+            assert stage_count("technical_analysis", stage, "<=100") == before[stage] + 1
+
+    def test_breakdown_on_result(self, sample_candles):
+        request = AnalysisRequest(symbol="BTCUSDT", timeframe="1h", candles=sample_candles)
+        timer = StageTimer("technical_analysis", len(sample_candles), collect=True)
+
+        result = asyncio.run(TechnicalAnalysisService.analyze(request, timer=timer))
+
+        assert set(result.stage_timings_ms) == SERVICE_STAGES
+        assert all(ms >= 0 for ms in result.stage_timings_ms.values())
+
+
+class TestAnalyzeEndpoint:
+    """debug_timings on POST /analyze"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.include_router(api_v1.router)
+        return TestClient(app)
+
+    def post(self, client, candles, debug_timings):
+        return client.post(
+            f"/analyze?debug_timings={str(debug_timings).lower()}",
+            json={"symbol": "BTCUSDT", "timeframe": "1h", "candles": candle_payload(candles)},
+        )
+
+    def test_breakdown_when_allowed(self, client, sample_candles, monkeypatch):
+        monkeypatch.setattr(api_v1.settings, "analysis_debug_timings", True)
+
+        response = self.post(client, sample_candles, True)
+
+        assert response.status_code == 200
+        timings = response.json()["stage_timings_ms"]
+        assert set(timings) == SERVICE_STAGES | {"serialization"}
+
+    def test_flag_ignored_outside_debug(self, client, sample_candles, monkeypatch):
+        monkeypatch.setattr(api_v1.settings, "debug", False)
+        monkeypatch.setattr(api_v1.settings, "analysis_debug_timings", False)
+        before = stage_count("technical_analysis", "serialization", "<=100")
+
+        response = self.post(client, sample_candles, True)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert "stage_timings_ms" not in body
+        assert set(body) == set(TechnicalAnalysisResult.model_fields) - {"stage_timings_ms"}
+        assert body["symbol"] == "BTCUSDT"
+        assert stage_count("technical_analysis", "serialization", "<=100") == before + 1
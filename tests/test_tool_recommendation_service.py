@@ -0,0 +1,277 @@
+"""
+Tests for Tool Recommendation Service
+
+Tests the custom-tool analysis path (real indicator results, shared
+calculations, concurrent pattern detection, latency budget) and the
+two-level recommendation cache with stale-while-revalidate.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gravity_tech.services import tool_indicator_engine, tool_recommendation_service
+from gravity_tech.services.cache_service import CacheManager
+from gravity_tech.services.tool_indicator_engine import ToolIndicatorEngine
+from gravity_tech.services.tool_recommendation_service import ToolRecommendationService
+
+
+@pytest.fixture
+def service():
+    return ToolRecommendationService(custom_analysis_budget_ms=30000)
+
+
+@pytest.fixture
+def shared_cache():
+    """Cache manager over a dict standing in for Redis."""
+    store = {}
+    manager = CacheManager(near_cache=None)
+    manager.redis = AsyncMock()
+    manager.redis.get.side_effect = lambda key: store.get(key)
+    manager.redis.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value)
+    manager._is_available = True
+    return manager
+
+
+class TestCustomToolAnalysis:
+    """Custom analysis backed by the indicator engine"""
+
+    @pytest.mark.asyncio
+    async def test_results_come_from_indicators(self, service):
+        result = await service.analyze_with_custom_tools(
+            "BTCUSDT", "1d", ["MACD", "rsi", "Bollinger_Bands", "Volume_Profile"]
+        )
+
+        candles_df = await service._fetch_market_data("BTCUSDT", "1d", 200)
+        candles = ToolIndicatorEngine.to_candles(candles_df, "BTCUSDT", "1d")
+        expected = tool_indicator_engine.CALCULATORS["macd"][1](candles)
+
+        macd = result["tool_results"]["MACD"]
+        assert macd["status"] == "ok"
+        assert macd["value"] == pytest.approx(expected.value)
+        assert macd["category"] == "trend_indicators"
+        assert result["tool_results"]["Volume_Profile"]["status"] == "unsupported"
+
+        metadata = result["metadata"]
+        assert set(metadata["tool_timings_ms"]) == {"MACD", "rsi", "Bollinger_Bands"}
+        assert set(metadata["pattern_timings_ms"]) == {"candlestick", "classical"}
+        assert metadata["unsupported_tools"] == ["Volume_Profile"]
+        assert result["summary"]["tools_analyzed"] == 3
+        assert 0 <= result["ml_scoring"]["combined_score"] <= 100
+
+    @pytest.mark.asyncio
+    async def test_shared_calculation_runs_once(self, service, monkeypatch):
+        calls = []
+        category, calculator = tool_indicator_engine.CALCULATORS["sr_levels"]
+        monkeypatch.setitem(
+            tool_indicator_engine.CALCULATORS, "sr_levels",
+            (category, lambda c: calls.append(1) or calculator(c))
+        )
+
+        result = await service.analyze_with_custom_tools(
+            "BTCUSDT", "1d", ["Support_Zones", "Resistance_Zones"], include_patterns=False
+        )
+
+        assert len(calls) == 1
+        zones = result["tool_results"]
+        assert zones["Support_Zones"]["value"] == zones["Resistance_Zones"]["value"]
+        assert result["patterns_detected"] is None
+
+    @pytest.mark.asyncio
+    async def test_budget_skips_remaining_tools(self, service):
+        result = await service.analyze_with_custom_tools(
+            "BTCUSDT", "1d", ["MACD", "RSI"], latency_budget_ms=1e-6
+        )
+
+        metadata = result["metadata"]
+        assert metadata["budget_exceeded"]
+        assert metadata["skipped_tools"] == ["MACD", "RSI"]
+        assert metadata["patterns_timed_out"]
+        assert result["summary"]["tools_analyzed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failing_detector_reported(self, service, monkeypatch):
+        def broken(candles):
+            raise RuntimeError("detector failed")
+
+        monkeypatch.setitem(tool_indicator_engine.PATTERN_DETECTORS, "classical", broken)
+
+        result = await service.analyze_with_custom_tools("BTCUSDT", "1d", ["RSI"])
+
+        metadata = result["metadata"]
+        assert metadata["pattern_errors"] == {
+            "classical": {"status": "error", "error": "detector failed"}
+        }
+        assert set(metadata["pattern_timings_ms"]) == {"candlestick"}
+        assert not metadata["patterns_timed_out"]
+        assert all(p["family"] == "candlestick" for p in result["patterns_detected"])
+        assert result["tool_results"]["RSI"]["status"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_unconvertible_result_reported_per_tool(self, service, monkeypatch):
+        monkeypatch.setitem(
+            tool_indicator_engine.CALCULATORS, "rsi",
+            ("momentum_indicators", lambda c: SimpleNamespace(value=None, signal=None, confidence=1.0))
+        )
+
+        result = await service.analyze_with_custom_tools(
+            "BTCUSDT", "1d", ["RSI", "MACD"], include_patterns=False
+        )
+
+        assert result["tool_results"]["RSI"]["status"] == "error"
+        assert result["tool_results"]["MACD"]["status"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_ml_scoring_uses_request_context(self, service, monkeypatch):
+        calls = []
+        analyze = service._analyze_market_context
+
+        def recording(**kwargs):
+            calls.append(kwargs)
+            return analyze(**kwargs)
+
+        monkeypatch.setattr(service, "_analyze_market_context", recording)
+
+        result = await service.analyze_with_custom_tools(
+            "BTCUSDT", "1d", ["RSI"], include_patterns=False
+        )
+
+        assert len(calls) == 1
+        assert (calls[0]["symbol"], calls[0]["timeframe"]) == ("BTCUSDT", "1d")
+        candles_df = await service._fetch_market_data("BTCUSDT", "1d", 200)
+        assert result["ml_scoring"]["regime"] == analyze(
+            symbol="BTCUSDT", candles=candles_df, timeframe="1d"
+        )["regime"]
+
+
+class TestToolIndicatorEngine:
+    """One pass over shared, read-only OHLCV columns"""
+
+    def test_calculators_share_one_column_set(self, monkeypatch):
+        seen = []
+        for key in ("rsi", "macd"):
+            category, calculator = tool_indicator_engine.CALCULATORS[key]
+            monkeypatch.setitem(
+                tool_indicator_engine.CALCULATORS, key,
+                (category, lambda c, calculator=calculator: seen.append(c) or calculator(c))
+            )
+        candles = TestCalculatorColumns.candles()
+
+        results, _ = ToolIndicatorEngine().compute(candles, ["RSI", "MACD"])
+
+        assert seen[0] is seen[1]
+        assert not seen[0].close.flags.writeable
+        assert results["RSI"]["value"] == pytest.approx(
+            tool_indicator_engine.CALCULATORS["rsi"][1](candles).value
+        )
+
+
+class TestCalculatorColumns:
+    """Every calculator gives the same result on shared columns as on candles"""
+
+    @staticmethod
+    def candles(n: int = 300):
+        rng = np.random.default_rng(11)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+        frame = pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-01", periods=n, freq="h"),
+            "open": close * (1 + rng.normal(0, 0.003, n)),
+            "close": close,
+            "volume": rng.uniform(1_000, 5_000, n),
+        })
+        frame["high"] = frame[["open", "close"]].max(axis=1) * 1.004
+        frame["low"] = frame[["open", "close"]].min(axis=1) * 0.996
+        return ToolIndicatorEngine.to_candles(frame, "BTCUSDT", "1h")
+
+    @pytest.mark.parametrize("key", sorted(tool_indicator_engine.CALCULATORS))
+    def test_same_result(self, key):
+        candles = self.candles()
+        category, calculator = tool_indicator_engine.CALCULATORS[key]
+
+        expected = ToolIndicatorEngine._to_dict(calculator(candles), category)
+        actual = ToolIndicatorEngine._to_dict(
+            calculator(ToolIndicatorEngine.columns(candles)), category
+        )
+
+        assert actual == expected
+
+
+class TestRecommendationCache:
+    """Bounded two-level cache with stale-while-revalidate"""
+
+    @staticmethod
+    def _counting(service, monkeypatch, gate=None):
+        calls = []
+        compute = service._compute_recommendations
+
+        async def counting(**params):
+            calls.append(params["symbol"])
+            if gate is not None:
+                await gate.wait()
+            return await compute(**params)
+
+        monkeypatch.setattr(service, "_compute_recommendations", counting)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_local_level_is_bounded(self, shared_cache, monkeypatch):
+        service = ToolRecommendationService(cache=shared_cache, local_cache_size=2)
+        calls = self._counting(service, monkeypatch)
+
+        for symbol in ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BTCUSDT"]:
+            await service.get_tool_recommendations(symbol)
+
+        assert len(service._local_cache) == 2
+        # BTCUSDT was evicted locally but still served from Redis
+        assert calls == ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+
+    @pytest.mark.asyncio
+    async def test_workers_share_redis_level(self, shared_cache, monkeypatch):
+        first = ToolRecommendationService(cache=shared_cache)
+        second = ToolRecommendationService(cache=shared_cache)
+        calls = self._counting(second, monkeypatch)
+
+        expected = await first.get_tool_recommendations("BTCUSDT", top_n=5)
+        result = await second.get_tool_recommendations("BTCUSDT", top_n=5)
+
+        assert calls == []
+        assert result == expected
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self, shared_cache, monkeypatch):
+        clock = SimpleNamespace(time=lambda: now, perf_counter=time.perf_counter)
+        monkeypatch.setattr(tool_recommendation_service, "time", clock)
+        service = ToolRecommendationService(
+            cache=shared_cache, recommendation_ttl=300, stale_ttl=600
+        )
+        gate = asyncio.Event()
+        gate.set()
+        calls = self._counting(service, monkeypatch, gate)
+        now = 1_000.0
+        first = await service.get_tool_recommendations("BTCUSDT")
+
+        # Past its TTL the refresh blocks, yet requests get the stale entry
+        now = 1_400.0
+        gate.clear()
+        stale = await asyncio.wait_for(service.get_tool_recommendations("BTCUSDT"), 1)
+        again = await service.get_tool_recommendations("BTCUSDT")
+        assert stale["timestamp"] == again["timestamp"] == first["timestamp"]
+        assert service.cache_stats()["refreshing"] == 1
+
+        gate.set()
+        await asyncio.gather(*service._refreshing.values())
+        refreshed = await service.get_tool_recommendations("BTCUSDT")
+
+        assert calls == ["BTCUSDT", "BTCUSDT"]
+        assert refreshed["timestamp"] > first["timestamp"]
+        assert service.cache_stats()["stale_hits"] == 2
@@ -0,0 +1,100 @@
+"""
+Tests for Dynamic Tool Recommender
+
+Tests that the precomputed score tables rank tools exactly like the
+per-tool scoring functions they are built from.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import importlib.util
+import itertools
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+def _load_recommender_module():
+    """
+    Load the root ml/ml_tool_recommender.py by path
+
+    Importing it as ml.ml_tool_recommender depends on which package owns
+    the top-level name "ml": modules that put src/gravity_tech on sys.path
+    make it gravity_tech/ml for the rest of the session.
+    """
+    name = "ml_tool_recommender"
+    if name not in sys.modules:
+        path = Path(__file__).resolve().parents[1] / "ml" / "ml_tool_recommender.py"
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        # dataclasses resolve annotations through sys.modules
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+_recommender_module = _load_recommender_module()
+DynamicToolRecommender = _recommender_module.DynamicToolRecommender
+MarketContext = _recommender_module.MarketContext
+
+
+@pytest.fixture
+def recommender(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return DynamicToolRecommender(model_type="sklearn")
+
+
+def _reference(recommender, context, ml_weights, top_n):
+    """Per-tool loop with a stable sort on confidence"""
+    if ml_weights is None:
+        ml_weights = recommender._get_regime_based_weights(context.market_regime)
+    rows = []
+    for category, tools in recommender.TOOL_CATEGORIES.items():
+        weight = ml_weights.get(category, recommender.BASE_CATEGORY_WEIGHTS[category])
+        for tool in tools:
+            score = recommender._calculate_tool_score(tool, category, weight, context)
+            accuracy = recommender._get_historical_accuracy(tool, context.market_regime)
+            rows.append((tool, weight * score, min(score * accuracy, 1.0),
+                         recommender._determine_priority(score, accuracy)))
+    rows.sort(key=lambda r: r[2], reverse=True)
+    return rows[:top_n]
+
+
+def test_table_scoring_matches_per_tool_scoring(recommender):
+    regimes = list(recommender.REGIMES) + ["unknown"]
+    timeframes = ["1m", "1h", "1d", "2h"]
+    styles = ["scalp", "position", None, "unknown"]
+    for regime, timeframe, style, volatility in itertools.product(
+        regimes, timeframes, styles, [10.0, 30.0, 70.0, 85.0]
+    ):
+        context = MarketContext("BTCUSDT", timeframe, regime, volatility, 50.0, "high", style)
+        for ml_weights, top_n in [(None, 15), ({"trend_indicators": 0.9}, 40)]:
+            recs = recommender.recommend_tools(context, ml_weights, top_n=top_n)
+            got = [(r.tool_name, r.ml_weight, r.confidence, r.priority) for r in recs]
+            assert got == _reference(recommender, context, ml_weights, top_n)
+
+
+def test_reasons_only_built_for_returned_tools(recommender, monkeypatch):
+    calls = []
+    original = recommender._generate_reason
+    monkeypatch.setattr(
+        recommender, "_generate_reason",
+        lambda tool, **kw: calls.append(tool) or original(tool=tool, **kw)
+    )
+    context = MarketContext("BTCUSDT", "1d", "ranging", 50.0, 40.0, "medium")
+    recs = recommender.recommend_tools(context, top_n=5)
+
+    assert calls == [r.tool_name for r in recs]
+    assert len(recs) == 5
+
+
+def test_top_indices_keep_tie_order():
+    values = np.array([0.5, 0.9, 0.5, 0.7, 0.5, 0.9])
+    assert list(DynamicToolRecommender._top_indices(values, 4)) == [1, 5, 3, 0]
+    assert list(DynamicToolRecommender._top_indices(values, 10)) == [1, 5, 3, 0, 2, 4]
+    assert len(DynamicToolRecommender._top_indices(values, 0)) == 0
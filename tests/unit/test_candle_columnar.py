@@ -0,0 +1,194 @@
+"""
+Tests for the slotted Candle, Candle.from_arrays and CandleArray/CandleView
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+import pickle
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.core.domain.entities import Candle, CandleArray, CandleView, validate_ohlcv
+from src.core.patterns.candlestick import CandlestickPatterns
+from gravity_tech.indicators.trend import TrendIndicators
+from gravity_tech.indicators.volume_profile import VolumeProfile
+from gravity_tech.patterns.pivots import find_pivots
+
+BASE = datetime(2024, 1, 1)
+
+
+def make_columns(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = close * (1 + rng.normal(0, 0.003, n))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.004, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.004, n)))
+    volume = rng.uniform(1_000, 5_000, n)
+    timestamps = [BASE + timedelta(hours=i) for i in range(n)]
+    return timestamps, open_, high, low, close, volume
+
+
+def make_candles(n: int, seed: int = 0):
+    timestamps, *ohlcv = make_columns(n, seed)
+    return [
+        Candle(ts, o, h, l, c, v, symbol="BTCUSDT")
+        for ts, o, h, l, c, v in zip(timestamps, *(a.tolist() for a in ohlcv))
+    ]
+
+
+class TestSlottedCandle:
+    """Candle keeps its API without a per-instance __dict__"""
+
+    def test_no_instance_dict(self):
+        candle = Candle(BASE, 1.0, 2.0, 0.5, 1.5, 10.0)
+
+        assert not hasattr(candle, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            candle.close = 3.0
+
+    def test_value_semantics(self):
+        candle = Candle(BASE, 1.0, 2.0, 0.5, 1.5, 10.0)
+        same = Candle(BASE, 1.0, 2.0, 0.5, 1.5, 10.0)
+
+        assert candle == same and hash(candle) == hash(same)
+        assert pickle.loads(pickle.dumps(candle)) == candle
+        assert candle.body_size == 0.5 and candle.is_bullish
+
+    def test_still_validates(self):
+        with pytest.raises(ValueError):
+            Candle(BASE, 1.0, 1.2, 0.5, 1.5, 10.0)
+
+
+class TestFromArrays:
+    """Bulk construction with vectorized validation"""
+
+    def test_matches_per_candle_construction(self):
+        timestamps, *ohlcv = make_columns(200)
+
+        candles = Candle.from_arrays(timestamps, *ohlcv, symbol="BTCUSDT")
+
+        assert candles == make_candles(200)
+        assert all(type(c.open) is float for c in candles)
+
+    def test_datetime64_timestamps(self):
+        _, *ohlcv = make_columns(3)
+        timestamps = np.array(["2024-01-01T00", "2024-01-01T01", "2024-01-01T02"], dtype="datetime64[ns]")
+
+        candles = Candle.from_arrays(timestamps, *ohlcv)
+
+        assert [c.timestamp for c in candles] == [BASE + timedelta(hours=i) for i in range(3)]
+
+    @pytest.mark.parametrize("column, value, message", [
+        (2, 0.0, "High"),
+        (3, 1e9, "Low"),
+        (5, -1.0, "Volume"),
+    ])
+    def test_reports_first_bad_row(self, column, value, message):
+        columns = list(make_columns(50))
+        columns[column] = columns[column].copy()
+        columns[column][[17, 30]] = value
+
+        with pytest.raises(ValueError, match=rf"{message}.*row 17"):
+            Candle.from_arrays(*columns)
+
+    def test_length_mismatch(self):
+        timestamps, open_, high, low, close, volume = make_columns(10)
+
+        with pytest.raises(ValueError):
+            Candle.from_arrays(timestamps, open_, high, low, close, volume[:-1])
+        with pytest.raises(ValueError):
+            Candle.from_arrays(timestamps[:-1], open_, high, low, close, volume)
+
+    def test_nan_passes_like_candle(self):
+        validate_ohlcv(*(np.array([np.nan]) for _ in range(5)))
+
+
+class TestCandleArray:
+    """Columnar series read through CandleView"""
+
+    def test_view_matches_candle(self):
+        candles = make_candles(100)
+        array = CandleArray(*make_columns(100), symbol="BTCUSDT")
+
+        assert len(array) == 100
+        for view, candle in zip(array, candles):
+            assert view == candle
+            assert view.candle_type == candle.candle_type
+            assert view.upper_shadow == candle.upper_shadow
+            assert view.body_percent == candle.body_percent
+            assert view.typical_price == candle.typical_price
+        assert array[5].true_range(array[4]) == candles[5].true_range(candles[4])
+        assert array[-1].to_candle() == candles[-1]
+        assert not hasattr(array[0], "__dict__")
+
+    def test_indexing_and_slicing(self):
+        array = CandleArray(*make_columns(10))
+
+        assert isinstance(array[0], CandleView)
+        assert array[-1] == array[9]
+        with pytest.raises(IndexError):
+            array[10]
+        window = array[2:5]
+        assert isinstance(window, CandleArray)
+        assert [v.close for v in window] == array.close[2:5].tolist()
+        assert np.shares_memory(window.close, array.close)
+
+    def test_validation(self):
+        timestamps, open_, high, low, close, volume = make_columns(10)
+
+        with pytest.raises(ValueError, match="row 0"):
+            CandleArray(timestamps, open_, low, low, close, volume)
+        CandleArray(timestamps, open_, low, low, close, volume, validate=False)
+
+    def test_round_trip(self):
+        candles = make_candles(20)
+
+        array = CandleArray.from_candles(candles)
+
+        assert array.symbol == "BTCUSDT"
+        assert array.to_candles() == candles
+
+
+class TestDetectorsOnCandleArray:
+    """Detectors written for List[Candle] give the same results on a CandleArray"""
+
+    def test_candlestick_patterns(self):
+        candles = make_candles(300, seed=3)
+        array = CandleArray.from_candles(candles)
+
+        assert CandlestickPatterns.detect_patterns(array) == CandlestickPatterns.detect_patterns(candles)
+        np.testing.assert_array_equal(
+            CandlestickPatterns.scan(array).net_score(),
+            CandlestickPatterns.scan(candles).net_score()
+        )
+
+    def test_trend_indicators(self):
+        candles = make_candles(300, seed=4)
+        array = CandleArray.from_candles(candles)
+
+        for name in ("sma", "ema", "adx"):
+            expected = getattr(TrendIndicators, name)(candles)
+            actual = getattr(TrendIndicators, name)(array)
+            assert actual.value == expected.value
+            assert actual.signal == expected.signal
+
+    def test_volume_profile_and_pivots(self):
+        candles = make_candles(500, seed=5)
+        array = CandleArray.from_candles(candles)
+
+        expected, actual = VolumeProfile(), VolumeProfile()
+        expected.rebuild(candles)
+        actual.rebuild(array)
+
+        for a, b in zip(actual.histogram(), expected.histogram()):
+            np.testing.assert_allclose(a, b)
+        assert actual.levels() == expected.levels()
+        np.testing.assert_array_equal(
+            find_pivots(array.high, 5), find_pivots(np.array([c.high for c in candles]), 5)
+        )
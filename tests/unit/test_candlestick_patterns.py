@@ -9,6 +9,7 @@ Version: 1.0.0
 """
 
 import pytest
+import numpy as np
 from datetime import datetime, timedelta
 from src.core.domain.entities import Candle, CoreSignalStrength as SignalStrength
 from src.core.patterns.candlestick import CandlestickPatterns
@@ -264,5 +265,87 @@ class TestEdgeCases:
             pass
 
 
+
+def _random_candles(n: int, seed: int = 7):
+    """Random-walk candles with small bodies so every pattern occurs."""
+    rng = np.random.default_rng(seed)
+    opens = 100 + np.cumsum(rng.normal(0, 1, n))
+    closes = opens + rng.normal(0, 1, n)
+    highs = np.maximum(opens, closes) + rng.exponential(0.5, n) * rng.integers(0, 2, n)
+    lows = np.minimum(opens, closes) - rng.exponential(0.5, n) * rng.integers(0, 2, n)
+    base = datetime(2024, 1, 1)
+    return [
+        Candle(base + timedelta(hours=i), opens[i], highs[i], lows[i], closes[i], 1000)
+        for i in range(n)
+    ]
+
+
+class TestVectorizedScan:
+    """Test vectorized scan against the per-candle predicates"""
+    
+    def test_scan_matches_predicates_on_every_bar(self):
+        """Every bar of the scan agrees with the per-candle predicates"""
+        candles = _random_candles(3000)
+        scan = CandlestickPatterns.scan(candles)
+        
+        assert scan.matches.shape == (3000, len(scan.names))
+        for i, current in enumerate(candles):
+            expected = {
+                "doji": CandlestickPatterns.is_doji(current),
+                "hammer": CandlestickPatterns.is_hammer(current),
+                "inverted_hammer": CandlestickPatterns.is_inverted_hammer(current),
+            }
+            pair = CandlestickPatterns.is_engulfing(candles[i - 1], current) if i >= 1 else None
+            harami = CandlestickPatterns.is_harami(candles[i - 1], current) if i >= 1 else None
+            window = candles[max(0, i - 2):i + 1]
+            star = CandlestickPatterns.is_morning_evening_star(window)
+            three = CandlestickPatterns.is_three_soldiers_crows(window)
+            expected.update({
+                "bullish_engulfing": pair == 'bullish',
+                "bearish_engulfing": pair == 'bearish',
+                "bullish_harami": harami == 'bullish',
+                "bearish_harami": harami == 'bearish',
+                "morning_star": star == 'morning',
+                "evening_star": star == 'evening',
+                "three_white_soldiers": three == 'soldiers',
+                "three_black_crows": three == 'crows',
+            })
+            for name, value in expected.items():
+                assert scan.column(name)[i] == value, f"{name} mismatch at bar {i}"
+        
+        # Random walk should exercise every pattern at least once
+        assert scan.matches.any(axis=0).all()
+    
+    def test_scan_consistent_with_detect_patterns(self):
+        """Patterns at the last bar match detect_patterns output"""
+        candles = _random_candles(500, seed=11)
+        scan = CandlestickPatterns.scan(candles)
+        
+        for end in range(3, len(candles) + 1):
+            detected = CandlestickPatterns.detect_patterns(candles[:end])
+            assert len(detected) == int(scan.matches[end - 1].sum())
+    
+    def test_strength_and_directions(self):
+        """Strength holds confidence where matched and is signed by direction"""
+        candles = [
+            Candle(datetime(2024, 1, 1), 105.0, 106.0, 100.0, 100.5, 1000),
+            Candle(datetime(2024, 1, 2), 100.0, 101.0, 98.0, 99.0, 800),
+            Candle(datetime(2024, 1, 3), 99.5, 105.0, 99.0, 104.0, 1200),
+        ]
+        scan = CandlestickPatterns.scan(candles)
+        j = scan.names.index("morning_star")
+        
+        assert scan.matches[2, j]
+        assert scan.strength[2, j] == pytest.approx(0.85)
+        assert scan.signed_strength()[2, j] > 0
+        assert scan.strength[~scan.matches].sum() == 0
+    
+    def test_scan_short_series(self):
+        """Series shorter than the pattern windows do not fail"""
+        scan = CandlestickPatterns.scan(_random_candles(1))
+        assert scan.matches.shape[0] == 1
+        assert not scan.matches[0, 3:].any()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -7,7 +7,11 @@ Test Classical Pattern Recognition
 import numpy as np
 from datetime import datetime, timedelta
 from src.core.domain.entities import Candle
-from gravity_tech.patterns.classical import ClassicalPatterns
+from gravity_tech.patterns.classical import (
+    ClassicalPatterns,
+    ClassicalPatternScanner,
+    SwingIndex,
+)
 
 
 def create_test_candles(pattern_type: str, num_candles: int = 50) -> list:
@@ -430,6 +434,89 @@ def test_all_patterns():
         print(f"   توضیحات: {pattern.description}")
 
 
+
+def _random_walk_candles(n: int, seed: int = 3) -> list:
+    """Random-walk candles for swing index and history scan tests"""
+    rng = np.random.default_rng(seed)
+    prices = 100 + np.cumsum(rng.normal(0, 1, n))
+    base_time = datetime(2024, 1, 1)
+    return [
+        Candle(
+            timestamp=base_time + timedelta(hours=i),
+            open=prices[i],
+            high=prices[i] + abs(rng.normal()),
+            low=prices[i] - abs(rng.normal()),
+            close=prices[i],
+            volume=1000
+        )
+        for i in range(n)
+    ]
+
+
+def test_swing_index_matches_find_swing_points():
+    """Swing index windows equal find_swing_points on the same slice"""
+    candles = _random_walk_candles(300)
+    index = SwingIndex(candles[:200])
+    index.append(candles[200:])
+    
+    for size in (30, 40, 50):
+        for end in (size, 150, 300):
+            expected = ClassicalPatterns.find_swing_points(candles[max(0, end - size):end])
+            assert index.window(size, end) == expected
+
+
+def test_detect_all_matches_individual_detectors():
+    """detect_all with the shared index reports what each detector finds alone"""
+    candles = _random_walk_candles(400, seed=5)
+    detectors = [
+        ClassicalPatterns.detect_head_and_shoulders,
+        ClassicalPatterns.detect_inverse_head_and_shoulders,
+        ClassicalPatterns.detect_double_top,
+        ClassicalPatterns.detect_double_bottom,
+        ClassicalPatterns.detect_ascending_triangle,
+        ClassicalPatterns.detect_descending_triangle,
+        ClassicalPatterns.detect_symmetrical_triangle,
+    ]
+    
+    for end in range(20, len(candles) + 1, 7):
+        prefix = candles[:end]
+        expected = [r for r in (detect(prefix) for detect in detectors) if r]
+        assert ClassicalPatterns.detect_all(prefix) == expected
+
+
+def test_scan_history_reports_every_occurrence():
+    """History scan covers every per-bar detection with its bar range"""
+    candles = _random_walk_candles(600, seed=7)
+    occurrences = ClassicalPatterns.scan_history(candles)
+    
+    reported = set()
+    for end in range(20, len(candles) + 1):
+        for result in ClassicalPatterns.detect_all(candles[:end]):
+            reported.add((result.pattern_name, end - 1))
+    
+    covered = set()
+    for occ in occurrences:
+        assert occ.start_index <= occ.detected_index <= occ.end_index
+        assert candles[occ.start_index].timestamp == occ.result.start_time
+        for bar in range(occ.detected_index, occ.end_index + 1):
+            covered.add((occ.pattern_name, bar))
+    
+    assert reported and covered == reported
+
+
+def test_scanner_incremental_update():
+    """Appending bars in chunks gives the same occurrences as one pass"""
+    candles = _random_walk_candles(500, seed=9)
+    
+    scanner = ClassicalPatternScanner()
+    for start in range(0, len(candles), 73):
+        scanner.update(candles[start:start + 73])
+    
+    full = ClassicalPatterns.scan_history(candles)
+    assert [(o.pattern_name, o.start_index, o.detected_index, o.end_index) for o in scanner.occurrences] == \
+        [(o.pattern_name, o.start_index, o.detected_index, o.end_index) for o in full]
+
+
 if __name__ == "__main__":
     print("╔" + "="*58 + "╗")
     print("║" + " "*15 + "تست الگوهای کلاسیک" + " "*23 + "║")
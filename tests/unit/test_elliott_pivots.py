@@ -0,0 +1,85 @@
+"""
+Tests for the vectorized Elliott pivot search, impulse screen and
+multi-degree scan
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.core.domain.entities import Candle
+from gravity_tech.patterns.elliott_wave import ElliottWaveAnalyzer, PivotSequence
+
+BASE = datetime(2024, 1, 1)
+
+
+def random_walk(n: int, seed: int) -> list:
+    """Random-walk candles for pivot tests"""
+    rng = np.random.default_rng(seed)
+    prices = 100 + np.cumsum(rng.normal(0, 1, n))
+    return [
+        Candle(
+            timestamp=BASE + timedelta(hours=i),
+            open=prices[i],
+            high=prices[i] + abs(rng.normal()),
+            low=prices[i] - abs(rng.normal()),
+            close=prices[i],
+            volume=1000
+        )
+        for i in range(n)
+    ]
+
+
+def reference_pivots(candles, window):
+    """Original neighbour-loop pivot detection"""
+    highs = [c.high for c in candles]
+    lows = [c.low for c in candles]
+    peaks, troughs = [], []
+    for i in range(window, len(candles) - window):
+        others = [j for j in range(i - window, i + window + 1) if j != i]
+        if all(highs[j] < highs[i] for j in others):
+            peaks.append(i)
+        if all(lows[j] > lows[i] for j in others):
+            troughs.append(i)
+    return peaks, troughs
+
+
+class TestPivotSearch:
+    """Vectorized pivots and impulse screen against the loop versions"""
+
+    def test_find_pivot_points_matches_reference(self):
+        for seed in range(20):
+            sample = random_walk(200, seed)
+            for window in (3, 5, 7):
+                assert ElliottWaveAnalyzer.find_pivot_points(sample, window) == reference_pivots(sample, window)
+
+    def test_impulse_screen_matches_detailed_validation(self):
+        for seed in range(20):
+            seq = PivotSequence.from_candles(random_walk(400, seed), window=3)
+            expected = [
+                i for i in range(len(seq) - 5)
+                if len({p[2] for p in seq.pivots(i, 6)}) == 2
+                and ElliottWaveAnalyzer.validate_impulsive_wave(seq.pivots(i, 6))
+            ]
+            assert seq.impulse_candidates().tolist() == expected
+
+
+class TestWaveDegrees:
+    """Multi-degree scan"""
+
+    def test_nesting(self):
+        counts = ElliottWaveAnalyzer.scan_wave_degrees(random_walk(3000, 1), windows=(3, 5, 7))
+
+        assert set(counts) == {3, 5, 7}
+        assert any(parent.subwaves for parent in counts[5] + counts[7])
+        for parent in counts[5] + counts[7]:
+            for wave, children in parent.subwaves.items():
+                for child in children:
+                    assert child.window < parent.window
+                    assert parent.pivot_indices[wave - 1] <= child.start_index
+                    assert child.end_index <= parent.pivot_indices[wave]
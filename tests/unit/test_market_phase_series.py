@@ -0,0 +1,80 @@
+"""
+Tests for the one-pass market phase series
+
+Every row of identify_phase_series must equal identify_phase on the
+candles up to that bar.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.core.domain.entities import Candle
+from gravity_tech.analysis.market_phase import (
+    MarketPhase,
+    MarketPhaseAnalysis,
+    PhaseStrength,
+    analyze_market_phase_series,
+)
+
+SCORES = ("trend", "volume", "momentum", "price_position")
+
+
+def regime_candles(n: int, seed: int):
+    """Random walk whose drift changes every 100 bars (all phases occur)"""
+    rng = np.random.default_rng(seed)
+    drift = np.repeat(rng.normal(0, 0.4, n // 100 + 1), 100)[:n]
+    close = np.abs(100 + np.cumsum(drift + rng.normal(0, 1, n))) + 20
+    open_ = close + rng.normal(0, 0.3, n)
+    high = np.maximum(open_, close) + np.abs(rng.normal(0, 0.5, n))
+    low = np.minimum(open_, close) - np.abs(rng.normal(0, 0.5, n))
+    volume = rng.uniform(1_000, 5_000, n)
+    base = datetime(2024, 1, 1)
+    return [
+        Candle(base + timedelta(hours=i), o, h, l, c, v)
+        for i, (o, h, l, c, v) in enumerate(zip(open_, high, low, close, volume))
+    ]
+
+
+class TestMarketPhaseSeries:
+    """Series mode against the single-bar analysis"""
+
+    @pytest.mark.parametrize("seed", [0, 1])
+    def test_matches_single_bar_at_every_index(self, seed):
+        candles = regime_candles(400, seed)
+        analyzer = MarketPhaseAnalysis()
+
+        series = analyzer.identify_phase_series(candles)
+
+        assert len(series) == len(candles)
+        for t in range(len(candles)):
+            phase, strength, detail = analyzer.identify_phase(candles[:t + 1])
+            row = series.iloc[t]
+            assert (row.phase, row.strength) == (phase.value, strength.value), t
+            if t < 49:
+                continue
+            assert row.trend_structure == detail["trend_structure"], t
+            assert row.volume_trend == detail["volume_behavior"]["volume_trend"], t
+            assert row.overall_score == detail["overall_score"], t
+            for name in SCORES:
+                assert row[f"{name}_score"] == detail["scores"][name], (t, name)
+
+    def test_covers_the_phases(self):
+        series = analyze_market_phase_series(regime_candles(1_200, 3))
+
+        assert {MarketPhase.MARKUP.value, MarketPhase.MARKDOWN.value,
+                MarketPhase.ACCUMULATION.value} <= set(series.phase)
+
+    def test_warmup_rows(self):
+        series = analyze_market_phase_series(regime_candles(60, 0))
+
+        assert (series.phase[:49] == MarketPhase.TRANSITION.value).all()
+        assert (series.strength[:49] == PhaseStrength.WEAK.value).all()
+        assert series.overall_score[:49].isna().all()
+        assert series.overall_score[49:].notna().all()
@@ -0,0 +1,139 @@
+"""
+Tests for the sliding-window extrema kernel and pivot detection
+
+The kernel is checked against plain neighbour loops (with ties and NaN
+gaps), and each detector that adopted it against its previous loop.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.core.domain.entities import Candle
+from gravity_tech.analysis.market_phase import MarketPhaseAnalysis
+from gravity_tech.indicators.support_resistance import SupportResistanceIndicators
+from gravity_tech.patterns.divergence import DivergenceDetector
+from gravity_tech.patterns.harmonic import HarmonicPatternDetector
+from gravity_tech.patterns.pivots import find_pivots, pivot_points, rolling_max, rolling_min
+
+
+def loop_pivots(values, window, maxima, strict):
+    """Neighbour loop the detectors used before the shared kernel"""
+    found = []
+    for i in range(window, len(values) - window):
+        neighbours = [values[j] for j in range(i - window, i + window + 1) if j != i]
+        if maxima:
+            ok = all(values[i] > v if strict else values[i] >= v for v in neighbours)
+        else:
+            ok = all(values[i] < v if strict else values[i] <= v for v in neighbours)
+        if ok:
+            found.append(i)
+    return found
+
+
+def series(n, seed, ties=False, gaps=False):
+    rng = np.random.default_rng(seed)
+    values = 100 + np.cumsum(rng.normal(0, 1, n))
+    if ties:
+        values = np.round(values)
+    if gaps:
+        values[rng.choice(n, n // 20, replace=False)] = np.nan
+    return values
+
+
+def candles_from(values):
+    base = datetime(2024, 1, 1)
+    return [
+        Candle(base + timedelta(hours=i), v, v + 0.5 + (i % 3) * 0.1, v - 0.5 - (i % 4) * 0.1, v, 1000.0)
+        for i, v in enumerate(np.abs(values) + 10)
+    ]
+
+
+class TestRollingExtrema:
+    """Monotonic-deque rolling max/min"""
+
+    @pytest.mark.parametrize("window", [1, 2, 5, 17])
+    def test_matches_naive_window(self, window):
+        values = series(300, window, ties=True)
+        expected_max = [values[max(0, i - window + 1):i + 1].max() for i in range(len(values))]
+        expected_min = [values[max(0, i - window + 1):i + 1].min() for i in range(len(values))]
+
+        np.testing.assert_array_equal(rolling_max(values, window), expected_max)
+        np.testing.assert_array_equal(rolling_min(values, window), expected_min)
+
+
+class TestFindPivots:
+    """Pivot API against the neighbour loop"""
+
+    @pytest.mark.parametrize("window", [1, 2, 3, 5, 9])
+    @pytest.mark.parametrize("strict", [False, True])
+    @pytest.mark.parametrize("maxima", [True, False])
+    @pytest.mark.parametrize("ties,gaps", [(False, False), (True, False), (True, True)])
+    def test_matches_loop(self, window, strict, maxima, ties, gaps):
+        values = series(400, window, ties=ties, gaps=gaps)
+
+        result = find_pivots(values, window, maxima=maxima, strict=strict)
+
+        assert result.tolist() == loop_pivots(values.tolist(), window, maxima, strict)
+
+    def test_short_series_and_invalid_window(self):
+        assert find_pivots([1.0, 2.0, 1.0], 2).size == 0
+        assert pivot_points([1.0, 3.0, 1.0], 1) == [(1, 3.0)]
+        with pytest.raises(ValueError):
+            find_pivots([1.0, 2.0], 0)
+
+
+class TestDetectorParity:
+    """Detectors give the same swings as their former loops"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_market_phase_trend_structure(self, seed):
+        candles = candles_from(series(300, seed, ties=True))
+        highs = [c.high for c in candles]
+        lows = [c.low for c in candles]
+
+        result = MarketPhaseAnalysis.identify_trend_structure(candles)
+
+        assert [i for i, _ in result["swing_highs"]] == loop_pivots(highs, 5, True, False)
+        assert [i for i, _ in result["swing_lows"]] == loop_pivots(lows, 5, False, False)
+        assert result["swing_highs"][-1][1] == result["last_high"]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_support_resistance_levels(self, seed):
+        candles = candles_from(series(120, seed, ties=True))
+        recent = candles[-50:]
+        price = candles[-1].close
+        highs = [recent[i].high for i in loop_pivots([c.high for c in recent], 2, True, True)]
+        lows = [recent[i].low for i in loop_pivots([c.low for c in recent], 2, False, True)]
+
+        result = SupportResistanceIndicators.support_resistance_levels(candles)
+
+        assert result.additional_values["resistance"] == min(
+            [h for h in highs if h > price], default=price * 1.05)
+        assert result.additional_values["support"] == max(
+            [l for l in lows if l < price], default=price * 0.95)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_harmonic_pivots(self, seed):
+        values = series(300, seed, ties=True)
+        detector = HarmonicPatternDetector()
+
+        assert [i for i, _ in detector._find_pivot_highs(values)] == loop_pivots(values, 5, True, False)
+        assert [i for i, _ in detector._find_pivot_lows(values)] == loop_pivots(values, 5, False, False)
+
+    def test_divergence_swing_points(self):
+        values = series(200, 7, ties=True, gaps=True).tolist()
+        detector = DivergenceDetector()
+
+        highs = detector._find_swing_points(values, is_high=True)
+        lows = detector._find_swing_points(values, is_high=False)
+
+        assert [s.index for s in highs] == loop_pivots(values, 3, True, False)
+        assert [s.index for s in lows] == loop_pivots(values, 3, False, False)
+        assert all(s.is_high for s in highs) and not any(s.is_high for s in lows)
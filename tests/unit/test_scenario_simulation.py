@@ -0,0 +1,120 @@
+"""
+Tests for the Monte-Carlo scenario simulation
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.core.domain.entities import Candle
+from gravity_tech.analysis.scenario_analysis import ScenarioAnalyzer
+from gravity_tech.analysis.scenario_simulation import (
+    MonteCarloSimulator,
+    SimulationConfig,
+)
+
+
+def make_closes(n: int, drift: float = 0.0, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.normal(drift, 0.01, n)))
+
+
+def make_candles(n: int, seed: int = 0):
+    closes = make_closes(n, seed=seed)
+    base = datetime(2024, 1, 1)
+    return [
+        Candle(base + timedelta(days=i), c, c * 1.01, c * 0.99, c, 1_000 + i % 7 * 100)
+        for i, c in enumerate(closes)
+    ]
+
+
+class TestMonteCarloSimulator:
+    """Vectorized path generation"""
+
+    @pytest.mark.parametrize("method", ["gbm", "bootstrap"])
+    def test_seeded_result_independent_of_chunking(self, method):
+        closes = make_closes(300)
+        whole = MonteCarloSimulator(SimulationConfig(n_paths=2_000, method=method, seed=7))
+        chunked = MonteCarloSimulator(SimulationConfig(
+            n_paths=2_000, method=method, seed=7, memory_budget_mb=0.05))
+
+        assert chunked.chunk_size() < 2_000
+        a, b = whole.simulate(closes), chunked.simulate(closes)
+        np.testing.assert_array_equal(a.terminal, b.terminal)
+        np.testing.assert_array_equal(a.highest, b.highest)
+        np.testing.assert_array_equal(a.lowest, b.lowest)
+
+    def test_gbm_matches_calibrated_moments(self):
+        closes = make_closes(300, drift=0.001)
+        simulator = MonteCarloSimulator(SimulationConfig(n_paths=20_000, steps=25, seed=1))
+        returns = simulator.log_returns(closes)
+
+        terminal = simulator.simulate(closes).terminal
+
+        assert terminal.mean() == pytest.approx(25 * returns.mean(), abs=3e-3)
+        assert terminal.std() == pytest.approx(5 * returns.std(ddof=1), rel=0.03)
+
+    def test_bootstrap_uses_historical_returns_only(self):
+        closes = make_closes(60)
+        simulator = MonteCarloSimulator(SimulationConfig(n_paths=500, steps=1, method="bootstrap", seed=2))
+
+        terminal = simulator.simulate(closes).terminal
+
+        assert set(np.round(terminal, 12)) <= set(np.round(np.diff(np.log(closes)), 12))
+
+    def test_path_extremes_bracket_terminal(self):
+        stats = MonteCarloSimulator(SimulationConfig(n_paths=1_000, seed=3)).simulate(make_closes(100))
+
+        assert np.all(stats.lowest <= np.minimum(stats.terminal, 0))
+        assert np.all(stats.highest >= np.maximum(stats.terminal, 0))
+
+    def test_scenarios_from_path_distribution(self):
+        closes = make_closes(300)
+        outcomes, summary = MonteCarloSimulator(
+            SimulationConfig(n_paths=5_000, seed=4)).scenarios(closes, closes[-1], 3.0)
+
+        total = sum(o.probability for o in outcomes.values())
+        assert total == pytest.approx(100.0, abs=0.05)
+        assert outcomes["optimistic"].target_price > outcomes["neutral"].target_price
+        assert outcomes["pessimistic"].stop_loss < outcomes["neutral"].stop_loss
+        assert summary.cvar_95 >= summary.var_95
+        q = summary.terminal_quantiles
+        assert q["p5"] < q["p50"] < q["p95"]
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            SimulationConfig(method="heston")
+        with pytest.raises(ValueError):
+            MonteCarloSimulator().simulate(make_closes(10))
+
+
+class TestScenarioAnalyzerSimulation:
+    """Simulation mode of ScenarioAnalyzer.analyze"""
+
+    def test_heuristic_mode_unchanged(self):
+        analysis = ScenarioAnalyzer().analyze("TEST", make_candles(250))
+
+        assert analysis.simulation is None
+        assert analysis.optimistic.timeframe_days == 30
+
+    def test_simulation_mode(self):
+        config = SimulationConfig(n_paths=5_000, steps=20, seed=5)
+        analyzer = ScenarioAnalyzer()
+        candles = make_candles(250)
+
+        analysis = analyzer.analyze("TEST", candles, simulation=config)
+        again = analyzer.analyze("TEST", candles, simulation=config)
+
+        assert analysis.simulation is not None
+        assert analysis.expected_return == analysis.simulation.expected_return
+        assert analysis.expected_risk == analysis.simulation.expected_risk
+        assert analysis.optimistic.timeframe_days == 20
+        assert analysis.optimistic.probability + analysis.neutral.probability \
+            + analysis.pessimistic.probability == pytest.approx(100.0, abs=0.05)
+        assert again.optimistic == analysis.optimistic
@@ -0,0 +1,192 @@
+"""
+Tests for the volume-profile level engine
+
+The incremental histogram is checked against a rebuild from the same
+bars, and level lookups against a linear scan of the levels.
+
+Author: Gravity Tech Team
+Date: November 14, 2025
+Version: 1.0.0
+License: MIT
+"""
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.core.domain.entities import Candle
+from gravity_tech.indicators.volume_profile import LevelEngine, VolumeProfile
+from gravity_tech.ml.multi_horizon_support_resistance_features import (
+    MultiHorizonSupportResistanceFeatureExtractor,
+)
+
+
+def make_candles(n: int, seed: int = 0, symbol: str = "BTCUSDT"):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = close * (1 + rng.normal(0, 0.003, n))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.004, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.004, n)))
+    volume = rng.uniform(1_000, 5_000, n)
+    base = datetime(2024, 1, 1)
+    return [
+        Candle(base + timedelta(hours=i), o, h, l, c, v, symbol=symbol)
+        for i, (o, h, l, c, v) in enumerate(zip(open_, high, low, close, volume))
+    ]
+
+
+def assert_same_profile(a: VolumeProfile, b: VolumeProfile):
+    edges_a, volume_a, touches_a = a.histogram()
+    edges_b, volume_b, touches_b = b.histogram()
+    np.testing.assert_allclose(edges_a, edges_b)
+    np.testing.assert_allclose(volume_a, volume_b, atol=1e-6)
+    np.testing.assert_array_equal(touches_a, touches_b)
+    assert [level.price for level in a.levels()] == pytest.approx(
+        [level.price for level in b.levels()])
+
+
+class TestVolumeProfile:
+    """Histogram updates and level queries"""
+
+    def test_incremental_matches_rebuild(self):
+        candles = make_candles(600)
+        incremental = VolumeProfile(window=200)
+        for candle in candles:
+            incremental.update(candle)
+        rebuilt = VolumeProfile(window=200)
+        rebuilt.rebuild(candles)
+
+        assert len(incremental) == len(rebuilt) == 200
+        assert_same_profile(incremental, rebuilt)
+
+    def test_histogram_holds_window_volume_and_touches(self):
+        candles = make_candles(300)
+        profile = VolumeProfile(window=100)
+        profile.rebuild(candles)
+        window = candles[-100:]
+
+        _, volume, touches = profile.histogram()
+
+        assert volume.sum() == pytest.approx(sum(c.volume for c in window))
+        single_bin = sum(profile.bin_index(c.low) == profile.bin_index(c.high) for c in window)
+        assert touches.sum() == 2 * len(window) - single_bin
+
+    def test_levels_sorted_and_clusters_within_tolerance(self):
+        profile = VolumeProfile(bin_pct=0.1, cluster_tolerance_pct=0.5)
+        profile.rebuild(make_candles(1_000, seed=3))
+
+        levels = profile.levels()
+        prices = [level.price for level in levels]
+
+        assert levels and prices == sorted(prices)
+        for level in levels:
+            assert level.lower <= level.price <= level.upper
+            assert level.upper / level.lower <= (1.001) ** 6 + 1e-9
+        assert sum(level.strength for level in levels) <= 1.0
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_nearest_levels_match_scan(self, seed):
+        profile = VolumeProfile()
+        profile.rebuild(make_candles(500, seed=seed))
+        levels = profile.levels()
+
+        for price in np.linspace(levels[0].price * 0.9, levels[-1].price * 1.1, 200):
+            below = [level for level in levels if level.price < price]
+            above = [level for level in levels if level.price > price]
+            assert profile.nearest_support(price) == (below[-1] if below else None)
+            assert profile.nearest_resistance(price) == (above[0] if above else None)
+
+        low, high = levels[0].price, levels[len(levels) // 2].price
+        assert profile.levels_between(low, high) == levels[:len(levels) // 2 + 1]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            VolumeProfile(bin_pct=0)
+        with pytest.raises(ValueError):
+            VolumeProfile(window=0)
+        assert VolumeProfile().levels() == []
+
+
+class TestLevelEngine:
+    """Per-series profiles synced incrementally"""
+
+    def test_streaming_sync_is_incremental(self):
+        candles = make_candles(400)
+        engine = LevelEngine()
+
+        for end in range(250, 400):
+            profile = engine.sync(candles[:end], window=120)
+
+        expected = VolumeProfile(window=120)
+        expected.rebuild(candles[:399])
+        assert engine.rebuilds == 1
+        assert engine.incremental_updates == 149
+        assert_same_profile(profile, expected)
+
+    def test_revised_last_candle_is_replaced(self):
+        candles = make_candles(200)
+        engine = LevelEngine()
+        engine.sync(candles, window=100)
+
+        last = candles[-1]
+        revised = candles[:-1] + [replace(last, high=last.high * 1.01, volume=last.volume * 3)]
+        profile = engine.sync(revised, window=100)
+
+        expected = VolumeProfile(window=100)
+        expected.rebuild(revised)
+        assert engine.rebuilds == 1
+        assert_same_profile(profile, expected)
+
+    def test_unrelated_series_rebuilds(self):
+        engine = LevelEngine()
+        engine.sync(make_candles(150, seed=1), window=100)
+
+        other = make_candles(150, seed=2)  # Same timestamps, other prices
+        profile = engine.sync(other, window=100)
+
+        expected = VolumeProfile(window=100)
+        expected.rebuild(other)
+        assert engine.rebuilds == 2
+        assert_same_profile(profile, expected)
+
+    def test_profiles_per_symbol_are_bounded(self):
+        engine = LevelEngine(max_profiles=2)
+        for symbol in ("A", "B", "C"):
+            engine.sync(make_candles(50, symbol=symbol))
+
+        assert len(engine) == 2
+
+
+class TestSupportResistanceFeatures:
+    """The multi-horizon extractor reads its dynamic levels from the engine"""
+
+    def test_dynamic_levels_from_profile(self):
+        candles = make_candles(800)
+        extractor = MultiHorizonSupportResistanceFeatureExtractor()
+
+        for end in range(760, 800):
+            features = extractor.extract_all_horizons(candles[:end])
+
+        # One rebuild per horizon window, then only new bars
+        assert extractor.level_engine.rebuilds == 3
+        assert '30d_nearest_support_dist' in features
+        assert features['3d_nearest_support_dist'] >= 0
+        assert features['3d_nearest_resistance_dist'] >= 0
+
+    def test_series_shorter_than_horizons_grows_incrementally(self):
+        candles = make_candles(100)
+        extractor = MultiHorizonSupportResistanceFeatureExtractor()
+
+        for end in range(20, 100):
+            extractor.extract_all_horizons(candles[:end])
+
+        # Profiles are keyed by horizon period, not by the growing slice:
+        # one for the shared short slice, one more once 3d is full
+        engine = extractor.level_engine
+        assert engine.rebuilds == 2
+        assert len(engine) == 2
+        expected = VolumeProfile(window=168)
+        expected.rebuild(candles[:99])
+        assert_same_profile(engine.profile("BTCUSDT", "1h", 168), expected)